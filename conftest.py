@@ -0,0 +1,113 @@
+"""
+pytest fixtures and timing report for the CRUD suite (test_crud_suite.py,
+cycles and entity table in harness/crud.py).
+
+Every pytest process takes one admin session from the session pool, so
+with pytest-xdist each worker runs whole entity cycles on its own session;
+the login itself is cached on disk and shared by the workers.
+The per-request timings travel back to the controller as user properties
+and are summarised at the end of the run.
+"""
+
+import json
+from collections import defaultdict
+
+import pytest
+
+from harness.crud import Csrf, select
+from harness.sessions import default_pool
+from harness.settings import NC, RED
+from harness.timing import print_regressions, recorder
+
+_steps = []
+
+# Rows in the timing table
+TOP = 20
+
+# Label of the CRUD suite's runs in the latency history
+CRUD_SCRIPT = 'test_crud_suite.py'
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('crud', 'admin CRUD suite')
+    group.addoption('--entities', default=None,
+                    help="comma list of entity keys or groups (core, extended, create-only, all); default core")
+    group.addoption('--crud-slow', type=float, default=1000, help="flag requests slower than this many ms (default 1000)")
+    group.addoption('--crud-json', default=None, help="write every timed request to this JSON file")
+
+
+def pytest_collection_modifyitems(session, config, items):
+    # xdist workers have no script name of their own; label them only when
+    # they run the CRUD suite, other test files keep their own label
+    if any(item.path.name == CRUD_SCRIPT for item in items):
+        recorder.script = CRUD_SCRIPT
+
+
+def pytest_sessionfinish(session):
+    # Workers write their samples before the controller reports
+    recorder.save()
+
+
+def pytest_generate_tests(metafunc):
+    if 'entity' in metafunc.fixturenames:
+        try:
+            entities = select(metafunc.config.getoption('entities'))
+        except ValueError as e:
+            raise pytest.UsageError(str(e))
+        metafunc.parametrize('entity', entities, ids=[e.key for e in entities])
+
+
+@pytest.fixture(scope='session')
+def admin_session():
+    """A logged-in admin session, one per pytest process"""
+    pool = default_pool()
+    if not pool.open():
+        pytest.fail("Admin login failed", pytrace=False)
+    return pool.acquire()
+
+
+@pytest.fixture(scope='session')
+def csrf(admin_session):
+    """The admin session's CSRF token, shared by every cycle in the process"""
+    return Csrf()
+
+
+def pytest_runtest_logreport(report):
+    if report.when == 'call':
+        for name, value in report.user_properties:
+            if name == 'crud_steps':
+                _steps.extend(value)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _steps:
+        return
+    slow = config.getoption('crud_slow')
+    write = terminalreporter.write_line
+
+    routes = defaultdict(list)
+    for step in _steps:
+        routes[(step['step'], step['method'], step['route'])].append(step['ms'])
+
+    ranked = sorted(routes.items(), key=lambda item: -max(item[1]))
+    terminalreporter.section(f'CRUD request timings (slowest {min(len(ranked), TOP)} of {len(ranked)})')
+    write(f"{'Step':<8}{'Method':<7}{'Route':<44}{'Reqs':>5}{'mean':>9}{'max':>9}   (ms)")
+    for (step, method, route), times in ranked[:TOP]:
+        worst = max(times)
+        line = f"{step:<8}{method:<7}{route[:43]:<44}{len(times):>5}{sum(times) / len(times):>9.0f}{worst:>9.0f}"
+        write(f"{RED}{line}  slow{NC}" if worst > slow else line)
+
+    totals = defaultdict(float)
+    for step in _steps:
+        totals[step['entity']] += step['ms']
+    write('')
+    write("Cycle time per entity: " + ', '.join(f"{entity} {ms / 1000:.1f}s" for entity, ms in sorted(totals.items(), key=lambda i: -i[1])))
+
+    write('')
+    # The xdist controller collects nothing, label its check here
+    recorder.script = CRUD_SCRIPT
+    print_regressions()
+
+    if config.getoption('crud_json'):
+        with open(config.getoption('crud_json'), 'w') as handle:
+            json.dump(_steps, handle, indent=2)
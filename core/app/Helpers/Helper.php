@@ -3,7 +3,8 @@
 namespace App\Helpers;
 
 use Illuminate\Support\Facades\Auth;
-use App\Models\Currency;
+use App\Services\CurrencyContext;
+use App\Services\ImagePipeline;
 use App\Models\StatusDescription;
 use Illuminate\Support\Facades\Session;
 use Illuminate\Support\Facades\DB;
@@ -46,32 +47,39 @@ class Helper
     }
     
     public static function showCurrencyPrice($price) {
-        $curr = Currency::where('is_default','=',1)->first();
-        $price = round($price * $curr->value,2);
-        if (Session::has('currency')){
-            $curr = Currency::find(Session::get('currency'));
-        }
-        else
-        {
-            $curr = Currency::where('is_default','=',1)->first();
-        }
+        return CurrencyContext::format($price);
+    }
 
+    // Format a list of prices (e.g. a product grid or the cart) in one pass
+    public static function showCurrencyPrices($prices) {
+        return CurrencyContext::formatMany($prices);
+    }
 
-            return $curr->sign.$price;
 
+    // <picture> tag serving the resized WebP/JPEG variants of an upload
+    public static function picture($name, $alt = '', $sizes = '100vw', $class = '', $location = 'img') {
+        $attributes = ($class ? ' class="'.e($class).'"' : '').' alt="'.e($alt).'" loading="lazy"';
+        $webp = ImagePipeline::srcset($name, $location, 'webp');
+        $jpeg = ImagePipeline::srcset($name, $location, 'jpg');
 
-    }
+        if ($jpeg === '') {
+            return '<img src="'.e(ImagePipeline::url($name, null, $location)).'"'.$attributes.'>';
+        }
 
+        return '<picture>'
+            .($webp !== '' ? '<source type="image/webp" srcset="'.e($webp).'" sizes="'.e($sizes).'">' : '')
+            .'<img src="'.e(ImagePipeline::url($name, 640, $location)).'" srcset="'.e($jpeg).'" sizes="'.e($sizes).'"'.$attributes.'>'
+            .'</picture>';
+    }
 
     public static function showAdminCurrencyPrice($price) {
-        $curr = Currency::where('is_default','=',1)->first();
-        $price = round($price * $curr->value,2);
-        return $curr->sign.$price;
+        $curr = CurrencyContext::default();
+        return $curr->sign.CurrencyContext::convert($price);
     }
 
 
       public static function storePrice($price) {
-        $curr = Currency::where('is_default','=',1)->first();
+        $curr = CurrencyContext::default();
         $price = ($price / $curr->value);
         return $price;
     }
@@ -79,27 +87,22 @@ class Helper
 
     public static function showCurrency()
     {
-        $curr = Currency::where('is_default','=',1)->first();
-        return $curr->sign;
+        return CurrencyContext::default()->sign;
     }
 
     public static function showCurrencyCode()
     {
-        $curr = Currency::where('is_default','=',1)->first();
-        return $curr->name;
+        return CurrencyContext::default()->name;
     }
 
     public static function showCurrencyValue()
     {
-        $curr = Currency::where('is_default','=',1)->first();
-        return $curr->value;
+        return CurrencyContext::default()->value;
     }
 
 
     public static function showPrice($price) {
-        $curr = Currency::where('is_default','=',1)->first();
-        $price = $price * $curr->value;
-        return round($price,2);
+        return CurrencyContext::convert($price);
 
     }
 
@@ -1,11 +1,13 @@
 <?php
 
 namespace App\Helpers;
+use App\Jobs\SendMail;
 use App\Models\Emailsetting;
 use App\Models\EmailTemplate;
+use App\Models\Setting;
+use Illuminate\Support\Facades\Log;
 use PHPMailer\PHPMailer\PHPMailer;
 use PHPMailer\PHPMailer\Exception;
-use Illuminate\Support\Str;
 
 class MailSend
 {
@@ -13,6 +15,14 @@ class MailSend
     public $mail;
     public $setting;
 
+    /**
+     * Mailer reused by every job a queue worker runs, so the SMTP
+     * connection stays open between messages.
+     *
+     * @var static|null
+     */
+    protected static $shared = null;
+
     public function __construct()
     {
         $this->setting = Emailsetting::first();
@@ -28,92 +38,113 @@ class MailSend
             $this->mail->Password   = $this->setting->smtp_pass;
             $this->mail->SMTPSecure = $this->setting->email_encryption;
             $this->mail->Port       = $this->setting->smtp_port;
+            $this->mail->SMTPKeepAlive = true;
 
         }
     }
 
-
-    public function sendAutoOrderMail(array $mailData,$id)
+    /**
+     * Get the worker-wide mailer.
+     *
+     * @return static
+     */
+    public static function shared()
     {
-        $temp = EmailTemplate::where('email_type','=',$mailData['type'])->first();
-        // $order = Order::findOrFail($id);
-        // $cart = json_decode($order->cart, true);
-        try{
+        if (static::$shared === null) {
+            static::$shared = new static();
+        }
 
-            $body = preg_replace("/{customer_name}/", $mailData['cname'] ,$temp->email_body);
-            $body = preg_replace("/{order_amount}/", $mailData['oamount'] ,$body);
-            $body = preg_replace("/{admin_name}/", $mailData['aname'] ,$body);
-            $body = preg_replace("/{admin_email}/", $mailData['aemail'] ,$body);
-            $body = preg_replace("/{order_number}/", $mailData['onumber'] ,$body);
-            $body = preg_replace("/{website_title}/", $this->gs->title ,$body);
+        return static::$shared;
+    }
 
+    /**
+     * Queue a message for delivery.
+     *
+     * $mailData keys: to, name (optional), subject, body, from / from_name
+     * (optional, default to the email settings), reply_to (optional) and
+     * attachments (optional list of file paths).
+     *
+     * @param  array  $mailData
+     * @return void
+     */
+    public static function queue(array $mailData)
+    {
+        // Workers do not run from the web root, so pin attachment paths now
+        $mailData['attachments'] = array_map(function ($path) {
+            return realpath($path) ?: $path;
+        }, $mailData['attachments'] ?? []);
+
+        // On the sync connection the job runs right here; a mail failure must
+        // not break the checkout or form that triggered it.
+        try {
+            SendMail::dispatch($mailData);
+        } catch (\Throwable $e) {
+            Log::error('Mail to ' . ($mailData['to'] ?? '') . ' failed: ' . $e->getMessage());
+        }
+    }
 
-            $fileName = public_path('assets/temp_files/').Str::random(4).time().'.pdf';
-            // $pdf = PDF::loadView('pdf.order', compact('order', 'cart'))->save($fileName);
+    /**
+     * Send a message over the open connection; throws when it fails.
+     *
+     * @param  array  $mailData
+     * @return void
+     *
+     * @throws \PHPMailer\PHPMailer\Exception
+     */
+    public function deliver(array $mailData)
+    {
+        $this->mail->clearAllRecipients();
+        $this->mail->clearAttachments();
+        $this->mail->clearReplyTos();
 
-            //Recipients
-            $this->mail->setFrom($this->gs->from_email, $this->gs->from_name);
-            $this->mail->addAddress($mailData['to']);     // Add a recipient
+        try {
+            $this->mail->setFrom($mailData['from'] ?? $this->setting->from_email, $mailData['from_name'] ?? $this->setting->from_name);
+            $this->mail->addAddress($mailData['to'], $mailData['name'] ?? '');
 
-            // Attachments
-            $this->mail->addAttachment($fileName);
+            if (!empty($mailData['reply_to'])) {
+                $this->mail->addReplyTo($mailData['reply_to'], $mailData['reply_to_name'] ?? '');
+            }
 
-            // Content
-            $this->mail->isHTML(true);
+            foreach ($mailData['attachments'] ?? [] as $attachment) {
+                $this->mail->addAttachment($attachment);
+            }
 
-            $this->mail->Subject = $temp->email_subject;
-
-            $this->mail->Body = $body;
+            $this->mail->isHTML(true);
+            $this->mail->Subject = $mailData['subject'];
+            $this->mail->Body = $mailData['body'];
 
             $this->mail->send();
-
+        } catch (Exception $e) {
+            // Drop a connection the server may have left half-way through a message
+            $this->mail->smtpClose();
+            throw $e;
         }
-        catch (Exception $e){
-                dd($e->getMessage());
-        }
-
-        $files = glob('assets/temp_files/*'); //get all file names
-        foreach($files as $file){
-            if(is_file($file))
-            unlink($file); //delete file
-        }
-
-        return true;
+    }
 
 
+    public function sendAutoOrderMail(array $mailData,$id)
+    {
+        return $this->sendAutoMail($mailData);
     }
 
     public function sendAutoMail(array $mailData)
     {
 
         $temp = EmailTemplate::where('email_type','=',$mailData['type'])->first();
+        $title = Setting::where('id', 1)->value('title');
 
-        try{
+        $body = preg_replace("/{customer_name}/", $mailData['cname'] ,$temp->email_body);
+        $body = preg_replace("/{order_amount}/", $mailData['oamount'] ,$body);
+        $body = preg_replace("/{admin_name}/", $mailData['aname'] ,$body);
+        $body = preg_replace("/{admin_email}/", $mailData['aemail'] ,$body);
+        $body = preg_replace("/{order_number}/", $mailData['onumber'] ,$body);
+        $body = preg_replace("/{website_title}/", $title ,$body);
 
-            $body = preg_replace("/{customer_name}/", $mailData['cname'] ,$temp->email_body);
-            $body = preg_replace("/{order_amount}/", $mailData['oamount'] ,$body);
-            $body = preg_replace("/{admin_name}/", $mailData['aname'] ,$body);
-            $body = preg_replace("/{admin_email}/", $mailData['aemail'] ,$body);
-            $body = preg_replace("/{order_number}/", $mailData['onumber'] ,$body);
-            $body = preg_replace("/{website_title}/", $this->gs->title ,$body);
-
-            //Recipients
-            $this->mail->setFrom($this->gs->from_email, $this->gs->from_name);
-            $this->mail->addAddress($mailData['to']);     // Add a recipient
-
-            // Content
-            $this->mail->isHTML(true);
-
-            $this->mail->Subject = $temp->email_subject;
-
-            $this->mail->Body = $body;
-
-            $this->mail->send();
-
-        }
-        catch (Exception $e){
-
-        }
+        static::queue([
+            'to' => $mailData['to'],
+            'subject' => $temp->email_subject,
+            'body' => $body,
+        ]);
 
         return true;
 
@@ -121,20 +152,13 @@ class MailSend
 
     public function sendCustomMail(array $mailData)
     {
-        try{
-            $this->mail->setFrom($this->setting->from_email, $this->setting->from_name);
-            $this->mail->addAddress($mailData['to']);     // Add a recipient
-            $this->mail->isHTML(true);
-            $this->mail->Subject = $mailData['subject'];
-            $this->mail->Body = $mailData['body'];
-            $this->mail->send();
-
-        }
-        catch (Exception $e){
-            dd($e->getMessage());
-        }
+        static::queue([
+            'to' => $mailData['to'],
+            'subject' => $mailData['subject'],
+            'body' => $mailData['body'],
+        ]);
 
         return true;
     }
 
-}
\ No newline at end of file
+}
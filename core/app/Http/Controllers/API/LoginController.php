@@ -27,6 +27,8 @@ use App\Models\SubCompany;
 use Illuminate\Support\Facades\File;
 use App\Models\Setting;
 use Illuminate\Support\Facades\Cache;
+use App\Services\ChatChannel;
+use App\Services\ImagePipeline;
 
 class LoginController extends Controller
 {
@@ -375,19 +377,18 @@ class LoginController extends Controller
             return $response;
         } 
         
-       $imagedir       = "/home/mbtcom/public_html/telco/assets/user";
-     //dd(public_path());
         $image = $request->profile_image;
         if(isset($image)) {
-            $upload_dir = $imagedir;
             $img =$image;
-            $type= ".jpg";
             $img = str_replace('data:image/jpeg;base64,', '', $img);
             $img = str_replace(' ', '+', $img);
             $datas = base64_decode($img);
-            $fileName = strtolower(time() . $type);
-            $file = $upload_dir .'/'. $fileName;
-            File::put($file, $datas);
+            // Content-hashed name; resized variants are generated off-request
+            $fileName = ImagePipeline::storeContents($datas, 'jpg', 'user');
+            $oldPhoto = User::where('id',$request->user_id)->value('photo');
+            if($oldPhoto && $oldPhoto !== $fileName) {
+                ImagePipeline::delete($oldPhoto, 'user');
+            }
             User::where('id',$request->user_id)->update(['photo'=>$fileName]);
             //$img = "https://telco.mbt.com.mm/assets/user/".$fileName;
             $url = "https://telco.mbt.com.mm/assets/user/";
@@ -501,6 +502,7 @@ class LoginController extends Controller
        
         if($result==1)
         {
+            ChatChannel::publish($userid);
             return response()->json(['status'=>200,'message'=>'Message send successfully!']);
        }
         else
@@ -538,6 +540,45 @@ class LoginController extends Controller
         }
       }
       
+      // Server-Sent Events stream of new chat messages and the unread count
+      public function chat_stream(Request $request)
+      {
+        $validator = \Validator::make($request->all(),
+         [
+             'userid' => 'required',
+         ]);
+        if($validator->fails())
+        {
+            $response['response'] = $validator->messages();
+            return $response;
+        }
+        $lastId = $request->header('Last-Event-ID', $request->input('last_id'));
+
+        return ChatChannel::stream((int) $request->input('userid'), false, $lastId !== null ? (int) $lastId : null);
+      }
+      
+      // Long-poll alternative to get-message: returns as soon as something new arrives
+      public function chat_updates(Request $request)
+      {
+        $validator = \Validator::make($request->all(),
+         [
+             'userid' => 'required',
+         ]);
+        if($validator->fails())
+        {
+            $response['response'] = $validator->messages();
+            return $response;
+        }
+        $lastId = $request->input('last_id');
+        $updates = ChatChannel::poll((int) $request->input('userid'), false, $lastId !== null ? (int) $lastId : null);
+
+        return response()->json([
+             'message'=>'Chat updates',
+             'status'=>200,
+             'data'=>$updates,
+        ]);
+      }
+      
      public function aboutmessage(Request $request)
      { 
          $validator = \Validator::make($request->all(),
@@ -39,6 +39,11 @@ use DateTime;
 use App\Models\WaveCallback;
 use App\Models\MaintenanceSetting;
 use App\Models\PaymentProcess;
+use App\Models\AppVersion;
+use App\Services\AppBootstrap;
+use App\Services\ChatChannel;
+use App\Services\AppLanguageBundle;
+use App\Services\PackageOfferMatrix;
 
 class MbtController extends Controller
 {
@@ -1120,49 +1125,26 @@ class MbtController extends Controller
             $response['response'] = $validator->messages();
             return $response;
         } 
-      $language = DB::table('app_language')->get();
-      if($request->language_id == 0)
+      // Only touch the users row when the language or device actually changed
+      if($user_id)
       {
-          foreach($language as $value)
-          {
-              $key[]      = $value->lang_string;
-              $newvalue[] = $value->lang_english;
-          }
-         $ArrayCombine = array_combine($key,$newvalue);
-      }elseif($request->language_id == 1)
-      {
-          foreach($language as $value)
-          {
-              $key[]      = $value->lang_string;
-              $newvalue[] = $value->lang_chinese;
-          }
-         $ArrayCombine = array_combine($key,$newvalue);
-      }elseif($request->language_id == 2)
-      {
-          foreach($language as $value)
-          {
-              $key[]      = $value->lang_string;
-              $newvalue[] = $value->lang_burmese;
-          }
-         $ArrayCombine = array_combine($key,$newvalue);
+          DB::table('users')->where('id',$user_id)
+              ->whereRaw('NOT (language_id <=> ? AND deviceId <=> ?)', [$lang_id, $deviceId])
+              ->update(['language_id'=>$lang_id, 'deviceId'=>$deviceId]);
       }
-      else
+      
+      $bundle = AppLanguageBundle::get($lang_id);
+      
+      if($request->header('If-None-Match') === $bundle['etag'])
       {
-          $ArrayCombine = array();
-      }   
-       
-       
-    $update = DB::table('users')->where('id',$user_id)->update(['language_id'=>$lang_id, 'deviceId'=>$deviceId]);
-     
-     if($update){
-         
-             return response()->json(['status'=>200,'message'=>'Get language data!','language'=>$ArrayCombine]);
-     }
-     else{
-         
-             return response()->json(['status'=>200,'message'=>'Get language data!','language'=>$ArrayCombine]);
-     }
-    
+          return response('', 304, ['ETag' => $bundle['etag'], 'Cache-Control' => 'no-cache']);
+      }
+      
+      return response($bundle['body'], 200, [
+          'Content-Type'  => 'application/json',
+          'ETag'          => $bundle['etag'],
+          'Cache-Control' => 'no-cache',
+      ]);
   }
   
     public function BindUser(Request $request)
@@ -2551,7 +2533,11 @@ class MbtController extends Controller
                         return $response;
                     } 
                     
-               $update = DB::table('chat')->where('reciever_userid',$user_id)->update(['mobile_read_status'=>1]);
+               $update = DB::table('chat')->where('reciever_userid',$user_id)->where('mobile_read_status',0)->update(['mobile_read_status'=>1]);
+               if($update)
+               {
+                   ChatChannel::publish($user_id);
+               }
                
                 return response()->json(['status'=>200,'message'=>'Status change Successfully']);
             }
@@ -4418,59 +4404,19 @@ class MbtController extends Controller
             if ($validator->fails()) {
                 return response()->json(['status' => $this->unauthorisedStatus,'message'=>$validator->errors()], $this->unauthorisedStatus);
             } else {
-                $GuzzleClient     = new \GuzzleHttp\Client();//GuzzleHttp\Client $request->reference_number
-                $GuzzleHttp       = $GuzzleClient->request('GET', 'https://play.google.com/store/apps/details?id=com.company.myanmarbroadbandtelecom&hl=en', [
-                    'headers' => [
-//                        'Content-Type' => 'application/x-www-form-urlencoded',
-                    ],
-                    'verify'  => FALSE
-                ]);
-                
-                $response['code'] = $GuzzleHttp->getStatusCode();
-                $response['res']  = $GuzzleHttp->getReasonPhrase();
-                if ($response['code'] == 200) {
-                    ob_start();
-                    echo $GuzzleHttp->getBody();
-                    $content        = ob_get_clean();
-                    $CurrentVersion = $this->get_string_between($content, '<div class="BgcNfc">Current Version</div><span class="htlgb"><div class="IQ1z0d"><span class="htlgb">', '</span>');
+                // Versions come from the local registry (admin > App Settings > App Versions)
+                // instead of scraping the store listing on every launch.
+                $entry = AppVersion::forPlatform($request->platform);
 
-                    // if (isset($CurrentVersion) && $CurrentVersion) {
-                    //     $data['api_ver_playstore'] = $CurrentVersion;
-                    //     $data['update_available']  = $CurrentVersion !== $request->app_ver ? true : false;
-                    //     return response()->json(['status' => $this->successStatus,'message'=>"Data Fetched Successfully.",'data'=>$data, 'forceUpdate' => true,'url'=>'https://play.google.com/store/apps/details?id=com.company.myanmarbroadbandtelecom'], $this->successStatus);
-                    // } else {
-                    //     return response()->json(['status' => 404,'message'=>"Internal Server Error', 'Error', 'Data Load Failed, Please try again.",'data'=>array()], $this->unauthorisedStatus);
-                    // }
-                    
-                    if($request->platform == 'Android'){
-                        if ($request->app_ver) {
-                            $data['api_ver_playstore'] = 3.2;
-                            if($data['api_ver_playstore'] > $request->app_ver){
-                                $data['update_available']  =  true;
-                            }else{
-                                $data['update_available']  =  false;
-                            }
-                            return response()->json(['status' => $this->successStatus,'message'=>"Data Fetched Successfully.",'data'=>$data, 'forceUpdate' => true,'url'=>'https://play.google.com/store/apps/details?id=com.company.myanmarbroadbandtelecom'], $this->successStatus);
-                        } else {
-                            return response()->json(['status' => 404,'message'=>"Internal Server Error', 'Error', 'Data Load Failed, Please try again.",'data'=>array()], $this->unauthorisedStatus);
-                        }
-                    }elseif($request->platform == 'iOS'){
-                        if ($request->app_ver) {
-                            $data['api_ver_playstore'] = 3.2;
-                            if($data['api_ver_playstore'] > $request->app_ver){
-                                $data['update_available']  =  true;
-                            }else{
-                                $data['update_available']  =  false;
-                            }
-                            
-                            return response()->json(['status' => $this->successStatus,'message'=>"Data Fetched Successfully.",'data'=>$data, 'forceUpdate' => true,'url'=>'https://apps.apple.com/my/app/id1617950941'], $this->successStatus);
-                        } else {
-                            return response()->json(['status' => 404,'message'=>"Internal Server Error', 'Error', 'Data Load Failed, Please try again.",'data'=>array()], $this->unauthorisedStatus);
-                        }
-                    }
-                    
+                if ($entry && $request->app_ver) {
+                    $check = AppVersion::check($entry, (string) $request->app_ver);
+
+                    $data['api_ver_playstore'] = is_numeric($entry['latest_version']) ? (float) $entry['latest_version'] : $entry['latest_version'];
+                    $data['update_available']  = $check['update_available'];
+
+                    return response()->json(['status' => $this->successStatus,'message'=>"Data Fetched Successfully.",'data'=>$data, 'forceUpdate' => $check['force_update'] || (bool) $entry['force_update'],'url'=>$entry['store_url']], $this->successStatus);
                 } else {
-                   return response()->json(['status' => 404,'message'=>"Internal Server Error', 'Error', 'Data Load Failed, Please try again.",'data'=>array()], $this->unauthorisedStatus);
+                    return response()->json(['status' => 404,'message'=>"Internal Server Error', 'Error', 'Data Load Failed, Please try again.",'data'=>array()], $this->unauthorisedStatus);
                 }
             }
     }
@@ -4937,126 +4883,10 @@ class MbtController extends Controller
             $PackageName = $decode['data'][0]['billing_name'];
             $explode     = explode(" ",$PackageName); //Explode package name for get price
             $takeprice   = $explode[0];  //get price from 0 index and made package for defferent time
-            $data = [];
-            $data['0']    = $takeprice*1; // One Month
-            $data['1']    = $takeprice*3; // Three Month
-            $data['2']    = $takeprice*6; // Six Month
-            $data['3']    = $takeprice*12; // twelve(1 year) Month
-           
-            $discount = $this->discount;
-            $commercial_tax = $this->commercial_tax;
-            
-            if($CurrDecode['data']['group_id'] == '17'){
-                $GetPackageDescription = Package::where('status',1)->orderBy('discount_price','asc')->get();
-                $all_promotions = Promotion::where('status', '1')->get();
             
-                foreach($GetPackageDescription as $key=>$value){
-                    foreach($all_promotions as $all_promotion){
-                        if($CurrDecode['data']['group_id'] == '17' && $all_promotion->promotion_type == '1'){
-                            if($value->plan_type == 'Monthly'){
-                                if($all_promotion->duration == $value->time){
-                                    $new_packages[] = Package::where('status',1)->where('time', $all_promotion->duration)->where('plan_type', 'Monthly')->orderBy('discount_price','asc')->first();
-                                }
-                            }elseif($value->plan_type == 'Yearly'){
-                                if($all_promotion->duration == '12'){
-                                    $new_packages[] = Package::where('status',1)->where('time', $all_promotion->duration/12)->where('plan_type', 'Yearly')->orderBy('discount_price','asc')->first();
-                                }
-                            }
-                        }
-                    }
-                }
-                
-                foreach($new_packages as $k=>$new_package){
-                    if($new_package->plan_type == 'Monthly'){
-                        $extra_month = Promotion::where('duration', $new_package->time)->where('promotion_type', '1')->first();
-                        
-                        if($new_package->time == '1'){
-                            $amount = $data[0];
-                        }elseif($new_package->time == '3'){
-                            $amount = $data[1];
-                        }elseif($new_package->time == '6'){
-                            $amount = $data[2];
-                        }
-                    }else{
-                        $extra_month = Promotion::where('duration', '12')->where('promotion_type', '1')->first();
-                        
-                        if($new_package->time == '1'){
-                            $amount = $data[3];
-                        }
-                    }
-                    
-                    if(!empty($extra_month)){
-                        $new_extra_month = $extra_month->extra_month;
-                        $new_extra_days = $extra_month->extra_days;
-                    }else{
-                        $new_extra_month = 0;
-                        $new_extra_days = 0;
-                    }
-                    
-                    $new_amount = ($amount/(1 + $discount/100))/(1 + $commercial_tax/100)+$installation_cost;
-                    $total_amount = number_format($new_amount, 0, '.', '');
-                    
-                    $new_package->price = $total_amount;
-                    $new_package->discounted_price = $total_amount;
-                    $new_package->extra_month = $new_extra_month;
-                    $new_package->extra_day = $new_extra_days;
-                }
-            }else{
-                $GetPackageDescription = Package::where('status',1)->orderBy('discount_price','asc')->get();
-                $all_promotions = Promotion::where('status', '1')->get();
-            
-                foreach($GetPackageDescription as $key=>$value){
-                    foreach($all_promotions as $all_promotion){
-                        if($CurrDecode['data']['group_id'] != '17' && $all_promotion->promotion_type != '1'){
-                            if($value->plan_type == 'Monthly'){
-                                if($all_promotion->duration == $value->time){
-                                    $new_packages[] = Package::where('status',1)->where('time', $all_promotion->duration)->where('plan_type', 'Monthly')->orderBy('discount_price','asc')->first();
-                                }
-                            }elseif($value->plan_type == 'Yearly'){
-                                if($all_promotion->duration == '12'){
-                                    $new_packages[] = Package::where('status',1)->where('time', $all_promotion->duration/12)->where('plan_type', 'Yearly')->orderBy('discount_price','asc')->first();
-                                }
-                            }
-                        }
-                    }
-                }
-                
-                foreach($new_packages as $k=>$new_package){
-                    if($new_package->plan_type == 'Monthly'){
-                        $extra_month = Promotion::where('duration', $new_package->time)->where('promotion_type', '1')->first();
-                        
-                        if($new_package->time == '1'){
-                            $amount = $data[0];
-                        }elseif($new_package->time == '3'){
-                            $amount = $data[1];
-                        }elseif($new_package->time == '6'){
-                            $amount = $data[2];
-                        }
-                    }else{
-                        $extra_month = Promotion::where('duration', '12')->where('promotion_type', '1')->first();
-                        
-                        if($new_package->time == '1'){
-                            $amount = $data[3];
-                        }
-                    }
-                    
-                    if(!empty($extra_month)){
-                        $new_extra_month = $extra_month->extra_month;
-                        $new_extra_days = $extra_month->extra_days;
-                    }else{
-                        $new_extra_month = 0;
-                        $new_extra_days = 0;
-                    }
-                    
-                    $new_amount = ($amount/(1 + $discount/100))/(1 + $commercial_tax/100)+$installation_cost;
-                    $total_amount = number_format($new_amount, 0, '.', '');
-                    
-                    $new_package->price = $total_amount;
-                    $new_package->discounted_price = $total_amount;
-                    $new_package->extra_month = $new_extra_month;
-                    $new_package->extra_day = $new_extra_days;
-                }
-            }
+            // Package x promotion matching is precompiled; only the user's price is applied here
+            $offers       = PackageOfferMatrix::offers($CurrDecode['data']['group_id']);
+            $new_packages = PackageOfferMatrix::price($offers, $takeprice, $this->discount, $this->commercial_tax, $installation_cost);
        
             return response()->json(['status'=>200,'message'=>'Get Package successfully!','package'=>$new_packages]);
            
@@ -5516,11 +5346,14 @@ class MbtController extends Controller
         $payment = PaymentNew::where('id', $trans_id)->first();
         
         if(!empty($payment)){
-            $pdf_url = url('invoice/'.$trans_id);
+            // Point at the stored document when it has been rendered already
+            $invoice = $payment->invoice;
+            $pdf_url = $invoice ? $invoice->htmlUrl() : url('invoice/'.$trans_id);
             return response()->json([
                 'status'=>200,
                 'message'=>'Invoice Available',
-                'pdf_url'=>$pdf_url
+                'pdf_url'=>$pdf_url,
+                'pdf_file_url'=>$invoice ? $invoice->pdfUrl() : null
             ]);
         }else{
             return response()->json([
@@ -5534,8 +5367,8 @@ class MbtController extends Controller
     
     public function check_maintenance() 
     {
-        $maintenance = Setting::where('id', '1')->first();
-        if(!empty($maintenance->maintenance_mode) && $maintenance->maintenance_mode == 'on'){
+        $maintenance = AppBootstrap::section('maintenance');
+        if($maintenance['maintenance_mode']){
             return response()->json([
                 'status'=>200,
                 'message'=>'Maintenance Available',
@@ -3,6 +3,7 @@
 namespace App\Http\Controllers\API\V1;
 
 use App\Http\Controllers\Controller;
+use App\Services\ImagePipeline;
 use App\Traits\ApiResponse;
 use Illuminate\Http\Request;
 
@@ -80,21 +81,20 @@ class ProfileController extends Controller
             $user = $request->user();
             
             if ($request->hasFile('image')) {
-                $image = $request->file('image');
-                $filename = 'profile_' . $user->id . '_' . time() . '.' . $image->getClientOriginalExtension();
-                
-                // Store in public storage
-                $path = $image->storeAs('profiles', $filename, 'public');
-                
-                // Delete old image if exists
-                if ($user->profile_image) {
-                    \Storage::disk('public')->delete($user->profile_image);
+                // Stored under its content hash; resized variants follow in the queue
+                $filename = ImagePipeline::store($request->file('image'), 'profiles');
+                $path = 'profiles/' . $filename;
+
+                // Delete old image (and its variants) if exists
+                if ($user->profile_image && $user->profile_image !== $path) {
+                    ImagePipeline::delete(basename($user->profile_image), 'profiles');
                 }
-                
+
                 $user->update(['profile_image' => $path]);
-                
+
                 return $this->successResponse([
                     'profile_image' => asset('storage/' . $path),
+                    'profile_image_thumbnail' => ImagePipeline::url($filename, 320, 'profiles'),
                 ], 'Profile image uploaded successfully');
             }
             
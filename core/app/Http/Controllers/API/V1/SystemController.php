@@ -4,9 +4,8 @@ namespace App\Http\Controllers\API\V1;
 
 use App\Http\Controllers\Controller;
 use App\Traits\ApiResponse;
-use App\Models\Slider;
-use App\Models\Setting;
-use App\Models\MaintenanceSetting;
+use App\Models\AppVersion;
+use App\Services\AppBootstrap;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\Log;
 
@@ -14,6 +13,31 @@ class SystemController extends Controller
 {
     use ApiResponse;
 
+    /**
+     * Get everything the app needs on startup in one cached response.
+     *
+     * Answers 304 when the client's If-None-Match matches the current ETag.
+     *
+     * @param  \Illuminate\Http\Request  $request
+     * @return \Illuminate\Http\Response
+     */
+    public function bootstrap(Request $request)
+    {
+        try {
+            $bootstrap = AppBootstrap::get($request->input('language_id', 1));
+            $headers = AppBootstrap::headers($bootstrap['etag']);
+
+            if (in_array($bootstrap['etag'], $request->getETags(), true)) {
+                return response('', 304, $headers);
+            }
+
+            return response($bootstrap['body'], 200, $headers + ['Content-Type' => 'application/json']);
+        } catch (\Exception $e) {
+            Log::error('Get bootstrap data failed: ' . $e->getMessage());
+            return $this->serverErrorResponse('Failed to retrieve bootstrap data.');
+        }
+    }
+
     /**
      * Get banners/sliders.
      *
@@ -23,20 +47,7 @@ class SystemController extends Controller
     public function banners(Request $request)
     {
         try {
-            $languageId = $request->input('language_id', 1);
-            
-            $sliders = Slider::where('status', 1)
-                ->where('language_id', $languageId)
-                ->get()
-                ->map(function ($slider) {
-                    return [
-                        'id' => $slider->id,
-                        'name' => $slider->name,
-                        'description' => $slider->desc,
-                        'image' => $slider->image ? url('assets/front/banner/' . $slider->image) : null,
-                        'offer' => $slider->offer,
-                    ];
-                });
+            $sliders = AppBootstrap::section('banners', $request->input('language_id', 1));
 
             return $this->successResponse([
                 'banners' => $sliders
@@ -55,15 +66,10 @@ class SystemController extends Controller
     public function maintenanceStatus()
     {
         try {
-            $maintenance = MaintenanceSetting::first();
-            
-            $isUnderMaintenance = false;
-            $message = null;
-            
-            if ($maintenance && $maintenance->status == 1) {
-                $isUnderMaintenance = true;
-                $message = $maintenance->message ?? 'The app is currently under maintenance. Please try again later.';
-            }
+            $maintenance = AppBootstrap::section('maintenance');
+
+            $isUnderMaintenance = $maintenance['under_maintenance'];
+            $message = $maintenance['message'];
 
             return $this->successResponse([
                 'under_maintenance' => $isUnderMaintenance,
@@ -90,27 +96,18 @@ class SystemController extends Controller
             $currentVersion = $request->input('version', '1.0.0');
             $platform = $request->input('platform', 'android'); // android or ios
             
-            $settings = Setting::first();
-            
-            // Default version info
-            $latestVersion = '1.0.0';
-            $minVersion = '1.0.0';
-            $updateUrl = null;
-            
-            if ($settings) {
-                if ($platform === 'ios') {
-                    $latestVersion = $settings->ios_version ?? '1.0.0';
-                    $minVersion = $settings->ios_min_version ?? '1.0.0';
-                    $updateUrl = $settings->ios_store_url ?? null;
-                } else {
-                    $latestVersion = $settings->android_version ?? '1.0.0';
-                    $minVersion = $settings->android_min_version ?? '1.0.0';
-                    $updateUrl = $settings->android_store_url ?? null;
-                }
-            }
-            
-            $forceUpdate = version_compare($currentVersion, $minVersion, '<');
-            $updateAvailable = version_compare($currentVersion, $latestVersion, '<');
+            $entry = AppVersion::forPlatform($platform);
+
+            $latestVersion = $entry['latest_version'] ?? '1.0.0';
+            $minVersion = $entry['min_version'] ?? '1.0.0';
+            $updateUrl = $entry['store_url'] ?? null;
+
+            $check = $entry ? AppVersion::check($entry, $currentVersion) : [
+                'update_available' => false,
+                'force_update' => false,
+            ];
+            $forceUpdate = $check['force_update'];
+            $updateAvailable = $check['update_available'];
 
             return $this->successResponse([
                 'current_version' => $currentVersion,
@@ -139,18 +136,7 @@ class SystemController extends Controller
     public function settings()
     {
         try {
-            $settings = Setting::first();
-            
-            $config = [
-                'app_name' => $settings->title ?? 'Telco ISP',
-                'support_phone' => $settings->phone ?? null,
-                'support_email' => $settings->email ?? null,
-                'address' => $settings->address ?? null,
-                'logo' => $settings->logo ? url('assets/front/img/' . $settings->logo) : null,
-                'facebook' => $settings->facebook ?? null,
-                'twitter' => $settings->twitter ?? null,
-                'instagram' => $settings->instagram ?? null,
-            ];
+            $config = AppBootstrap::section('settings');
 
             return $this->successResponse([
                 'settings' => $config
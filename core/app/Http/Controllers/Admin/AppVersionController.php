@@ -0,0 +1,42 @@
+<?php
+
+namespace App\Http\Controllers\Admin;
+
+use App\Http\Controllers\Controller;
+use Illuminate\Http\Request;
+use App\Models\AppVersion;
+
+class AppVersionController extends Controller
+{
+    public function app_versions()
+    {
+        $versions = AppVersion::orderBy('id', 'asc')->get();
+        return view('admin.app_version.app_version', ['title' => 'App Versions', 'versions' => $versions]);
+    }
+
+    public function edit_app_version($ln, $id)
+    {
+        $version = AppVersion::findOrFail($id);
+        return view('admin.app_version.edit_app_version', ['title' => 'Edit App Version', 'version' => $version]);
+    }
+
+    public function update_app_version(Request $request, $ln, $id)
+    {
+        $request->validate([
+            'latest_version' => 'required|max:32|regex:/^\d+(\.\d+)*$/',
+            'min_version' => 'required|max:32|regex:/^\d+(\.\d+)*$/',
+            'store_url' => 'nullable|url|max:255',
+        ]);
+
+        // Saving through the model refreshes the cached registry used by the app APIs
+        $version = AppVersion::findOrFail($id);
+        $version->update([
+            'latest_version' => $request->latest_version,
+            'min_version' => $request->min_version,
+            'force_update' => $request->force_update ? 1 : 0,
+            'store_url' => $request->store_url,
+        ]);
+
+        return redirect()->route('admin.app.version', app()->getLocale())->with('success', 'App Version Updated Successfully!');
+    }
+}
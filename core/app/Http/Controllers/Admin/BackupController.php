@@ -4,49 +4,78 @@ namespace App\Http\Controllers\Admin;
 
 use App\Models\Backup;
 use App\Http\Controllers\Controller;
+use App\Services\DatabaseBackup;
 use Illuminate\Http\Request;
-use Symfony\Component\Process\Process;
 
 class BackupController extends Controller
 {
     public function index() {
         $data['backups'] = Backup::orderBy('id', 'DESC')->paginate(10);
+        $data['tables'] = DatabaseBackup::tables();
         return view('admin.backup', $data);
     }
 
-    public function store() {
+    // Queue a backup; the dump itself runs in RunBackup
+    public function store(Request $request) {
 
-        $filename = uniqid() . '.sql';
+        $request->validate([
+            'mode' => 'nullable|in:' . implode(',', DatabaseBackup::MODES),
+            'tables' => 'required_if:mode,tables|array',
+        ]);
 
-        $process = new Process((array)sprintf(
-            'mysqldump -u%s -p%s %s > %s',
-            config('database.connections.mysql.username'),
-            config('database.connections.mysql.password'),
-            config('database.connections.mysql.database'),
-            'core/storage/app/public/' . $filename
-        ));
+        if (DatabaseBackup::busy()) {
+            $notification = array(
+                'messege' => 'A backup is already in progress',
+                'alert' => 'warning'
+            );
+            return redirect()->back()->with('notification', $notification);
+        }
 
-        $process->mustRun();
+        if ($request->mode === 'tables' && !array_intersect((array) $request->tables, DatabaseBackup::tables())) {
+            $notification = array(
+                'messege' => 'Select at least one existing table',
+                'alert' => 'warning'
+            );
+            return redirect()->back()->with('notification', $notification);
+        }
 
-        $backup = new Backup;
-        $backup->filename = $filename;
-        $backup->save();
+        DatabaseBackup::queue($request->mode ?? 'full', (array) $request->tables);
 
         $notification = array(
-            'messege' => 'Backup saved successfully',
+            'messege' => 'Backup started, it will appear in the list when done',
             'alert' => 'success'
         );
         return redirect()->back()->with('notification', $notification);
     }
 
-    public function download(Request $request) {
-        return response()->download('core/storage/app/public/'.$request->filename, 'backup.sql');
+    public function progress($locale, $id) {
+        $backup = Backup::findOrFail($id);
+
+        return response()->json([
+            'status' => $backup->status,
+            'progress' => $backup->progress(),
+            'tables_done' => $backup->tables_done,
+            'tables_total' => $backup->tables_total,
+            'size' => $backup->size,
+            'error' => $backup->error,
+        ]);
+    }
+
+    // Streamed from disk, with Range support so large dumps can be resumed
+    public function download($locale, $id) {
+        $backup = Backup::where('status', 'done')->findOrFail($id);
+        $path = DatabaseBackup::path($backup);
+
+        if (!is_file($path)) {
+            abort(404);
+        }
+
+        return response()->download($path, $backup->compression === null ? 'backup.sql' : $backup->filename);
     }
 
     public function delete($locale, $id) {
-        $backup = Backup::find($id);
-        @unlink('core/storage/app/public/'.$backup->filename);
-        $backup->delete();
+        $backup = Backup::findOrFail($id);
+        DatabaseBackup::delete($backup);
 
         $notification = array(
             'messege' => 'Database sql file deleted successfully!',
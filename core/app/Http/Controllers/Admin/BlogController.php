@@ -12,6 +12,7 @@ use Illuminate\Support\Str;
 use Illuminate\Http\Request;
 use Mews\Purifier\Facades\Purifier;
 use App\Http\Controllers\Controller;
+use App\Services\ImagePipeline;
 
 class BlogController extends Controller
 {
@@ -89,10 +90,7 @@ class BlogController extends Controller
 
         if($request->hasFile('main_image')){
 
-            $file = $request->file('main_image');
-            $extension = $file->getClientOriginalExtension();
-            $main_image = time().rand().'.'.$extension;
-            $file->move('assets/front/img/', $main_image);
+            $main_image = ImagePipeline::store($request->file('main_image'));
 
             $blog->main_image = $main_image;
         }
@@ -120,7 +118,7 @@ class BlogController extends Controller
     public function delete($locale, $id){
 
         $blog = Blog::find($id);
-        @unlink('assets/front/img/'. $blog->main_image);
+        ImagePipeline::delete($blog->main_image);
         $blog->delete();
 
     }
@@ -168,12 +166,10 @@ class BlogController extends Controller
         ]);
 
         if($request->hasFile('main_image')){
-            @unlink('assets/front/img/'. $blog->main_image);
-
-            $file = $request->file('main_image');
-            $extension = $file->getClientOriginalExtension();
-            $main_image = time().rand().'.'.$extension;
-            $file->move('assets/front/img/', $main_image);
+            $main_image = ImagePipeline::store($request->file('main_image'));
+            if ($blog->main_image !== $main_image) {
+                ImagePipeline::delete($blog->main_image);
+            }
 
             $blog->main_image = $main_image;
             
@@ -3,6 +3,7 @@
 namespace App\Http\Controllers\Admin;
 
 use App\Models\Currency;
+use App\Services\CurrencyContext;
 use App\Models\Language;
 use Illuminate\Http\Request;
 use App\Http\Controllers\Controller;
@@ -97,6 +98,7 @@ class CurrencyController extends Controller
             $data->is_default = 1;
             $data->update();
             $data = Currency::where('id','!=',$id1)->update(['is_default' => 0]);
+            CurrencyContext::forget();
             
             $notification = array(
                 'messege' => 'Currency Updated successfully!',
@@ -124,6 +126,7 @@ class CurrencyController extends Controller
         $data = Currency::findOrFail($id);
         if($data->is_default == 1) {
         Currency::where('id','=',1)->update(['is_default' => 1]);
+        CurrencyContext::forget();
         }
         $data->delete();
 
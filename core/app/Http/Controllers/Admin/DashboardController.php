@@ -34,7 +34,9 @@ use Illuminate\Support\Facades\Hash;
 use Carbon\Carbon;
 use App\Models\Notification;
 use App\Models\PaymentNew;
+use App\Models\PersonalAccessToken;
 use App\Models\UserDevice;
+use App\Services\ChatChannel;
 
 class DashboardController extends Controller
 {
@@ -1234,6 +1236,11 @@ public function search_install_query(Request $request)
         'user_status'     => $request->user_status,
             ]);
         
+        // The mass update skips User's updated hook; drop the cached tokens so a disabled user loses API access now
+        if ($user = User::find($request->query_id)) {
+            PersonalAccessToken::forgetCached($user->tokens()->pluck('token'));
+        }
+        
         return redirect()->back()->with('message','User Update Successfully!');
        // dd($request->all());
     }
@@ -1587,7 +1594,10 @@ public function search_install_query(Request $request)
         $sqlQuery = DB::select("select * from chat where `reciever_userid` = $user2 or `sender_userid` = $user2 order by timestamp asc");
       
       	
-      	DB::table('chat') ->where('sender_userid', $request->user_id)->update(['read_status' => 1]); 
+      	$marked = DB::table('chat') ->where('sender_userid', $request->user_id)->where('read_status', 0)->update(['read_status' => 1]); 
+      	if ($marked) {
+      	    ChatChannel::publish($request->user_id);
+      	}
       	
       	$decode = json_decode(json_encode($sqlQuery),true);
       	$conversation = '<ul class="message-body">'; 
@@ -1625,6 +1635,7 @@ public function search_install_query(Request $request)
         $insert = DB::table('chat')->insert(['sender_userid'=>$request->from_user_id,'reciever_userid'=>$request->user_id,'message'=>$request->message,'status'=>0]);
         if($insert)
         {     
+            ChatChannel::publish($request->user_id);
             //DB::table('users')->where('id', 7)->update(array('last_messsage' => ok));  
             $user = User::find($request->user_id);
             Helper::SendFirebasePush($user->device_id,$request->message);
@@ -1656,6 +1667,16 @@ public function search_install_query(Request $request)
        }
    }
    
+   /**
+    * Stream new messages and unread counts for the open conversation (SSE).
+    */
+   public function chat_stream(Request $request)
+   {
+        $lastId = $request->header('Last-Event-ID', $request->input('last_id'));
+
+        return ChatChannel::stream((int) $request->user_id, true, $lastId !== null ? (int) $lastId : null);
+   }
+   
    public function notification(request $request)
    {  
       // echo $abcd=$_GET['yearname'];
@@ -12,6 +12,7 @@ use Illuminate\Support\Facades\Input;
 use Illuminate\Support\Facades\Session;
 use Illuminate\Support\Facades\Validator;
 use DB;
+use App\Services\AppLanguageBundle;
 class LanguageController extends Controller
 {
     public function index($lang = false)
@@ -37,6 +38,7 @@ class LanguageController extends Controller
         $insert = DB::table('app_language')->where('lang_id',$request->lang_id)->update(['lang_string'=>$request->string,'lang_english'=>$request->english,'lang_burmese'=>$request->burmese,'lang_chinese'=>$request->chinese]);
         if($insert)
         {
+             AppLanguageBundle::forget();
              $notification = array(
                 'messege' => 'Language updated successfully',
                 'alert' => 'success'
@@ -57,6 +59,7 @@ class LanguageController extends Controller
         $insert = DB::table('app_language')->insert(['lang_string'=>$request->string,'lang_english'=>$request->english,'lang_burmese'=>$request->burmese,'lang_chinese'=>$request->chinese]);
         if($insert)
         {
+             AppLanguageBundle::forget();
              $notification = array(
                 'messege' => 'Language store successfully',
                 'alert' => 'success'
@@ -41,7 +41,7 @@ class MaintainanceController extends Controller
     
     public function update_maintainance_settings(Request $request, $ln, $id)
     {
-        $rs = MaintenanceSetting::where('id', $id)->update([
+        $rs = MaintenanceSetting::findOrFail($id)->update([
             'subject' => $request->subject,
             'date' => $request->date,
             'from_time' => $request->from_time,
@@ -54,7 +54,7 @@ class MaintainanceController extends Controller
     
     public function delete_maintainance_settings($ln, $id)
     {
-        $setting = MaintenanceSetting::where('id', $id)->delete();
+        $setting = MaintenanceSetting::findOrFail($id)->delete();
         return redirect()->route('admin.maintainance.setting',app()->getLocale())->with('success', 'Settings Deleted Successfully!');
     }
 }
\ No newline at end of file
@@ -3,6 +3,7 @@
 namespace App\Http\Controllers\Admin;
 
 use App\Http\Controllers\Controller;
+use App\Services\ImagePipeline;
 use Illuminate\Http\Request;
 use App\Models\Language;
 use App\Models\Mediazone;
@@ -51,10 +52,7 @@ class MediaController extends Controller
         $media = new Mediazone();
 
         if($request->hasFile('icon')){
-            $file = $request->file('icon');
-            $extension = $file->getClientOriginalExtension();
-            $icon = time().rand().'.'.$extension;
-            $file->move('assets/front/img/', $icon);
+            $icon = ImagePipeline::store($request->file('icon'));
             $media->icon = $icon;
         }
       
@@ -76,7 +74,7 @@ class MediaController extends Controller
     public function delete($locale, $id){
 
         $media = Mediazone::find($id);
-        @unlink('assets/front/img/'. $media->icon);
+        ImagePipeline::delete($media->icon);
         $media->delete();
 
         return back();
@@ -103,11 +101,10 @@ class MediaController extends Controller
         $media = Mediazone::find($id);
 
         if($request->hasFile('icon')){
-            @unlink('assets/front/img/'. $media->icon);
-            $file = $request->file('icon');
-            $extension = $file->getClientOriginalExtension();
-            $icon = time().rand().'.'.$extension;
-            $file->move('assets/front/img/', $icon);
+            $icon = ImagePipeline::store($request->file('icon'));
+            if ($media->icon !== $icon) {
+                ImagePipeline::delete($media->icon);
+            }
 
             $media->icon = $icon;
         }
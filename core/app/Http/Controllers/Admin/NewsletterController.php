@@ -2,13 +2,11 @@
 
 namespace App\Http\Controllers\Admin;
 
-use App\Models\Emailsetting;
-use App\Models\Setting;
 use App\Models\Language;
 use App\Models\Newsletter;
+use App\Models\NewsletterCampaign;
+use App\Jobs\SendNewsletterBatch;
 use Illuminate\Http\Request;
-use PHPMailer\PHPMailer\Exception;
-use PHPMailer\PHPMailer\PHPMailer;
 use App\Http\Controllers\Controller;
 use Illuminate\Support\Facades\Session;
 
@@ -81,7 +79,8 @@ class NewsletterController extends Controller
 
 
     public function mailsubscriber() {
-        return view('admin.newsletter.mail');
+        $campaigns = NewsletterCampaign::orderBy('id', 'DESC')->limit(10)->get();
+        return view('admin.newsletter.mail', compact('campaigns'));
       }
   
       public function subscsendmail(Request $request) {
@@ -90,65 +89,29 @@ class NewsletterController extends Controller
           'message' => 'required'
         ]);
   
-        $sub = $request->subject;
-        $msg = $request->message;
-  
-        $subscs = Newsletter::all();
-  
-        $be = Emailsetting::first();
-  
-  
-          $mail = new PHPMailer(true);
-  
-   
-
-          if ($be->is_smtp == 1) {
-              try {
-              
-     
-                  $mail->isSMTP();                                            
-                  $mail->Host       = $be->smtp_host;                   
-                  $mail->SMTPAuth   = true;                                   
-                  $mail->Username   = $be->smtp_user;                    
-                  $mail->Password   = $be->smtp_pass;                               
-                  $mail->SMTPSecure = $be->email_encryption;         
-                  $mail->Port       = $be->smtp_port;     
-                 
-                  //Recipients
-                  $mail->setFrom($be->from_email, $be->from_name);
-
-                  foreach ($subscs as $key => $subsc) {
-                      $mail->addAddress($subsc->email);   
-                  }
-                   
-                  
-
-                    
-              } catch (Exception $e) {
-                  // die($e->getMessage());
-              }
-          } else {
-              try {
-  
-                  //Recipients
-                  $mail->setFrom($be->from_email, $be->from_name);
-                  foreach ($subscs as $key => $subsc) {
-                      $mail->addAddress($subsc->email);     // Add a recipient
-                  }
-
-              } catch (Exception $e) {
-                  // die($e->getMessage());
-              }
-          }
-      
-          $mail->isHTML(true);                        
-          $mail->Subject = $sub;
-          $mail->Body    = $msg;
-  
-          $mail->send();
+        $campaign = NewsletterCampaign::create([
+            'subject' => $request->subject,
+            'message' => $request->message,
+            'total'   => Newsletter::count(),
+        ]);
+
+        // One message per subscriber, in throttled batches on the mail queue
+        $batchSize = max(1, (int) config('mail.newsletter.batch_size', 50));
+        $delay = (int) config('mail.newsletter.batch_delay', 60);
+        $batch = 0;
+
+        Newsletter::select('email')->orderBy('id')->chunk($batchSize, function ($subscs) use ($campaign, $delay, &$batch) {
+            SendNewsletterBatch::dispatch($campaign->id, $subscs->pluck('email')->all())
+                ->delay(now()->addSeconds($batch * $delay));
+            $batch++;
+        });
+
+        if ($campaign->total == 0) {
+            $campaign->update(['status' => 'done']);
+        }
 
           $notification = array(
-            'messege' => 'Mail sent successfully!',
+            'messege' => 'Mail queued for '.$campaign->total.' subscribers!',
             'alert' => 'success'
         );
         return redirect()->back()->with('notification', $notification);
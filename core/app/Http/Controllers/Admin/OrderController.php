@@ -10,9 +10,7 @@ use Illuminate\Http\Request;
 use App\Http\Controllers\Controller;
 use App\Models\Package;
 use Barryvdh\DomPDF\Facade\Pdf as PDF;
-use App\Models\Emailsetting;
-use PHPMailer\PHPMailer\PHPMailer;
-use PHPMailer\PHPMailer\Exception;
+use App\Helpers\MailSend;
 use Illuminate\Support\Facades\Auth;
 
 class OrderController extends Controller
@@ -162,56 +160,16 @@ class OrderController extends Controller
         ]);
 
             // Send Mail to Buyer
-        $mail = new PHPMailer(true);
         $user = User::find($request->user_id);
 
-        $em = Emailsetting::first();
-
-        if ($em->is_smtp == 1) {
-            try {
-                $mail->isSMTP();
-                $mail->Host       = $em->smtp_host;
-                $mail->SMTPAuth   = true;
-                $mail->Username   = $em->smtp_user;
-                $mail->Password   = $em->smtp_pass;
-                $mail->SMTPSecure = $em->email_encryption;
-                $mail->Port       = $em->smtp_port;
-
-                //Recipients
-                $mail->setFrom($em->from_email, $em->from_name);
-                $mail->addAddress($user->email, $user->name);
-
-                // Attachments
-                $mail->addAttachment('assets/front/invoices/bill/' . $fileName);
-
-                // Content
-                $mail->isHTML(true);
-                $mail->Subject = "Bill Paid";
-                $mail->Body    = 'Hello <strong>' . $user->name . '</strong>,<br/>Your bill was paid successfully. We have attached an invoice in this mail.<br/>Thank you.';
-
-                $mail->send();
-            } catch (Exception $e) {
-                // die($e->getMessage());
-            }
-        } else {
-            try {
-                //Recipients
-                $mail->setFrom($em->from_mail, $em->from_name);
-                $mail->addAddress($user->email, $user->name);
-
-                // Attachments
-                $mail->addAttachment('assets/front/invoices/bill/' . $fileName);
-
-                // Content
-                $mail->isHTML(true);
-                $mail->Subject = "Bill Paid";
-                $mail->Body    = 'Hello <strong>' . $user->name . '</strong>,<br/>Your bill was paid successfully. We have attached an invoice in this mail.<br/>Thank you.';
-
-                $mail->send();
-            } catch (Exception $e) {
-                // die($e->getMessage());
-            }
-        }
+
+        MailSend::queue([
+            'to'      => $user->email,
+            'name'    => $user->name,
+            'subject' => "Bill Paid",
+            'body'    => 'Hello <strong>' . $user->name . '</strong>,<br/>Your bill was paid successfully. We have attached an invoice in this mail.<br/>Thank you.',
+            'attachments' => ['assets/front/invoices/bill/' . $fileName],
+        ]);
 
 
         $notification = array(
@@ -7,6 +7,7 @@ use Illuminate\Http\Request;
 use App\Models\Package;
 use App\Models\Sectiontitle;
 use App\Models\Language;
+use App\Services\PackageOfferMatrix;
 use Session;
 
 class PackagController extends Controller
@@ -45,6 +46,7 @@ class PackagController extends Controller
         ]);
 
         Package::create($request->all());
+        PackageOfferMatrix::forget();
 
         $notification = array(
             'messege' => 'Package Added successfully!',
@@ -58,6 +60,7 @@ class PackagController extends Controller
 
         $Package = Package::find($id);
         $Package->delete();
+        PackageOfferMatrix::forget();
         $notification = array(
             'messege' => 'Package Delete successfully!',
             'alert' => 'success'
@@ -86,7 +89,8 @@ class PackagController extends Controller
             'status' => 'required|max:150',
         ]);
 
-        $package = Package::where('id',$request->package_id)->update([
+        $package = Package::findOrFail($request->package_id);
+        $package->update([
             'name'          =>$request->name,
             'time'          =>$request->time,
             'feature'       =>$request->feature,
@@ -95,6 +99,7 @@ class PackagController extends Controller
             'extra_days'    => $request->extra_days,
             'billing_package_id' => $request->bill_package_id,
             ]);
+        PackageOfferMatrix::forget();
         
         $notification = array(
             'messege' => 'Package Updated successfully!',
@@ -7,8 +7,7 @@ use App\Models\Emailsetting;
 use App\Models\ProductOrder;
 use Illuminate\Http\Request;
 use App\Helpers\Helper;
-use PHPMailer\PHPMailer\Exception;
-use PHPMailer\PHPMailer\PHPMailer;
+use App\Helpers\MailSend;
 use App\Http\Controllers\Controller;
 use Illuminate\Support\Facades\Config;
 use Illuminate\Support\Facades\Session;
@@ -61,49 +60,14 @@ class ProductOrderController extends Controller
         $em = Emailsetting::first();
         $sub = 'Order Status Update';
          // Send Mail to Buyer
-         $mail = new PHPMailer(true);
 
       
-         if ($em->is_smtp == 1) {
-             try {
-                $mail->isSMTP();
-                $mail->Host       = $em->smtp_host;
-                $mail->SMTPAuth   = true;
-                $mail->Username   = $em->smtp_user;
-                $mail->Password   = $em->smtp_pass;
-                $mail->SMTPSecure = $em->email_encryption;
-                $mail->Port       = $em->smtp_port;
-
-                 //Recipients
-                 $mail->setFrom($em->from_email, $em->from_name);
-                 $mail->addAddress($user->email, $user->name);
-
-                 // Content
-                 $mail->isHTML(true);
-                 $mail->Subject = $sub;
-                 $mail->Body    = 'Hello <strong>' . $user->name . '</strong>,<br/>Your order status is '.$request->order_status.'.<br/>Thank you.';
-                 $mail->send();
-             } catch (Exception $e) {
-                 // die($e->getMessage());
-             }
-         } else {
-             try {
-
-                 //Recipients
-                 $mail->setFrom($em->from_mail, $em->from_name);
-                 $mail->addAddress($user->email, $user->name);
-
-
-                 // Content
-                 $mail->isHTML(true);
-                 $mail->Subject = $sub ;
-                 $mail->Body    = 'Hello <strong>' . $user->name . '</strong>,<br/>Your order status is '.$request->order_status.'.<br/>Thank you.';
-
-                 $mail->send();
-             } catch (Exception $e) {
-                 // die($e->getMessage());
-             }
-         }
+         MailSend::queue([
+             'to'      => $user->email,
+             'name'    => $user->name,
+             'subject' => $sub,
+             'body'    => 'Hello <strong>' . $user->name . '</strong>,<br/>Your order status is '.$request->order_status.'.<br/>Thank you.',
+         ]);
 
          $notification = array(
             'messege' => 'Order status changed successfully!',
@@ -9,6 +9,7 @@ use Illuminate\Http\Request;
 use Mews\Purifier\Facades\Purifier;
 use App\Http\Controllers\Controller;
 use App\Models\ExtraMonth;
+use App\Services\PackageOfferMatrix;
 
 class PromotionController extends Controller
 {
@@ -47,6 +48,7 @@ class PromotionController extends Controller
         $promotion->extra_month = $request->extra_month;
         $promotion->extra_days = $request->extra_days;
         $promotion->save();
+        PackageOfferMatrix::forget();
        
         $notification = array(
             'messege' => 'Promotion Added successfully!',
@@ -59,6 +61,7 @@ class PromotionController extends Controller
     {
         $promotion = Promotion::find($id);
         $promotion->delete();
+        PackageOfferMatrix::forget();
         
         $notification = array(
             'messege' => 'Promotion Deleted successfully!',
@@ -92,6 +95,7 @@ class PromotionController extends Controller
         $promotion->extra_month = $request->extra_month;
         $promotion->extra_days = $request->extra_days;
         $promotion->save();
+        PackageOfferMatrix::forget();
 
         $notification = array(
             'messege' => 'Promotion Updated successfully!',
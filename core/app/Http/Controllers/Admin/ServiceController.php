@@ -11,6 +11,7 @@ use Illuminate\Support\Str;
 use Illuminate\Http\Request;
 use Mews\Purifier\Facades\Purifier;
 use App\Http\Controllers\Controller;
+use App\Services\ImagePipeline;
 
 class ServiceController extends Controller
 {
@@ -70,19 +71,13 @@ class ServiceController extends Controller
         $service = new Service();
 
         if($request->hasFile('icon')){
-            $file = $request->file('icon');
-            $extension = $file->getClientOriginalExtension();
-            $icon = time().rand().'.'.$extension;
-            $file->move('assets/front/img/', $icon);
+            $icon = ImagePipeline::store($request->file('icon'));
 
             $service->icon = $icon;
         }
 
         if($request->hasFile('image')){
-            $file = $request->file('image');
-            $extension = $file->getClientOriginalExtension();
-            $image = time().rand().'.'.$extension;
-            $file->move('assets/front/img/', $image);
+            $image = ImagePipeline::store($request->file('image'));
 
             $service->image = $image;
         }
@@ -106,7 +101,8 @@ class ServiceController extends Controller
     public function delete($locale, $id){
 
         $service = Service::find($id);
-        @unlink('assets/front/img/'. $service->icon);
+        ImagePipeline::delete($service->icon);
+        ImagePipeline::delete($service->image);
         $service->delete();
 
         return back();
@@ -148,21 +144,19 @@ class ServiceController extends Controller
         ]);
 
         if($request->hasFile('icon')){
-            @unlink('assets/front/img/'. $service->icon);
-            $file = $request->file('icon');
-            $extension = $file->getClientOriginalExtension();
-            $icon = time().rand().'.'.$extension;
-            $file->move('assets/front/img/', $icon);
+            $icon = ImagePipeline::store($request->file('icon'));
+            if ($service->icon !== $icon) {
+                ImagePipeline::delete($service->icon);
+            }
 
             $service->icon = $icon;
         }
 
         if($request->hasFile('image')){
-            @unlink('assets/front/img/'. $service->image);
-            $file = $request->file('image');
-            $extension = $file->getClientOriginalExtension();
-            $image = time().rand().'.'.$extension;
-            $file->move('assets/front/img/', $image);
+            $image = ImagePipeline::store($request->file('image'));
+            if ($service->image !== $image) {
+                ImagePipeline::delete($service->image);
+            }
 
             $service->image = $image;
         }
@@ -3,6 +3,7 @@
 namespace App\Http\Controllers\Admin;
 
 use App\Http\Controllers\Controller;
+use App\Services\ImagePipeline;
 use App\Models\Language;
 use Illuminate\Http\Request;
 use App\Models\Slider;
@@ -49,10 +50,7 @@ class SliderController extends Controller
 
         $slider = new Slider();
         if($request->hasFile('image')){
-            $file = $request->file('image');
-            $extension = $file->getClientOriginalExtension();
-            $image = time().rand().'.'.$extension;
-            $file->move('assets/front/img/', $image);
+            $image = ImagePipeline::store($request->file('image'));
 
             $slider->image = $image;
         }
@@ -75,7 +73,7 @@ class SliderController extends Controller
     public function delete($locale, $id){
 
         $slider = Slider::find($id);
-        @unlink('assets/front/img/'. $slider->image);
+        ImagePipeline::delete($slider->image);
         $slider->delete();
 
         return back();
@@ -104,11 +102,10 @@ class SliderController extends Controller
         $slider = Slider::find($id);
 
         if($request->hasFile('image')){
-            @unlink('assets/front/img/'. $slider->image);
-            $file = $request->file('image');
-            $extension = $file->getClientOriginalExtension();
-            $image = time().rand().'.'.$extension;
-            $file->move('assets/front/img/', $image);
+            $image = ImagePipeline::store($request->file('image'));
+            if ($slider->image !== $image) {
+                ImagePipeline::delete($slider->image);
+            }
 
             $slider->image = $image;
         }
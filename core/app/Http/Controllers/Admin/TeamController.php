@@ -6,6 +6,7 @@ use App\Models\Team;
 use App\Models\Language;
 use Illuminate\Http\Request;
 use App\Http\Controllers\Controller;
+use App\Services\ImagePipeline;
 use Illuminate\Support\Facades\Session;
 
 class TeamController extends Controller
@@ -50,10 +51,7 @@ class TeamController extends Controller
 
         if($request->hasFile('image')){
 
-            $file = $request->file('image');
-            $extension = $file->getClientOriginalExtension();
-            $image = time().rand().'.'.$extension;
-            $file->move('assets/front/img/', $image);
+            $image = ImagePipeline::store($request->file('image'));
 
             $team->image = $image;
         }
@@ -101,7 +99,7 @@ class TeamController extends Controller
     public function delete($locale, $id){
 
         $team = Team::find($id);
-        @unlink('assets/front/img/'. $team->image);
+        ImagePipeline::delete($team->image);
         $team->delete();
         
         return back();
@@ -127,12 +125,10 @@ class TeamController extends Controller
         $team = Team::findOrFail($id);
 
         if($request->hasFile('image')){
-            @unlink('assets/front/img/'. $team->image);
-            
-            $file = $request->file('image');
-            $extension = $file->getClientOriginalExtension();
-            $image = time().rand().'.'.$extension;
-            $file->move('assets/front/img/', $image);
+            $image = ImagePipeline::store($request->file('image'));
+            if ($team->image !== $image) {
+                ImagePipeline::delete($team->image);
+            }
 
             $team->image = $image;
         }
@@ -29,12 +29,11 @@ use App\Http\Controllers\Controller;
 use App\Models\Product;
 use App\Models\Testimonial;
 use Illuminate\Support\Facades\Auth;
-use PHPMailer\PHPMailer\Exception;
-use PHPMailer\PHPMailer\PHPMailer;
 use App\Models\PaymentNew;
 use App\Models\Setting;
 use App\Models\User;
 use App\Models\PendingPayment;
+use App\Services\InvoiceRenderer;
 
 class FrontendController extends Controller
 {
@@ -255,48 +254,15 @@ class FrontendController extends Controller
         $name = $request->name;
         $fromemail = $request->email;
         $number = $request->phone;
-        $mail = new PHPMailer(true);
         $em = Emailsetting::first();
-        if ($em->is_smtp == 1) {
-            try {
-                $mail->isSMTP();
-                $mail->Host       = $em->smtp_host;
-                $mail->SMTPAuth   = true;
-                $mail->Username   = $em->smtp_user;
-                $mail->Password   = $em->smtp_pass;
-                $mail->SMTPSecure = $em->email_encryption;
-                $mail->Port       = $em->smtp_port;
-
-                //Recipients
-                $mail->setFrom($fromemail, $name);
-                $mail->addAddress($em->from_email, $em->from_name);
-
-                // Content
-                $mail->isHTML(true);
-                $mail->Subject = "User message from contact page";
-                $mail->Body    = "Name: ".$name."</br>Email: ".$fromemail."</br>Phone: ".$number."</br>Message: ".$request->message;
-
-                $mail->send();
-            } catch (Exception $e) {
-                // die($e->getMessage());
-            }
-        } else {
-            try {
-                //Recipients
-                $mail->setFrom($fromemail, $name);
-                $mail->addAddress($em->from_email, $em->from_name);
-
-
-                // Content
-                $mail->isHTML(true);
-                $mail->Subject = "User message from contact page";
-                $mail->Body    = "Name: ".$name."</br>Email: ".$fromemail."</br>Phone: ".$number."</br>Message: ".$request->message;
-
-                $mail->send();
-            } catch (Exception $e) {
-                // die($e->getMessage());
-            }
-        }
+        MailSend::queue([
+            'to'      => $em->from_email,
+            'name'    => $em->from_name,
+            'reply_to'      => $fromemail,
+            'reply_to_name' => $name,
+            'subject' => "User message from contact page",
+            'body'    => "Name: ".$name."</br>Email: ".$fromemail."</br>Phone: ".$number."</br>Message: ".$request->message,
+        ]);
 
 
          $notification = array(
@@ -352,18 +318,17 @@ class FrontendController extends Controller
         $term = $request->term;
         $month = $request->month;
         $year = $request->year;
-        $bcategories = Bcategory::where('status', 1)->where('language_id', $currlang->id)->orderBy('id', 'DESC')->get();
+        $bcategories = Bcategory::withCachedCounts($currlang->id);
 
         $latestblogs = Blog::where('status', 1)->where('language_id', $currlang->id)->orderBy('id', 'DESC')->limit(4)->get();
 
+        // Keyset pagination on id, so deep pages cost the same as the first
         $blogs = Blog::where('status', 1)->where('language_id', $currlang->id)
                         ->when($catid, function ($query, $catid) {
                             return $query->where('bcategory_id', $catid);
                         })
-                        ->when($term, function ($query, $term) {
-                            return $query->where('title', 'like', '%'.$term.'%');
-                        })
-                        ->orderBy('id', 'DESC')->paginate(6);
+                        ->search($term)
+                        ->orderBy('id', 'DESC')->cursorPaginate(6);
 
         return view('front.blogs', compact('blogs', 'bcategories', 'latestblogs'));
     }
@@ -379,7 +344,7 @@ class FrontendController extends Controller
 
         $blog = Blog::where('slug', $slug)->where('language_id', $currlang->id)->firstOrFail();
         $latestblogs = Blog::where('status', 1)->where('language_id', $currlang->id)->orderBy('id', 'DESC')->limit(4)->get();
-        $bcategories = Bcategory::where('status', 1)->where('language_id', $currlang->id)->orderBy('id', 'DESC')->get();
+        $bcategories = Bcategory::withCachedCounts($currlang->id);
        
         return view('front.blogdetails', compact('blog', 'bcategories', 'latestblogs'));
     }
@@ -454,93 +419,17 @@ class FrontendController extends Controller
     
     public function invoice($id)
     {
-        $payment = PaymentNew::where('id', $id)->first();
-        $pending_pay = PendingPayment::where('number', $payment->invoice_no)->first();
-        $settings = Setting::where('id', '1')->first();
-        
-        $url = $settings->ip_address."api/v1/auth/get-access-token"; 
-        $headerArray =array("Content-type:application/json","Accept:application/json");
-        $ch = curl_init();
-        curl_setopt($ch, CURLOPT_URL, $url);
-        curl_setopt($ch, CURLOPT_POST, 0); 
-        curl_setopt($ch, CURLOPT_SSL_VERIFYPEER, FALSE); 
-        curl_setopt($ch, CURLOPT_SSL_VERIFYHOST, FALSE); 
-        curl_setopt($ch, CURLOPT_RETURNTRANSFER, 1);
-        curl_setopt($ch,CURLOPT_HTTPHEADER,$headerArray);
-        curl_setopt($ch, CURLOPT_TIMEOUT, 15*60);
-        $output = curl_exec($ch);
-        if ($output === false)
-        {
-            echo 'Curl error: ' . curl_error($ch);
+        // Rendered once per payment; later views go straight to the stored file
+        try {
+            $invoice = InvoiceRenderer::forPayment($id);
+        } catch (\Illuminate\Database\Eloquent\ModelNotFoundException $e) {
+            abort(404);
+        } catch (\Exception $e) {
+            \Log::error('Invoice render failed for payment ' . $id . ': ' . $e->getMessage());
+            abort(503);
         }
-        else
-        {
-            echo PHP_EOL;  
-            echo "\n";
-            $decode_token = json_decode($output,true);
-            $access_token = $decode_token['data']['access_token'];
-        };
-        curl_close($ch);
-        
-        $user_name    = $payment->payment_user_name;
-        $data         = "access_token={$access_token}&user_name={$user_name}";
-        $Currurl             = "api/v1/user/view?".$data; 
-        $mainUrl = $settings->ip_address.$Currurl;
-        $headerArray =array("Content-type:application/json","Accept:application/json");
-        $ch = curl_init();
-        curl_setopt($ch, CURLOPT_URL, $mainUrl);
-        curl_setopt($ch, CURLOPT_POST, 0); 
-        curl_setopt($ch, CURLOPT_SSL_VERIFYPEER, FALSE); 
-        curl_setopt($ch, CURLOPT_SSL_VERIFYHOST, FALSE); 
-        curl_setopt($ch, CURLOPT_RETURNTRANSFER, 1);
-        curl_setopt($ch,CURLOPT_HTTPHEADER,$headerArray);
-        curl_setopt($ch, CURLOPT_TIMEOUT, 1000);
-        $result = curl_exec($ch);
-        curl_close($ch);
-    
-        $CurrDecode = json_decode($result,true);
-        
-        if(!empty($CurrDecode['data']['Installation_cost'])){
-            if($CurrDecode['data']['Installation_cost'] == 'FREE'){
-                $installation_cost = 0;
-            }elseif($CurrDecode['data']['Installation_cost'] == 'Free'){
-                $installation_cost = 0;
-            }else{
-                $installation_cost = $CurrDecode['data']['Installation_cost'];
-            }
-        }else{
-            if($CurrDecode['data']['Installation_cost'] == '0'){
-                $installation_cost = $CurrDecode['data']['Installation_cost'];
-            }else{
-                $installation_cost = '0';
-            }
-        }
-        
-        $user = $CurrDecode['data'];
-        
-        $Currurl1          = "api/v1/package/users-packages?".$data;  
-        $mainUrl = $settings->ip_address.$Currurl1;
-        $ch = curl_init();
-        curl_setopt($ch, CURLOPT_URL, $mainUrl);
-        curl_setopt($ch, CURLOPT_POST, 0); 
-        curl_setopt($ch, CURLOPT_SSL_VERIFYPEER, FALSE); 
-        curl_setopt($ch, CURLOPT_SSL_VERIFYHOST, FALSE); 
-        curl_setopt($ch, CURLOPT_RETURNTRANSFER, 1);
-        curl_setopt($ch,CURLOPT_HTTPHEADER,$headerArray);
-        curl_setopt($ch, CURLOPT_TIMEOUT, 1000);
-        $result1 = curl_exec($ch);
-        curl_close($ch);
-    
-        $CurrDecode1 = json_decode($result1,true);
-        
-        $payment_rec = $CurrDecode1['data'][0];
-        
-        $amount4 = $pending_pay->amount - $pending_pay->installation_cost;
-        $amount5 = number_format($amount4 * (1 + $pending_pay->commercial_tax/100), 0, '.', '');
-        $amount6 = number_format($amount5 * (1 + $pending_pay->discount/100), 0, '.', '');
-        $act_months = number_format($amount6/$payment_rec['checkout_amount'], 0, '.', '');
-        
-        return view('front.invoice', compact('payment', 'installation_cost', 'user', 'payment_rec', 'pending_pay', 'act_months'));
+
+        return redirect($invoice->htmlUrl());
     }
 
 }
\ No newline at end of file
@@ -8,11 +8,9 @@ use App\Models\Package;
 use Illuminate\Http\Request;
 use App\Http\Controllers\Controller;
 use App\Models\Packageorder;
-use PHPMailer\PHPMailer\PHPMailer;
-use PHPMailer\PHPMailer\Exception;
+use App\Helpers\MailSend;
 use Illuminate\Support\Str;
 use Barryvdh\DomPDF\Facade\Pdf as PDF;
-use App\Models\Emailsetting;
 use Carbon\Carbon;
 use App\Models\PaymentGatewey;
 use App\Models\Setting;
@@ -225,56 +223,16 @@ class PaypalController extends Controller
             ]);
 
                 // Send Mail to Buyer
-            $mail = new PHPMailer(true);
             $user = Auth::user();
 
-            $em = Emailsetting::first();
-
-            if ($em->is_smtp == 1) {
-                try {
-                    $mail->isSMTP();
-                    $mail->Host       = $em->smtp_host;
-                    $mail->SMTPAuth   = true;
-                    $mail->Username   = $em->smtp_user;
-                    $mail->Password   = $em->smtp_pass;
-                    $mail->SMTPSecure = $em->email_encryption;
-                    $mail->Port       = $em->smtp_port;
-
-                    //Recipients
-                    $mail->setFrom($em->from_email, $em->from_name);
-                    $mail->addAddress($user->email, $user->name);
-
-                    // Attachments
-                    $mail->addAttachment('assets/front/invoices/package/' . $fileName);
-
-                    // Content
-                    $mail->isHTML(true);
-                    $mail->Subject = "Order placed for Package";
-                    $mail->Body    = 'Hello <strong>' . $user->name . '</strong>,<br/>Your bill was paid successfully. We have attached an invoice in this mail.<br/>Thank you.';
-
-                    $mail->send();
-                } catch (Exception $e) {
-                    // die($e->getMessage());
-                }
-            } else {
-                try {
-                    //Recipients
-                    $mail->setFrom($em->from_mail, $em->from_name);
-                    $mail->addAddress($user->email, $user->name);
-
-                    // Attachments
-                    $mail->addAttachment('assets/front/invoices/package/' . $fileName);
-
-                    // Content
-                    $mail->isHTML(true);
-                    $mail->Subject = "Order placed for Package";
-                    $mail->Body    = 'Hello <strong>' . $user->name . '</strong>,<br/>Your bill was paid successfully. We have attached an invoice in this mail.<br/>Thank you.';
-
-                    $mail->send();
-                } catch (Exception $e) {
-                    // die($e->getMessage());
-                }
-            }
+
+            MailSend::queue([
+                'to'      => $user->email,
+                'name'    => $user->name,
+                'subject' => "Order placed for Package",
+                'body'    => 'Hello <strong>' . $user->name . '</strong>,<br/>Your bill was paid successfully. We have attached an invoice in this mail.<br/>Thank you.',
+                'attachments' => ['assets/front/invoices/package/' . $fileName],
+            ]);
 
             return view('front.success.package');
         }
@@ -6,15 +6,13 @@ use App\Models\User;
 use App\Models\Package;
 use App\Models\Billpaid;
 use Carbon\Carbon;
-use App\Models\Emailsetting;
 use App\Models\Packageorder;
 use App\Helpers\Helper;
 use App\Models\PaymentGatewey;
 use Barryvdh\DomPDF\Facade\Pdf as PDF;
 use Illuminate\Support\Str;
 use Illuminate\Http\Request;
-use PHPMailer\PHPMailer\Exception;
-use PHPMailer\PHPMailer\PHPMailer;
+use App\Helpers\MailSend;
 use App\Http\Controllers\Controller;
 use Illuminate\Support\Facades\Auth;
 use Illuminate\Support\Facades\Config;
@@ -141,56 +139,16 @@ class StripeController extends Controller
                     ]);
 
                         // Send Mail to Buyer
-                    $mail = new PHPMailer(true);
                     $user = Auth::user();
 
-                    $em = Emailsetting::first();
-
-                    if ($em->is_smtp == 1) {
-                        try {
-                            $mail->isSMTP();
-                            $mail->Host       = $em->smtp_host;
-                            $mail->SMTPAuth   = true;
-                            $mail->Username   = $em->smtp_user;
-                            $mail->Password   = $em->smtp_pass;
-                            $mail->SMTPSecure = $em->email_encryption;
-                            $mail->Port       = $em->smtp_port;
-        
-                            //Recipients
-                            $mail->setFrom($em->from_email, $em->from_name);
-                            $mail->addAddress($user->email, $user->name);
-        
-                            // Attachments
-                            $mail->addAttachment('assets/front/invoices/package/' . $fileName);
-        
-                            // Content
-                            $mail->isHTML(true);
-                            $mail->Subject = "Order placed for Package";
-                            $mail->Body    = 'Hello <strong>' . $user->name . '</strong>,<br/>Your bill was paid successfully. We have attached an invoice in this mail.<br/>Thank you.';
-        
-                            $mail->send();
-                        } catch (Exception $e) {
-                            // die($e->getMessage());
-                        }
-                    } else {
-                        try {
-                            //Recipients
-                            $mail->setFrom($em->from_mail, $em->from_name);
-                            $mail->addAddress($user->email, $user->name);
-        
-                            // Attachments
-                            $mail->addAttachment('assets/front/invoices/package/' . $fileName);
-        
-                            // Content
-                            $mail->isHTML(true);
-                            $mail->Subject = "Order placed for Package";
-                            $mail->Body    = 'Hello <strong>' . $user->name . '</strong>,<br/>Your bill was paid successfully. We have attached an invoice in this mail.<br/>Thank you.';
-        
-                            $mail->send();
-                        } catch (Exception $e) {
-                            // die($e->getMessage());
-                        }
-                    }
+
+                    MailSend::queue([
+                        'to'      => $user->email,
+                        'name'    => $user->name,
+                        'subject' => "Order placed for Package",
+                        'body'    => 'Hello <strong>' . $user->name . '</strong>,<br/>Your bill was paid successfully. We have attached an invoice in this mail.<br/>Thank you.',
+                        'attachments' => ['assets/front/invoices/package/' . $fileName],
+                    ]);
 
                     return view('front.success.package');
                     
@@ -208,12 +166,6 @@ class StripeController extends Controller
                     'alert' => 'warning'
                 );
                 return redirect()->back()->with('notification', $notification);
-            }catch (Exception $e){
-                $notification = array(
-                    'messege' => $e->getMessage(),
-                    'alert' => 'warning'
-                );
-                return redirect()->back()->with('notification', $notification);
             }
         $notification = array(
             'messege' => 'Please Enter Valid Credit Card Informations.',
@@ -7,7 +7,6 @@ use App\Models\Language;
 use App\Models\Shipping;
 use App\Models\OrderItem;
 use PayPal\Api\Item;
-use App\Models\Emailsetting;
 use App\Models\ProductOrder;
 use PayPal\Api\Payer;
 use PayPal\Api\Amount;
@@ -22,8 +21,7 @@ use PayPal\Api\RedirectUrls;
 use Illuminate\Support\Carbon;
 use PayPal\Api\PaymentExecution;
 use Barryvdh\DomPDF\Facade\Pdf as PDF;
-use PHPMailer\PHPMailer\Exception;
-use PHPMailer\PHPMailer\PHPMailer;
+use App\Helpers\MailSend;
 use App\Http\Controllers\Controller;
 use Illuminate\Support\Facades\Auth;
 use PayPal\Auth\OAuthTokenCredential;
@@ -351,58 +349,16 @@ class PaypalController extends Controller
             ]);
 
             // Send Mail to Buyer
-            $mail = new PHPMailer(true);
             $user = Auth::user();
 
-            $em = Emailsetting::first();
 
-            if ($em->is_smtp == 1) {
-                try {
-
-                    $mail->isSMTP();
-                    $mail->Host       = $em->smtp_host;
-                    $mail->SMTPAuth   = true;
-                    $mail->Username   = $em->smtp_user;
-                    $mail->Password   = $em->smtp_pass;
-                    $mail->SMTPSecure = $em->email_encryption;
-                    $mail->Port       = $em->smtp_port;
-
-                    //Recipients
-                    $mail->setFrom($em->from_email, $em->from_name);
-                    $mail->addAddress($user->email, $user->name);
-
-                    // Attachments
-                    $mail->addAttachment('assets/front/invoices/product/' . $fileName);
-
-                    // Content
-                    $mail->isHTML(true);
-                    $mail->Subject = "Order placed for Product";
-                    $mail->Body    = 'Hello <strong>' . $user->name . '</strong>,<br/>Your order has been placed successfully. We have attached an invoice in this mail.<br/>Thank you.';
-
-                    $mail->send();
-                } catch (Exception $e) {
-                    // die($e->getMessage());
-                }
-            } else {
-                try {
-
-                    //Recipients
-                    $mail->setFrom($em->from_mail, $em->from_name);
-                    $mail->addAddress($user->email, $user->name);
-
-                    // Attachments
-                    $mail->addAttachment('assets/front/invoices/product/' . $fileName);
-
-                    // Content
-                    $mail->isHTML(true);
-                    $mail->Subject = "Order placed for Product";
-                    $mail->Body    = 'Hello <strong>' . $user->name . '</strong>,<br/>Your order has been placed successfully. We have attached an invoice in this mail.<br/>Thank you.';
-
-                    $mail->send();
-                } catch (Exception $e) {
-                    // die($e->getMessage());
-                }
-            }
+            MailSend::queue([
+                'to'      => $user->email,
+                'name'    => $user->name,
+                'subject' => "Order placed for Product",
+                'body'    => 'Hello <strong>' . $user->name . '</strong>,<br/>Your order has been placed successfully. We have attached an invoice in this mail.<br/>Thank you.',
+                'attachments' => ['assets/front/invoices/product/' . $fileName],
+            ]);
 
 
             Session::forget('paypal_data');
@@ -7,15 +7,13 @@ use App\Models\Product;
 use App\Models\Shipping;
 use App\Models\OrderItem;
 use Carbon\Carbon;
-use App\Models\Emailsetting;
 use App\Models\ProductOrder;
 use App\Helpers\Helper;
 use App\Models\PaymentGatewey;
 use Illuminate\Support\Str;
 use Illuminate\Http\Request;
 use Barryvdh\DomPDF\Facade\Pdf as PDF;
-use PHPMailer\PHPMailer\Exception;
-use PHPMailer\PHPMailer\PHPMailer;
+use App\Helpers\MailSend;
 use App\Http\Controllers\Controller;
 use Illuminate\Support\Facades\Auth;
 use Illuminate\Support\Facades\Config;
@@ -230,56 +228,16 @@ class StripeController extends Controller
 
 
                 // Send Mail to Buyer
-                $mail = new PHPMailer(true);
                 $user = Auth::user();
 
-                $em = Emailsetting::first();
-
-                if ($em->is_smtp == 1) {
-                    try {
-                        $mail->isSMTP();
-                        $mail->Host       = $em->smtp_host;
-                        $mail->SMTPAuth   = true;
-                        $mail->Username   = $em->smtp_user;
-                        $mail->Password   = $em->smtp_pass;
-                        $mail->SMTPSecure = $em->email_encryption;
-                        $mail->Port       = $em->smtp_port;
-    
-                        //Recipients
-                        $mail->setFrom($em->from_email, $em->from_name);
-                        $mail->addAddress($user->email, $user->name);
-    
-                        // Attachments
-                        $mail->addAttachment('assets/front/invoices/product/' . $fileName);
-    
-                        // Content
-                        $mail->isHTML(true);
-                        $mail->Subject = "Order placed for Product";
-                        $mail->Body    = 'Hello <strong>' . $user->name . '</strong>,<br/>Your order has been placed successfully. We have attached an invoice in this mail.<br/>Thank you.';
-    
-                        $mail->send();
-                    } catch (Exception $e) {
-                        // die($e->getMessage());
-                    }
-                } else {
-                    try {
-                        //Recipients
-                        $mail->setFrom($em->from_mail, $em->from_name);
-                        $mail->addAddress($user->email, $user->name);
-    
-                        // Attachments
-                        $mail->addAttachment('assets/front/invoices/product/' . $fileName);
-    
-                        // Content
-                        $mail->isHTML(true);
-                        $mail->Subject = "Order placed for Product";
-                        $mail->Body    = 'Hello <strong>' . $user->name . '</strong>,<br/>Your order has been placed successfully. We have attached an invoice in this mail.<br/>Thank you.';
-    
-                        $mail->send();
-                    } catch (Exception $e) {
-                        // die($e->getMessage());
-                    }
-                }
+
+                MailSend::queue([
+                    'to'      => $user->email,
+                    'name'    => $user->name,
+                    'subject' => "Order placed for Product",
+                    'body'    => 'Hello <strong>' . $user->name . '</strong>,<br/>Your order has been placed successfully. We have attached an invoice in this mail.<br/>Thank you.',
+                    'attachments' => ['assets/front/invoices/product/' . $fileName],
+                ]);
 
                 Session::forget('cart');
 
@@ -297,12 +255,6 @@ class StripeController extends Controller
                 'alert' => 'warning'
             );
             return redirect()->back()->with('notification', $notification);
-        } catch (Exception $e) {
-            $notification = array(
-                'messege' => 'Please Enter Valid Credit Card Informations.',
-                'alert' => 'warning'
-            );
-            return redirect()->back()->with('notification', $notification);
         }
 
         // return back()->with('unsuccess', 'Please Enter Valid Credit Card Informations.');
@@ -66,5 +66,6 @@ class Kernel extends HttpKernel
         'setlang' => \App\Http\Middleware\SetLangMiddleware::class,
         'setlocale' => \App\Http\Middleware\SetLocale::class,
         'api.limit' => \App\Http\Middleware\ApiRateLimiter::class,
+        'page.cache' => \App\Http\Middleware\CacheResponse::class,
     ];
 }
\ No newline at end of file
@@ -2,13 +2,18 @@
 
 namespace App\Http\Middleware;
 
+use App\Services\RateLimit\Limiter;
 use Closure;
 use Illuminate\Http\Request;
-use Illuminate\Support\Facades\Cache;
 use Illuminate\Support\Facades\Log;
 
 class ApiRateLimiter
 {
+    /**
+     * Counter of the shared MBT outbound budget.
+     */
+    const MBT_BUDGET_KEY = 'rate_limit:mbt:global';
+
     /**
      * Rate limit configurations for different endpoint types.
      * Format: [max_attempts, decay_minutes]
@@ -27,67 +32,157 @@ class ApiRateLimiter
             'default' => [60, 1],        // 60 requests per minute
             'write' => [30, 1],          // 30 write operations per minute
             'read' => [120, 1],          // 120 read operations per minute
+            // mbt: config('ratelimit.mbt_client_limit') cost units per client per minute
         ],
     ];
 
+    /**
+     * Cost weights for the legacy routes that proxy to the MBT billing
+     * server, roughly the number of MBT calls one hit fans out into.
+     * Routes not listed here cost 1.
+     */
+    protected $mbtCosts = [
+        'get-self-profile' => 3,
+        'get-payment-record' => 3,
+        'check-payment' => 3,
+        'bind-user' => 3,
+        'update-payment' => 3,
+        'get-new-package' => 2,
+        'get-new-package-information' => 2,
+        'get-new-package-message' => 2,
+        'get-package-information' => 2,
+        'get-payment-failed-record' => 2,
+        'user-super-search' => 2,
+        'check-user' => 2,
+        'check-new-user' => 2,
+        'check-expire-time' => 2,
+        'mbt-kbz-pay-check' => 2,
+    ];
+
+    /**
+     * Legacy MBT routes that are never shed or throttled.
+     */
+    protected $mbtUnshed = [
+        'update-payment',
+    ];
+
+    /**
+     * The limiter backend.
+     *
+     * @var \App\Services\RateLimit\Limiter
+     */
+    protected $limiter;
+
+    /**
+     * Create a new middleware instance.
+     *
+     * @param  \App\Services\RateLimit\Limiter  $limiter
+     */
+    public function __construct(Limiter $limiter)
+    {
+        $this->limiter = $limiter;
+    }
+
     /**
      * Handle an incoming request.
      *
      * @param  \Illuminate\Http\Request  $request
      * @param  \Closure  $next
-     * @param  string  $type  Rate limit type: auth, api, write, read
+     * @param  string  $type  Rate limit type: auth, api, write, read, mbt
      * @return mixed
      */
     public function handle(Request $request, Closure $next, string $type = 'default')
     {
         $key = $this->resolveRequestSignature($request, $type);
-        $limits = $this->getLimits($request, $type);
-        
-        $maxAttempts = $limits[0];
-        $decayMinutes = $limits[1];
-        
-        $currentAttempts = Cache::get($key, 0);
-        
-        if ($currentAttempts >= $maxAttempts) {
-            $retryAfter = Cache::get($key . ':timer', 0) - time();
-            $retryAfter = max($retryAfter, 1);
-            
-            Log::warning('Rate limit exceeded', [
-                'ip' => $request->ip(),
-                'path' => $request->path(),
-                'type' => $type,
-                'attempts' => $currentAttempts,
-            ]);
-            
-            return response()->json([
-                'success' => false,
-                'status' => 429,
-                'message' => 'Too many requests. Please try again later.',
-                'data' => [
-                    'retry_after' => $retryAfter,
-                    'limit' => $maxAttempts,
-                    'remaining' => 0,
-                ]
-            ], 429, [
-                'Retry-After' => $retryAfter,
-                'X-RateLimit-Limit' => $maxAttempts,
-                'X-RateLimit-Remaining' => 0,
-                'X-RateLimit-Reset' => Cache::get($key . ':timer', time() + ($decayMinutes * 60)),
-            ]);
+        [$maxAttempts, $decayMinutes] = $this->getLimits($request, $type);
+
+        $cost = $this->getCost($request, $type);
+
+        $checks = [[$key, $maxAttempts, $decayMinutes * 60, $type]];
+
+        if ($type === 'mbt') {
+            $budget = (int) config('ratelimit.mbt_budget', 600);
+
+            // Paid recharges are applied whatever the load. They still use
+            // up the shared budget, so the other routes shed first.
+            if (in_array(basename($request->path()), $this->mbtUnshed, true)) {
+                $this->limiter->hit(self::MBT_BUDGET_KEY, $budget, 60, $cost);
+                return $next($request);
+            }
+
+            // The account name is chosen by the caller, so the address it
+            // comes from is limited as well
+            $ipKey = 'rate_limit:mbt:ip:' . $request->ip();
+            if ($key !== $ipKey && !$request->user()) {
+                array_unshift($checks, [$ipKey, (int) config('ratelimit.mbt_ip_limit', 300), 60, 'mbt:ip']);
+            }
+
+            // Shared outbound budget toward the billing server, checked
+            // first so a shed request does not count against the client
+            array_unshift($checks, [self::MBT_BUDGET_KEY, $budget, 60, 'mbt:global']);
+        }
+
+        $taken = [];
+        foreach ($checks as [$checkKey, $checkMax, $checkDecay, $label]) {
+            $result = $this->limiter->hit($checkKey, $checkMax, $checkDecay, $cost);
+
+            if (!$result['allowed']) {
+                // Give back what this request took from the counters before
+                // the one that refused it; a shed request keeps no budget
+                if ($checkKey === self::MBT_BUDGET_KEY) {
+                    $taken[] = [$checkKey, $checkDecay];
+                }
+                foreach ($taken as [$takenKey, $takenDecay]) {
+                    $this->limiter->refund($takenKey, $takenDecay, $cost);
+                }
+                return $this->tooManyRequests($request, $label, $result);
+            }
+
+            $taken[] = [$checkKey, $checkDecay];
         }
-        
-        // Increment attempts
-        $this->incrementAttempts($key, $decayMinutes);
         
         $response = $next($request);
         
-        // Add rate limit headers to response
-        $remaining = max(0, $maxAttempts - Cache::get($key, 0));
-        
         return $response->withHeaders([
             'X-RateLimit-Limit' => $maxAttempts,
-            'X-RateLimit-Remaining' => $remaining,
-            'X-RateLimit-Reset' => Cache::get($key . ':timer', time() + ($decayMinutes * 60)),
+            'X-RateLimit-Remaining' => $result['remaining'],
+            'X-RateLimit-Reset' => $result['reset'],
+        ]);
+    }
+
+    /**
+     * Build the 429 response for an exhausted limit.
+     *
+     * @param  \Illuminate\Http\Request  $request
+     * @param  string  $type
+     * @param  array  $result
+     * @return \Illuminate\Http\JsonResponse
+     */
+    protected function tooManyRequests(Request $request, string $type, array $result)
+    {
+        $retryAfter = max($result['reset'] - time(), 1);
+        
+        Log::warning('Rate limit exceeded', [
+            'ip' => $request->ip(),
+            'path' => $request->path(),
+            'type' => $type,
+            'attempts' => $result['attempts'],
+        ]);
+        
+        return response()->json([
+            'success' => false,
+            'status' => 429,
+            'message' => 'Too many requests. Please try again later.',
+            'data' => [
+                'retry_after' => $retryAfter,
+                'limit' => $result['limit'],
+                'remaining' => 0,
+            ]
+        ], 429, [
+            'Retry-After' => $retryAfter,
+            'X-RateLimit-Limit' => $result['limit'],
+            'X-RateLimit-Remaining' => 0,
+            'X-RateLimit-Reset' => $result['reset'],
         ]);
     }
 
@@ -104,6 +199,15 @@ class ApiRateLimiter
         $identifier = $request->user() 
             ? 'user:' . $request->user()->id 
             : 'ip:' . $request->ip();
+
+        // The MBT routes are unauthenticated and many subscribers share a
+        // carrier NAT address, so key them by the MBT account they name
+        if ($type === 'mbt' && !$request->user()) {
+            $account = $request->input('user_name') ?? $request->input('account_id');
+            if (is_scalar($account) && $account !== '') {
+                $identifier = 'account:' . sha1((string) $account);
+            }
+        }
         
         // Include endpoint for auth-specific limits
         if ($type === 'auth') {
@@ -122,9 +226,20 @@ class ApiRateLimiter
      * @return array [max_attempts, decay_minutes]
      */
     protected function getLimits(Request $request, string $type): array
+    {
+        return $this->limitsFor($type, basename($request->path()));
+    }
+
+    /**
+     * Get the rate limits for a type and (for auth) endpoint.
+     *
+     * @param  string  $type
+     * @param  string  $endpoint
+     * @return array [max_attempts, decay_minutes]
+     */
+    protected function limitsFor(string $type, string $endpoint): array
     {
         if ($type === 'auth') {
-            $endpoint = basename($request->path());
             return $this->limits['auth'][$endpoint] ?? [10, 1];
         }
         
@@ -136,26 +251,27 @@ class ApiRateLimiter
             return $this->limits['api']['read'];
         }
         
+        if ($type === 'mbt') {
+            return [(int) config('ratelimit.mbt_client_limit', 60), 1];
+        }
+        
         return $this->limits['api']['default'];
     }
 
     /**
-     * Increment the counter for the given key.
+     * Get the cost of the request against its limit.
      *
-     * @param  string  $key
-     * @param  int  $decayMinutes
-     * @return void
+     * @param  \Illuminate\Http\Request  $request
+     * @param  string  $type
+     * @return int
      */
-    protected function incrementAttempts(string $key, int $decayMinutes): void
+    protected function getCost(Request $request, string $type): int
     {
-        $expiresAt = now()->addMinutes($decayMinutes);
-        
-        if (!Cache::has($key)) {
-            Cache::put($key, 1, $expiresAt);
-            Cache::put($key . ':timer', $expiresAt->timestamp, $expiresAt);
-        } else {
-            Cache::increment($key);
+        if ($type === 'mbt') {
+            return $this->mbtCosts[basename($request->path())] ?? 1;
         }
+        
+        return 1;
     }
 
     /**
@@ -168,7 +284,11 @@ class ApiRateLimiter
     public static function clear(string $identifier, string $type = 'auth'): void
     {
         $key = "rate_limit:{$type}:{$identifier}";
-        Cache::forget($key);
-        Cache::forget($key . ':timer');
+        $endpoint = $type === 'auth' ? explode(':', $identifier)[0] : '';
+
+        $middleware = app(static::class);
+        [, $decayMinutes] = $middleware->limitsFor($type, $endpoint);
+
+        $middleware->limiter->clear($key, $decayMinutes * 60);
     }
 }
@@ -27,7 +27,7 @@ class AuthenticateApi
             ], 401);
         }
 
-        $accessToken = PersonalAccessToken::findToken($token);
+        $accessToken = PersonalAccessToken::findCachedToken($token);
 
         if (!$accessToken) {
             return response()->json([
@@ -59,8 +59,8 @@ class AuthenticateApi
             ], 401);
         }
 
-        // Update last used timestamp
-        $accessToken->update(['last_used_at' => now()]);
+        // Update last used timestamp (coalesced, see auth.api_tokens)
+        $accessToken->touchLastUsed();
 
         // Set the user and token on the request
         $request->setUserResolver(function () use ($user, $accessToken) {
@@ -0,0 +1,56 @@
+<?php
+
+namespace App\Http\Middleware;
+
+use Closure;
+use App\Services\PageCache;
+use Illuminate\Http\Response;
+
+class CacheResponse
+{
+    /**
+     * Serve public pages from the page cache.
+     *
+     * A current copy is returned as is. An outdated copy is returned while
+     * one request (holding the rebuild lock) renders the page again; when no
+     * copy exists the page is rendered and stored.
+     *
+     * @param  \Illuminate\Http\Request  $request
+     * @param  \Closure  $next
+     * @param  string  ...$tags
+     * @return mixed
+     */
+    public function handle($request, Closure $next, ...$tags)
+    {
+        if (!PageCache::cacheable($request)) {
+            return $next($request);
+        }
+
+        $key = PageCache::key($request);
+        $versions = PageCache::versions(array_merge([PageCache::LAYOUT], $tags));
+        $entry = cache()->get($key);
+
+        if ($entry && PageCache::fresh($entry, $versions)) {
+            return PageCache::respond($entry, 'HIT');
+        }
+
+        if ($entry && !PageCache::lock($key)) {
+            return PageCache::respond($entry, 'STALE');
+        }
+
+        try {
+            $response = $next($request);
+
+            if ($response instanceof Response && $response->getStatusCode() === 200 && PageCache::cacheable($request)) {
+                PageCache::put($key, $response, $versions);
+                $response->headers->set('X-Page-Cache', 'MISS');
+            }
+        } finally {
+            if ($entry) {
+                PageCache::unlock($key);
+            }
+        }
+
+        return $response;
+    }
+}
@@ -19,9 +19,9 @@ class SetLangMiddleware
         if (session()->has('lang')) {
            app()->setLocale(session()->get('lang'));
          } else {
-           $defaultLang = Language::where('is_default', 1)->first();
-           if (!empty($defaultLang)) {
-             app()->setLocale($defaultLang->code);
+           $defaultCode = Language::defaultCode();
+           if (!empty($defaultCode)) {
+             app()->setLocale($defaultCode);
            }
          }
 
@@ -0,0 +1,38 @@
+<?php
+
+namespace App\Jobs;
+
+use App\Services\ImagePipeline;
+use Illuminate\Bus\Queueable;
+use Illuminate\Contracts\Queue\ShouldQueue;
+use Illuminate\Foundation\Bus\Dispatchable;
+use Illuminate\Queue\InteractsWithQueue;
+use Illuminate\Queue\SerializesModels;
+
+class ProcessImage implements ShouldQueue
+{
+    use Dispatchable, InteractsWithQueue, Queueable, SerializesModels;
+
+    /**
+     * Attempts before the job is failed.
+     *
+     * @var int
+     */
+    public $tries = 2;
+
+    /**
+     * @param  string  $name
+     * @param  string  $location
+     */
+    public function __construct(public $name, public $location = 'img')
+    {
+    }
+
+    /**
+     * Generate the resized variants of the uploaded image.
+     */
+    public function handle(): void
+    {
+        ImagePipeline::process($this->name, $this->location);
+    }
+}
@@ -0,0 +1,49 @@
+<?php
+
+namespace App\Jobs;
+
+use App\Models\PaymentNew;
+use App\Services\InvoiceRenderer;
+use Illuminate\Bus\Queueable;
+use Illuminate\Contracts\Queue\ShouldQueue;
+use Illuminate\Foundation\Bus\Dispatchable;
+use Illuminate\Queue\InteractsWithQueue;
+use Illuminate\Queue\SerializesModels;
+
+class RenderInvoice implements ShouldQueue
+{
+    use Dispatchable, InteractsWithQueue, Queueable, SerializesModels;
+
+    /**
+     * Attempts before the job is failed (MBT may be briefly unreachable).
+     *
+     * @var int
+     */
+    public $tries = 5;
+
+    /**
+     * Seconds to wait between attempts.
+     *
+     * @var array
+     */
+    public $backoff = [60, 300, 900];
+
+    /**
+     * @param  int  $paymentId
+     */
+    public function __construct(public $paymentId)
+    {
+    }
+
+    /**
+     * Render and store the invoice documents of the payment.
+     */
+    public function handle(): void
+    {
+        $payment = PaymentNew::find($this->paymentId);
+
+        if ($payment) {
+            InvoiceRenderer::render($payment);
+        }
+    }
+}
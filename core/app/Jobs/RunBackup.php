@@ -0,0 +1,67 @@
+<?php
+
+namespace App\Jobs;
+
+use App\Models\Backup;
+use App\Services\DatabaseBackup;
+use Throwable;
+use Illuminate\Bus\Queueable;
+use Illuminate\Contracts\Queue\ShouldQueue;
+use Illuminate\Foundation\Bus\Dispatchable;
+use Illuminate\Queue\InteractsWithQueue;
+use Illuminate\Queue\SerializesModels;
+
+class RunBackup implements ShouldQueue
+{
+    use Dispatchable, InteractsWithQueue, Queueable, SerializesModels;
+
+    /**
+     * A failed dump is not retried; the admin can start a new one.
+     *
+     * @var int
+     */
+    public $tries = 1;
+
+    /**
+     * Seconds the job may run (set from config('backup.timeout')).
+     *
+     * @var int
+     */
+    public $timeout;
+
+    /**
+     * @param  int  $backupId
+     */
+    public function __construct(public $backupId)
+    {
+        $this->timeout = (int) config('backup.timeout', 3600) + 60;
+    }
+
+    /**
+     * Dump the database and prune old backups.
+     */
+    public function handle(): void
+    {
+        $backup = Backup::find($this->backupId);
+
+        if ($backup && $backup->status === 'queued') {
+            DatabaseBackup::run($backup);
+            DatabaseBackup::prune();
+        }
+    }
+
+    /**
+     * Record a job that died outside run() (timeout, killed worker) so the
+     * row does not stay "running" and block later backups.
+     */
+    public function failed(Throwable $e): void
+    {
+        Backup::where('id', $this->backupId)
+            ->whereIn('status', ['queued', 'running'])
+            ->update([
+                'status' => 'failed',
+                'error' => mb_substr($e->getMessage(), 0, 2000),
+                'finished_at' => now(),
+            ]);
+    }
+}
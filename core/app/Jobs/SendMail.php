@@ -0,0 +1,54 @@
+<?php
+
+namespace App\Jobs;
+
+use App\Helpers\MailSend;
+use Illuminate\Bus\Queueable;
+use Illuminate\Contracts\Queue\ShouldQueue;
+use Illuminate\Foundation\Bus\Dispatchable;
+use Illuminate\Queue\InteractsWithQueue;
+use Illuminate\Queue\SerializesModels;
+use Illuminate\Support\Facades\Log;
+
+class SendMail implements ShouldQueue
+{
+    use Dispatchable, InteractsWithQueue, Queueable, SerializesModels;
+
+    /**
+     * Attempts before the job is failed.
+     *
+     * @var int
+     */
+    public $tries = 3;
+
+    /**
+     * Seconds to wait between attempts.
+     *
+     * @var array
+     */
+    public $backoff = [30, 120];
+
+    /**
+     * @param  array  $mailData  See MailSend::queue().
+     */
+    public function __construct(public array $mailData)
+    {
+        $this->onQueue(config('mail.queue', 'default'));
+    }
+
+    /**
+     * Deliver the message through the worker's shared SMTP connection.
+     */
+    public function handle(): void
+    {
+        MailSend::shared()->deliver($this->mailData);
+    }
+
+    /**
+     * Record a message that could not be delivered.
+     */
+    public function failed(\Throwable $e): void
+    {
+        Log::error('Mail to ' . $this->mailData['to'] . ' failed: ' . $e->getMessage());
+    }
+}
@@ -0,0 +1,68 @@
+<?php
+
+namespace App\Jobs;
+
+use App\Helpers\MailSend;
+use App\Models\NewsletterCampaign;
+use Illuminate\Bus\Queueable;
+use Illuminate\Contracts\Queue\ShouldQueue;
+use Illuminate\Foundation\Bus\Dispatchable;
+use Illuminate\Queue\InteractsWithQueue;
+use Illuminate\Queue\SerializesModels;
+use Illuminate\Support\Facades\Log;
+
+class SendNewsletterBatch implements ShouldQueue
+{
+    use Dispatchable, InteractsWithQueue, Queueable, SerializesModels;
+
+    /**
+     * A batch is not retried as a whole; failures are counted per recipient.
+     *
+     * @var int
+     */
+    public $tries = 1;
+
+    /**
+     * @param  int  $campaignId
+     * @param  array  $emails
+     */
+    public function __construct(public $campaignId, public array $emails)
+    {
+        $this->onQueue(config('mail.queue', 'default'));
+    }
+
+    /**
+     * Send the campaign to each address of the batch and record progress.
+     */
+    public function handle(): void
+    {
+        $campaign = NewsletterCampaign::find($this->campaignId);
+        if (!$campaign) {
+            return;
+        }
+
+        $mailer = MailSend::shared();
+        $pause = (int) config('mail.newsletter.pause_ms', 0) * 1000;
+        $sent = $failed = 0;
+
+        foreach ($this->emails as $email) {
+            try {
+                $mailer->deliver([
+                    'to' => $email,
+                    'subject' => $campaign->subject,
+                    'body' => $campaign->message,
+                ]);
+                $sent++;
+            } catch (\Exception $e) {
+                Log::warning('Newsletter ' . $campaign->id . ' to ' . $email . ' failed: ' . $e->getMessage());
+                $failed++;
+            }
+
+            if ($pause > 0) {
+                usleep($pause);
+            }
+        }
+
+        $campaign->recordProgress($sent, $failed);
+    }
+}
@@ -0,0 +1,86 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Factories\HasFactory;
+use Illuminate\Database\Eloquent\Model;
+use Illuminate\Support\Facades\Cache;
+use App\Services\AppBootstrap;
+
+class AppVersion extends Model
+{
+    use HasFactory;
+
+    protected $guarded = [];
+
+    /**
+     * Cache key of the version registry.
+     */
+    const CACHE_KEY = 'app_versions:registry';
+
+    /**
+     * Registry loaded during the current request.
+     *
+     * @var array|null
+     */
+    protected static $registry = null;
+
+    /**
+     * Refresh the cached registry whenever a version row changes.
+     */
+    protected static function booted(): void
+    {
+        static::saved(function () {
+            static::forgetRegistry();
+        });
+
+        static::deleted(function () {
+            static::forgetRegistry();
+        });
+    }
+
+    /**
+     * Get the version entry for a platform (android or ios).
+     *
+     * @param  string|null  $platform
+     * @return array|null
+     */
+    public static function forPlatform(?string $platform): ?array
+    {
+        if (static::$registry === null) {
+            static::$registry = Cache::rememberForever(static::CACHE_KEY, function () {
+                return static::get()->keyBy('platform')->toArray();
+            });
+        }
+
+        return static::$registry[strtolower((string) $platform)] ?? null;
+    }
+
+    /**
+     * Forget the cached registry.
+     */
+    public static function forgetRegistry(): void
+    {
+        static::$registry = null;
+        Cache::forget(static::CACHE_KEY);
+        AppBootstrap::forget();
+    }
+
+    /**
+     * Compare a client version against a platform entry.
+     *
+     * @param  array  $entry
+     * @param  string  $currentVersion
+     * @return array{update_available: bool, force_update: bool}
+     */
+    public static function check(array $entry, string $currentVersion): array
+    {
+        $updateAvailable = version_compare($currentVersion, $entry['latest_version'], '<');
+
+        return [
+            'update_available' => $updateAvailable,
+            'force_update' => version_compare($currentVersion, $entry['min_version'], '<')
+                || ($updateAvailable && (bool) $entry['force_update']),
+        ];
+    }
+}
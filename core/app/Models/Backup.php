@@ -10,4 +10,24 @@ class Backup extends Model
     use HasFactory;
 
     protected $guarded = [];
+
+    protected $casts = [
+        'since' => 'datetime',
+        'started_at' => 'datetime',
+        'finished_at' => 'datetime',
+    ];
+
+    /**
+     * Share of tables dumped so far, in percent.
+     *
+     * @return int
+     */
+    public function progress(): int
+    {
+        if ($this->status === 'done') {
+            return 100;
+        }
+
+        return $this->tables_total > 0 ? (int) floor($this->tables_done * 100 / $this->tables_total) : 0;
+    }
 }
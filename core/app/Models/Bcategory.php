@@ -4,10 +4,82 @@ namespace App\Models;
 
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Database\Eloquent\Model;
+use App\Traits\FlushesPageCache;
+use Illuminate\Support\Facades\Cache;
 
 class Bcategory extends Model
 {
-    use HasFactory;
+    use HasFactory, FlushesPageCache;
 
     protected $guarded = [];
+
+    /**
+     * Public page cache tags showing this model.
+     */
+    protected static $pageCacheTags = ['blog'];
+
+    /**
+     * Drop the cached counts whenever a category changes.
+     */
+    protected static function booted(): void
+    {
+        static::saved(function ($bcategory) {
+            static::forgetCounts($bcategory->language_id);
+
+            if ($bcategory->wasChanged('language_id')) {
+                static::forgetCounts($bcategory->getOriginal('language_id'));
+            }
+        });
+
+        static::deleted(function ($bcategory) {
+            static::forgetCounts($bcategory->language_id);
+        });
+    }
+
+    public function blogs()
+    {
+        return $this->hasMany(Blog::class, 'bcategory_id');
+    }
+
+    /**
+     * Active categories of a language with their published post counts
+     * (blogs_count), cached until a post or category changes.
+     *
+     * @param  int  $languageId
+     * @return \Illuminate\Database\Eloquent\Collection
+     */
+    public static function withCachedCounts($languageId)
+    {
+        return Cache::rememberForever(static::countsKey($languageId), function () use ($languageId) {
+            return static::where('status', 1)
+                ->where('language_id', $languageId)
+                ->withCount(['blogs' => function ($query) {
+                    $query->where('status', 1);
+                }])
+                ->orderBy('id', 'DESC')
+                ->get();
+        });
+    }
+
+    /**
+     * Forget the cached categories of a language.
+     *
+     * @param  int  $languageId
+     * @return void
+     */
+    public static function forgetCounts($languageId): void
+    {
+        Cache::forget(static::countsKey($languageId));
+    }
+
+    /**
+     * Cache key of a language's categories.
+     *
+     * @param  int  $languageId
+     * @return string
+     */
+    protected static function countsKey($languageId): string
+    {
+        return 'blog:categories:' . (int) $languageId;
+    }
 }
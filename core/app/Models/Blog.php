@@ -4,10 +4,88 @@ namespace App\Models;
 
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Database\Eloquent\Model;
+use App\Traits\FlushesPageCache;
+use Illuminate\Support\Facades\DB;
 
 class Blog extends Model
 {
-    use HasFactory;
+    use HasFactory, FlushesPageCache;
 
     protected $guarded = [];
+
+    /**
+     * Public page cache tags showing this model.
+     */
+    protected static $pageCacheTags = ['blog'];
+
+    /**
+     * Shortest word the InnoDB full-text index holds (innodb_ft_min_token_size).
+     */
+    const FULLTEXT_MIN_WORD = 3;
+
+    /**
+     * InnoDB's default full-text stopwords (INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD);
+     * a required stopword makes a boolean search match nothing.
+     */
+    const FULLTEXT_STOPWORDS = [
+        'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en', 'for', 'from', 'how', 'i',
+        'in', 'is', 'it', 'la', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'what', 'when',
+        'where', 'who', 'will', 'with', 'und', 'www',
+    ];
+
+    /**
+     * Keep the cached category counts in step with the posts.
+     */
+    protected static function booted(): void
+    {
+        static::saved(function ($blog) {
+            Bcategory::forgetCounts($blog->language_id);
+
+            if ($blog->wasChanged('language_id')) {
+                Bcategory::forgetCounts($blog->getOriginal('language_id'));
+            }
+        });
+
+        static::deleted(function ($blog) {
+            Bcategory::forgetCounts($blog->language_id);
+        });
+    }
+
+    /**
+     * Filter posts by a title search term.
+     *
+     * Uses the title FULLTEXT index on MySQL, matching every word as a
+     * prefix. Falls back to LIKE for other drivers and for terms the index
+     * cannot answer: words too short to be indexed, stopwords, and
+     * non-Latin scripts such as Burmese and Chinese, which the default
+     * parser does not split into words.
+     *
+     * @param  \Illuminate\Database\Eloquent\Builder  $query
+     * @param  string|null  $term
+     * @return \Illuminate\Database\Eloquent\Builder
+     */
+    public function scopeSearch($query, $term)
+    {
+        $term = trim((string) $term);
+        if ($term === '') {
+            return $query;
+        }
+
+        $words = preg_split('/\s+/u', trim(preg_replace('/[+\-<>()~*"@]+/u', ' ', $term)), -1, PREG_SPLIT_NO_EMPTY);
+        $indexable = $words && !array_filter($words, function ($word) {
+            return mb_strlen($word) < self::FULLTEXT_MIN_WORD
+                || in_array(mb_strtolower($word), self::FULLTEXT_STOPWORDS, true)
+                || preg_match('/[^\p{Latin}\p{N}\'_]/u', $word);
+        });
+
+        if (DB::getDriverName() !== 'mysql' || !$indexable) {
+            return $query->where('title', 'like', '%' . $term . '%');
+        }
+
+        $boolean = implode(' ', array_map(function ($word) {
+            return '+' . $word . '*';
+        }, $words));
+
+        return $query->whereFullText('title', $boolean, ['mode' => 'boolean']);
+    }
 }
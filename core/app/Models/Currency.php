@@ -4,10 +4,25 @@ namespace App\Models;
 
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Database\Eloquent\Model;
+use App\Services\CurrencyContext;
 
 class Currency extends Model
 {
     use HasFactory;
 
     protected $guarded = [];
+
+    /**
+     * Drop the cached currency table whenever a currency changes.
+     */
+    protected static function booted(): void
+    {
+        static::saved(function () {
+            CurrencyContext::forget();
+        });
+
+        static::deleted(function () {
+            CurrencyContext::forget();
+        });
+    }
 }
@@ -4,10 +4,16 @@ namespace App\Models;
 
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Database\Eloquent\Model;
+use App\Traits\FlushesPageCache;
 
 class Daynamicpage extends Model
 {
-    use HasFactory;
+    use HasFactory, FlushesPageCache;
 
     protected $guarded = [];
+
+    /**
+     * Public page cache tags showing this model.
+     */
+    protected static $pageCacheTags = ['page', 'layout'];
 }
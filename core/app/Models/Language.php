@@ -4,10 +4,43 @@ namespace App\Models;
 
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Database\Eloquent\Model;
+use App\Traits\FlushesPageCache;
+use Illuminate\Support\Facades\Cache;
 
 class Language extends Model
 {
-    use HasFactory;
+    use HasFactory, FlushesPageCache;
 
     protected $guarded = [];
+
+    /**
+     * Public page cache tags showing this model.
+     */
+    protected static $pageCacheTags = ['layout'];
+
+    /**
+     * Code of the default language, cached until a language changes.
+     *
+     * @return string|null
+     */
+    public static function defaultCode(): ?string
+    {
+        return Cache::rememberForever('language:default_code', function () {
+            return static::where('is_default', 1)->value('code');
+        });
+    }
+
+    /**
+     * Drop the cached default language whenever a language changes.
+     */
+    protected static function booted(): void
+    {
+        static::saved(function () {
+            Cache::forget('language:default_code');
+        });
+
+        static::deleted(function () {
+            Cache::forget('language:default_code');
+        });
+    }
 }
@@ -0,0 +1,43 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Factories\HasFactory;
+use Illuminate\Database\Eloquent\Model;
+use Illuminate\Support\Facades\DB;
+
+class NewsletterCampaign extends Model
+{
+    use HasFactory;
+
+    protected $guarded = [];
+
+    /**
+     * Add a finished batch to the counters and close the campaign when
+     * every recipient has been handled.
+     *
+     * @param  int  $sent
+     * @param  int  $failed
+     * @return void
+     */
+    public function recordProgress(int $sent, int $failed): void
+    {
+        // Single statement, since several workers may finish batches at once
+        static::whereKey($this->id)->update([
+            'sent' => DB::raw('sent + ' . $sent),
+            'failed' => DB::raw('failed + ' . $failed),
+            'status' => DB::raw("CASE WHEN sent + failed >= total THEN 'done' ELSE 'sending' END"),
+            'updated_at' => now(),
+        ]);
+    }
+
+    /**
+     * Share of recipients handled so far, in percent.
+     *
+     * @return int
+     */
+    public function progress(): int
+    {
+        return $this->total > 0 ? (int) floor(($this->sent + $this->failed) * 100 / $this->total) : 100;
+    }
+}
@@ -4,14 +4,20 @@ namespace App\Models;
 
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Database\Eloquent\Model;
+use App\Traits\FlushesPageCache;
 use Illuminate\Database\Eloquent\Relations\HasMany;
 
 class Package extends Model
 {
-    use HasFactory;
+    use HasFactory, FlushesPageCache;
 
     protected $guarded = [];
 
+    /**
+     * Public page cache tags showing this model.
+     */
+    protected static $pageCacheTags = ['package'];
+
     public function packageorders(): HasMany
     {
         return $this->hasMany(Packageorder::class, 'package_id');
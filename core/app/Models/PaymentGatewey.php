@@ -4,7 +4,7 @@ namespace App\Models;
 
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Database\Eloquent\Model;
-use Illuminate\Support\Facades\Session;
+use App\Services\CurrencyContext;
 
 class PaymentGatewey extends Model
 {
@@ -25,11 +25,7 @@ class PaymentGatewey extends Model
 
     public function checkCurrency(): bool
     {
-        if (Session::has('currency')) {
-            $curr = Currency::find(Session::get('currency'));
-        } else {
-            $curr = Currency::where('is_default', '=', 1)->first();
-        }
+        $curr = CurrencyContext::current();
 
         if ($this->currency_id == 0 || $this->currency->name == '0' || $this->currency_id == $curr->id) {
             return false;
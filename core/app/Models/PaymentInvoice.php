@@ -0,0 +1,37 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Factories\HasFactory;
+use Illuminate\Database\Eloquent\Model;
+
+class PaymentInvoice extends Model
+{
+    use HasFactory;
+
+    protected $guarded = [];
+
+    protected $casts = [
+        'snapshot' => 'array',
+    ];
+
+    /**
+     * Public URL of the HTML invoice.
+     *
+     * @return string
+     */
+    public function htmlUrl(): string
+    {
+        return url(config('invoice.url') . '/' . $this->html_file);
+    }
+
+    /**
+     * Public URL of the PDF invoice.
+     *
+     * @return string|null
+     */
+    public function pdfUrl(): ?string
+    {
+        return $this->pdf_file ? url(config('invoice.url') . '/' . $this->pdf_file) : null;
+    }
+}
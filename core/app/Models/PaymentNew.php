@@ -4,6 +4,7 @@ namespace App\Models;
 
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Database\Eloquent\Model;
+use App\Jobs\RenderInvoice;
 
 class PaymentNew extends Model
 {
@@ -11,4 +12,38 @@ class PaymentNew extends Model
 
     protected $table = 'payment_new';
     protected $guarded = [];
+
+    /**
+     * Render the invoice in the background once a payment is confirmed
+     * (admin_status 1), whether it is recorded confirmed or confirmed later.
+     * Pending payments from the v1 API get no invoice until then.
+     *
+     * With the sync queue the invoice is rendered on first view instead,
+     * so recording a payment never waits on the billing server.
+     */
+    protected static function booted(): void
+    {
+        static::saved(function ($payment) {
+            $confirmed = $payment->wasRecentlyCreated || $payment->wasChanged('admin_status');
+
+            if ($confirmed && $payment->isConfirmed() && config('queue.default') !== 'sync') {
+                RenderInvoice::dispatch($payment->id);
+            }
+        });
+    }
+
+    /**
+     * Whether the payment went through.
+     *
+     * @return bool
+     */
+    public function isConfirmed(): bool
+    {
+        return (int) $this->admin_status === 1;
+    }
+
+    public function invoice()
+    {
+        return $this->hasOne(PaymentInvoice::class, 'payment_id');
+    }
 }
@@ -4,6 +4,7 @@ namespace App\Models;
 
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Database\Eloquent\Model;
+use Illuminate\Support\Facades\Cache;
 
 class PersonalAccessToken extends Model
 {
@@ -45,6 +46,16 @@ class PersonalAccessToken extends Model
         ];
     }
 
+    /**
+     * Drop a token from the lookup cache as soon as it is deleted.
+     */
+    protected static function booted(): void
+    {
+        static::deleted(function (PersonalAccessToken $token) {
+            static::forgetCached([$token->token]);
+        });
+    }
+
     /**
      * Get the tokenable model that the access token belongs to.
      */
@@ -63,6 +74,67 @@ class PersonalAccessToken extends Model
         return static::where('token', $hashedToken)->first();
     }
 
+    /**
+     * Find the token (with its user loaded) through the lookup cache.
+     *
+     * Unknown tokens are cached as well so that replayed or forged tokens
+     * do not reach the database on every request.
+     */
+    public static function findCachedToken(string $token): ?static
+    {
+        $hashedToken = hash('sha256', $token);
+
+        $cached = Cache::remember(
+            static::cacheKey($hashedToken),
+            now()->addSeconds(config('auth.api_tokens.cache_ttl', 60)),
+            function () use ($hashedToken) {
+                return static::with('tokenable')->where('token', $hashedToken)->first() ?? false;
+            }
+        );
+
+        return $cached ?: null;
+    }
+
+    /**
+     * Remove the given token hashes from the lookup cache.
+     *
+     * @param  iterable<string>  $hashedTokens
+     */
+    public static function forgetCached(iterable $hashedTokens): void
+    {
+        foreach ($hashedTokens as $hashedToken) {
+            Cache::forget(static::cacheKey($hashedToken));
+        }
+    }
+
+    /**
+     * Cache key for a hashed token.
+     */
+    protected static function cacheKey(string $hashedToken): string
+    {
+        return 'api_token:' . $hashedToken;
+    }
+
+    /**
+     * Record token usage, writing last_used_at at most once per interval.
+     */
+    public function touchLastUsed(): void
+    {
+        $interval = (int) config('auth.api_tokens.last_used_interval', 5);
+
+        if (Cache::add('api_token:used:' . $this->getKey(), 1, now()->addMinutes($interval))) {
+            static::whereKey($this->getKey())->update(['last_used_at' => now()]);
+        }
+    }
+
+    /**
+     * Determine if the token has expired.
+     */
+    public function isExpired(): bool
+    {
+        return $this->expires_at && $this->expires_at->isPast();
+    }
+
     /**
      * Determine if the token has the given ability.
      */
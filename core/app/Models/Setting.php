@@ -4,10 +4,31 @@ namespace App\Models;
 
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Database\Eloquent\Model;
+use App\Traits\FlushesPageCache;
+use App\Services\AppBootstrap;
 
 class Setting extends Model
 {
-    use HasFactory;
+    use HasFactory, FlushesPageCache;
 
     protected $guarded = [];
+
+    /**
+     * Public page cache tags showing this model.
+     */
+    protected static $pageCacheTags = ['layout'];
+
+    /**
+     * Rebuild the app bootstrap payload whenever this model changes.
+     */
+    protected static function booted(): void
+    {
+        static::saved(function () {
+            AppBootstrap::forget();
+        });
+
+        static::deleted(function () {
+            AppBootstrap::forget();
+        });
+    }
 }
@@ -4,10 +4,25 @@ namespace App\Models;
 
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Database\Eloquent\Model;
+use App\Services\AppBootstrap;
 
 class Slider extends Model
 {
     use HasFactory;
 
     protected $guarded = [];
+
+    /**
+     * Rebuild the app bootstrap payload whenever this model changes.
+     */
+    protected static function booted(): void
+    {
+        static::saved(function () {
+            AppBootstrap::forget();
+        });
+
+        static::deleted(function () {
+            AppBootstrap::forget();
+        });
+    }
 }
@@ -10,6 +10,7 @@ use App\Models\Daynamicpage;
 use App\Models\Social;
 use App\Models\Language;
 use App\Models\Sectiontitle;
+use App\Services\RateLimit\Limiter;
 
 class AppServiceProvider extends ServiceProvider
 {
@@ -20,7 +21,9 @@ class AppServiceProvider extends ServiceProvider
      */
     public function register()
     {
-        //
+        $this->app->singleton(Limiter::class, function () {
+            return Limiter::make();
+        });
     }
 
 
@@ -0,0 +1,172 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\AppVersion;
+use App\Models\MaintenanceSetting;
+use App\Models\Setting;
+use App\Models\Slider;
+use Illuminate\Support\Facades\Cache;
+
+class AppBootstrap
+{
+    /**
+     * Cache key of the counter that versions every compiled payload.
+     */
+    const GENERATION_KEY = 'app_bootstrap:generation';
+
+    /**
+     * Seconds a compiled payload is kept; it is replaced earlier whenever
+     * a source changes, this only lets superseded generations expire.
+     */
+    const TTL = 86400;
+
+    /**
+     * Seconds clients and CDNs may reuse a response without revalidating.
+     */
+    const MAX_AGE = 30;
+
+    /**
+     * Get the precompiled bootstrap response for a language id.
+     *
+     * The payload bundles everything the apps ask for on startup and
+     * resume (maintenance state, banners, store versions, the language
+     * bundle hash and contact settings) so one cache read serves it.
+     *
+     * @param  int|string  $languageId
+     * @return array{data: array, body: string, etag: string}
+     */
+    public static function get($languageId): array
+    {
+        $languageId = (int) $languageId;
+        $key = 'app_bootstrap:' . self::generation() . ':' . $languageId;
+
+        return Cache::remember($key, self::TTL, function () use ($languageId) {
+            $data = self::build($languageId);
+
+            $body = json_encode([
+                'success' => true,
+                'status' => 200,
+                'message' => 'Bootstrap data retrieved successfully',
+                'data' => $data,
+            ], JSON_UNESCAPED_UNICODE | JSON_UNESCAPED_SLASHES);
+
+            return [
+                'data' => $data,
+                'body' => $body,
+                'etag' => '"' . sha1($body) . '"',
+            ];
+        });
+    }
+
+    /**
+     * Get one section of the bootstrap payload.
+     *
+     * @param  string  $section
+     * @param  int|string  $languageId
+     * @return mixed
+     */
+    public static function section(string $section, $languageId = 1)
+    {
+        return self::get($languageId)['data'][$section] ?? null;
+    }
+
+    /**
+     * Headers for a bootstrap response.
+     *
+     * @param  string  $etag
+     * @return array
+     */
+    public static function headers(string $etag): array
+    {
+        return [
+            'ETag' => $etag,
+            'Cache-Control' => 'public, max-age=' . self::MAX_AGE . ', must-revalidate',
+            'Vary' => 'Accept-Encoding',
+        ];
+    }
+
+    /**
+     * Invalidate every compiled payload after one of its sources changed.
+     *
+     * @return void
+     */
+    public static function forget(): void
+    {
+        if (!Cache::add(self::GENERATION_KEY, 1)) {
+            Cache::increment(self::GENERATION_KEY);
+        }
+    }
+
+    /**
+     * Current payload generation.
+     *
+     * @return int
+     */
+    protected static function generation(): int
+    {
+        return (int) Cache::get(self::GENERATION_KEY, 0);
+    }
+
+    /**
+     * Assemble the payload from the database.
+     *
+     * @param  int  $languageId
+     * @return array
+     */
+    protected static function build(int $languageId): array
+    {
+        $settings = Setting::where('id', 1)->first();
+        $maintenance = MaintenanceSetting::first();
+        $underMaintenance = $maintenance && $maintenance->status == 1;
+
+        $banners = Slider::where('status', 1)
+            ->where('language_id', $languageId)
+            ->get()
+            ->map(function ($slider) {
+                return [
+                    'id' => $slider->id,
+                    'name' => $slider->name,
+                    'description' => $slider->desc,
+                    'image' => $slider->image ? url('assets/front/banner/' . $slider->image) : null,
+                    'offer' => $slider->offer,
+                ];
+            })
+            ->all();
+
+        $versions = [];
+        foreach (['android', 'ios'] as $platform) {
+            $entry = AppVersion::forPlatform($platform);
+            $versions[$platform] = $entry ? [
+                'latest_version' => $entry['latest_version'],
+                'min_version' => $entry['min_version'],
+                'force_update' => (bool) $entry['force_update'],
+                'update_url' => $entry['store_url'],
+            ] : null;
+        }
+
+        return [
+            'maintenance' => [
+                // Site-wide switch from Basic Information (legacy check-maintenance)
+                'maintenance_mode' => !empty($settings->maintenance_mode) && $settings->maintenance_mode == 'on',
+                'under_maintenance' => $underMaintenance,
+                'message' => $underMaintenance
+                    ? ($maintenance->message ?? 'The app is currently under maintenance. Please try again later.')
+                    : null,
+            ],
+            'banners' => $banners,
+            'versions' => $versions,
+            'language_version' => AppLanguageBundle::version(),
+            'settings' => [
+                'app_name' => $settings->title ?? 'Telco ISP',
+                'support_phone' => $settings->phone ?? null,
+                'support_email' => $settings->email ?? null,
+                'address' => $settings->address ?? null,
+                'logo' => !empty($settings->logo) ? url('assets/front/img/' . $settings->logo) : null,
+                'facebook' => $settings->facebook ?? null,
+                'twitter' => $settings->twitter ?? null,
+                'instagram' => $settings->instagram ?? null,
+            ],
+        ];
+    }
+}
@@ -0,0 +1,87 @@
+<?php
+
+namespace App\Services;
+
+use Illuminate\Support\Facades\Cache;
+use Illuminate\Support\Facades\DB;
+
+class AppLanguageBundle
+{
+    /**
+     * app_language column holding the strings for each app language id.
+     */
+    const COLUMNS = [
+        0 => 'lang_english',
+        1 => 'lang_chinese',
+        2 => 'lang_burmese',
+    ];
+
+    /**
+     * Get the precompiled get-language response for a language id.
+     *
+     * The JSON body is built once from app_language and kept in the cache
+     * together with its ETag until the strings are edited in the admin.
+     *
+     * @param  int|string  $languageId
+     * @return array{body: string, etag: string}
+     */
+    public static function get($languageId): array
+    {
+        $languageId = (int) $languageId;
+
+        return Cache::rememberForever(self::cacheKey($languageId), function () use ($languageId) {
+            $strings = isset(self::COLUMNS[$languageId])
+                ? DB::table('app_language')->pluck(self::COLUMNS[$languageId], 'lang_string')->toArray()
+                : [];
+
+            $body = json_encode([
+                'status' => 200,
+                'message' => 'Get language data!',
+                'language' => $strings,
+            ], JSON_UNESCAPED_UNICODE);
+
+            return [
+                'body' => $body,
+                'etag' => '"' . sha1($body) . '"',
+            ];
+        });
+    }
+
+    /**
+     * Hash identifying the current version of all bundles.
+     *
+     * @return string
+     */
+    public static function version(): string
+    {
+        return sha1(implode('|', array_map(function ($languageId) {
+            return self::get($languageId)['etag'];
+        }, array_keys(self::COLUMNS))));
+    }
+
+    /**
+     * Drop the compiled bundles after app_language changes.
+     *
+     * @return void
+     */
+    public static function forget(): void
+    {
+        foreach (array_keys(self::COLUMNS) as $languageId) {
+            Cache::forget(self::cacheKey($languageId));
+        }
+
+        // The bootstrap payload carries the bundle hash
+        AppBootstrap::forget();
+    }
+
+    /**
+     * Cache key of a compiled bundle.
+     *
+     * @param  int  $languageId
+     * @return string
+     */
+    protected static function cacheKey(int $languageId): string
+    {
+        return "app_language:bundle:{$languageId}";
+    }
+}
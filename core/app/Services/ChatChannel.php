@@ -0,0 +1,275 @@
+<?php
+
+namespace App\Services;
+
+use Illuminate\Support\Facades\Cache;
+use Illuminate\Support\Facades\DB;
+use Symfony\Component\HttpFoundation\StreamedResponse;
+
+class ChatChannel
+{
+    /**
+     * Channel that tracks the admin inbox (unread counts across all users).
+     */
+    const INBOX = 'inbox';
+
+    /**
+     * Admin account id used as the receiver for messages sent from the app.
+     */
+    const ADMIN_USER_ID = 1;
+
+    /**
+     * Announce that a user's conversation changed (new message or read state).
+     *
+     * @param  int  $userId
+     * @return void
+     */
+    public static function publish($userId): void
+    {
+        Cache::increment(self::versionKey((int) $userId));
+        Cache::increment(self::versionKey(self::INBOX));
+    }
+
+    /**
+     * Get the current version of a user's conversation.
+     *
+     * @param  int  $userId
+     * @return int
+     */
+    public static function version($userId): int
+    {
+        if (config('chat.driver') === 'database') {
+            // Read flags count too, otherwise marking messages read never moves the version
+            $state = self::thread($userId)
+                ->selectRaw('MAX(id) AS last_id, SUM(read_status) AS seen, SUM(mobile_read_status) AS seen_mobile')
+                ->first();
+
+            return crc32("{$state->last_id}:{$state->seen}:{$state->seen_mobile}");
+        }
+
+        return (int) Cache::get(self::versionKey((int) $userId), 0);
+    }
+
+    /**
+     * Get the highest chat id in a user's conversation.
+     *
+     * @param  int  $userId
+     * @return int
+     */
+    public static function latestMessageId($userId): int
+    {
+        return (int) self::thread($userId)->max('id');
+    }
+
+    /**
+     * Get messages in a user's conversation newer than the given id.
+     *
+     * @param  int  $userId
+     * @param  int  $lastId
+     * @return \Illuminate\Support\Collection
+     */
+    public static function messagesSince($userId, int $lastId)
+    {
+        return self::thread($userId)
+            ->where('id', '>', $lastId)
+            ->orderBy('id', 'ASC')
+            ->limit(config('chat.batch_size', 50))
+            ->get();
+    }
+
+    /**
+     * Get unread counters for a conversation.
+     *
+     * The admin side counts messages the user sent that the admin has not
+     * opened; the mobile side counts admin replies the app has not marked
+     * as read.
+     *
+     * @param  int  $userId
+     * @param  bool  $forAdmin
+     * @return array
+     */
+    public static function unread($userId, bool $forAdmin): array
+    {
+        if ($forAdmin) {
+            return [
+                'unread' => DB::table('chat')->where('sender_userid', $userId)->where('read_status', 0)->count(),
+                'inbox' => DB::table('chat')->where('read_status', 0)->where('sender_userid', '!=', self::ADMIN_USER_ID)->count(),
+            ];
+        }
+
+        return [
+            'unread' => DB::table('chat')->where('reciever_userid', $userId)->where('mobile_read_status', 0)->count(),
+        ];
+    }
+
+    /**
+     * Wait until the conversation has news or the timeout passes.
+     *
+     * Returns the new messages and unread counters; an empty message list
+     * means only the read state changed or the request timed out, and the
+     * client should simply poll again with the returned last_id.
+     *
+     * @param  int  $userId
+     * @param  bool  $forAdmin
+     * @param  int|null  $lastId
+     * @return array
+     */
+    public static function poll($userId, bool $forAdmin, ?int $lastId = null): array
+    {
+        self::extendTimeLimit();
+
+        $lastId = $lastId ?? self::latestMessageId($userId);
+        $deadline = time() + (int) config('chat.timeout', 25);
+        $version = self::version($userId);
+
+        $messages = self::messagesSince($userId, $lastId);
+
+        if ($messages->isEmpty() && self::waitForChange($userId, $version, $deadline) !== null) {
+            $messages = self::messagesSince($userId, $lastId);
+        }
+
+        return [
+            'last_id' => $messages->isNotEmpty() ? $messages->last()->id : $lastId,
+            'messages' => $messages,
+        ] + self::unread($userId, $forAdmin);
+    }
+
+    /**
+     * Stream conversation updates as Server-Sent Events.
+     *
+     * Emits "message" events (with the chat id as the event id, so that
+     * EventSource resumes through Last-Event-ID) and "unread" events
+     * whenever the counters may have changed.
+     *
+     * @param  int  $userId
+     * @param  bool  $forAdmin
+     * @param  int|null  $lastId
+     * @return \Symfony\Component\HttpFoundation\StreamedResponse
+     */
+    public static function stream($userId, bool $forAdmin, ?int $lastId = null): StreamedResponse
+    {
+        return response()->stream(function () use ($userId, $forAdmin, $lastId) {
+            self::extendTimeLimit();
+
+            $lastId = $lastId ?? self::latestMessageId($userId);
+            $deadline = time() + (int) config('chat.timeout', 25);
+            $keepalive = max(1, (int) config('chat.keepalive', 15));
+            $version = self::version($userId);
+
+            self::send('retry: ' . (int) config('chat.retry', 2000) . "\n\n");
+            self::sendUnread($userId, $forAdmin);
+
+            while (!connection_aborted()) {
+                foreach (self::messagesSince($userId, $lastId) as $message) {
+                    $lastId = $message->id;
+                    self::send("id: {$lastId}\nevent: message\ndata: " . json_encode($message) . "\n\n");
+                }
+
+                $version = self::waitForChange($userId, $version, min($deadline, time() + $keepalive));
+
+                if ($version === null) {
+                    if (time() >= $deadline) {
+                        break;
+                    }
+                    $version = self::version($userId);
+                    self::send(": keep-alive\n\n");
+                    continue;
+                }
+
+                self::sendUnread($userId, $forAdmin);
+            }
+        }, 200, [
+            'Content-Type' => 'text/event-stream',
+            'Cache-Control' => 'no-cache, no-store',
+            'Connection' => 'keep-alive',
+            'X-Accel-Buffering' => 'no',
+        ]);
+    }
+
+    /**
+     * Sleep until the conversation version moves past the given one.
+     *
+     * @param  int  $userId
+     * @param  int  $version
+     * @param  int  $until
+     * @return int|null  The new version, or null when the wait timed out.
+     */
+    protected static function waitForChange($userId, int $version, int $until): ?int
+    {
+        $interval = max(1, (int) config('chat.poll_interval', 1));
+
+        while (time() < $until && !connection_aborted()) {
+            sleep($interval);
+
+            $current = self::version($userId);
+            if ($current !== $version) {
+                return $current;
+            }
+        }
+
+        return null;
+    }
+
+    /**
+     * Base query for a user's conversation with the admin.
+     *
+     * @param  int  $userId
+     * @return \Illuminate\Database\Query\Builder
+     */
+    protected static function thread($userId)
+    {
+        return DB::table('chat')->where(function ($query) use ($userId) {
+            $query->where('sender_userid', $userId)
+                  ->orWhere('reciever_userid', $userId);
+        });
+    }
+
+    /**
+     * Emit the unread counters as an SSE event.
+     *
+     * @param  int  $userId
+     * @param  bool  $forAdmin
+     * @return void
+     */
+    protected static function sendUnread($userId, bool $forAdmin): void
+    {
+        self::send("event: unread\ndata: " . json_encode(self::unread($userId, $forAdmin)) . "\n\n");
+    }
+
+    /**
+     * Write a chunk to the client immediately.
+     *
+     * @param  string  $chunk
+     * @return void
+     */
+    protected static function send(string $chunk): void
+    {
+        echo $chunk;
+
+        if (ob_get_level() > 0) {
+            ob_flush();
+        }
+        flush();
+    }
+
+    /**
+     * Make sure PHP does not kill the request before the channel timeout.
+     *
+     * @return void
+     */
+    protected static function extendTimeLimit(): void
+    {
+        @set_time_limit((int) config('chat.timeout', 25) + 10);
+    }
+
+    /**
+     * Cache key holding a channel's version counter.
+     *
+     * @param  int|string  $channel
+     * @return string
+     */
+    protected static function versionKey($channel): string
+    {
+        return "chat:version:{$channel}";
+    }
+}
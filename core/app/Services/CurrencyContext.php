@@ -0,0 +1,117 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Currency;
+use Illuminate\Support\Facades\Cache;
+use Illuminate\Support\Facades\Session;
+
+class CurrencyContext
+{
+    /**
+     * Cache key of the currency table.
+     */
+    const CACHE_KEY = 'currencies:all';
+
+    /**
+     * Currency table loaded during the current request, keyed by id.
+     *
+     * @var \Illuminate\Support\Collection|null
+     */
+    protected static $currencies = null;
+
+    /**
+     * All currencies keyed by id.
+     *
+     * Read from the cache once per request; price helpers called for every
+     * product in a grid or cart line share this copy.
+     *
+     * @return \Illuminate\Support\Collection
+     */
+    public static function currencies()
+    {
+        if (static::$currencies === null) {
+            static::$currencies = Cache::rememberForever(self::CACHE_KEY, function () {
+                return Currency::all()->keyBy('id');
+            });
+        }
+
+        return static::$currencies;
+    }
+
+    /**
+     * The default currency (prices are stored in its unit).
+     *
+     * @return \App\Models\Currency|null
+     */
+    public static function default()
+    {
+        return static::currencies()->firstWhere('is_default', 1);
+    }
+
+    /**
+     * The currency chosen in the session, or the default one.
+     *
+     * @return \App\Models\Currency|null
+     */
+    public static function current()
+    {
+        if (Session::has('currency')) {
+            return static::currencies()->get(Session::get('currency'));
+        }
+
+        return static::default();
+    }
+
+    /**
+     * Format a stored price for display.
+     *
+     * @param  float|int|string  $price
+     * @return string
+     */
+    public static function format($price): string
+    {
+        return static::current()->sign . static::convert($price);
+    }
+
+    /**
+     * Format many stored prices at once, keeping their keys.
+     *
+     * @param  iterable  $prices
+     * @return array
+     */
+    public static function formatMany(iterable $prices): array
+    {
+        $sign = static::current()->sign;
+        $value = static::default()->value;
+
+        $formatted = [];
+        foreach ($prices as $key => $price) {
+            $formatted[$key] = $sign . round($price * $value, 2);
+        }
+
+        return $formatted;
+    }
+
+    /**
+     * Convert a stored price with the default currency rate.
+     *
+     * @param  float|int|string  $price
+     * @return float
+     */
+    public static function convert($price): float
+    {
+        return round($price * static::default()->value, 2);
+    }
+
+    /**
+     * Forget the cached currency table after a currency changes.
+     *
+     * @return void
+     */
+    public static function forget(): void
+    {
+        static::$currencies = null;
+        Cache::forget(self::CACHE_KEY);
+    }
+}
@@ -0,0 +1,448 @@
+<?php
+
+namespace App\Services;
+
+use App\Jobs\RunBackup;
+use App\Models\Backup;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\File;
+use RuntimeException;
+use Symfony\Component\Process\Process;
+use Throwable;
+
+class DatabaseBackup
+{
+    /**
+     * Supported backup modes.
+     */
+    const MODES = ['full', 'tables', 'incremental'];
+
+    /**
+     * mysqldump comment opening each table's data; used to count progress.
+     */
+    const TABLE_MARKER = '-- Dumping data for table `';
+
+    /**
+     * Record a backup and hand it to the queue.
+     *
+     * @param  string  $mode
+     * @param  array  $tables  Tables to dump in "tables" mode.
+     * @return \App\Models\Backup
+     */
+    public static function queue(string $mode = 'full', array $tables = []): Backup
+    {
+        $compression = static::compression();
+
+        $backup = Backup::create([
+            'mode' => $mode,
+            'tables' => $mode === 'tables' ? implode(',', array_intersect($tables, static::tables())) : null,
+            'compression' => $compression,
+            'status' => 'queued',
+        ]);
+
+        $backup->update([
+            'filename' => 'backup-' . $backup->created_at->format('Ymd-His') . '-' . $backup->id . static::extension($compression),
+        ]);
+
+        if (config('queue.default') === 'sync') {
+            RunBackup::dispatchAfterResponse($backup->id);
+        } else {
+            RunBackup::dispatch($backup->id)->onQueue(config('backup.queue', 'default'));
+        }
+
+        return $backup;
+    }
+
+    /**
+     * Whether a backup is waiting or running.
+     *
+     * @return bool
+     */
+    public static function busy(): bool
+    {
+        static::expireStale();
+
+        return Backup::whereIn('status', ['queued', 'running'])->exists();
+    }
+
+    /**
+     * Mark backups that have been running, or waiting for a worker, for
+     * longer than the timeout as failed; their worker was killed before it
+     * could record the outcome, or no worker ever picked them up.
+     *
+     * @return int  Number of backups marked failed.
+     */
+    public static function expireStale(): int
+    {
+        $cutoff = now()->subSeconds((int) config('backup.timeout', 3600) + 300);
+
+        $interrupted = Backup::where('status', 'running')
+            ->where('started_at', '<', $cutoff)
+            ->update([
+                'status' => 'failed',
+                'error' => 'The backup was interrupted before it finished.',
+                'finished_at' => now(),
+            ]);
+
+        $abandoned = Backup::where('status', 'queued')
+            ->where('created_at', '<', $cutoff)
+            ->update([
+                'status' => 'failed',
+                'error' => 'No queue worker picked up the backup.',
+                'finished_at' => now(),
+            ]);
+
+        return $interrupted + $abandoned;
+    }
+
+    /**
+     * Dump the database, compressing the output as it streams in.
+     *
+     * @param  \App\Models\Backup  $backup
+     * @return void
+     */
+    public static function run(Backup $backup): void
+    {
+        @set_time_limit((int) config('backup.timeout', 3600) + 60);
+
+        $since = null;
+        if ($backup->mode === 'incremental') {
+            // Only full and incremental backups cover every table; a "tables"
+            // backup in between must not move the starting point
+            $since = Backup::where('status', 'done')
+                ->whereIn('mode', ['full', 'incremental'])
+                ->where('id', '<', $backup->id)
+                ->latest('id')
+                ->value('started_at');
+
+            // Nothing to be incremental to yet
+            if (!$since) {
+                $backup->mode = 'full';
+            }
+        }
+
+        $tables = static::tablesFor($backup);
+
+        // mysqldump without table arguments would dump the whole database
+        if ($backup->mode !== 'full' && empty($tables)) {
+            $backup->update([
+                'status' => 'failed',
+                'error' => 'No tables to back up.',
+                'finished_at' => now(),
+            ]);
+
+            throw new RuntimeException("Backup {$backup->id} has no tables to dump.");
+        }
+
+        $backup->update([
+            'mode' => $backup->mode,
+            'status' => 'running',
+            'since' => $since,
+            'started_at' => now(),
+            'tables_total' => count($tables),
+            'tables_done' => 0,
+            'error' => null,
+        ]);
+
+        $file = static::path($backup);
+        $part = $file . '.part';
+        File::ensureDirectoryExists(dirname($file));
+
+        [$write, $close] = static::open($part, $backup->compression);
+
+        try {
+            $process = new Process(
+                static::command($backup, $tables, $since),
+                null,
+                ['MYSQL_PWD' => (string) config('database.connections.mysql.password')],
+                null,
+                (float) config('backup.timeout', 3600)
+            );
+
+            $tail = '';
+            $done = 0;
+            $errors = '';
+
+            $process->run(function ($type, $buffer) use ($write, $backup, &$tail, &$done, &$errors) {
+                if ($type !== Process::OUT) {
+                    $errors .= $buffer;
+                    return;
+                }
+
+                $write($buffer);
+
+                // The marker may straddle two chunks, so count across a carried tail
+                $window = $tail . $buffer;
+                $found = substr_count($window, self::TABLE_MARKER) - substr_count($tail, self::TABLE_MARKER);
+                $tail = substr($window, -strlen(self::TABLE_MARKER));
+
+                if ($found > 0) {
+                    $done += $found;
+                    $backup->update(['tables_done' => $done]);
+                }
+            });
+
+            $close();
+            $close = null;
+
+            if (!$process->isSuccessful()) {
+                throw new RuntimeException(trim($errors) ?: 'mysqldump exited with code ' . $process->getExitCode());
+            }
+
+            // Deleted from the backup page while it was running
+            if (!Backup::whereKey($backup->id)->exists()) {
+                @unlink($part);
+                return;
+            }
+
+            rename($part, $file);
+
+            $backup->update([
+                'status' => 'done',
+                'tables_done' => $backup->tables_total,
+                'size' => filesize($file),
+                'finished_at' => now(),
+            ]);
+        } catch (Throwable $e) {
+            if ($close) {
+                try {
+                    $close();
+                } catch (Throwable $ignored) {
+                }
+            }
+            @unlink($part);
+
+            $backup->update([
+                'status' => 'failed',
+                'error' => mb_substr($e->getMessage(), 0, 2000),
+                'finished_at' => now(),
+            ]);
+
+            throw $e;
+        }
+    }
+
+    /**
+     * Delete finished backups that fall outside the retention rules.
+     *
+     * The newest full backup and every incremental taken after it are
+     * kept, since restoring the latest state needs the whole chain.
+     *
+     * @return int  Number of backups removed.
+     */
+    public static function prune(): int
+    {
+        $keep = (int) config('backup.keep', 10);
+        $days = (int) config('backup.keep_days', 30);
+
+        $backups = Backup::where('status', 'done')->orderBy('id', 'DESC')->get();
+        $latestFull = optional($backups->firstWhere('mode', 'full'))->id;
+        $removed = 0;
+
+        foreach ($backups->values() as $index => $backup) {
+            $chain = $latestFull !== null && ($backup->id === $latestFull
+                || ($backup->mode === 'incremental' && $backup->id > $latestFull));
+
+            if ($chain) {
+                continue;
+            }
+
+            $expired = ($keep > 0 && $index >= $keep)
+                || ($days > 0 && $backup->created_at->lt(now()->subDays($days)));
+
+            if ($expired) {
+                static::delete($backup);
+                $removed++;
+            }
+        }
+
+        return $removed;
+    }
+
+    /**
+     * Remove a backup file and its record.
+     *
+     * @param  \App\Models\Backup  $backup
+     * @return void
+     */
+    public static function delete(Backup $backup): void
+    {
+        if ($backup->filename && basename($backup->filename) === $backup->filename) {
+            @unlink(static::path($backup));
+            @unlink(static::path($backup) . '.part');
+        }
+
+        $backup->delete();
+    }
+
+    /**
+     * Absolute path of a backup file.
+     *
+     * Rows created before backups were queued have no compression and live
+     * in the old public storage directory.
+     *
+     * @param  \App\Models\Backup  $backup
+     * @return string
+     */
+    public static function path(Backup $backup): string
+    {
+        if ($backup->compression === null) {
+            return storage_path('app/public/' . $backup->filename);
+        }
+
+        return rtrim(config('backup.path'), '/') . '/' . $backup->filename;
+    }
+
+    /**
+     * Base tables of the application database.
+     *
+     * @return array
+     */
+    public static function tables(): array
+    {
+        return array_map(
+            fn ($row) => array_values((array) $row)[0],
+            DB::connection('mysql')->select("SHOW FULL TABLES WHERE Table_type = 'BASE TABLE'")
+        );
+    }
+
+    /**
+     * Tables a backup covers.
+     *
+     * @param  \App\Models\Backup  $backup
+     * @return array
+     */
+    protected static function tablesFor(Backup $backup): array
+    {
+        if ($backup->mode === 'tables') {
+            return array_values(array_filter(explode(',', (string) $backup->tables)));
+        }
+
+        if ($backup->mode === 'incremental') {
+            return DB::connection('mysql')->table('information_schema.COLUMNS')
+                ->where('TABLE_SCHEMA', config('database.connections.mysql.database'))
+                ->where('COLUMN_NAME', config('backup.incremental_column', 'updated_at'))
+                ->pluck('TABLE_NAME')
+                ->all();
+        }
+
+        return static::tables();
+    }
+
+    /**
+     * Build the mysqldump command line.
+     *
+     * The password is passed through MYSQL_PWD so it never shows up in the
+     * process list.
+     *
+     * @param  \App\Models\Backup  $backup
+     * @param  array  $tables
+     * @param  mixed  $since
+     * @return array
+     */
+    protected static function command(Backup $backup, array $tables, $since): array
+    {
+        $connection = config('database.connections.mysql');
+
+        $command = [
+            config('backup.mysqldump', 'mysqldump'),
+            '--host=' . $connection['host'],
+            '--port=' . $connection['port'],
+            '--user=' . $connection['username'],
+            '--single-transaction',
+            '--quick',
+            '--skip-lock-tables',
+            '--default-character-set=utf8mb4',
+        ];
+
+        if ($backup->mode === 'full') {
+            $command[] = '--routines';
+            $command[] = '--triggers';
+        }
+
+        if ($backup->mode === 'incremental') {
+            $command[] = '--no-create-info';
+            $command[] = '--replace';
+            $command[] = '--where=' . config('backup.incremental_column', 'updated_at') . " >= '" . $since . "'";
+        }
+
+        $command[] = $connection['database'];
+
+        if ($backup->mode !== 'full') {
+            array_push($command, ...$tables);
+        }
+
+        return $command;
+    }
+
+    /**
+     * Open a compressing writer on the given file.
+     *
+     * @param  string  $file
+     * @param  string  $compression
+     * @return array  [write(string), close()] callables.
+     */
+    protected static function open(string $file, string $compression): array
+    {
+        $level = (int) config('backup.level', 6);
+
+        if ($compression === 'gzip') {
+            $gz = gzopen($file, 'wb' . max(1, min(9, $level)));
+
+            return [fn ($data) => gzwrite($gz, $data), fn () => gzclose($gz)];
+        }
+
+        if ($compression === 'zstd') {
+            $process = proc_open(
+                ['zstd', '-q', '-f', '-' . max(1, min(19, $level)), '-o', $file],
+                [0 => ['pipe', 'r'], 1 => ['file', '/dev/null', 'w'], 2 => ['file', '/dev/null', 'w']],
+                $pipes
+            );
+
+            if (!is_resource($process)) {
+                throw new RuntimeException('Could not start zstd.');
+            }
+
+            return [
+                fn ($data) => fwrite($pipes[0], $data),
+                function () use ($process, $pipes) {
+                    fclose($pipes[0]);
+                    if (proc_close($process) !== 0) {
+                        throw new RuntimeException('zstd failed to compress the backup.');
+                    }
+                },
+            ];
+        }
+
+        $handle = fopen($file, 'wb');
+
+        return [fn ($data) => fwrite($handle, $data), fn () => fclose($handle)];
+    }
+
+    /**
+     * Compression to use, falling back to plain SQL without zlib.
+     *
+     * @return string
+     */
+    protected static function compression(): string
+    {
+        $compression = config('backup.compression', 'gzip');
+
+        if ($compression === 'gzip' && !function_exists('gzopen')) {
+            return 'none';
+        }
+
+        return in_array($compression, ['gzip', 'zstd', 'none'], true) ? $compression : 'gzip';
+    }
+
+    /**
+     * File extension for a compression.
+     *
+     * @param  string  $compression
+     * @return string
+     */
+    protected static function extension(string $compression): string
+    {
+        return ['gzip' => '.sql.gz', 'zstd' => '.sql.zst'][$compression] ?? '.sql';
+    }
+}
@@ -0,0 +1,399 @@
+<?php
+
+namespace App\Services;
+
+use App\Jobs\ProcessImage;
+use Illuminate\Http\UploadedFile;
+use Illuminate\Support\Facades\File;
+use Illuminate\Support\Facades\Log;
+use Illuminate\Support\Str;
+use InvalidArgumentException;
+
+class ImagePipeline
+{
+    /**
+     * Directory (inside a location) holding the resized variants.
+     */
+    const VARIANTS = 'variants';
+
+    /**
+     * Variant manifests already read during this request.
+     *
+     * @var array
+     */
+    protected static $manifests = [];
+
+    /**
+     * Store an uploaded image under a new content-hashed name and queue its
+     * variants.
+     *
+     * Every upload gets its own file, even when another record uploaded the
+     * same bytes, so deleting one record's image never breaks another's.
+     *
+     * @param  \Illuminate\Http\UploadedFile  $file
+     * @param  string  $location
+     * @return string  The stored file name.
+     */
+    public static function store(UploadedFile $file, string $location = 'img'): string
+    {
+        $extension = static::normalizeExtension($file->guessExtension() ?: $file->getClientOriginalExtension());
+        $name = static::hashName(sha1_file($file->getRealPath()), $extension);
+
+        $file->move(static::path($location), $name);
+
+        static::queue($name, $location);
+
+        return $name;
+    }
+
+    /**
+     * Store raw image bytes (e.g. a base64 upload) and queue its variants.
+     *
+     * @param  string  $contents
+     * @param  string  $extension
+     * @param  string  $location
+     * @return string  The stored file name.
+     */
+    public static function storeContents(string $contents, string $extension, string $location = 'img'): string
+    {
+        $name = static::hashName(sha1($contents), static::normalizeExtension($extension));
+
+        File::ensureDirectoryExists(static::path($location));
+        File::put(static::path($location) . '/' . $name, $contents);
+
+        static::queue($name, $location);
+
+        return $name;
+    }
+
+    /**
+     * Generate the resized JPEG and WebP variants of a stored image.
+     *
+     * GIFs (possibly animated) and SVGs are served as uploaded.
+     *
+     * @param  string  $name
+     * @param  string  $location
+     * @return array  The manifest that was written, or an empty array.
+     */
+    public static function process(string $name, string $location = 'img'): array
+    {
+        if (in_array(pathinfo($name, PATHINFO_EXTENSION), ['gif', 'svg'], true)) {
+            return [];
+        }
+
+        $file = static::path($location) . '/' . $name;
+        $source = File::exists($file) ? @imagecreatefromstring(File::get($file)) : false;
+
+        if (!$source) {
+            Log::warning("Image variants skipped, unreadable file: {$file}");
+            return [];
+        }
+
+        $source = static::orient($source, $file);
+        $width = imagesx($source);
+        $height = imagesy($source);
+
+        $widths = array_filter(config('images.widths', []), fn ($w) => $w < $width);
+        if (empty($widths) || $width <= max(config('images.widths', [0]))) {
+            $widths[] = $width;
+        }
+        sort($widths);
+
+        $directory = static::path($location) . '/' . self::VARIANTS;
+        File::ensureDirectoryExists($directory);
+
+        $stem = pathinfo($name, PATHINFO_FILENAME);
+        $webp = function_exists('imagewebp');
+
+        foreach ($widths as $w) {
+            $resized = static::resize($source, $w, max(1, (int) round($height * $w / $width)));
+
+            static::write("{$directory}/{$stem}-{$w}.jpg", function ($tmp) use ($resized) {
+                $flat = static::flatten($resized);
+                imageinterlace($flat, true);
+                imagejpeg($flat, $tmp, (int) config('images.jpeg_quality', 80));
+                imagedestroy($flat);
+            });
+
+            if ($webp) {
+                static::write("{$directory}/{$stem}-{$w}.webp", function ($tmp) use ($resized) {
+                    imagewebp($resized, $tmp, (int) config('images.webp_quality', 75));
+                });
+            }
+
+            imagedestroy($resized);
+        }
+
+        imagedestroy($source);
+
+        $manifest = [
+            'width' => $width,
+            'height' => $height,
+            'widths' => array_values($widths),
+            'webp' => $webp,
+        ];
+
+        File::put("{$directory}/{$stem}.json", json_encode($manifest));
+        static::$manifests[$location . '/' . $name] = $manifest;
+
+        return $manifest;
+    }
+
+    /**
+     * Get the variant manifest of an image (empty until it is processed).
+     *
+     * @param  string|null  $name
+     * @param  string  $location
+     * @return array
+     */
+    public static function variants(?string $name, string $location = 'img'): array
+    {
+        if (!$name) {
+            return [];
+        }
+
+        $key = $location . '/' . $name;
+
+        if (!array_key_exists($key, static::$manifests)) {
+            $manifest = static::path($location) . '/' . self::VARIANTS . '/' . pathinfo($name, PATHINFO_FILENAME) . '.json';
+            static::$manifests[$key] = File::exists($manifest) ? (json_decode(File::get($manifest), true) ?: []) : [];
+        }
+
+        return static::$manifests[$key];
+    }
+
+    /**
+     * Get the URL of the smallest variant at least $width wide.
+     *
+     * Falls back to the original upload when no variants exist yet.
+     *
+     * @param  string|null  $name
+     * @param  int|null  $width
+     * @param  string  $location
+     * @param  string  $format  "jpg" or "webp"
+     * @return string
+     */
+    public static function url(?string $name, ?int $width = null, string $location = 'img', string $format = 'jpg'): string
+    {
+        $manifest = static::variants($name, $location);
+
+        if (empty($manifest['widths']) || ($format === 'webp' && empty($manifest['webp']))) {
+            return asset(static::baseUrl($location) . '/' . $name);
+        }
+
+        $chosen = end($manifest['widths']);
+        foreach ($manifest['widths'] as $w) {
+            if ($width === null || $w >= $width) {
+                $chosen = $w;
+                break;
+            }
+        }
+
+        return static::variantUrl($name, $chosen, $location, $format);
+    }
+
+    /**
+     * Build a srcset attribute value for all variants of an image.
+     *
+     * @param  string|null  $name
+     * @param  string  $location
+     * @param  string  $format
+     * @return string
+     */
+    public static function srcset(?string $name, string $location = 'img', string $format = 'jpg'): string
+    {
+        $manifest = static::variants($name, $location);
+
+        if (empty($manifest['widths']) || ($format === 'webp' && empty($manifest['webp']))) {
+            return '';
+        }
+
+        return implode(', ', array_map(
+            fn ($w) => static::variantUrl($name, $w, $location, $format) . " {$w}w",
+            $manifest['widths']
+        ));
+    }
+
+    /**
+     * Remove an image and all of its variants.
+     *
+     * @param  string|null  $name
+     * @param  string  $location
+     * @return void
+     */
+    public static function delete(?string $name, string $location = 'img'): void
+    {
+        if (!$name || basename($name) !== $name) {
+            return;
+        }
+
+        $directory = static::path($location);
+        $stem = pathinfo($name, PATHINFO_FILENAME);
+
+        @unlink($directory . '/' . $name);
+        File::delete(File::glob($directory . '/' . self::VARIANTS . '/' . $stem . '-*.{jpg,webp}', GLOB_BRACE) ?: []);
+        @unlink($directory . '/' . self::VARIANTS . '/' . $stem . '.json');
+
+        unset(static::$manifests[$location . '/' . $name]);
+    }
+
+    /**
+     * Absolute directory of a location.
+     *
+     * @param  string  $location
+     * @return string
+     */
+    public static function path(string $location): string
+    {
+        $path = config("images.locations.{$location}.path");
+
+        if (!$path) {
+            throw new InvalidArgumentException("Unknown image location [{$location}].");
+        }
+
+        return rtrim($path, '/');
+    }
+
+    /**
+     * Public URL path of a location.
+     *
+     * @param  string  $location
+     * @return string
+     */
+    public static function baseUrl(string $location): string
+    {
+        return trim(config("images.locations.{$location}.url"), '/');
+    }
+
+    /**
+     * Hand the variant generation to the queue, or run it once the
+     * response has been sent when there is no queue worker.
+     *
+     * @param  string  $name
+     * @param  string  $location
+     * @return void
+     */
+    protected static function queue(string $name, string $location): void
+    {
+        if (config('queue.default') === 'sync') {
+            ProcessImage::dispatchAfterResponse($name, $location);
+            return;
+        }
+
+        ProcessImage::dispatch($name, $location)->onQueue(config('images.queue', 'default'));
+    }
+
+    /**
+     * Public URL of one variant.
+     *
+     * @param  string  $name
+     * @param  int  $width
+     * @param  string  $location
+     * @param  string  $format
+     * @return string
+     */
+    protected static function variantUrl(string $name, int $width, string $location, string $format): string
+    {
+        $stem = pathinfo($name, PATHINFO_FILENAME);
+
+        return asset(static::baseUrl($location) . '/' . self::VARIANTS . "/{$stem}-{$width}.{$format}");
+    }
+
+    /**
+     * Resample an image to the given size, keeping transparency.
+     *
+     * @param  \GdImage  $source
+     * @param  int  $width
+     * @param  int  $height
+     * @return \GdImage
+     */
+    protected static function resize($source, int $width, int $height)
+    {
+        $canvas = imagecreatetruecolor($width, $height);
+        imagealphablending($canvas, false);
+        imagesavealpha($canvas, true);
+        imagecopyresampled($canvas, $source, 0, 0, 0, 0, $width, $height, imagesx($source), imagesy($source));
+
+        return $canvas;
+    }
+
+    /**
+     * Copy an image onto a white background (JPEG has no alpha channel).
+     *
+     * @param  \GdImage  $image
+     * @return \GdImage
+     */
+    protected static function flatten($image)
+    {
+        $flat = imagecreatetruecolor(imagesx($image), imagesy($image));
+        imagefill($flat, 0, 0, imagecolorallocate($flat, 255, 255, 255));
+        imagecopy($flat, $image, 0, 0, 0, 0, imagesx($image), imagesy($image));
+
+        return $flat;
+    }
+
+    /**
+     * Apply the EXIF orientation of phone photos, which resizing would lose.
+     *
+     * @param  \GdImage  $image
+     * @param  string  $file
+     * @return \GdImage
+     */
+    protected static function orient($image, string $file)
+    {
+        if (!function_exists('exif_read_data')) {
+            return $image;
+        }
+
+        $exif = @exif_read_data($file);
+        $angle = [3 => 180, 6 => -90, 8 => 90][$exif['Orientation'] ?? 1] ?? 0;
+
+        if ($angle === 0) {
+            return $image;
+        }
+
+        $rotated = imagerotate($image, $angle, 0);
+        imagedestroy($image);
+
+        return $rotated;
+    }
+
+    /**
+     * Write a file through a temporary name so readers never see it half done.
+     *
+     * @param  string  $file
+     * @param  callable  $writer
+     * @return void
+     */
+    protected static function write(string $file, callable $writer): void
+    {
+        $tmp = $file . '.' . getmypid() . '.tmp';
+        $writer($tmp);
+        rename($tmp, $file);
+    }
+
+    /**
+     * Build a file name from the content hash plus a per-upload suffix.
+     *
+     * @param  string  $hash
+     * @param  string  $extension
+     * @return string
+     */
+    protected static function hashName(string $hash, string $extension): string
+    {
+        return substr($hash, 0, 20) . '-' . Str::lower(Str::random(8)) . '.' . $extension;
+    }
+
+    /**
+     * Normalise an image extension ("JPEG" -> "jpg").
+     *
+     * @param  string  $extension
+     * @return string
+     */
+    protected static function normalizeExtension(string $extension): string
+    {
+        $extension = strtolower(ltrim($extension, '.'));
+
+        return $extension === 'jpeg' ? 'jpg' : $extension;
+    }
+}
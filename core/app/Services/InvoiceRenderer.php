@@ -0,0 +1,145 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\PaymentInvoice;
+use App\Models\PaymentNew;
+use App\Models\PendingPayment;
+use App\Models\Setting;
+use Illuminate\Support\Facades\File;
+use Illuminate\Support\Facades\Http;
+use Illuminate\Support\Facades\Log;
+use PDF;
+use RuntimeException;
+
+class InvoiceRenderer
+{
+    /**
+     * MBT account fields kept in the snapshot: the ones the invoice view
+     * shows or the totals are computed from. The rest of user/view
+     * (password, security question and answer, ...) is never stored.
+     */
+    const USER_FIELDS = ['user_real_name', 'user_address', 'Installation_date', 'Installation_cost'];
+
+    /**
+     * Package fields kept in the snapshot.
+     */
+    const PACKAGE_FIELDS = ['products_name', 'checkout_amount'];
+
+    /**
+     * Get the stored invoice of a payment, rendering it on first use.
+     *
+     * Only confirmed payments have an invoice; others are not found.
+     *
+     * @param  int  $paymentId
+     * @return \App\Models\PaymentInvoice
+     */
+    public static function forPayment($paymentId): PaymentInvoice
+    {
+        $invoice = PaymentInvoice::where('payment_id', $paymentId)->first();
+
+        return $invoice ?: static::render(PaymentNew::where('admin_status', 1)->findOrFail($paymentId));
+    }
+
+    /**
+     * Render a payment's invoice and store it as HTML and PDF files.
+     *
+     * The MBT account and package data are fetched once here and kept in
+     * the snapshot, so later views never call the billing server.
+     *
+     * @param  \App\Models\PaymentNew  $payment
+     * @return \App\Models\PaymentInvoice
+     */
+    public static function render(PaymentNew $payment): PaymentInvoice
+    {
+        $existing = PaymentInvoice::where('payment_id', $payment->id)->first();
+        if ($existing) {
+            return $existing;
+        }
+
+        if (!$payment->isConfirmed()) {
+            throw new RuntimeException("Payment {$payment->id} is not confirmed.");
+        }
+
+        $pending_pay = PendingPayment::where('number', $payment->invoice_no)->first();
+        if (!$pending_pay) {
+            throw new RuntimeException("No pending payment for invoice {$payment->invoice_no}.");
+        }
+
+        $snapshot = static::fetchAccount($payment->payment_user_name);
+        $user = $snapshot['user'];
+        $payment_rec = $snapshot['package'];
+
+        $installation_cost = $user['Installation_cost'] ?? '0';
+        if (in_array($installation_cost, ['FREE', 'Free', ''], true)) {
+            $installation_cost = 0;
+        }
+
+        $amount4 = $pending_pay->amount - $pending_pay->installation_cost;
+        $amount5 = number_format($amount4 * (1 + $pending_pay->commercial_tax/100), 0, '.', '');
+        $amount6 = number_format($amount5 * (1 + $pending_pay->discount/100), 0, '.', '');
+        $act_months = number_format($amount6/$payment_rec['checkout_amount'], 0, '.', '');
+
+        $html = view('front.invoice', compact('payment', 'installation_cost', 'user', 'payment_rec', 'pending_pay', 'act_months'))->render();
+
+        $directory = config('invoice.path');
+        File::ensureDirectoryExists($directory);
+
+        $name = 'invoice_' . $payment->id . '_' . substr(sha1($html), 0, 16);
+        File::put($directory . '/' . $name . '.html', $html);
+
+        $pdfFile = $name . '.pdf';
+        try {
+            PDF::loadHTML($html)->save($directory . '/' . $pdfFile);
+        } catch (\Throwable $e) {
+            Log::error('Invoice PDF failed for payment ' . $payment->id . ': ' . $e->getMessage());
+            $pdfFile = null;
+        }
+
+        return PaymentInvoice::firstOrCreate(['payment_id' => $payment->id], [
+            'invoice_no' => $payment->invoice_no,
+            'html_file' => $name . '.html',
+            'pdf_file' => $pdfFile,
+            'snapshot' => [
+                'user' => $user,
+                'package' => $payment_rec,
+                'installation_cost' => $installation_cost,
+                'act_months' => $act_months,
+                'pending_payment' => $pending_pay->toArray(),
+            ],
+        ]);
+    }
+
+    /**
+     * Fetch the customer's account and current package from MBT, reduced
+     * to USER_FIELDS and PACKAGE_FIELDS.
+     *
+     * @param  string  $userName
+     * @return array{user: array, package: array}
+     */
+    protected static function fetchAccount($userName): array
+    {
+        $settings = Setting::where('id', '1')->first();
+        $client = Http::withoutVerifying()
+            ->acceptJson()
+            ->timeout((int) config('invoice.timeout', 20));
+
+        $token = $client->get($settings->ip_address . 'api/v1/auth/get-access-token')->json('data.access_token');
+        if (!$token) {
+            throw new RuntimeException('Could not get an MBT access token.');
+        }
+
+        $query = ['access_token' => $token, 'user_name' => $userName];
+        $user = $client->get($settings->ip_address . 'api/v1/user/view', $query)->json('data');
+        $packages = $client->get($settings->ip_address . 'api/v1/package/users-packages', $query)->json('data');
+
+        if (empty($user) || empty($packages[0])) {
+            throw new RuntimeException("MBT returned no account data for {$userName}.");
+        }
+
+        return [
+            'user' => array_intersect_key($user, array_flip(self::USER_FIELDS)),
+            'package' => array_intersect_key($packages[0], array_flip(self::PACKAGE_FIELDS)),
+        ];
+    }
+}
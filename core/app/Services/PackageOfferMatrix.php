@@ -0,0 +1,154 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Package;
+use App\Models\Promotion;
+use Illuminate\Support\Facades\Cache;
+
+class PackageOfferMatrix
+{
+    /**
+     * Cache key of the compiled matrix.
+     */
+    const CACHE_KEY = 'package_offers:matrix';
+
+    /**
+     * MBT group whose users get the promotion_type 1 offers.
+     */
+    const PROMOTION_GROUP = '17';
+
+    /**
+     * Get the offers for a user's MBT group.
+     *
+     * Each offer holds the package attributes, the index of the price slot
+     * it is billed from (1, 3, 6 or 12 months) and its bonus period.
+     *
+     * @param  string|int  $groupId
+     * @return array
+     */
+    public static function offers($groupId): array
+    {
+        $matrix = Cache::rememberForever(self::CACHE_KEY, function () {
+            return self::build();
+        });
+
+        return $groupId == self::PROMOTION_GROUP ? $matrix['promotion'] : $matrix['standard'];
+    }
+
+    /**
+     * Apply a user's base price, discount, tax and installation cost.
+     *
+     * @param  array  $offers
+     * @param  int|float  $basePrice  Monthly price parsed from the MBT billing name.
+     * @param  int|float  $discount
+     * @param  int|float  $commercialTax
+     * @param  int|float  $installationCost
+     * @return array
+     */
+    public static function price(array $offers, $basePrice, $discount, $commercialTax, $installationCost): array
+    {
+        $prices = [$basePrice * 1, $basePrice * 3, $basePrice * 6, $basePrice * 12];
+        $amount = 0;
+        $packages = [];
+
+        foreach ($offers as $offer) {
+            if ($offer['slot'] !== null) {
+                $amount = $prices[$offer['slot']];
+            }
+
+            $total = number_format(($amount / (1 + $discount / 100)) / (1 + $commercialTax / 100) + $installationCost, 0, '.', '');
+
+            $packages[] = array_merge($offer['package'], [
+                'price' => $total,
+                'discounted_price' => $total,
+                'extra_month' => $offer['extra_month'],
+                'extra_day' => $offer['extra_day'],
+            ]);
+        }
+
+        return $packages;
+    }
+
+    /**
+     * Drop the compiled matrix after a package or promotion changes.
+     *
+     * @return void
+     */
+    public static function forget(): void
+    {
+        Cache::forget(self::CACHE_KEY);
+    }
+
+    /**
+     * Compile the offer lists from the active packages and promotions.
+     *
+     * Mirrors the original per-request loops: every (package, promotion)
+     * pair whose duration matches yields the cheapest active package of
+     * that plan type and duration.
+     *
+     * @return array
+     */
+    protected static function build(): array
+    {
+        $packages = Package::where('status', 1)->orderBy('discount_price', 'asc')->get();
+        $promotions = Promotion::where('status', '1')->get();
+
+        // Bonus periods come from the first promotion_type 1 row per duration.
+        $bonuses = [];
+        foreach (Promotion::where('promotion_type', '1')->get() as $promotion) {
+            $bonuses[(string) $promotion->duration] = $bonuses[(string) $promotion->duration] ?? $promotion;
+        }
+
+        $matrix = ['promotion' => [], 'standard' => []];
+
+        foreach ($packages as $value) {
+            foreach ($promotions as $promotion) {
+                $kind = $promotion->promotion_type == '1' ? 'promotion' : 'standard';
+
+                if ($value->plan_type == 'Monthly' && $promotion->duration == $value->time) {
+                    $package = $packages->first(function ($candidate) use ($promotion) {
+                        return $candidate->plan_type == 'Monthly' && $candidate->time == $promotion->duration;
+                    });
+                } elseif ($value->plan_type == 'Yearly' && $promotion->duration == '12') {
+                    $package = $packages->first(function ($candidate) {
+                        return $candidate->plan_type == 'Yearly' && $candidate->time == 1;
+                    });
+                } else {
+                    continue;
+                }
+
+                if ($package) {
+                    $matrix[$kind][] = self::offer($package, $bonuses);
+                }
+            }
+        }
+
+        return $matrix;
+    }
+
+    /**
+     * Build a single offer entry.
+     *
+     * @param  \App\Models\Package  $package
+     * @param  array  $bonuses
+     * @return array
+     */
+    protected static function offer(Package $package, array $bonuses): array
+    {
+        if ($package->plan_type == 'Monthly') {
+            $slots = ['1' => 0, '3' => 1, '6' => 2];
+            $bonus = $bonuses[(string) $package->time] ?? null;
+        } else {
+            $slots = ['1' => 3];
+            $bonus = $bonuses['12'] ?? null;
+        }
+
+        return [
+            'package' => $package->toArray(),
+            'slot' => $slots[(string) $package->time] ?? null,
+            'extra_month' => $bonus ? $bonus->extra_month : 0,
+            'extra_day' => $bonus ? $bonus->extra_days : 0,
+        ];
+    }
+}
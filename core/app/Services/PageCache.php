@@ -0,0 +1,176 @@
+<?php
+
+namespace App\Services;
+
+use Illuminate\Http\Request;
+use Illuminate\Http\Response;
+use Illuminate\Support\Facades\Auth;
+use Illuminate\Support\Facades\Cache;
+
+class PageCache
+{
+    /**
+     * Tag carried by every page (layout data from the view composer).
+     */
+    const LAYOUT = 'layout';
+
+    /**
+     * Stand-in for the CSRF token inside stored pages.
+     */
+    const CSRF_PLACEHOLDER = '__page_cache_csrf__';
+
+    /**
+     * Decide whether a request may be answered from the cache.
+     *
+     * Only guests without flashed session data (notifications, validation
+     * errors, old input) get shared pages, since the layout renders those.
+     *
+     * @param  \Illuminate\Http\Request  $request
+     * @return bool
+     */
+    public static function cacheable(Request $request): bool
+    {
+        if (!config('pagecache.enabled') || !$request->isMethod('GET')) {
+            return false;
+        }
+
+        if (array_diff(array_keys($request->query()), config('pagecache.query', []))) {
+            return false;
+        }
+
+        if ($request->hasSession() && !empty($request->session()->get('_flash.old'))) {
+            return false;
+        }
+
+        return !Auth::check();
+    }
+
+    /**
+     * Cache key for a page.
+     *
+     * @param  \Illuminate\Http\Request  $request
+     * @return string
+     */
+    public static function key(Request $request): string
+    {
+        $query = $request->query();
+        ksort($query);
+
+        return 'page_cache:' . sha1(app()->getLocale() . '|' . $request->path() . '?' . http_build_query($query));
+    }
+
+    /**
+     * Current versions of the given tags.
+     *
+     * @param  array  $tags
+     * @return array
+     */
+    public static function versions(array $tags): array
+    {
+        $keys = array_map([self::class, 'tagKey'], $tags);
+
+        return array_map('intval', array_values(Cache::many($keys)));
+    }
+
+    /**
+     * Invalidate every page carrying one of the given tags.
+     *
+     * @param  string  ...$tags
+     * @return void
+     */
+    public static function flush(string ...$tags): void
+    {
+        foreach ($tags as $tag) {
+            if (!Cache::add(self::tagKey($tag), 1)) {
+                Cache::increment(self::tagKey($tag));
+            }
+        }
+    }
+
+    /**
+     * Store a rendered page.
+     *
+     * @param  string  $key
+     * @param  \Illuminate\Http\Response  $response
+     * @param  array  $versions
+     * @return void
+     */
+    public static function put(string $key, Response $response, array $versions): void
+    {
+        $content = $response->getContent();
+
+        if (csrf_token()) {
+            $content = str_replace(csrf_token(), self::CSRF_PLACEHOLDER, $content);
+        }
+
+        Cache::put($key, [
+            'content' => $content,
+            'type' => $response->headers->get('Content-Type'),
+            'versions' => $versions,
+            'time' => time(),
+        ], (int) config('pagecache.ttl', 300) + (int) config('pagecache.stale', 3600));
+    }
+
+    /**
+     * Whether a stored page is still current.
+     *
+     * @param  array  $entry
+     * @param  array  $versions
+     * @return bool
+     */
+    public static function fresh(array $entry, array $versions): bool
+    {
+        return $entry['versions'] === $versions
+            && time() - $entry['time'] < (int) config('pagecache.ttl', 300);
+    }
+
+    /**
+     * Build a response from a stored page.
+     *
+     * @param  array  $entry
+     * @param  string  $status  HIT or STALE
+     * @return \Illuminate\Http\Response
+     */
+    public static function respond(array $entry, string $status): Response
+    {
+        $content = str_replace(self::CSRF_PLACEHOLDER, (string) csrf_token(), $entry['content']);
+
+        return new Response($content, 200, [
+            'Content-Type' => $entry['type'] ?: 'text/html; charset=UTF-8',
+            'X-Page-Cache' => $status,
+        ]);
+    }
+
+    /**
+     * Take the rebuild lock for a page.
+     *
+     * @param  string  $key
+     * @return bool
+     */
+    public static function lock(string $key): bool
+    {
+        return Cache::add($key . ':lock', 1, (int) config('pagecache.lock', 30));
+    }
+
+    /**
+     * Release the rebuild lock for a page.
+     *
+     * @param  string  $key
+     * @return void
+     */
+    public static function unlock(string $key): void
+    {
+        Cache::forget($key . ':lock');
+    }
+
+    /**
+     * Cache key holding a tag's version.
+     *
+     * @param  string  $tag
+     * @return string
+     */
+    protected static function tagKey(string $tag): string
+    {
+        return "page_cache:tag:{$tag}";
+    }
+}
@@ -0,0 +1,49 @@
+<?php
+
+namespace App\Services\RateLimit;
+
+class ApcuLimiter extends Limiter
+{
+    /**
+     * Prefix for APCu keys (shared memory is per server, not per app).
+     *
+     * @var string
+     */
+    protected $prefix;
+
+    /**
+     * Create a new APCu limiter for single-node deployments.
+     *
+     * @param  string|null  $prefix
+     */
+    public function __construct(?string $prefix = null)
+    {
+        $this->prefix = $prefix ?? '';
+    }
+
+    /**
+     * {@inheritdoc}
+     */
+    protected function increment(string $key, int $cost, int $ttl): int
+    {
+        $key = $this->prefix . $key;
+
+        // apcu_inc creates a missing entry with the given TTL atomically.
+        $attempts = apcu_inc($key, $cost, $success, max(1, $ttl));
+
+        if (!$success) {
+            apcu_add($key, $cost, max(1, $ttl));
+            return $cost;
+        }
+
+        return (int) $attempts;
+    }
+
+    /**
+     * {@inheritdoc}
+     */
+    protected function forget(string $key): void
+    {
+        apcu_delete($this->prefix . $key);
+    }
+}
@@ -0,0 +1,49 @@
+<?php
+
+namespace App\Services\RateLimit;
+
+use Illuminate\Support\Facades\Cache;
+
+class CacheLimiter extends Limiter
+{
+    /**
+     * The cache store name.
+     *
+     * @var string|null
+     */
+    protected $store;
+
+    /**
+     * Create a new limiter on top of a Laravel cache store.
+     *
+     * @param  string|null  $store
+     */
+    public function __construct(?string $store = null)
+    {
+        $this->store = $store;
+    }
+
+    /**
+     * {@inheritdoc}
+     */
+    protected function increment(string $key, int $cost, int $ttl): int
+    {
+        $cache = Cache::store($this->store);
+
+        // add() only writes when the key is missing, so the first hit of a
+        // window sets the counter and its expiry in one call.
+        if ($cache->add($key, $cost, max(1, $ttl))) {
+            return $cost;
+        }
+
+        return (int) $cache->increment($key, $cost);
+    }
+
+    /**
+     * {@inheritdoc}
+     */
+    protected function forget(string $key): void
+    {
+        Cache::store($this->store)->forget($key);
+    }
+}
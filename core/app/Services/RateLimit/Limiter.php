@@ -0,0 +1,132 @@
+<?php
+
+namespace App\Services\RateLimit;
+
+abstract class Limiter
+{
+    /**
+     * Record a hit of the given cost and return the window state.
+     *
+     * Windows are aligned to multiples of the decay period, so the reset
+     * time follows from the clock and no separate ":timer" key is needed.
+     * Implementations perform the increment-and-expire in one operation.
+     *
+     * @param  string  $key
+     * @param  int  $maxAttempts
+     * @param  int  $decaySeconds
+     * @param  int  $cost
+     * @return array{allowed: bool, limit: int, remaining: int, reset: int, attempts: int}
+     */
+    public function hit(string $key, int $maxAttempts, int $decaySeconds, int $cost = 1): array
+    {
+        $decaySeconds = max(1, $decaySeconds);
+        $reset = $this->windowEnd($decaySeconds);
+
+        $attempts = $this->increment($this->windowKey($key, $decaySeconds), $cost, $reset - time());
+
+        return [
+            'allowed' => $attempts <= $maxAttempts,
+            'limit' => $maxAttempts,
+            'remaining' => max(0, $maxAttempts - $attempts),
+            'reset' => $reset,
+            'attempts' => $attempts,
+        ];
+    }
+
+    /**
+     * Give back the cost of a hit in the current window, not going below zero.
+     *
+     * @param  string  $key
+     * @param  int  $decaySeconds
+     * @param  int  $cost
+     * @return void
+     */
+    public function refund(string $key, int $decaySeconds, int $cost = 1): void
+    {
+        $decaySeconds = max(1, $decaySeconds);
+        $windowKey = $this->windowKey($key, $decaySeconds);
+        $ttl = $this->windowEnd($decaySeconds) - time();
+
+        // The hit may have landed in the previous window; never leave the
+        // new one below zero
+        $attempts = $this->increment($windowKey, -$cost, $ttl);
+        if ($attempts < 0) {
+            $this->increment($windowKey, -$attempts, $ttl);
+        }
+    }
+
+    /**
+     * Reset the current window for the given key.
+     *
+     * @param  string  $key
+     * @param  int  $decaySeconds
+     * @return void
+     */
+    public function clear(string $key, int $decaySeconds): void
+    {
+        $this->forget($this->windowKey($key, max(1, $decaySeconds)));
+    }
+
+    /**
+     * Atomically add the cost to the counter, creating it with the TTL.
+     *
+     * @param  string  $key
+     * @param  int  $cost
+     * @param  int  $ttl
+     * @return int  The counter value after the increment.
+     */
+    abstract protected function increment(string $key, int $cost, int $ttl): int;
+
+    /**
+     * Delete a counter.
+     *
+     * @param  string  $key
+     * @return void
+     */
+    abstract protected function forget(string $key): void;
+
+    /**
+     * Build the limiter for the configured driver.
+     *
+     * Falls back to the cache store when APCu is requested but not loaded.
+     *
+     * @return static
+     */
+    public static function make(): self
+    {
+        switch (config('ratelimit.driver', 'cache')) {
+            case 'redis':
+                return new RedisLimiter(config('ratelimit.redis_connection'));
+            case 'apcu':
+                if (function_exists('apcu_enabled') && apcu_enabled()) {
+                    return new ApcuLimiter(config('ratelimit.prefix'));
+                }
+                return new CacheLimiter(config('ratelimit.cache_store'));
+            default:
+                return new CacheLimiter(config('ratelimit.cache_store'));
+        }
+    }
+
+    /**
+     * Key of the counter for the window the current time falls into.
+     *
+     * @param  string  $key
+     * @param  int  $decaySeconds
+     * @return string
+     */
+    protected function windowKey(string $key, int $decaySeconds): string
+    {
+        return $key . ':' . intdiv(time(), $decaySeconds);
+    }
+
+    /**
+     * Timestamp at which the current window closes.
+     *
+     * @param  int  $decaySeconds
+     * @return int
+     */
+    protected function windowEnd(int $decaySeconds): int
+    {
+        return (intdiv(time(), $decaySeconds) + 1) * $decaySeconds;
+    }
+}
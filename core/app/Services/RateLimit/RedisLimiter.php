@@ -0,0 +1,52 @@
+<?php
+
+namespace App\Services\RateLimit;
+
+use Illuminate\Support\Facades\Redis;
+
+class RedisLimiter extends Limiter
+{
+    /**
+     * INCRBY and set the expiry on first use, in a single round trip.
+     */
+    const SCRIPT = <<<'LUA'
+local attempts = redis.call('INCRBY', KEYS[1], ARGV[1])
+if attempts == tonumber(ARGV[1]) then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return attempts
+LUA;
+
+    /**
+     * The Redis connection name.
+     *
+     * @var string|null
+     */
+    protected $connection;
+
+    /**
+     * Create a new Redis limiter.
+     *
+     * @param  string|null  $connection
+     */
+    public function __construct(?string $connection = null)
+    {
+        $this->connection = $connection;
+    }
+
+    /**
+     * {@inheritdoc}
+     */
+    protected function increment(string $key, int $cost, int $ttl): int
+    {
+        return (int) Redis::connection($this->connection)->eval(self::SCRIPT, 1, $key, $cost, max(1, $ttl));
+    }
+
+    /**
+     * {@inheritdoc}
+     */
+    protected function forget(string $key): void
+    {
+        Redis::connection($this->connection)->del($key);
+    }
+}
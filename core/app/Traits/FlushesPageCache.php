@@ -0,0 +1,23 @@
+<?php
+
+namespace App\Traits;
+
+use App\Services\PageCache;
+
+trait FlushesPageCache
+{
+    /**
+     * Invalidate the public pages showing this model whenever it is saved
+     * or deleted. Models list their page tags in static::$pageCacheTags.
+     */
+    public static function bootFlushesPageCache(): void
+    {
+        static::saved(function () {
+            PageCache::flush(...static::$pageCacheTags);
+        });
+
+        static::deleted(function () {
+            PageCache::flush(...static::$pageCacheTags);
+        });
+    }
+}
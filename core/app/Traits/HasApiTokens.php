@@ -14,6 +14,17 @@ trait HasApiTokens
      */
     protected ?PersonalAccessToken $accessToken = null;
 
+    /**
+     * Clear cached token lookups when the model changes, so the API never
+     * serves a stale user (status, profile) from the token cache.
+     */
+    public static function bootHasApiTokens(): void
+    {
+        static::updated(function ($model) {
+            PersonalAccessToken::forgetCached($model->tokens()->pluck('token'));
+        });
+    }
+
     /**
      * Get the access tokens that belong to the model.
      */
@@ -68,6 +79,8 @@ trait HasApiTokens
      */
     public function revokeAllTokens(): void
     {
+        PersonalAccessToken::forgetCached($this->tokens()->pluck('token'));
+
         $this->tokens()->delete();
     }
 
@@ -130,4 +130,21 @@ return [
 
     'password_timeout' => 10800,
 
+    /*
+    |--------------------------------------------------------------------------
+    | API Token Lookup
+    |--------------------------------------------------------------------------
+    |
+    | Resolved v1 API tokens (and their users) are cached for "cache_ttl"
+    | seconds; revoking a token clears its entry immediately. The token's
+    | last_used_at column is written at most once per "last_used_interval"
+    | minutes instead of on every request.
+    |
+    */
+
+    'api_tokens' => [
+        'cache_ttl' => env('API_TOKEN_CACHE_TTL', 60),
+        'last_used_interval' => env('API_TOKEN_LAST_USED_INTERVAL', 5),
+    ],
+
 ];
@@ -0,0 +1,50 @@
+<?php
+
+return [
+
+    /*
+    |--------------------------------------------------------------------------
+    | Database Backups
+    |--------------------------------------------------------------------------
+    |
+    | Backups run as a queued job (after the response when the queue is
+    | "sync"). mysqldump uses --single-transaction, so InnoDB tables are
+    | read from a consistent snapshot without locking, and its output is
+    | compressed as it is produced instead of being written as plain SQL.
+    |
+    | A long dump must not be picked up again by a second worker: give the
+    | backup queue a connection whose retry_after exceeds "timeout".
+    |
+    */
+
+    // Directory the dumps are written to (outside the public docroot).
+    'path' => env('BACKUP_PATH', storage_path('app/backups')),
+
+    // "gzip" (zlib extension), "zstd" (zstd binary on the PATH) or "none".
+    'compression' => env('BACKUP_COMPRESSION', 'gzip'),
+
+    // gzip level 1-9 / zstd level 1-19.
+    'level' => env('BACKUP_LEVEL', 6),
+
+    // mysqldump binary.
+    'mysqldump' => env('BACKUP_MYSQLDUMP', 'mysqldump'),
+
+    // Seconds a single backup may run; one still "running" (or still
+    // "queued") well past this is marked failed.
+    'timeout' => env('BACKUP_TIMEOUT', 3600),
+
+    // Queue the backup jobs are pushed to.
+    'queue' => env('BACKUP_QUEUE', 'default'),
+
+    // Incremental backups dump rows of tables having this column that
+    // changed since the previous finished full or incremental backup.
+    'incremental_column' => 'updated_at',
+
+    // Retention: finished backups beyond the newest "keep", or older than
+    // "keep_days" days, are pruned after each run (0 disables a rule).
+    // The newest full backup and the incrementals after it are never
+    // pruned.
+    'keep' => env('BACKUP_KEEP', 10),
+    'keep_days' => env('BACKUP_KEEP_DAYS', 30),
+
+];
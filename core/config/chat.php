@@ -0,0 +1,42 @@
+<?php
+
+return [
+
+    /*
+    |--------------------------------------------------------------------------
+    | Chat Update Channel
+    |--------------------------------------------------------------------------
+    |
+    | Support chat clients (admin inbox and mobile app) hold one streaming
+    | or long-poll connection instead of re-reading the whole conversation.
+    | Each thread carries a version counter in the cache store (a Redis GET
+    | when CACHE_DRIVER=redis); the chat table is only queried when that
+    | counter moves. When the cache store is not shared between workers,
+    | use the "database" driver to watch the chat table itself instead.
+    |
+    | Every open connection occupies a PHP worker, so keep the timeout short
+    | and let the client reconnect (EventSource does this automatically).
+    |
+    */
+
+    // "cache" watches a version counter in the cache store; "database"
+    // watches the thread's highest chat id and read flags (use with the
+    // array cache).
+    'driver' => env('CHAT_STREAM_DRIVER', 'cache'),
+
+    // Seconds a single SSE / long-poll request stays open.
+    'timeout' => env('CHAT_STREAM_TIMEOUT', 25),
+
+    // Seconds between cache version checks while a connection is open.
+    'poll_interval' => env('CHAT_STREAM_POLL_INTERVAL', 1),
+
+    // Seconds between SSE keep-alive comments when nothing changes.
+    'keepalive' => env('CHAT_STREAM_KEEPALIVE', 15),
+
+    // Milliseconds the browser waits before reconnecting an SSE stream.
+    'retry' => env('CHAT_STREAM_RETRY', 2000),
+
+    // Maximum messages returned per update.
+    'batch_size' => 50,
+
+];
@@ -0,0 +1,46 @@
+<?php
+
+return [
+
+    /*
+    |--------------------------------------------------------------------------
+    | Uploaded Images
+    |--------------------------------------------------------------------------
+    |
+    | Uploads are stored under a content-hashed name, made unique per upload
+    | so records never share a file, and then resized into width buckets,
+    | each written as a recompressed JPEG and (when GD has WebP support) a
+    | WebP file in a "variants" directory next to the original. Resizing
+    | runs in the queue, or after the response has been sent when the
+    | queue is "sync", so the upload request never waits on it. Until the
+    | variants exist pages simply fall back to the original.
+    |
+    */
+
+    // Where each kind of upload lives: absolute directory and public URL.
+    'locations' => [
+        'img' => [
+            'path' => dirname(base_path()) . '/assets/front/img',
+            'url' => 'assets/front/img',
+        ],
+        'user' => [
+            'path' => dirname(base_path()) . '/assets/user',
+            'url' => 'assets/user',
+        ],
+        'profiles' => [
+            'path' => storage_path('app/public/profiles'),
+            'url' => 'storage/profiles',
+        ],
+    ],
+
+    // Variant widths in pixels; buckets wider than the original are skipped.
+    'widths' => [320, 640, 1024, 1600],
+
+    // Recompression quality (0-100).
+    'jpeg_quality' => env('IMAGE_JPEG_QUALITY', 80),
+    'webp_quality' => env('IMAGE_WEBP_QUALITY', 75),
+
+    // Queue the resize jobs are pushed to.
+    'queue' => env('IMAGE_QUEUE', 'default'),
+
+];
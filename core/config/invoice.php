@@ -0,0 +1,27 @@
+<?php
+
+return [
+
+    /*
+    |--------------------------------------------------------------------------
+    | Invoice Documents
+    |--------------------------------------------------------------------------
+    |
+    | Customer invoices (/invoice/{id}, print-invoice) are rendered once per
+    | confirmed payment, with the MBT account data snapshotted at that time,
+    | and written as HTML and PDF files under the public assets directory.
+    | File names carry a content hash, so the web server may cache them
+    | indefinitely (see assets/front/invoices/payment/.htaccess).
+    |
+    */
+
+    // Absolute directory the documents are written to.
+    'path' => env('INVOICE_PATH', dirname(base_path()) . '/assets/front/invoices/payment'),
+
+    // Public URL path of that directory.
+    'url' => env('INVOICE_URL', 'assets/front/invoices/payment'),
+
+    // Seconds to wait for the MBT billing server while rendering.
+    'timeout' => env('INVOICE_MBT_TIMEOUT', 20),
+
+];
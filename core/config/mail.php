@@ -133,4 +133,25 @@ return [
 
     'log_channel' => env('MAIL_LOG_CHANNEL'),
 
+    /*
+    |--------------------------------------------------------------------------
+    | Outgoing Mail Queue
+    |--------------------------------------------------------------------------
+    |
+    | App\Helpers\MailSend queues every message (order confirmations, account
+    | mails, newsletters) on this queue. Run a worker with
+    | "php artisan queue:work --queue=mail" and QUEUE_CONNECTION=database or
+    | redis; each worker keeps one SMTP connection open between messages.
+    | Newsletters are split into batches, spaced "batch_delay" seconds apart.
+    |
+    */
+
+    'queue' => env('MAIL_QUEUE', 'mail'),
+
+    'newsletter' => [
+        'batch_size' => env('NEWSLETTER_BATCH_SIZE', 50),
+        'batch_delay' => env('NEWSLETTER_BATCH_DELAY', 60),
+        'pause_ms' => env('NEWSLETTER_PAUSE_MS', 100),
+    ],
+
 ];
@@ -0,0 +1,38 @@
+<?php
+
+return [
+
+    /*
+    |--------------------------------------------------------------------------
+    | Public Page Cache
+    |--------------------------------------------------------------------------
+    |
+    | Rendered pages of the public site (faq, about, service, package, blog,
+    | ...) are kept in the cache store for guests, keyed by path, locale and
+    | the whitelisted query parameters below. Each page carries tags (see the
+    | "page.cache" middleware in routes/web.php); saving or deleting one of
+    | the models behind a tag moves that tag's version, and the page is
+    | rebuilt on the next visit.
+    |
+    | Outdated pages are still served for up to "stale" seconds while a
+    | single request rebuilds them, so concurrent visitors never wait on
+    | the database.
+    |
+    */
+
+    'enabled' => env('PAGE_CACHE_ENABLED', true),
+
+    // Seconds a page is served without being rebuilt.
+    'ttl' => env('PAGE_CACHE_TTL', 300),
+
+    // Seconds an outdated page may still be served during a rebuild.
+    'stale' => env('PAGE_CACHE_STALE', 3600),
+
+    // Seconds one request holds the rebuild lock for a page.
+    'lock' => 30,
+
+    // Query parameters that select content; any other parameter (e.g. a
+    // blog search term) bypasses the cache.
+    'query' => ['page', 'cursor', 'category', 'month', 'year'],
+
+];
@@ -0,0 +1,56 @@
+<?php
+
+return [
+
+    /*
+    |--------------------------------------------------------------------------
+    | API Rate Limiter Backend
+    |--------------------------------------------------------------------------
+    |
+    | The api.limit middleware records each hit with one atomic operation
+    | that returns limit, remaining and reset together.
+    |
+    | Supported: "cache" (any Laravel cache store, e.g. the default file
+    |            store), "redis" (Lua INCRBY + EXPIRE), "apcu" (in-memory,
+    |            single-node deployments only)
+    |
+    */
+
+    'driver' => env('RATE_LIMIT_DRIVER', 'cache'),
+
+    // Cache store used by the "cache" driver (null = default store).
+    'cache_store' => env('RATE_LIMIT_CACHE_STORE'),
+
+    // Redis connection used by the "redis" driver (null = default).
+    'redis_connection' => env('RATE_LIMIT_REDIS_CONNECTION'),
+
+    // Key prefix used by the "apcu" driver.
+    'prefix' => env('RATE_LIMIT_PREFIX', 'telco_isp:'),
+
+    /*
+    |--------------------------------------------------------------------------
+    | MBT Outbound Budget
+    |--------------------------------------------------------------------------
+    |
+    | Cost units per minute that all clients together may spend on the
+    | legacy routes proxying to the MBT billing server (api.limit:mbt).
+    | Requests beyond it are shed with a 429 before any MBT call is made.
+    |
+    | Each client also gets its own allowance per minute. These routes are
+    | unauthenticated, so a client is the MBT account named in user_name /
+    | account_id, falling back to the IP address when neither is sent.
+    | Since the account is whatever the caller sends, every IP address has
+    | its own allowance too, set higher to leave room for carrier NAT.
+    |
+    | update-payment applies paid recharges and is never refused; its cost
+    | is still taken from the budget.
+    |
+    */
+
+    'mbt_budget' => env('RATE_LIMIT_MBT_BUDGET', 600),
+
+    'mbt_client_limit' => env('RATE_LIMIT_MBT_CLIENT_LIMIT', 60),
+
+    'mbt_ip_limit' => env('RATE_LIMIT_MBT_IP_LIMIT', 300),
+
+];
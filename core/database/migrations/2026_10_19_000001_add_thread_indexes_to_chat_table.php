@@ -0,0 +1,41 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * The chat stream looks up "messages in this thread newer than id X";
+     * these indexes let both sides of the OR resolve without a table scan.
+     */
+    public function up(): void
+    {
+        if (!Schema::hasTable('chat')) {
+            return;
+        }
+
+        Schema::table('chat', function (Blueprint $table) {
+            $table->index(['sender_userid', 'id'], 'chat_sender_thread_index');
+            $table->index(['reciever_userid', 'id'], 'chat_reciever_thread_index');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        if (!Schema::hasTable('chat')) {
+            return;
+        }
+
+        Schema::table('chat', function (Blueprint $table) {
+            $table->dropIndex('chat_sender_thread_index');
+            $table->dropIndex('chat_reciever_thread_index');
+        });
+    }
+};
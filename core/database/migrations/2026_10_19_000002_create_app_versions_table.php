@@ -0,0 +1,55 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+use Illuminate\Support\Facades\DB;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        Schema::create('app_versions', function (Blueprint $table) {
+            $table->id();
+            $table->string('platform', 32)->unique();
+            $table->string('min_version', 32)->default('1.0.0');
+            $table->string('latest_version', 32)->default('1.0.0');
+            $table->tinyInteger('force_update')->default(0);
+            $table->string('store_url')->nullable();
+            $table->timestamps();
+        });
+
+        // Values previously hard-coded in MbtController::checkAppUpdate
+        DB::table('app_versions')->insert([
+            [
+                'platform' => 'android',
+                'min_version' => '3.2',
+                'latest_version' => '3.2',
+                'force_update' => 1,
+                'store_url' => 'https://play.google.com/store/apps/details?id=com.company.myanmarbroadbandtelecom',
+                'created_at' => now(),
+                'updated_at' => now(),
+            ],
+            [
+                'platform' => 'ios',
+                'min_version' => '3.2',
+                'latest_version' => '3.2',
+                'force_update' => 1,
+                'store_url' => 'https://apps.apple.com/my/app/id1617950941',
+                'created_at' => now(),
+                'updated_at' => now(),
+            ],
+        ]);
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('app_versions');
+    }
+};
@@ -0,0 +1,62 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * Covers the public blog queries: listing by language (newest first),
+     * filtering by category, lookups by slug and title search.
+     */
+    public function up(): void
+    {
+        if (Schema::hasTable('blogs')) {
+            Schema::table('blogs', function (Blueprint $table) {
+                $table->index(['language_id', 'status', 'id'], 'blogs_language_status_index');
+                $table->index(['bcategory_id', 'status', 'id'], 'blogs_category_status_index');
+                $table->index(['slug', 'language_id'], 'blogs_slug_index');
+
+                if (DB::getDriverName() === 'mysql') {
+                    $table->fullText('title', 'blogs_title_fulltext');
+                }
+            });
+        }
+
+        if (Schema::hasTable('bcategories')) {
+            Schema::table('bcategories', function (Blueprint $table) {
+                $table->index(['language_id', 'status'], 'bcategories_language_status_index');
+                $table->index('slug', 'bcategories_slug_index');
+            });
+        }
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        if (Schema::hasTable('blogs')) {
+            Schema::table('blogs', function (Blueprint $table) {
+                $table->dropIndex('blogs_language_status_index');
+                $table->dropIndex('blogs_category_status_index');
+                $table->dropIndex('blogs_slug_index');
+
+                if (DB::getDriverName() === 'mysql') {
+                    $table->dropFullText('blogs_title_fulltext');
+                }
+            });
+        }
+
+        if (Schema::hasTable('bcategories')) {
+            Schema::table('bcategories', function (Blueprint $table) {
+                $table->dropIndex('bcategories_language_status_index');
+                $table->dropIndex('bcategories_slug_index');
+            });
+        }
+    }
+};
@@ -0,0 +1,32 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        Schema::create('payment_invoices', function (Blueprint $table) {
+            $table->id();
+            $table->unsignedBigInteger('payment_id')->unique();
+            $table->string('invoice_no')->nullable();
+            $table->string('html_file');
+            $table->string('pdf_file')->nullable();
+            $table->longText('snapshot')->nullable();
+            $table->timestamps();
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('payment_invoices');
+    }
+};
@@ -0,0 +1,48 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * Newsletter campaigns track batched sending; the jobs table backs the
+     * "database" queue connection used for outgoing mail.
+     */
+    public function up(): void
+    {
+        Schema::create('newsletter_campaigns', function (Blueprint $table) {
+            $table->id();
+            $table->string('subject');
+            $table->longText('message');
+            $table->unsignedInteger('total')->default(0);
+            $table->unsignedInteger('sent')->default(0);
+            $table->unsignedInteger('failed')->default(0);
+            $table->string('status', 16)->default('queued');
+            $table->timestamps();
+        });
+
+        if (!Schema::hasTable('jobs')) {
+            Schema::create('jobs', function (Blueprint $table) {
+                $table->bigIncrements('id');
+                $table->string('queue')->index();
+                $table->longText('payload');
+                $table->unsignedTinyInteger('attempts');
+                $table->unsignedInteger('reserved_at')->nullable();
+                $table->unsignedInteger('available_at');
+                $table->unsignedInteger('created_at');
+            });
+        }
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('newsletter_campaigns');
+    }
+};
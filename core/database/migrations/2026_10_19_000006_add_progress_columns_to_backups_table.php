@@ -0,0 +1,45 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * Backups are produced by a queued job now; these columns carry its
+     * mode, progress and outcome. Existing rows are plain SQL files in the
+     * old public storage directory and keep a null compression.
+     */
+    public function up(): void
+    {
+        Schema::table('backups', function (Blueprint $table) {
+            $table->string('mode', 16)->default('full')->after('filename');
+            $table->text('tables')->nullable()->after('mode');
+            $table->string('compression', 8)->nullable()->after('tables');
+            $table->string('status', 16)->default('done')->after('compression');
+            $table->unsignedInteger('tables_total')->default(0)->after('status');
+            $table->unsignedInteger('tables_done')->default(0)->after('tables_total');
+            $table->unsignedBigInteger('size')->default(0)->after('tables_done');
+            $table->timestamp('since')->nullable()->after('size');
+            $table->timestamp('started_at')->nullable()->after('since');
+            $table->timestamp('finished_at')->nullable()->after('started_at');
+            $table->text('error')->nullable()->after('finished_at');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('backups', function (Blueprint $table) {
+            $table->dropColumn([
+                'mode', 'tables', 'compression', 'status', 'tables_total', 'tables_done',
+                'size', 'since', 'started_at', 'finished_at', 'error',
+            ]);
+        });
+    }
+};
@@ -0,0 +1,39 @@
+<?php
+
+use App\Services\InvoiceRenderer;
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Support\Facades\DB;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * Snapshots stored before InvoiceRenderer::USER_FIELDS existed hold the
+     * whole MBT account, credentials included; keep only the rendered fields.
+     */
+    public function up(): void
+    {
+        DB::table('payment_invoices')->whereNotNull('snapshot')->orderBy('id')->chunkById(500, function ($invoices) {
+            foreach ($invoices as $invoice) {
+                $snapshot = json_decode($invoice->snapshot, true);
+                if (!is_array($snapshot)) {
+                    continue;
+                }
+
+                $snapshot['user'] = array_intersect_key($snapshot['user'] ?? [], array_flip(InvoiceRenderer::USER_FIELDS));
+                $snapshot['package'] = array_intersect_key($snapshot['package'] ?? [], array_flip(InvoiceRenderer::PACKAGE_FIELDS));
+
+                DB::table('payment_invoices')->where('id', $invoice->id)->update(['snapshot' => json_encode($snapshot)]);
+            }
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        // The removed fields are not recoverable
+    }
+};
@@ -0,0 +1,72 @@
+@extends('admin.layout')
+@section('content')
+
+<div class="content-header">
+    <div class="container-fluid">
+        <div class="row">
+        <div class="col-sm-6">
+            <h1 class="m-0 text-dark">{{ __('App Versions') }} </h1>
+        </div><!-- /.col -->
+        <div class="col-sm-6">
+            <ol class="breadcrumb float-sm-right">
+            <li class="breadcrumb-item"><a href="{{ route('admin.dashboard',app()->getLocale()) }}"><i class="fas fa-home"></i>{{ __('Home') }}</a></li>
+            <li class="breadcrumb-item">{{ __('App Versions') }}</li>
+            </ol>
+        </div><!-- /.col -->
+        </div><!-- /.row -->
+    </div><!-- /.container-fluid -->
+</div>
+<section class="content">
+    <div class="container-fluid">
+        <div class="row">
+            <div class="col-md-12">
+                <div class="card card-primary card-outline">
+                    <div class="card-header">
+                        <h3 class="card-title mt-1">{{ __('App Versions List') }}</h3>
+                    </div>
+                    <!-- /.card-header -->
+                    <div class="card-body">
+                    <table class="table table-striped table-bordered">
+                        <thead>
+                            <tr>
+                                <th>{{__('#')}}</th>
+                                <th>{{__('Platform')}}</th>
+                                <th>{{__('Latest Version')}}</th>
+                                <th>{{__('Minimum Version')}}</th>
+                                <th>{{__('Force Update')}}</th>
+                                <th>{{__('Store URL')}}</th>
+                                <th>{{__('Updated')}}</th>
+                                <th>{{ __('Action') }}</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            @foreach($versions as $k=>$val)
+                                <tr>
+                                    <td>{{++$k}}.</td>
+                                    <td>{{ $val->platform == 'ios' ? 'iOS' : ucfirst($val->platform) }}</td>
+                                    <td>{{$val->latest_version}}</td>
+                                    <td>{{$val->min_version}}</td>
+                                    <td>
+                                        @if($val->force_update==1)
+                                        <span class="badge badge-pill badge-info">{{__('Yes')}}</span>
+                                        @else
+                                        <span class="badge badge-pill badge-danger">{{__('No')}}</span>
+                                        @endif
+                                    </td>
+                                    <td><a href="{{$val->store_url}}" target="_blank">{{$val->store_url}}</a></td>
+                                    <td>{{date("Y/m/d h:i:A", strtotime($val->updated_at))}}</td>
+                                    <td>
+                                        <a href="{{route('admin.edit.app.version',[app()->getLocale(),$val->id])}}" class="btn btn-info btn-sm"><i class="fas fa-pencil-alt"></i>{{ __('Edit') }}</a>
+                                    </td>
+                                </tr>
+                            @endforeach
+                        </tbody>
+                    </table>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+    <!-- /.row -->
+</section>
+@endsection
@@ -0,0 +1,88 @@
+@extends('admin.layout')
+@section('content')
+
+<div class="content-header">
+    <div class="container-fluid">
+        <div class="row">
+        <div class="col-sm-6">
+            <h1 class="m-0 text-dark">{{ __('App Versions') }} </h1>
+        </div><!-- /.col -->
+        <div class="col-sm-6">
+            <ol class="breadcrumb float-sm-right">
+                <li class="breadcrumb-item"><a href="{{ route('admin.dashboard',app()->getLocale()) }}"><i class="fas fa-home"></i>{{ __('Home') }}</a></li>
+                <li class="breadcrumb-item">{{ __('App Versions') }}</li>
+            </ol>
+        </div><!-- /.col -->
+        </div><!-- /.row -->
+    </div><!-- /.container-fluid -->
+</div>
+<section class="content">
+    <div class="container-fluid">
+        <div class="row">
+            <div class="col-lg-12">
+                <div class="card card-primary card-outline">
+                    <div class="card-header">
+                        <h3 class="card-title mt-1">{{ __('Edit App Version') }} ({{ $version->platform == 'ios' ? 'iOS' : ucfirst($version->platform) }})</h3>
+                        <div class="card-tools">
+                            <a href="{{ route('admin.app.version',app()->getLocale()) }}" class="btn btn-primary btn-sm">
+                                <i class="fas fa-angle-double-left"></i> {{ __('Back') }}
+                            </a>
+                        </div>
+                    </div>
+                    <div class="card-body">
+                        <form class="form-horizontal" action="{{route('admin.update.app.version', [app()->getLocale(),$version->id])}}" method="POST">
+                            @csrf
+                            <div class="form-group row">
+                                <label class="col-sm-2 control-label">{{ __('Latest Version') }}<span class="text-danger">*</span></label>
+
+                                <div class="col-sm-10">
+                                    <input type="text" class="form-control" name="latest_version" placeholder="{{ __('Latest Version') }}" value="{{ old('latest_version', $version->latest_version) }}">
+                                    @if ($errors->has('latest_version'))
+                                        <p class="text-danger"> {{ $errors->first('latest_version') }} </p>
+                                    @endif
+                                </div>
+                            </div>
+
+                            <div class="form-group row">
+                                <label class="col-sm-2 control-label">{{ __('Minimum Version') }}<span class="text-danger">*</span></label>
+
+                                <div class="col-sm-10">
+                                    <input type="text" class="form-control" name="min_version" placeholder="{{ __('Minimum Version') }}" value="{{ old('min_version', $version->min_version) }}">
+                                    @if ($errors->has('min_version'))
+                                        <p class="text-danger"> {{ $errors->first('min_version') }} </p>
+                                    @endif
+                                </div>
+                            </div>
+
+                            <div class="form-group row">
+                                <label class="col-sm-2 control-label">{{ __('Store URL') }}</label>
+
+                                <div class="col-sm-10">
+                                    <input type="text" class="form-control" name="store_url" placeholder="{{ __('Store URL') }}" value="{{ old('store_url', $version->store_url) }}">
+                                    @if ($errors->has('store_url'))
+                                        <p class="text-danger"> {{ $errors->first('store_url') }} </p>
+                                    @endif
+                                </div>
+                            </div>
+
+                            <div class="form-group row">
+                                <label class="col-sm-2 control-label">{{ __('Force Update') }}</label>
+
+                                <div class="col-sm-10">
+                                    <input type="checkbox" name="force_update" value="1" @if(old('force_update', $version->force_update)) checked @endif>
+                                </div>
+                            </div>
+
+                            <div class="form-group row">
+                                <div class="offset-sm-2 col-sm-10">
+                                    <button type="submit" class="btn btn-primary">{{ __('Update') }}</button>
+                                </div>
+                            </div>
+                        </form>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+</section>
+@endsection
@@ -25,8 +25,18 @@
                         <div class="card-header">
                             <h3 class="card-title mt-1">{{ __('Backup Lists') }}</h3>
                             <div class="card-tools d-flex">
-                                <form  action="{{route('admin.backup.store', app()->getLocale())}}" method="post">
+                                <form class="form-inline" action="{{route('admin.backup.store', app()->getLocale())}}" method="post">
                                     @csrf
+                                    <select name="mode" class="form-control form-control-sm mr-1" id="backup_mode">
+                                        <option value="full">{{ __('Full') }}</option>
+                                        <option value="incremental">{{ __('Incremental') }}</option>
+                                        <option value="tables">{{ __('Selected tables') }}</option>
+                                    </select>
+                                    <select name="tables[]" class="form-control form-control-sm mr-1 d-none" id="backup_tables" multiple>
+                                        @foreach ($tables as $table)
+                                            <option value="{{ $table }}">{{ $table }}</option>
+                                        @endforeach
+                                    </select>
                                     <button type="submit" class="btn btn-primary btn-sm"><i class="fas fa-plus"></i> Create Backup</button>
                                 </form>
                             </div>
@@ -39,8 +49,10 @@
                             <table  class="table table-striped table-bordered data_table">
                                 <thead>
                                 <tr>
-                                    <th>{{ __('#') }}</th>
                                     <th>{{ __('Data & Time') }}</th>
+                                    <th>{{ __('Mode') }}</th>
+                                    <th>{{ __('Status') }}</th>
+                                    <th>{{ __('Size') }}</th>
                                     <th>{{ __('Action') }}</th>
                                 </tr>
                                 </thead>
@@ -48,17 +60,28 @@
                                 @foreach ($backups as $key => $backup)
                                     <tr>
                                         <td>{{$backup->created_at}}</td>
+                                        <td>{{ ucfirst($backup->mode) }}@if($backup->mode == 'tables') <small class="text-muted">({{ $backup->tables }})</small>@endif</td>
                                         <td>
-                                            <form class="d-inline-block" action="{{route('admin.backup.download', ['locale' => app()->getLocale(), 'id' => $backup->id])}}" method="post">
-                                                @csrf
-                                                <input type="hidden" name="filename" value="{{$backup->filename}}">
-                                                <button type="submit" class="btn btn-secondary btn-sm">
+                                            @if (in_array($backup->status, ['queued', 'running']))
+                                                <div class="progress backup-progress" data-url="{{ route('admin.backup.progress', ['locale' => app()->getLocale(), 'id' => $backup->id]) }}">
+                                                    <div class="progress-bar progress-bar-striped progress-bar-animated" role="progressbar" style="width: {{ $backup->progress() }}%">{{ $backup->progress() }}%</div>
+                                                </div>
+                                            @elseif ($backup->status == 'failed')
+                                                <span class="badge badge-danger" title="{{ $backup->error }}">{{ __('Failed') }}</span>
+                                            @else
+                                                <span class="badge badge-success">{{ __('Done') }}</span>
+                                            @endif
+                                        </td>
+                                        <td>{{ $backup->size ? number_format($backup->size / 1048576, 2) . ' MB' : '-' }}</td>
+                                        <td>
+                                            @if ($backup->status == 'done')
+                                            <a class="btn btn-secondary btn-sm" href="{{route('admin.backup.download', ['locale' => app()->getLocale(), 'id' => $backup->id])}}">
                                 <span class="btn-label">
                                   <i class="fas fa-arrow-alt-circle-down"></i>
                                 </span>
-                                                    Download
-                                                </button>
-                                            </form>
+                                                Download
+                                            </a>
+                                            @endif
                                             <form class="deleteform d-inline-block" action="{{route('admin.backup.delete', ['locale' => app()->getLocale(), 'id' => $backup->id])}}" method="post">
                                                 @csrf
                                                 <button type="submit" class="btn btn-danger btn-sm deletebtn">
@@ -82,3 +105,25 @@
         <!-- /.row -->
     </section>
 @endsection
+
+@section('script')
+<script>
+    $('#backup_mode').on('change', function () {
+        $('#backup_tables').toggleClass('d-none', $(this).val() !== 'tables');
+    });
+
+    // Follow running backups and reload once they finish
+    $('.backup-progress').each(function () {
+        var $progress = $(this);
+        var timer = setInterval(function () {
+            $.getJSON($progress.data('url'), function (data) {
+                $progress.find('.progress-bar').css('width', data.progress + '%').text(data.progress + '%');
+                if (data.status === 'done' || data.status === 'failed') {
+                    clearInterval(timer);
+                    location.reload();
+                }
+            });
+        }, 3000);
+    });
+</script>
+@endsection
@@ -937,10 +937,40 @@ $(document).ready(function(){
            $('#conversation').html(res)
            //m//
 		jQuery('.messages').scrollTop(jQuery('.messages')[0].scrollHeight);
+		openChatStream(to_user_id);
         }
         });
 	}
 	
+	// Push updates for the open conversation instead of re-polling get-user-chat
+	var chatStream = null;
+	function openChatStream(to_user_id)
+	{
+	    if (chatStream) {
+	        chatStream.close();
+	    }
+	    if (!window.EventSource) {
+	        return;
+	    }
+	    chatStream = new EventSource("{{url('en/admin/chat-stream')}}?user_id="+to_user_id);
+	    chatStream.addEventListener('message', function(event) {
+	        var chat = JSON.parse(event.data);
+	        // Our own replies are already rendered by insert-user-chat
+	        if (chat.sender_userid == $('#from_user_id').val()) {
+	            return;
+	        }
+	        var item = $('<li class="send"><img width="22px" height="22px" src="https://telco.mbt.com.mm/assets/admin/img/avatar.png" alt="" /><p></p></li>');
+	        item.find('p').text(chat.message).append('<br>' + $('<span>').text(chat.timestamp).html());
+	        $('#conversation ul').append(item);
+	        jQuery('.messages').scrollTop(jQuery('.messages')[0].scrollHeight);
+	    });
+	    chatStream.addEventListener('unread', function(event) {
+	        var counts = JSON.parse(event.data);
+	        $('#part' + to_user_id).hide();
+	        $('#chat-unread-count').text(counts.inbox > 0 ? counts.inbox : '');
+	    });
+	}
+	
 	$(document).on("click", '.submit', function(event) { 
 		var to_user_id   =  $('#to_user_id').val();
 		var from_user_id =  $('#from_user_id').val(); 
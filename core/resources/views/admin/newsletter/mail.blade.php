@@ -56,6 +56,53 @@
                 </div>
             </div>
         </div>
+        @if(count($campaigns) > 0)
+        <div class="row">
+            <div class="col-md-12">
+                <div class="card card-primary card-outline">
+                    <div class="card-header">
+                        <h3 class="card-title mt-1">{{ __('Recent Campaigns') }}</h3>
+                    </div>
+                    <div class="card-body">
+                        <table class="table table-striped table-bordered">
+                            <thead>
+                                <tr>
+                                    <th>{{ __('Subject') }}</th>
+                                    <th>{{ __('Progress') }}</th>
+                                    <th>{{ __('Sent') }}</th>
+                                    <th>{{ __('Failed') }}</th>
+                                    <th>{{ __('Status') }}</th>
+                                    <th>{{ __('Created') }}</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                @foreach($campaigns as $campaign)
+                                <tr>
+                                    <td>{{ $campaign->subject }}</td>
+                                    <td>
+                                        <div class="progress">
+                                            <div class="progress-bar" role="progressbar" style="width: {{ $campaign->progress() }}%">{{ $campaign->progress() }}%</div>
+                                        </div>
+                                    </td>
+                                    <td>{{ $campaign->sent }} / {{ $campaign->total }}</td>
+                                    <td>{{ $campaign->failed }}</td>
+                                    <td>
+                                        @if($campaign->status == 'done')
+                                        <span class="badge badge-pill badge-info">{{ __('Done') }}</span>
+                                        @else
+                                        <span class="badge badge-pill badge-warning">{{ __(ucfirst($campaign->status)) }}</span>
+                                        @endif
+                                    </td>
+                                    <td>{{ date("Y/m/d h:i:A", strtotime($campaign->created_at)) }}</td>
+                                </tr>
+                                @endforeach
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+            </div>
+        </div>
+        @endif
     </div>
     <!-- /.row -->
 </section>
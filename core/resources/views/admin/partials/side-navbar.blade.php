@@ -286,6 +286,7 @@
                @if(request()->routeIs('admin.errormessage')) menu-open @endif
                @if(request()->routeIs('admin.package')) menu-open @endif
                @if(request()->routeIs('admin.package.edit')) menu-open @endif
+               @if(request()->routeIs('admin.app.version') || request()->routeIs('admin.edit.app.version')) menu-open @endif
                ">
                <a href="#" class="nav-link">
                   <i class="nav-icon fas fas fa-mobile"></i>
@@ -314,6 +315,15 @@
                      </a>
                   </li>
                   @endif
+                  @if(in_array("50", $arr))
+                  <li class="nav-item">
+                     <a href="{{route('admin.app.version',app()->getLocale())}}" class="nav-link
+                        @if(request()->routeIs('admin.app.version') || request()->routeIs('admin.edit.app.version')) active @endif">
+                        <i class="far fa-circle nav-icon"></i>
+                        <p>{{ __("App Versions") }}</p>
+                     </a>
+                  </li>
+                  @endif
                   @if(in_array("54", $arr))
                   <li class="nav-item">
                      <a href="{{route('admin.Preferential_activities',app()->getLocale())}}" class="nav-link
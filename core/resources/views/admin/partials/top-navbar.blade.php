@@ -10,7 +10,7 @@
         <a class="ok" data-toggle="dropdown" href="#" style="margin: 8px;">
             <i class="fas fa-bell" style="height: 0px; border-radius: 68%; background: #2a7cce; padding: 6px 7px 23px; border-color: yellow;" aria-hidden="true">
                 <b class="badge badge-info"></b>
-                <span style="color: #f4f6f9; padding: 2px; background: #ffa700; position: absolute;">
+                <span id="chat-unread-count" style="color: #f4f6f9; padding: 2px; background: #ffa700; position: absolute;">
                     <?php 
                         $count = DB::table('chat')->select(DB::raw('count(*) as count'))->where('read_status', '=', 0)->where('sender_userid', '!=', 1 )->count();
                         if($count==0){ 
@@ -43,7 +43,7 @@
 				<div class="col-lg-8">
 					<div class="blog-details">
                         <div class="img">
-                            <img src="{{asset('assets/front/img/'.$blog->main_image) }}" alt="">
+                            {!! Helper::picture($blog->main_image, '', '(max-width: 767px) 100vw, 33vw') !!}
                         </div>
                         <div class="content">
                             <ul class="top-meta">
@@ -112,7 +112,7 @@
 							<li class="@if(request()->input('category') == $bcategory->id) active @endif">
 								<a href="{{route('front.blogs',  ['term'=>request()->input('term'), 'category'=>$bcategory->slug]) }}">
 									<p>
-										<i class="fas fa-angle-double-right"></i>	{{ $bcategory->name }}
+										<i class="fas fa-angle-double-right"></i>	{{ $bcategory->name }} ({{ $bcategory->blogs_count }})
 									</p>
 								</a>
 							</li>
@@ -128,7 +128,7 @@
 							<li>
 								<a href="{{route('front.blogdetails', $latestblog->slug)}}" class="post">
 									<div class="post-img">
-										<img src="{{asset('assets/front/img/'.$latestblog->main_image)}}" alt="">
+										{!! Helper::picture($latestblog->main_image, '', '(max-width: 767px) 100vw, 33vw') !!}
 									</div>
 									<div class="post-details">
 										<p class="post-title">
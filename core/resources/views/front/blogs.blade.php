@@ -48,7 +48,7 @@
 							<div class="col-md-6">
 								<a href="{{route('front.blogdetails', $blog->slug)}}" class="single-blog">
 									<div class="img">
-										<img src="{{asset('assets/front/img/'.$blog->main_image) }}" alt="">
+										{!! Helper::picture($blog->main_image, '', '(max-width: 767px) 100vw, 33vw') !!}
 									</div>
 									<div class="content">
 										<ul class="top-meta">
@@ -95,7 +95,7 @@
 							<li class="@if(request()->input('category') == $bcategory->slug) active @endif">
 								<a href="{{route('front.blogs',  ['term'=>request()->input('term'), 'category'=>$bcategory->slug]) }}">
 									<p>
-										<i class="fas fa-angle-double-right"></i>	{{ $bcategory->name }}
+										<i class="fas fa-angle-double-right"></i>	{{ $bcategory->name }} ({{ $bcategory->blogs_count }})
 									</p>
 								</a>
 							</li>
@@ -111,7 +111,7 @@
 							<li>
 								<a href="{{route('front.blogdetails', $latestblog->slug)}}" class="post">
 									<div class="post-img">
-										<img src="{{asset('assets/front/img/'.$latestblog->main_image)}}" alt="">
+										{!! Helper::picture($latestblog->main_image, '', '(max-width: 767px) 100vw, 33vw') !!}
 									</div>
 									<div class="post-details">
 										<p class="post-title">
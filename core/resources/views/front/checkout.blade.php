@@ -64,6 +64,11 @@
 						</tr>
 					  </thead>
 					  <tbody>
+					  @php
+						  $lineTotals = Helper::showCurrencyPrices(collect($cart)->map(function ($item) {
+							  return $item['price'] * $item['qty'];
+						  }));
+					  @endphp
 					  @foreach ($cart as $id => $item)
 					  <tr>
 						<td>
@@ -73,7 +78,7 @@
 						  <h4 class="product-title"><a href="{{ route('front.product.details',$product->slug) }}">{{ $item['name'] }}</a></h4>
 						</td>
 						<td class="price">{{ $item['price'] }} * {{ $item['qty'] }}
-						  = {{ Helper::showCurrencyPrice($item['price'] * $item['qty']) }}</td>
+						  = {{ $lineTotals[$id] }}</td>
 					  </tr>
 					  @endforeach
 					  </tbody>
@@ -8,7 +8,7 @@
 		<div class="hero-area-slider">
 			<div class="intro-carousel">
 				@foreach($sliders as $slider)
-				<div class="intro-content slide-one" style="background-image: url({{ asset('assets/front/img/'.$slider->image) }})">
+				<div class="intro-content slide-one" style="background-image: url({{ \App\Services\ImagePipeline::url($slider->image, 1600) }})">
 					<div class="container">
 						<div class="row">
 							<div class="col-lg-12">
@@ -211,7 +211,7 @@
 					<div class="col-lg-3 col-md-6">
 						<div class="single-counter">
 							<div class="icon">
-								<img src="{{ asset('assets/front/img/'.$funfact->icon) }}" alt="">
+								{!! Helper::picture($funfact->icon, '', '80px') !!}
 							</div>
 							<div class="content">
 								<h4>{{ $funfact->value }}</h4>
@@ -247,7 +247,7 @@
 				<div class="col-lg-4 col-md-6">
 					<a href="{{ route('front.service.details', $service->slug) }}" class="single-service">
 						<div class="left-area">
-							<img class="w-80" src="{{ asset('assets/front/img/'.$service->icon) }}" alt="">
+							{!! Helper::picture($service->icon, '', '80px', 'w-80') !!}
 						</div>
 						<div class="right-area">
 							<h4 class="title">
@@ -311,7 +311,7 @@
 								</div>
 								<div class="reviewr">
 									<div class="img">
-										<img src="{{asset('assets/front/img/'.$testimonial->image) }}" alt="">
+										{!! Helper::picture($testimonial->image, '', '(max-width: 767px) 100vw, 50vw') !!}
 									</div>
 									<div class="content">
 										<h4 class="name">
@@ -356,7 +356,7 @@
 				<div class="col-lg-4 col-md-6">
 					<a href="{{route('front.blogdetails', $blog->slug)}}" class="single-blog">
 						<div class="img">
-							<img src="{{asset('assets/front/img/'.$blog->main_image) }}" alt="">
+							{!! Helper::picture($blog->main_image, '', '(max-width: 767px) 100vw, 33vw') !!}
 						</div>
 						<div class="content">
 							<ul class="top-meta">
@@ -51,7 +51,7 @@
 				<div class="col-lg-3 col-md-6">
 					<div class="single-service entertainment">
 						<div class="left-area">
-							<img src="{{ asset('assets/front/img/'.$entertainment->icon) }}" alt="">
+							{!! Helper::picture($entertainment->icon, '', '(max-width: 767px) 100vw, 50vw') !!}
 						</div>
 						<div class="right-area">
 							<h4 class="title">
@@ -82,7 +82,7 @@
 				<div class="col-lg-3 col-md-6">
 					<a href="{{ $mediazone->link }}" class="single-service media d-block" target="_blank">
 						<div class="left-area">
-								<img src="{{ asset('assets/front/img/'.$mediazone->icon) }}" alt="">
+								{!! Helper::picture($mediazone->icon, '', '(max-width: 767px) 100vw, 50vw') !!}
 						</div>
 						<div class="right-area">
 							<h4 class="title">
@@ -67,7 +67,7 @@
               <div class="col-lg-8">
                 <div class="service-content-wrapper">
                   <div class="main-image">
-                    <img src="{{ asset('assets/front/img/'.$service->image) }}" alt="">
+                    {!! Helper::picture($service->image, '', '(max-width: 767px) 100vw, 50vw') !!}
                   </div>
                   <div class="content">
   
@@ -39,7 +39,7 @@
 				<div class="col-lg-4 col-md-6">
 					<a href="{{ route('front.service.details', $service->slug) }}" class="single-service">
 						<div class="left-area">
-							<img class="w-80" src="{{ asset('assets/front/img/'.$service->icon) }}" alt="">
+							{!! Helper::picture($service->icon, '', '80px', 'w-80') !!}
 						</div>
 						<div class="right-area">
 							<h4 class="title">
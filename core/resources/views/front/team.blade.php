@@ -39,7 +39,7 @@
 				<div class="col-lg-4 col-md-6">
 					<div class="team-member">
 						<div class="member-pic">
-						<img src="{{ asset('assets/front/img/'.$team->image) }}" alt="">
+						{!! Helper::picture($team->image, '', '(max-width: 767px) 100vw, 33vw') !!}
 						</div>
 
 						<div class="social">
@@ -10,6 +10,9 @@
 |
 | SECURITY: Removed hardcoded CORS headers - use config/cors.php instead
 |
+| Routes that proxy to the MBT billing server use api.limit:mbt, which
+| charges a per-route cost against the client and a shared MBT budget.
+|
 */
 
 use Illuminate\Http\Request;
@@ -31,19 +34,19 @@ Route::middleware('auth:api')->get('/user', function (Request $request) {
 Route::group(['namespace' => 'API'], function ()
 {
     // Mbt Api
-  Route::get('get-access-token','MbtController@gettoken');
-  Route::get('store-user','MbtController@StoreUser');
-  Route::get('view-user','MbtController@viewUser');
-  Route::get('bound-device','MbtController@boundDevices');
+  Route::get('get-access-token','MbtController@gettoken')->middleware('api.limit:mbt');
+  Route::get('store-user','MbtController@StoreUser')->middleware('api.limit:mbt');
+  Route::get('view-user','MbtController@viewUser')->middleware('api.limit:mbt');
+  Route::get('bound-device','MbtController@boundDevices')->middleware('api.limit:mbt');
   //Route::get('payment-records','MbtController@paymentRecords');
-  Route::get('install-broadband-bind-mobile-number','MbtController@bindMobileNumber');
-  Route::get('query-ordersed-product','MbtController@QueryOrderProduct');
-  Route::get('send-notification','MbtController@SendNotification');
-  Route::get('product-operators','MbtController@ProductOperators');
-  Route::get('add-group','MbtController@AddGroup');
-  Route::get('view-all-groups','MbtController@ViewAllGroups');
-  Route::get('add-billing','MbtController@AddBilling');
-  Route::get('create-control','MbtController@CreateControl');
+  Route::get('install-broadband-bind-mobile-number','MbtController@bindMobileNumber')->middleware('api.limit:mbt');
+  Route::get('query-ordersed-product','MbtController@QueryOrderProduct')->middleware('api.limit:mbt');
+  Route::get('send-notification','MbtController@SendNotification')->middleware('api.limit:mbt');
+  Route::get('product-operators','MbtController@ProductOperators')->middleware('api.limit:mbt');
+  Route::get('add-group','MbtController@AddGroup')->middleware('api.limit:mbt');
+  Route::get('view-all-groups','MbtController@ViewAllGroups')->middleware('api.limit:mbt');
+  Route::get('add-billing','MbtController@AddBilling')->middleware('api.limit:mbt');
+  Route::get('create-control','MbtController@CreateControl')->middleware('api.limit:mbt');
   
   //Our server Api
   Route::post("check-validation","LoginController@CheckMobileNumber");
@@ -51,17 +54,17 @@ Route::group(['namespace' => 'API'], function ()
   Route::post("login","LoginController@login");
   Route::post("forgot-password","LoginController@forgot_password");
   Route::post("apply-install-broadband","LoginController@ApplyInstallBroadband");
-  Route::post("get-payment-record","MbtController@paymentRecords");
+  Route::post("get-payment-record","MbtController@paymentRecords")->middleware('api.limit:mbt');
  // Route::post("get-payment-record","LoginController@GetPaymentRecord");
-  Route::get("get-package-information","MbtController@GetPackageInformation");
-  Route::get("user-super-search","MbtController@UserSuperSearch");
+  Route::get("get-package-information","MbtController@GetPackageInformation")->middleware('api.limit:mbt');
+  Route::get("user-super-search","MbtController@UserSuperSearch")->middleware('api.limit:mbt');
   
   Route::get("get-notification","MbtController@GetMessage");
   
   Route::post("update-notification","MbtController@updatenoti");
   Route::post("language-id","MbtController@get_language");
   
-  Route::post("get-payment-failed-record","MbtController@paymentfailedRecords");
+  Route::post("get-payment-failed-record","MbtController@paymentfailedRecords")->middleware('api.limit:mbt');
   
   Route::post("user-message","MbtController@user_message");
 
@@ -98,9 +101,9 @@ Route::group(['namespace' => 'API'], function ()
   Route::post("mbt-kbz-refund-status","MbtController@mbtkbzrefundstatus");
   Route::post("mbt-kbz-close","MbtController@mbtkbzclose");
   Route::post("mbt-kbz-refund","MbtController@mbtkbzrefund");
-  Route::post("check-payment","MbtController@check_payment");
+  Route::post("check-payment","MbtController@check_payment")->middleware('api.limit:mbt');
   
-  Route::post("mbt-kbz-pay-check","MbtController@mbtkbzpaycheck");
+  Route::post("mbt-kbz-pay-check","MbtController@mbtkbzpaycheck")->middleware('api.limit:mbt');
   
   // KBZ Mobile Banking
   
@@ -131,15 +134,15 @@ Route::group(['namespace' => 'API'], function ()
   Route::match(array('GET','POST'),'wave-payment-status', 'MbtController@wavepay_payment_status')->name('wavepay_payment_status');
   
   
-  Route::post('check-user', 'MbtController@check_user')->name('check_user');
+  Route::post('check-user', 'MbtController@check_user')->name('check_user')->middleware('api.limit:mbt');
 
   Route::post("store-failure-reports","MbtController@StoreFailureReports");
   Route::get("get-failure-reports","MbtController@GetFailureReports");
   Route::get("get-banner","MbtController@GetBanner"); 
   Route::get("get-Preferential-activities","LoginController@Preferential_activities"); 
-  Route::post("get-self-profile","MbtController@GetMySelf"); 
+  Route::post("get-self-profile","MbtController@GetMySelf")->middleware('api.limit:mbt');
   Route::post("get-language","MbtController@GetLanguage"); 
-  Route::post("bind-user","MbtController@BindUser"); 
+  Route::post("bind-user","MbtController@BindUser")->middleware('api.limit:mbt');
   Route::post("change-number","LoginController@change_number"); 
   Route::post("change-password","LoginController@change_Password"); 
   Route::post("forgot-password","LoginController@forgotPassword"); 
@@ -150,9 +153,11 @@ Route::group(['namespace' => 'API'], function ()
   //Chat api//
   Route::Post("insert-message","LoginController@insertmessage");
   Route::Post("get-message","LoginController@get_message");
+  Route::get("chat-stream","LoginController@chat_stream");
+  Route::Post("chat-updates","LoginController@chat_updates");
   Route::Post("get-apply-query","LoginController@GetApplyQuery");
   Route::Post("update-apply-query","LoginController@UpdateApplyQuery");
-  Route::get("get-package","MbtController@GetPackage");
+  Route::get("get-package","MbtController@GetPackage")->middleware('api.limit:mbt');
   Route::post("unbind-user","MbtController@UnbindUser");
   Route::post("store-payment","MbtController@StorePayment");
   Route::post("payment-method","LoginController@paymentmethod");
@@ -161,16 +166,16 @@ Route::group(['namespace' => 'API'], function ()
   Route::post("signupotp","LoginController@signupot");
   
   Route::get("mbtprofile","MbtController@logo_image");
-  Route::post("update-payment","MbtController@UpdatePayment");
+  Route::post("update-payment","MbtController@UpdatePayment")->middleware('api.limit:mbt');
   Route::post("check-app-version","MbtController@checkAppUpdate");
   
   Route::post("remove-user","MbtController@removeUser");
   
-  Route::post("check-new-user","MbtController@checknewuser");
-  Route::post("check-expire-time","MbtController@checkexpiretime");
-  Route::get("get-new-package","MbtController@GetNewPackage");
-  Route::post("get-new-package-message","MbtController@getnewpackage_language");
-  Route::get("get-new-package-information","MbtController@GetNewPackageInformation");
+  Route::post("check-new-user","MbtController@checknewuser")->middleware('api.limit:mbt');
+  Route::post("check-expire-time","MbtController@checkexpiretime")->middleware('api.limit:mbt');
+  Route::get("get-new-package","MbtController@GetNewPackage")->middleware('api.limit:mbt');
+  Route::post("get-new-package-message","MbtController@getnewpackage_language")->middleware('api.limit:mbt');
+  Route::get("get-new-package-information","MbtController@GetNewPackageInformation")->middleware('api.limit:mbt');
   Route::post("store-new-payment","MbtController@StoreNewPayment");
   Route::post("print-invoice","MbtController@printinvoice");
   
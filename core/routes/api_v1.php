@@ -40,6 +40,7 @@ Route::prefix('v1')->namespace('API\V1')->middleware('api.limit:auth')->group(fu
 Route::prefix('v1')->namespace('API\V1')->middleware('api.limit:read')->group(function () {
     Route::get('packages', 'PackageController@index');
     Route::get('packages/{id}', 'PackageController@show');
+    Route::get('bootstrap', 'SystemController@bootstrap');
     Route::get('banners', 'SystemController@banners');
     Route::get('maintenance-status', 'SystemController@maintenanceStatus');
     Route::get('app-version', 'SystemController@appVersion');
@@ -16,3 +16,25 @@ use Illuminate\Foundation\Inspiring;
 Artisan::command('inspire', function () {
     $this->comment(Inspiring::quote());
 })->describe('Display an inspiring quote');
+
+Artisan::command('images:variants {location=img} {--force : Regenerate variants that already exist}', function ($location) {
+    $directory = \App\Services\ImagePipeline::path($location);
+    $count = 0;
+
+    foreach (\Illuminate\Support\Facades\File::files($directory) as $file) {
+        $name = $file->getFilename();
+
+        if (!in_array(strtolower($file->getExtension()), ['jpg', 'jpeg', 'png', 'webp'], true)) {
+            continue;
+        }
+        if (!$this->option('force') && \App\Services\ImagePipeline::variants($name, $location)) {
+            continue;
+        }
+
+        if (\App\Services\ImagePipeline::process($name, $location)) {
+            $count++;
+        }
+    }
+
+    $this->info("Generated variants for {$count} image(s) in {$directory}.");
+})->describe('Generate resized JPEG/WebP variants for images uploaded before the pipeline');
@@ -48,14 +48,14 @@ Route::group(['middleware' => 'setlang'], function () {
     return view('admin.login');
     })->name('front.index');
     Route::get('/notify', 'Front\FrontendController@notify')->name('user.notify');
-    Route::get('/faq', 'Front\FrontendController@faq')->name('front.faq');
-    Route::get('/about', 'Front\FrontendController@about')->name('front.about');
-    Route::get('/service', 'Front\FrontendController@service')->name('front.service');
-    Route::get('/service/{slug}', 'Front\FrontendController@service_details')->name('front.service.details');
-    Route::get('/package', 'Front\FrontendController@package')->name('front.package');
-    Route::get('/media', 'Front\FrontendController@media')->name('front.media');
-    Route::get('/branch', 'Front\FrontendController@branch')->name('front.branch');
-    Route::get('/team', 'Front\FrontendController@team')->name('front.team');
+    Route::get('/faq', 'Front\FrontendController@faq')->name('front.faq')->middleware('page.cache:faq');
+    Route::get('/about', 'Front\FrontendController@about')->name('front.about')->middleware('page.cache:about');
+    Route::get('/service', 'Front\FrontendController@service')->name('front.service')->middleware('page.cache:service');
+    Route::get('/service/{slug}', 'Front\FrontendController@service_details')->name('front.service.details')->middleware('page.cache:service');
+    Route::get('/package', 'Front\FrontendController@package')->name('front.package')->middleware('page.cache:package');
+    Route::get('/media', 'Front\FrontendController@media')->name('front.media')->middleware('page.cache:media');
+    Route::get('/branch', 'Front\FrontendController@branch')->name('front.branch')->middleware('page.cache:branch');
+    Route::get('/team', 'Front\FrontendController@team')->name('front.team')->middleware('page.cache:team');
     Route::get('/contact', 'Front\FrontendController@contact')->name('front.contact');
     Route::post('/contact/submit', 'Front\FrontendController@contactSubmit')->name('front.contact.submit');
     Route::post('/newsletter/store', 'Admin\NewsletterController@store')->name('front.newsletter');
@@ -79,8 +79,8 @@ Route::group(['middleware' => 'setlang'], function () {
     Route::get('/checkout', 'Front\ProductController@checkout')->name('front.checkout');
 
     // Blog route
-    Route::get('/blog', 'Front\FrontendController@blogs')->name('front.blogs');
-    Route::get('/blog-details/{slug}', 'Front\FrontendController@blogdetails')->name('front.blogdetails');
+    Route::get('/blog', 'Front\FrontendController@blogs')->name('front.blogs')->middleware('page.cache:blog');
+    Route::get('/blog-details/{slug}', 'Front\FrontendController@blogdetails')->name('front.blogdetails')->middleware('page.cache:blog');
     Route::get('/changelanguage/{lang}', 'Front\FrontendController@changeLanguage')->name('changeLanguage');
 
 
@@ -228,6 +228,11 @@ Route::group(['prefix' => '{locale}/admin', 'where' => ['locale' => '[a-zA-Z]{2}
     Route::post('update-maintainance-settings/{id}', 'Admin\MaintainanceController@update_maintainance_settings')->name('admin.update.maintainance.setting');
     Route::get('delete-maintainance-settings/{id}', 'Admin\MaintainanceController@delete_maintainance_settings')->name('admin.delete.maintainance.setting');
     
+    // App Versions
+    Route::get('app-versions', 'Admin\AppVersionController@app_versions')->name('admin.app.version');
+    Route::get('edit-app-version/{id}', 'Admin\AppVersionController@edit_app_version')->name('admin.edit.app.version');
+    Route::post('update-app-version/{id}', 'Admin\AppVersionController@update_app_version')->name('admin.update.app.version');
+    
     // Extra Months
     Route::get('/extra-months', 'Admin\PromotionController@extra_months')->name('admin.extra.months');
     Route::get('/extra-months-edit/{id}/', 'Admin\PromotionController@extra_months_edit')->name('admin.extra.months.edit');
@@ -238,6 +243,7 @@ Route::group(['prefix' => '{locale}/admin', 'where' => ['locale' => '[a-zA-Z]{2}
      Route::get('/get-user-details','Admin\DashboardController@get_user_details');
      Route::get('/get-user-chat','Admin\DashboardController@get_user_chat');
      Route::get('/insert-user-chat','Admin\DashboardController@insert_user_chat');
+     Route::get('/chat-stream','Admin\DashboardController@chat_stream');
      Route::get('/fetch-user', 'Admin\DashboardController@fetch_user');
      Route::get('/fetch-all-user', 'Admin\DashboardController@fetch_all_user');
      
@@ -655,12 +661,13 @@ Route::group(['prefix' => '{locale}/admin', 'where' => ['locale' => '[a-zA-Z]{2}
     Route::get('/backup', 'Admin\BackupController@index')->name('admin.backup.index');
     Route::post('/backup/store', 'Admin\BackupController@store')->name('admin.backup.store');
     Route::post('/backup/{id}/delete', 'Admin\BackupController@delete')->name('admin.backup.delete');
-    Route::post('/backup/download', 'Admin\BackupController@download')->name('admin.backup.download');
+    Route::get('/backup/{id}/download', 'Admin\BackupController@download')->name('admin.backup.download');
+    Route::get('/backup/{id}/progress', 'Admin\BackupController@progress')->name('admin.backup.progress');
 //});
 });
 
 Route::group(['middleware' => 'setlang'], function () {
 
-    Route::get('/{slug}', 'Front\FrontendController@front_dynamic_page')->name('front.front_dynamic_page');
+    Route::get('/{slug}', 'Front\FrontendController@front_dynamic_page')->name('front.front_dynamic_page')->middleware('page.cache:page');
 
 });
\ No newline at end of file
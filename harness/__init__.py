@@ -0,0 +1,7 @@
+"""
+Shared pieces of the HTTP test harness.
+
+The test_*.py scripts in the repository root are thin front ends over
+these modules: settings (target site and admin credentials), auth (admin
+login) and sweep (concurrent GET sweep over admin routes).
+"""
@@ -0,0 +1,55 @@
+"""
+Admin login shared by the harness scripts.
+"""
+
+import re
+
+import requests
+import urllib3
+
+from harness.timing import attach
+from harness.settings import (
+    ADMIN_PASSWORD, ADMIN_URL, ADMIN_USERNAME, BASE_URL, LOGIN_MARKER, USER_AGENT, VERIFY_TLS,
+)
+
+urllib3.disable_warnings()
+
+CSRF_RE = re.compile(r'name="_token"\s+value="([^"]+)"')
+CSRF_META_RE = re.compile(r'<meta name="csrf-token" content="([^"]+)"')
+
+
+def get_csrf_token(html):
+    """Extract the Laravel CSRF token from a form, or the admin layout's meta tag"""
+    match = CSRF_RE.search(html) or CSRF_META_RE.search(html)
+    return match.group(1) if match else None
+
+
+def new_session(cls=requests.Session):
+    """Create a session configured for the target site, with request timing"""
+    session = cls()
+    session.verify = VERIFY_TLS
+    session.headers.update({'User-Agent': USER_AGENT})
+    return attach(session)
+
+
+def login(session, username=ADMIN_USERNAME, password=ADMIN_PASSWORD):
+    """Log the session in as admin and return True if the dashboard loads"""
+    login_url = f"{BASE_URL}/admin"
+    response = session.get(login_url, timeout=30)
+
+    csrf_token = get_csrf_token(response.text)
+    if not csrf_token:
+        return False
+
+    session.post(f"{BASE_URL}/admin/login", data={
+        '_token': csrf_token,
+        'username': username,
+        'password': password,
+    }, headers={
+        'Accept': 'text/html,application/xhtml+xml',
+        'Origin': BASE_URL,
+        'Referer': login_url,
+    }, allow_redirects=True, timeout=30)
+
+    dashboard = session.get(f"{ADMIN_URL}/dashboard", timeout=30)
+    return dashboard.status_code == 200 and LOGIN_MARKER not in dashboard.text
@@ -0,0 +1,371 @@
+"""
+Create / read / update / delete cycles over the admin entities.
+
+Every entity is one row of ENTITIES: where its list, form, store, edit,
+update and delete endpoints live and which fields to post. A Cycle runs
+the four steps for one entity on a logged-in session, times every HTTP
+request it makes and checks the effect of each write:
+
+    create  POST store, then find the new id on the list page
+    read    GET the edit page, which must show the created values
+    update  POST update, then the edit page must show the new values
+    delete  POST (or GET) delete, then the id must be gone from the list
+
+The CSRF token is read once from whatever admin page the session already
+fetched (every admin layout carries it in a meta tag) and only refetched
+when Laravel answers 419, so no form page is loaded just for its token.
+
+The pytest suite (test_crud_suite.py and conftest.py at the repository
+root) runs one cycle per entity, in parallel with pytest-xdist:
+
+    python3 -m pytest test_crud_suite.py -n 9
+    python3 -m pytest test_crud_suite.py --entities faq,slider --crud-json crud.json
+
+Entities belong to a group: "core" (the nine cycles the old test_crud_*
+scripts ran, selected by default), "extended" (further entities from
+test_all_crud.py) and "create-only" (forms from test_comprehensive.py
+without known edit/delete routes; they leave their records behind).
+"""
+
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from harness.auth import get_csrf_token
+from harness.settings import ADMIN_URL
+
+GROUPS = ['core', 'extended', 'create-only']
+
+SUITE = Path(__file__).resolve().parent.parent / 'test_crud_suite.py'
+
+
+def minimal_png():
+    """A valid 1x1 PNG for image fields"""
+    return bytes([
+        0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,
+        0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,
+        0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,
+        0x08, 0x02, 0x00, 0x00, 0x00, 0x90, 0x77, 0x53,
+        0xDE, 0x00, 0x00, 0x00, 0x0C, 0x49, 0x44, 0x41,
+        0x54, 0x08, 0xD7, 0x63, 0xF8, 0xCF, 0xC0, 0x00,
+        0x00, 0x01, 0x01, 0x01, 0x00, 0x18, 0xDD, 0x8D,
+        0xB4, 0x00, 0x00, 0x00, 0x00, 0x49, 0x45, 0x4E,
+        0x44, 0xAE, 0x42, 0x60, 0x82,
+    ])
+
+
+@dataclass
+class Entity:
+    """
+    One admin entity. Routes are relative to ADMIN_URL; "{id}" is replaced
+    with the created record's id. create(unique, page) and
+    update_form(unique, id, page) return the form fields; page is the add
+    or edit page HTML when needs_page is set, else None.
+    """
+    key: str
+    name: str
+    list: str
+    store: str
+    create: Callable
+    edit: Optional[str] = None
+    update: Optional[str] = None
+    update_form: Optional[Callable] = None
+    delete: Optional[str] = None
+    delete_method: str = 'POST'
+    add: Optional[str] = None
+    files: tuple = ()
+    needs_page: bool = False
+    check_update: bool = True
+    group: str = 'core'
+
+    @property
+    def id_pattern(self):
+        """Regex matching record ids in links on the list page"""
+        route = self.edit or self.delete
+        return re.compile('/' + re.escape(route.rstrip('/')).replace(re.escape('{id}'), r'(\d+)'))
+
+
+def role_permissions(page):
+    return re.findall(r'name="permission\[\]"[^>]*value="(\d+)"', page or '') or ['1', '2']
+
+
+ENTITIES = [
+    Entity('faq', 'FAQ', 'faq', 'faq/store', add='faq/add',
+           create=lambda u, page: {'title': f'TestFAQ_{u}', 'content': f'Content for {u}', 'language_id': '1', 'status': '1'},
+           edit='faq/edit/{id}', update='faq/update/{id}/', delete='faq/delete/{id}/',
+           update_form=lambda u, i, page: {'title': f'UpdatedFAQ_{u}', 'content': 'Updated content', 'language_id': '1', 'status': '1'}),
+    Entity('blog_category', 'Blog Category', 'blog/blog-category', 'blog/blog-category/store', add='blog/blog-category/add',
+           create=lambda u, page: {'name': f'Cat_{u}', 'language_id': '1', 'status': '1'},
+           edit='blog/blog-category/edit/{id}/', update='blog/blog-category/update/{id}/', delete='blog/blog-category/delete/{id}/',
+           update_form=lambda u, i, page: {'name': f'UpdatedCat_{u}', 'language_id': '1', 'status': '1'}),
+    Entity('slinks', 'Social Links', 'slinks', 'slinks/store', check_update=False,
+           create=lambda u, page: {'icon': f'fab fa-test-{u}', 'url': f'https://test-{u}.com'},
+           edit='slinks/edit/{id}/', update='slinks/update/{id}/', delete='slinks/delete/{id}/',
+           update_form=lambda u, i, page: {'icon': 'fab fa-updated', 'url': f'https://updated-{u}.com'}),
+    Entity('role', 'Role', 'user-role-manage', 'user-role-store', add='user-role-add', needs_page=True,
+           create=lambda u, page: {'role_name': f'Role{u}', 'permission[]': role_permissions(page)[:2]},
+           edit='user-role-update/{id}', update='user-role-edit', delete='user-role-delete/{id}', delete_method='GET',
+           update_form=lambda u, i, page: {'role_id': i, 'role_name': f'Updated{u}', 'permission[]': role_permissions(page)[:3]}),
+    Entity('shipping', 'Shipping', 'shipping/methods/', 'shipping/method/store', add='shipping/method/add',
+           create=lambda u, page: {'title': f'Ship_{u}', 'subtitle': 'Test subtitle', 'cost': '100', 'language_id': '1', 'status': '1'},
+           edit='shipping/method/edit/{id}/', update='shipping/method/update/{id}/', delete='shipping/method/delete/{id}/',
+           update_form=lambda u, i, page: {'title': f'UpdatedShip_{u}', 'subtitle': 'Updated subtitle', 'cost': '150', 'language_id': '1', 'status': '1'}),
+    Entity('service', 'Service', 'service', 'service/store', add='service/add', files=('icon', 'image'),
+           create=lambda u, page: {'name': f'Service_{u}', 'content': '<p>Service content</p>', 'language_id': '1', 'status': '1'},
+           edit='service/edit/{id}/', update='service/update/{id}/', delete='service/delete/{id}/',
+           update_form=lambda u, i, page: {'name': f'UpdatedService_{u}', 'content': '<p>Updated</p>', 'language_id': '1', 'status': '1'}),
+    Entity('slider', 'Slider', 'slider', 'slider/store', add='slider/add', files=('image',),
+           create=lambda u, page: {'name': f'Slider_{u}', 'offer': '50% OFF', 'desc': 'Test description', 'language_id': '1', 'status': '1'},
+           edit='slider/edit/{id}/', update='slider/update/{id}/', delete='slider/delete/{id}/',
+           update_form=lambda u, i, page: {'name': f'UpdatedSlider_{u}', 'offer': '75% OFF', 'desc': 'Updated desc', 'language_id': '1', 'status': '1'}),
+    Entity('team', 'Team', 'team', 'team/store', add='team/add', files=('image',),
+           create=lambda u, page: {'name': f'Team_{u}', 'dagenation': 'Developer', 'icon1': 'fab fa-facebook', 'url1': 'https://facebook.com',
+                                   'icon2': '', 'url2': '', 'icon3': '', 'url3': '', 'language_id': '1', 'status': '1'},
+           edit='team/edit/{id}/', update='team/update/{id}/', delete='team/delete/{id}/',
+           update_form=lambda u, i, page: {'name': f'UpdatedTeam_{u}', 'dagenation': 'Senior Dev', 'icon1': 'fab fa-facebook',
+                                           'url1': 'https://facebook.com', 'language_id': '1', 'status': '1'}),
+    Entity('funfact', 'Funfact', 'funfact', 'funfact/store', add='funfact/add', files=('icon',),
+           create=lambda u, page: {'name': f'Funfact_{u}', 'value': '100', 'language_id': '1'},
+           edit='funfact/edit/{id}/', update='funfact/update/{id}/', delete='funfact/delete/{id}/',
+           update_form=lambda u, i, page: {'name': f'UpdatedFunfact_{u}', 'value': '200', 'language_id': '1'}),
+
+    # From test_all_crud.py
+    Entity('testimonial', 'Testimonial', 'testimonial', 'testimonial/store', add='testimonial/add', files=('image',), group='extended',
+           create=lambda u, page: {'name': f'Test_{u}', 'designation': 'Tester', 'comment': f'Comment {u}', 'language_id': '1'},
+           edit='testimonial/edit/{id}/', update='testimonial/update/{id}/', delete='testimonial/delete/{id}/',
+           update_form=lambda u, i, page: {'name': f'Updated_{u}', 'designation': 'Updated', 'comment': f'Updated {u}', 'language_id': '1'}),
+    Entity('entertainment', 'Entertainment', 'entertainment', 'entertainment/store', add='entertainment/add', files=('image',), group='extended',
+           create=lambda u, page: {'title': f'Ent_{u}', 'language_id': '1'},
+           edit='entertainment/edit/{id}/', update='entertainment/update/{id}/', delete='entertainment/delete/{id}/',
+           update_form=lambda u, i, page: {'title': f'UpdatedEnt_{u}', 'language_id': '1'}),
+    Entity('media', 'Media Zone', 'media', 'media/store', add='media/add', files=('image',), group='extended',
+           create=lambda u, page: {'title': f'Media_{u}', 'language_id': '1'},
+           edit='media/edit/{id}/', update='media/update/{id}/', delete='media/delete/{id}/',
+           update_form=lambda u, i, page: {'title': f'UpdatedMedia_{u}', 'language_id': '1'}),
+    Entity('branch', 'Branch', 'branch', 'branch/store', add='branch/add', group='extended',
+           create=lambda u, page: {'name': f'Branch_{u}', 'address': f'Address {u}', 'phone': '123456', 'language_id': '1'},
+           edit='branch/edit/{id}/', update='branch/update/{id}/', delete='branch/delete/{id}/',
+           update_form=lambda u, i, page: {'name': f'UpdatedBranch_{u}', 'address': f'Updated {u}', 'phone': '654321', 'language_id': '1'}),
+    Entity('currency', 'Currency', 'currency', 'currency/store', add='currency/add', group='extended',
+           create=lambda u, page: {'name': f'Cur_{u}', 'symbol': '$', 'text': f'CUR_{u.upper()}', 'rate': '1.0'},
+           edit='currency/edit/{id}/', update='currency/update/{id}/', delete='currency/delete/{id}/',
+           update_form=lambda u, i, page: {'name': f'UpdatedCur_{u}', 'symbol': '€', 'text': f'UPD_{u.upper()}', 'rate': '1.5'}),
+    Entity('dynamic_page', 'Dynamic Page', 'dynamic-page', 'dynamic-page/store', add='dynamic-page/add', group='extended',
+           create=lambda u, page: {'name': f'Page_{u}', 'title': f'Title_{u}', 'body': f'Body {u}', 'language_id': '1', 'status': '1'},
+           edit='dynamic-page/edit/{id}/', update='dynamic-page/update/{id}/', delete='dynamic-page/delete/{id}/',
+           update_form=lambda u, i, page: {'name': f'UpdatedPage_{u}', 'title': f'Updated_{u}', 'body': f'Updated {u}', 'language_id': '1', 'status': '1'}),
+    Entity('promotion', 'Promotion', 'promotion', 'promotion/store', add='promotion/add', files=('image',), group='extended',
+           create=lambda u, page: {'title': f'Promo_{u}', 'description': f'Desc {u}'},
+           edit='promotion/edit/{id}/', update='promotion/update/{id}/', delete='promotion/delete/{id}/',
+           update_form=lambda u, i, page: {'title': f'UpdatedPromo_{u}', 'description': f'Updated {u}'}),
+    Entity('payment_process', 'Payment Process', 'payment-process', 'payment-process/store', add='payment-process/add',
+           files=('image',), group='extended',
+           create=lambda u, page: {'title': f'Pay_{u}', 'description': f'Desc {u}'},
+           edit='payment-process/edit/{id}/', update='payment-process/update/{id}/', delete='payment-process/delete/{id}/',
+           update_form=lambda u, i, page: {'title': f'UpdatedPay_{u}', 'description': f'Updated {u}'}),
+    Entity('maintenance', 'Maintenance Settings', 'maintainance-settings', 'store-maintainance-settings',
+           add='add-maintainance-settings', group='extended',
+           create=lambda u, page: {'title': f'Maint_{u}', 'description': f'Desc {u}', 'start_date': '2025-01-01', 'end_date': '2025-12-31'},
+           edit='edit-maintainance-settings/{id}', update='update-maintainance-settings/{id}', delete='delete-maintainance-settings/{id}',
+           update_form=lambda u, i, page: {'title': f'UpdatedMaint_{u}', 'description': f'Updated {u}', 'start_date': '2025-01-01', 'end_date': '2025-12-31'}),
+
+    # From test_comprehensive.py; no known edit/delete routes
+    Entity('blog', 'Blog', 'blog', 'blog/store', add='blog/add', files=('image',), group='create-only',
+           create=lambda u, page: {'title': f'Test Blog {u}', 'category_id': '1', 'details': 'Test content', 'source': 'Test source',
+                                   'meta_tag': 'test', 'meta_description': 'test desc'}),
+    Entity('product', 'Product', 'product', 'product/store', add='product/add', files=('thumbnail',), group='create-only',
+           create=lambda u, page: {'type': 'physical', 'product_type': 'device', 'title': f'Test Product {u}', 'current_price': '100',
+                                   'previous_price': '120', 'short_description': 'Short desc', 'description': 'Long desc', 'stock': '10'}),
+    Entity('offer', 'Offer', 'offer', 'offer/store', add='offer/add', files=('image',), group='create-only',
+           create=lambda u, page: {'title': f'Test Offer {u}', 'text': 'Offer text', 'details': 'Offer details'}),
+    Entity('package', 'Package', 'package', 'package/store', add='package/add', files=('icon',), group='create-only',
+           create=lambda u, page: {'name': f'Package {u}', 'price': '29.99', 'chinese': 'Chinese text', 'myanmar': 'Myanmar text',
+                                   'speed': '100', 'device': '5', 'title': 'Best Value', 'featured': '0'}),
+    Entity('about', 'About', 'about', 'about/store', add='about/add', files=('image',), group='create-only',
+           create=lambda u, page: {'title': f'About {u}', 'text': 'About text content'}),
+    Entity('language', 'Language', 'languages', 'language/store', add='language/add', group='create-only',
+           create=lambda u, page: {'name': f'Lang {u}', 'code': u[:2], 'icon': 'flag-icon'}),
+]
+
+BY_KEY = {entity.key: entity for entity in ENTITIES}
+
+
+def select(spec=None):
+    """Entities for a comma list of keys and/or group names ("all" for everything); core by default"""
+    if not spec:
+        return [e for e in ENTITIES if e.group == 'core']
+    chosen = []
+    for item in (s.strip() for s in spec.split(',') if s.strip()):
+        if item == 'all':
+            matches = ENTITIES
+        elif item in GROUPS:
+            matches = [e for e in ENTITIES if e.group == item]
+        elif item in BY_KEY:
+            matches = [BY_KEY[item]]
+        else:
+            raise ValueError(f"Unknown entity or group '{item}' (choose from {', '.join(GROUPS + list(BY_KEY))})")
+        chosen += [e for e in matches if e not in chosen]
+    return chosen
+
+
+class Csrf:
+    """The session's CSRF token, refreshed from pages it loads anyway"""
+
+    def __init__(self, token=None):
+        self.token = token
+
+    def seen(self, html):
+        """Pick up the token from a fetched admin page"""
+        self.token = get_csrf_token(html) or self.token
+
+
+@dataclass
+class Step:
+    entity: str
+    step: str
+    method: str
+    route: str      # route pattern, {id} not filled in
+    status: object
+    elapsed: float
+    ok: bool = True
+
+    def as_dict(self):
+        return {'entity': self.entity, 'step': self.step, 'method': self.method, 'route': self.route,
+                'status': self.status, 'ms': round(self.elapsed * 1000, 1), 'ok': self.ok}
+
+
+class CrudError(AssertionError):
+    """A CRUD step did not have its expected effect"""
+
+
+class Cycle:
+    """Run the CRUD steps of one entity, timing every request"""
+
+    def __init__(self, session, entity, csrf=None, timeout=30):
+        self.session = session
+        self.entity = entity
+        self.csrf = csrf or Csrf()
+        self.timeout = timeout
+        self.steps = []
+        self.unique = f"{entity.key[:4]}{int(time.time() * 1000) % 10**8:08d}"
+
+    def run(self):
+        """
+        Create, read, update and delete; raises CrudError on the first failed
+        step. A created record is deleted even when a later step fails, so
+        repeated runs do not leave rows behind on the target.
+        """
+        entity = self.entity
+        record_id = self.create()
+        deleted = False
+        try:
+            if entity.edit:
+                self.read(record_id)
+            if entity.update:
+                self.update(record_id)
+            if entity.delete:
+                deleted = True
+                self.delete(record_id)
+        finally:
+            if entity.delete and record_id is not None and not deleted:
+                self.discard(record_id)
+        return self.steps
+
+    def create(self):
+        entity = self.entity
+        listing = self.request('list', 'GET', entity.list)
+        old_ids = set(entity.id_pattern.findall(listing.text)) if entity.edit or entity.delete else set()
+
+        page = self.request('form', 'GET', entity.add).text if entity.needs_page else None
+        files = {field: (f'{field}.png', minimal_png(), 'image/png') for field in entity.files}
+        response = self.request('create', 'POST', entity.store, data=entity.create(self.unique, page), files=files or None)
+
+        if not (entity.edit or entity.delete):
+            self.check(response.status_code == 200 and ('successfully' in response.text.lower() or entity.list in response.url),
+                       f"store answered {response.status_code} without a success message")
+            return None
+
+        new_ids = set(entity.id_pattern.findall(response.text)) - old_ids
+        if not new_ids:
+            listing = self.request('create', 'GET', entity.list)
+            new_ids = set(entity.id_pattern.findall(listing.text)) - old_ids
+        self.check(new_ids, "no new record on the list page")
+        return max(new_ids, key=int)
+
+    def read(self, record_id):
+        response = self.request('read', 'GET', self.entity.edit, record_id)
+        self.check(response.status_code == 200 and self.unique in response.text,
+                   f"edit page answered {response.status_code} without the created values")
+        self.page = response.text
+
+    def update(self, record_id):
+        entity = self.entity
+        data = entity.update_form(self.unique, record_id, getattr(self, 'page', None))
+        response = self.request('update', 'POST', entity.update, record_id, data=data)
+        self.check(response.status_code < 400, f"update answered {response.status_code}")
+        expected = next((v for v in data.values() if isinstance(v, str) and self.unique in v), None)
+        if entity.check_update and entity.edit and expected:
+            response = self.request('update', 'GET', entity.edit, record_id)
+            self.check(expected in response.text, f"edit page does not show '{expected}'")
+
+    def delete(self, record_id):
+        entity = self.entity
+        response = self.request('delete', entity.delete_method, entity.delete, record_id,
+                                data={} if entity.delete_method == 'POST' else None)
+        if response.url.rstrip('/') != self.url(entity.list).rstrip('/'):
+            response = self.request('delete', 'GET', entity.list)
+        self.check(record_id not in entity.id_pattern.findall(response.text), f"record {record_id} is still listed")
+
+    def discard(self, record_id):
+        """Best-effort delete after a failed step; its own failure must not hide the first one"""
+        try:
+            self.request('cleanup', self.entity.delete_method, self.entity.delete, record_id,
+                         data={} if self.entity.delete_method == 'POST' else None)
+        except CrudError:
+            pass
+
+    def request(self, step, method, route, record_id=None, data=None, files=None):
+        """One timed request; POSTs carry the cached token and retry once on 419"""
+        url = self.url(route, record_id)
+        for attempt in (1, 2):
+            if method == 'POST':
+                data = dict(data or {}, _token=self.csrf.token or '')
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, data=data, files=files,
+                                                timeout=self.timeout, allow_redirects=True)
+            except Exception as e:
+                self.steps.append(Step(self.entity.key, step, method, route, 'exception', time.perf_counter() - started, False))
+                raise CrudError(f"{step}: {method} {route} failed: {e}") from e
+            self.steps.append(Step(self.entity.key, step, method, route, response.status_code,
+                                   time.perf_counter() - started, response.status_code < 400))
+            self.csrf.seen(response.text)
+            if response.status_code != 419 or attempt == 2:
+                break
+            # Token expired; the 419 page does not carry one, the list page does
+            self.csrf.seen(self.session.get(self.url(self.entity.list), timeout=self.timeout).text)
+        return response
+
+    def check(self, condition, message):
+        if not condition:
+            self.steps[-1].ok = False
+            raise CrudError(f"{self.steps[-1].step}: {message}")
+
+    @staticmethod
+    def url(route, record_id=None):
+        if record_id is not None:
+            route = route.replace('{id}', str(record_id))
+        return f"{ADMIN_URL}/{route.lstrip('/')}"
+
+
+def main(entities=None, argv=None):
+    """Run the pytest CRUD suite for the given entity spec; returns the exit code"""
+    import pytest
+
+    args = [str(SUITE), '-p', 'no:cacheprovider']
+    if entities:
+        args += ['--entities', entities]
+    return pytest.main(args + list(sys.argv[1:] if argv is None else argv))
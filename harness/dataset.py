@@ -0,0 +1,424 @@
+"""
+Synthetic production-sized dataset for local benchmarks.
+
+DemoDataSeeder and test_data.sql create a handful of rows; the dashboard
+sums, exports, notification fan-out and chat history only get slow at
+hundreds of thousands. This writes referentially consistent rows for
+users, mbt_bind_user, user_devices, payment_new, notification and chat
+at a scale factor, either as multi-row INSERTs or as tab-separated files
+with a LOAD DATA script:
+
+    python3 -m harness.dataset --scale 2 | mysql tlink
+    python3 -m harness.dataset --scale 10 --format tsv --out /tmp/bench
+    mysql --local-infile=1 tlink < /tmp/bench/load.sql
+
+Generated ids start at --start-id (default 1000000) so they never collide
+with real or seeded rows, and --clean first deletes that id range, which
+makes reruns with the same --start-id and row counts idempotent; rows an
+earlier run wrote outside the range are left alone. Every row points at generated rows only: bound
+accounts belong to generated users, payments and notifications to bound
+accounts, chat threads run between a generated user and the admin
+(ChatChannel::ADMIN_USER_ID). Column lists follow test_data.sql and the
+controllers that write these tables. Generated users log in with the
+password "password".
+
+Rows per table at --scale 1 are in BASE_ROWS; --rows table=N overrides
+one table. The same --seed gives the same data.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+BASE_ROWS = {
+    'users': 10_000,
+    'mbt_bind_user': 12_000,
+    'user_devices': 13_000,
+    'payment_new': 250_000,
+    'notification': 200_000,
+    'chat': 150_000,
+}
+
+COLUMNS = {
+    'users': ['id', 'name', 'email', 'username', 'activepackage', 'phone', 'address', 'country', 'state', 'city',
+              'zipcode', 'email_verified', 'password', 'bind_user_id', 'bind_id', 'created_at', 'updated_at'],
+    'mbt_bind_user': ['id', 'er_id', 'user_name', 'user_real_name', 'group_id', 'region_id', 'user_create_time',
+                      'user_update_time', 'user_expire_time', 'user_status_mbt', 'balance', 'mgr_name_create',
+                      'mgr_name_update', 'phone', 'email', 'Bandwidth', 'Service_type', 'Monthly_Cost', 'user_id',
+                      'mbt_user_id', 'bind_status', 'created_at', 'updated_at'],
+    'user_devices': ['id', 'user_id', 'device_id', 'fcm_token', 'language_id', 'device_type', 'device_token',
+                     'created_at', 'updated_at'],
+    'payment_new': ['id', 'sub_com_id', 'product_id', 'user_id', 'begin_date', 'expire_date', 'order_id',
+                    'payment_user_name', 'pack_expiery_date', 'trans_date', 'transaction_id', 'total_amt',
+                    'invoice_no', 'admin_status', 'for_filter', 'payment_method', 'package_id', 'status', 'phone',
+                    'discount', 'commercial_tax', 'created_at', 'updated_at'],
+    'notification': ['id', 'user_id', 'account_id', 'title', 'message', 'publish_info', 'install_user_id', 'is_read',
+                     'is_multi', 'marketing_information_status', 'created_at', 'updated_at'],
+    'chat': ['id', 'sender_userid', 'reciever_userid', 'message', 'status', 'read_status', 'mobile_read_status',
+             'timestamp'],
+}
+
+# Load order: referenced tables first
+TABLES = list(BASE_ROWS)
+
+ADMIN_CHAT_ID = 1
+
+# Laravel's factory hash of "password"
+PASSWORD_HASH = '$2y$10$92IXUNpkjO0rOQ5byMi.Ye4oKoEa3Ro9llC/.og/at2.uheWG/igi'
+
+# (package id, speed, service type, monthly price) as in test_data.sql
+PACKAGES = [(1, '10 Mbps', 'Fiber', 12000), (2, '30 Mbps', 'Fiber', 22000), (3, '50 Mbps', 'Fiber', 35000),
+            (4, '100 Mbps', 'Fiber', 55000), (5, '50 Mbps', 'Dedicated', 75000), (6, '100 Mbps', 'Dedicated', 140000),
+            (7, '200 Mbps', 'Dedicated', 280000), (8, '20 Mbps', 'Fiber', 8000)]
+PACKAGE_WEIGHTS = [20, 30, 22, 10, 5, 3, 1, 9]
+
+PAYMENT_METHODS = ['KBZ Pay', 'Wave Pay', 'AYA Pay', 'CB Pay']
+PAYMENT_METHOD_WEIGHTS = [45, 30, 15, 10]
+
+CITIES = [('Yangon', 'Yangon Region', '11051'), ('Mandalay', 'Mandalay Region', '05011'),
+          ('Naypyidaw', 'Naypyidaw Union Territory', '15011'), ('Taunggyi', 'Shan State', '06011'),
+          ('Mawlamyine', 'Mon State', '12011')]
+STREETS = ['Pyay Road', 'Insein Road', 'Kabar Aye Pagoda Road', '78th Street', 'Bogyoke Road', 'Strand Road']
+
+GIVEN = ['Aung', 'Kyaw', 'Zaw', 'Min', 'Thu', 'May', 'Hnin', 'Ei', 'Su', 'Nay', 'Win', 'Htet', 'Myo', 'Thiri',
+         'Phyo', 'Khin', 'Soe', 'Wai', 'Yadanar', 'Hla']
+PREFIXES = ['U', 'Daw', 'Ko', 'Ma', 'Mg']
+
+NOTICES = [
+    ('Payment Received', 'We have received your payment of {amount} MMK. Thank you!'),
+    ('Package Expiring Soon', 'Your package expires on {date}. Renew now to stay connected.'),
+    ('Speed Upgrade Available', 'You are eligible for a free speed upgrade. Contact support to activate.'),
+    ('Fault Report Update', 'Our engineer has been assigned to your fault report.'),
+]
+CAMPAIGNS = [
+    ('Scheduled Maintenance', 'Network maintenance on {date} from 2 AM to 4 AM. Service may be interrupted briefly.'),
+    ('New Year Promotion', 'Refer a friend this month and get 1 month FREE!'),
+    ('App Update', 'Our mobile app has been updated with new features. Please update to the latest version.'),
+]
+CHAT_LINES = [
+    'Hello, my internet is very slow today', 'The router light is blinking red', 'When will the technician arrive?',
+    'I paid but my package is not active yet', 'Thank you, it works now', 'Please check my connection',
+    'We are checking your line, please wait', 'Please restart your router and try again',
+    'Your payment has been confirmed', 'A technician will visit tomorrow morning',
+]
+
+
+class Dataset:
+    """Row generators for one scale; rows are tuples in COLUMNS order"""
+
+    def __init__(self, rows, start_id=1_000_000, months=24, seed=1, now=None):
+        self.rows = rows
+        self.start = start_id
+        self.rng = random.Random(seed)
+        self.now = now or datetime.now().replace(microsecond=0)
+        self.begin = self.now - timedelta(days=30 * months)
+        self._accounts = None
+
+    def ids(self, table):
+        return range(self.start, self.start + self.rows[table])
+
+    def generate(self, table):
+        return getattr(self, table)()
+
+    # --- helpers ---
+
+    def moment(self, share):
+        """Timestamp `share` (0..1) of the way through the history, with a little jitter"""
+        span = (self.now - self.begin).total_seconds()
+        seconds = min(span, max(0.0, share * span + self.rng.uniform(-3600, 3600)))
+        return self.begin + timedelta(seconds=seconds)
+
+    def skewed(self, n, power=1.6):
+        """Index in range(n) favouring the low end, so a few accounts carry much of the traffic"""
+        return min(n - 1, int(n * self.rng.random() ** power))
+
+    def person(self, i):
+        rng = random.Random(self.start + i)
+        return f"{rng.choice(PREFIXES)} {rng.choice(GIVEN)} {rng.choice(GIVEN)}"
+
+    @staticmethod
+    def package(bind_id):
+        """Package of an MBT account, weighted towards the home plans"""
+        return random.Random(bind_id).choices(PACKAGES, PACKAGE_WEIGHTS)[0]
+
+    @staticmethod
+    def phone(i):
+        return f"09{700000000 + i % 300000000:09d}"
+
+    def accounts(self):
+        """(bind id, user id, mbt user id, name, phone, package) of every bound account"""
+        if self._accounts is None:
+            users = self.rows['users']
+            accounts = []
+            for n, bind_id in enumerate(self.ids('mbt_bind_user')):
+                # every user binds one account, the rest go to the first users again; 5% stay unbound
+                if n < self.rows['mbt_bind_user'] * 0.95:
+                    user_index = n % users
+                    accounts.append((bind_id, self.start + user_index, f"MBT{bind_id}", self.person(user_index),
+                                     self.phone(user_index), self.package(bind_id)))
+            self._accounts = accounts
+        return self._accounts
+
+    # --- tables ---
+
+    def users(self):
+        binds = self.rows['mbt_bind_user']
+        for n, user_id in enumerate(self.ids('users')):
+            city, state, zipcode = CITIES[n % len(CITIES)]
+            created = self.moment(n / self.rows['users'])
+            bind_id = self.start + n if n < binds * 0.95 else None
+            package = self.package(bind_id)[0] if bind_id else None
+            yield (user_id, self.person(n), f"bench{user_id}@example.com", f"bench{user_id}", package, self.phone(n),
+                   f"No. {n % 300 + 1}, {STREETS[n % len(STREETS)]}", 'Myanmar', state, city, zipcode, '1',
+                   PASSWORD_HASH, bind_id, 1 if bind_id else 0, created, created)
+
+    def mbt_bind_user(self):
+        bound = {account[0]: account for account in self.accounts()}
+        for n, bind_id in enumerate(self.ids('mbt_bind_user')):
+            created = self.moment(n / self.rows['mbt_bind_user'])
+            account = bound.get(bind_id)
+            user_index = n % self.rows['users']
+            package = self.package(bind_id)
+            unix = int(created.timestamp())
+            expires = (self.now + timedelta(days=self.rng.randint(-60, 60))).date()
+            yield (bind_id, bind_id, f"tlink_{bind_id}", self.person(user_index), 1 + n % 5, 1 + n % 3, unix, unix,
+                   expires, 0, round(self.rng.uniform(0, 200000), 2), 'admin', 'admin', self.phone(user_index),
+                   f"mbt{bind_id}@example.com", package[1], package[2], str(package[3]),
+                   account[1] if account else None, f"MBT{bind_id}", 1 if account else 0, created, created)
+
+    def user_devices(self):
+        users = self.rows['users']
+        for n, device_id in enumerate(self.ids('user_devices')):
+            # one device per user, then a second one on the other platform
+            user_index = n % users
+            ios = (user_index % 4 == 0) != (n // users % 2 == 1)
+            device_type = 'ios' if ios else 'android'
+            created = self.moment(n / self.rows['user_devices'])
+            token = f"{self.rng.getrandbits(128):032x}:APA91b{self.rng.getrandbits(256):064x}"
+            # the legacy MBT app (MbtController::userdevice) writes device_id / fcm_token /
+            # language_id, the V1 API device_type / device_token; fill both paths
+            hardware_id = f"{self.rng.getrandbits(64):016x}"
+            yield (device_id, self.start + user_index, hardware_id, token, user_index % 3, device_type, token,
+                   created, created)
+
+    def payment_new(self):
+        accounts = self.accounts()
+        for n, payment_id in enumerate(self.ids('payment_new')):
+            bind_id, user_id, mbt_user_id, name, phone, package = accounts[self.skewed(len(accounts), 1.3)]
+            created = self.moment(n / self.rows['payment_new'])
+            begin = created.date().replace(day=1) + timedelta(days=32)
+            begin = begin.replace(day=1)
+            expire = (begin + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+            price = package[3]
+            discount = round(price * self.rng.choice((0, 0, 0, 0.1, 0.2)), 2)
+            tax = round((price - discount) * 0.05, 2)
+
+            roll = self.rng.random()
+            if roll < 0.86:      # paid and confirmed
+                status, admin_status, for_filter = 1, 1, 'paid'
+            elif roll < 0.95:    # abandoned at the gateway
+                status, admin_status, for_filter = 0, 0, 'pending'
+            else:                # paid, waiting for the admin
+                status, admin_status, for_filter = 1, 0, 'paid'
+            paid = status == 1
+            method = self.rng.choices(PAYMENT_METHODS, PAYMENT_METHOD_WEIGHTS)[0]
+
+            yield (payment_id, 1 + bind_id % 3, package[0], user_id, begin, expire, f"BENCH-{payment_id}", name,
+                   expire, created.date() if paid else None, f"TXN{payment_id:012d}" if paid else None,
+                   round(price - discount + tax, 2), f"INV-B{payment_id}", admin_status, for_filter,
+                   method if paid else None, package[0], status, phone, discount, tax, created, created)
+
+    def notification(self):
+        accounts = self.accounts()
+        total = self.rows['notification']
+        ids = iter(self.ids('notification'))
+        n = 0
+        while n < total:
+            share = n / total
+            created = self.moment(share)
+            read_rate = 0.3 + 0.6 * (1 - share)
+            if self.rng.random() < 0.02:
+                # campaign: the same message fanned out to a block of accounts
+                title, message = self.rng.choice(CAMPAIGNS)
+                message = message.format(date=(created + timedelta(days=3)).date())
+                first = self.rng.randrange(len(accounts))
+                size = min(total - n, len(accounts), self.rng.randint(500, 5000))
+                for k in range(size):
+                    _, user_id, mbt_user_id, *_ = accounts[(first + k) % len(accounts)]
+                    yield (next(ids), user_id, mbt_user_id, title, message, None, None,
+                           int(self.rng.random() < read_rate), 1, 1, created, created)
+                n += size
+            else:
+                _, user_id, mbt_user_id, _, _, package = accounts[self.skewed(len(accounts))]
+                title, message = self.rng.choice(NOTICES)
+                message = message.format(amount=f"{package[3]:,}", date=(created + timedelta(days=5)).date())
+                yield (next(ids), user_id, mbt_user_id, title, message, None, None,
+                       int(self.rng.random() < read_rate), 0, 0, created, created)
+                n += 1
+
+    def chat(self):
+        users = self.rows['users']
+        total = self.rows['chat']
+        for n, chat_id in enumerate(self.ids('chat')):
+            share = n / total
+            user_id = self.start + self.skewed(users, 2.5)
+            from_user = self.rng.random() < 0.55
+            sender, receiver = (user_id, ADMIN_CHAT_ID) if from_user else (ADMIN_CHAT_ID, user_id)
+            # older messages have been read on both sides
+            settled = share < 0.97
+            yield (chat_id, sender, receiver, self.rng.choice(CHAT_LINES), 0,
+                   1 if settled or not from_user else 0, 1 if settled or from_user else 0,
+                   self.begin + (self.now - self.begin) * share)
+
+
+# --- writers ---
+
+def sql_value(value):
+    if value is None:
+        return 'NULL'
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, datetime):
+        return f"'{value:%Y-%m-%d %H:%M:%S}'"
+    text = str(value)
+    if "'" in text or '\\' in text or '\n' in text:
+        text = text.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n')
+    return f"'{text}'"
+
+
+def tsv_value(value):
+    if value is None:
+        return '\\N'
+    if isinstance(value, datetime):
+        return f"{value:%Y-%m-%d %H:%M:%S}"
+    text = str(value)
+    if '\t' in text or '\n' in text or '\\' in text:
+        text = text.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+    return text
+
+
+def column_list(table):
+    return ', '.join(f"`{c}`" for c in COLUMNS[table])
+
+
+def clean_statement(dataset, table):
+    ids = dataset.ids(table)
+    return f"DELETE FROM `{table}` WHERE `id` BETWEEN {ids.start} AND {ids.stop - 1};\n"
+
+
+def write_sql(dataset, tables, out, batch=1000, clean=False):
+    """Multi-row INSERTs in one transaction; returns rows written per table"""
+    out.write("SET NAMES utf8mb4;\nSET foreign_key_checks = 0;\nSET unique_checks = 0;\nSET autocommit = 0;\n")
+    if clean:
+        for table in reversed(tables):
+            out.write(clean_statement(dataset, table))
+
+    counts = {}
+    for table in tables:
+        head = f"INSERT INTO `{table}` ({column_list(table)}) VALUES\n"
+        rows = []
+        count = 0
+        for row in dataset.generate(table):
+            rows.append('(' + ','.join(map(sql_value, row)) + ')')
+            if len(rows) == batch:
+                out.write(head + ',\n'.join(rows) + ';\n')
+                count += len(rows)
+                rows = []
+        if rows:
+            out.write(head + ',\n'.join(rows) + ';\n')
+            count += len(rows)
+        counts[table] = count
+        log(f"  {table:<14} {count:>10,} rows")
+
+    out.write("COMMIT;\nSET unique_checks = 1;\nSET foreign_key_checks = 1;\n")
+    out.write(''.join(f"ANALYZE TABLE `{table}`;\n" for table in tables))
+    return counts
+
+
+def write_tsv(dataset, tables, directory, clean=False):
+    """One .tsv per table plus load.sql (LOAD DATA LOCAL INFILE); returns rows written per table"""
+    os.makedirs(directory, exist_ok=True)
+    directory = os.path.abspath(directory)
+    counts = {}
+    script = ["SET NAMES utf8mb4;", "SET foreign_key_checks = 0;", "SET unique_checks = 0;"]
+    if clean:
+        script += [clean_statement(dataset, table).strip() for table in reversed(tables)]
+
+    for table in tables:
+        path = os.path.join(directory, f"{table}.tsv")
+        count = 0
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
+            for row in dataset.generate(table):
+                f.write('\t'.join(map(tsv_value, row)) + '\n')
+                count += 1
+        counts[table] = count
+        log(f"  {table:<14} {count:>10,} rows  {path}")
+        script.append(f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE `{table}` CHARACTER SET utf8mb4 "
+                      f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' ({column_list(table)});")
+
+    script += ["SET unique_checks = 1;", "SET foreign_key_checks = 1;"]
+    script += [f"ANALYZE TABLE `{table}`;" for table in tables]
+    with open(os.path.join(directory, 'load.sql'), 'w') as f:
+        f.write('\n'.join(script) + '\n')
+    return counts
+
+
+def log(message):
+    print(message, file=sys.stderr)
+
+
+def row_counts(scale, overrides):
+    rows = {table: max(1, int(count * scale)) for table, count in BASE_ROWS.items()}
+    for item in overrides or ():
+        table, _, count = item.partition('=')
+        if table not in rows:
+            raise SystemExit(f"Unknown table '{table}' (known: {', '.join(TABLES)})")
+        rows[table] = int(count)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a production-sized synthetic dataset for local MySQL benchmarks")
+    parser.add_argument('--scale', type=float, default=1.0, help="multiplier for BASE_ROWS (default 1)")
+    parser.add_argument('--rows', action='append', metavar='TABLE=N', help="exact row count for one table")
+    parser.add_argument('--tables', help=f"comma list of tables to write (default all: {','.join(TABLES)})")
+    parser.add_argument('--format', choices=['sql', 'tsv'], default='sql', help="multi-row INSERTs or LOAD DATA files")
+    parser.add_argument('--out', help="sql: output file (default stdout); tsv: output directory (required)")
+    parser.add_argument('--batch', type=int, default=1000, help="rows per INSERT statement (default 1000)")
+    parser.add_argument('--start-id', type=int, default=1_000_000, help="first generated id (default 1000000)")
+    parser.add_argument('--months', type=int, default=24, help="months of history (default 24)")
+    parser.add_argument('--seed', type=int, default=1, help="random seed (default 1)")
+    parser.add_argument('--clean', action='store_true', help="delete this run's id range (--start-id and the row counts) before loading; "
+                             "rows from earlier runs with other ranges stay in the database")
+    args = parser.parse_args(argv)
+
+    tables = args.tables.split(',') if args.tables else TABLES
+    unknown = [t for t in tables if t not in COLUMNS]
+    if unknown:
+        parser.error(f"unknown tables: {', '.join(unknown)}")
+    tables = [t for t in TABLES if t in tables]
+    if args.format == 'tsv' and not args.out:
+        parser.error("--format tsv needs --out DIRECTORY")
+
+    dataset = Dataset(row_counts(args.scale, args.rows), args.start_id, args.months, args.seed)
+    log(f"Generating scale {args.scale:g} dataset (ids from {args.start_id}):")
+    started = time.perf_counter()
+
+    if args.format == 'tsv':
+        counts = write_tsv(dataset, tables, args.out, args.clean)
+        log(f"Load with: mysql --local-infile=1 <database> < {os.path.join(args.out, 'load.sql')}")
+    elif args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            counts = write_sql(dataset, tables, f, args.batch, args.clean)
+    else:
+        counts = write_sql(dataset, tables, sys.stdout, args.batch, args.clean)
+
+    log(f"{sum(counts.values()):,} rows in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
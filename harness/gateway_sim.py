@@ -0,0 +1,520 @@
+"""
+Local stand-ins for the KBZPay, CB Pay, AYA Pay and WavePay gateways, plus
+a generator of signed gateway callbacks.
+
+Serve mode implements the gateway endpoints MbtController and
+PendingController call, with the same signature schemes, so payment
+creation and reconciliation (check_payment, update_*pay) run without the
+live gateways:
+
+    python3 -m harness.gateway_sim serve --port 8900
+    # then point the payment settings row at the simulator:
+    #   kbz_api_url      http://127.0.0.1:8900/kbz
+    #   api_url          http://127.0.0.1:8900/cb
+    #   aya_api_baseurl  http://127.0.0.1:8900/aya
+    #   aya_api_tokenurl http://127.0.0.1:8900/aya/token
+    #   wave_base_url    http://127.0.0.1:8900/wave/
+    # with kbz_key / auth_token / aya_enc_key / wave_secret_key matching
+    # the HARNESS_* secrets in harness.settings
+
+    kbz   POST precreate, queryorder   sorted key=value&...&key=KEY, SHA256, upper-case
+    cb    POST request-payment-order.service, checkstatus-webpayment.service
+          sha256(authToken&ecommerceId&subMerId&orderId&amount&currency)
+    aya   POST token, login, requestPushPayment
+    wave  POST payment                 HMAC-SHA256 over the concatenated fields
+
+Orders created through the simulator are listed at GET /__orders. Queries
+for orders it has never seen answer as missing, or as paid with
+--unknown paid.
+
+Callback mode replays gateway notifications against the app's callback
+routes (api/notify, api/aya-callback, api/wave-callback-payment) at a fixed
+rate, with duplicate deliveries, stale "pending" notifications and bounded
+reordering, and reports throughput and latency for first deliveries and
+duplicates separately:
+
+    python3 -m harness.gateway_sim callbacks --target http://127.0.0.1:8000 \\
+        --orders-from http://127.0.0.1:8900 --rate 50 --duplicates 0.3 --stale 0.2 --reorder 20
+
+api/notify does not check signatures and recharges any pending order it is
+told was paid, so callbacks are only sent to a local target unless
+--allow-remote is given.
+
+With the app's billing calls pointed at harness.mbt_sim, the recharge
+counters in its /__stats show whether a duplicate ever recharged twice.
+AYA callbacks are AES-256-ECB encrypted and need the optional
+"cryptography" package.
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import random
+import secrets
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+
+from harness.auth import new_session
+from harness.histogram import Histogram
+from harness.settings import AYA_ENC_KEY, CB_AUTH_TOKEN, GREEN, KBZ_KEY, NC, RED, WAVE_SECRET_KEY, is_local
+from harness.simhttp import Server, add_fault_arguments, faults_from
+
+try:
+    from cryptography.hazmat.primitives import padding
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except ImportError:
+    Cipher = None
+
+GATEWAYS = ['kbz', 'cb', 'aya', 'wave']
+
+# Final and interim status of each gateway's notifications
+PAID = {'kbz': 'PAY_SUCCESS', 'cb': 'S', 'aya': 'done', 'wave': 'PAYMENT_CONFIRMED'}
+FAILED = {'kbz': 'PAY_FAILED', 'cb': 'F', 'aya': 'failed', 'wave': 'PAYMENT_FAILED'}
+PENDING = {'kbz': 'WAIT_PAY', 'cb': 'P', 'aya': 'pending', 'wave': 'PROCESSING'}
+
+
+# -- signatures -------------------------------------------------------------
+
+def kbz_sign(params, key=KBZ_KEY):
+    """KBZPay: sorted key=value pairs (sign/sign_type excluded), &key=, SHA256 upper-case"""
+    pairs = [f"{k}={v}" for k, v in sorted(params.items()) if k not in ('sign', 'sign_type')]
+    return hashlib.sha256(('&'.join(pairs) + f"&key={key}").encode()).hexdigest().upper()
+
+
+def kbz_flatten(request):
+    """The Request fields and biz_content merged, as KBZPay signs them"""
+    params = {k: v for k, v in request.items() if k != 'biz_content'}
+    params.update(request.get('biz_content') or {})
+    return params
+
+
+def cb_signature(*parts):
+    """CB Pay: sha256 of the fields joined with '&'"""
+    return hashlib.sha256('&'.join(str(p) for p in parts).encode()).hexdigest()
+
+
+def wave_hash(values, secret=WAVE_SECRET_KEY):
+    """WavePay: HMAC-SHA256 of the fields concatenated without separators"""
+    return hmac.new(secret.encode(), ''.join(str(v) for v in values).encode(), hashlib.sha256).hexdigest()
+
+
+def aya_encrypt(payload, key=AYA_ENC_KEY):
+    """AYA Pay: base64(AES-256-ECB(json)), the format ayacallback decrypts"""
+    if Cipher is None:
+        raise RuntimeError("AYA callbacks need the 'cryptography' package (pip install cryptography)")
+    # openssl_decrypt() NUL-pads or truncates the key to 32 bytes
+    raw_key = key.encode()[:32].ljust(32, b'\0')
+    padder = padding.PKCS7(128).padder()
+    data = padder.update(payload.encode()) + padder.finalize()
+    encryptor = Cipher(algorithms.AES(raw_key), modes.ECB()).encryptor()
+    return base64.b64encode(encryptor.update(data) + encryptor.finalize()).decode()
+
+
+# -- gateway endpoints ------------------------------------------------------
+
+@dataclass
+class Order:
+    gateway: str
+    order_id: str
+    amount: str
+    reference: str
+    merchant: str = ''
+    appid: str = ''
+    phone: str = ''
+    created: float = field(default_factory=time.time)
+    paid: bool = True
+
+
+class GatewaySimulator:
+
+    def __init__(self, pay_rate=1.0, pay_after=0.0, unknown='missing', faults=None):
+        self.pay_rate = pay_rate
+        self.pay_after = pay_after
+        self.unknown = unknown
+        self.orders = {}
+        self.tokens = set()
+        self.server = Server(faults)
+
+        routes = {
+            'kbz/precreate': self.kbz_precreate,
+            'kbz/queryorder': self.kbz_queryorder,
+            'cb/request-payment-order.service': self.cb_request,
+            'cb/checkstatus-webpayment.service': self.cb_status,
+            'aya/token': self.aya_token,
+            'aya/login': self.aya_login,
+            'aya/requestPushPayment': self.aya_request,
+            'wave/payment': self.wave_payment,
+            'wave/authenticate': self.wave_authenticate,
+            '__orders': self.list_orders,
+        }
+        for path, handler in routes.items():
+            self.server.route(path, handler)
+
+    def create(self, gateway, order_id, amount, **extra):
+        order = Order(gateway, str(order_id), str(amount), secrets.token_hex(12),
+                      paid=random.random() < self.pay_rate, **extra)
+        self.orders[(gateway, order.order_id)] = order
+        return order
+
+    def state(self, gateway, order_id):
+        """'paid', 'failed', 'pending' or 'missing'"""
+        order = self.orders.get((gateway, str(order_id)))
+        if order is None:
+            return 'paid' if self.unknown == 'paid' else 'missing'
+        if time.time() - order.created < self.pay_after:
+            return 'pending'
+        return 'paid' if order.paid else 'failed'
+
+    def list_orders(self, request):
+        gateway = request.query.get('gateway')
+        return 200, [asdict(o) for o in self.orders.values() if not gateway or o.gateway == gateway]
+
+    # -- KBZPay --------------------------------------------------------------
+
+    def kbz_response(self, **values):
+        values.setdefault('nonce_str', secrets.token_hex(16))
+        values['sign_type'] = 'SHA256'
+        values['sign'] = kbz_sign(values)
+        return 200, {'Response': values}
+
+    def kbz_verified(self, request):
+        """The Request object when its sign checks out, else None"""
+        body = request.json().get('Request') or {}
+        params = kbz_flatten(body)
+        return body if params.get('sign') == kbz_sign(params) else None
+
+    def kbz_precreate(self, request):
+        body = self.kbz_verified(request)
+        if body is None:
+            return self.kbz_response(result='FAIL', code='AUTHENTICATION_FAIL', msg='Sign verification failed')
+        biz = body.get('biz_content') or {}
+        order = self.create('kbz', biz.get('merch_order_id'), biz.get('total_amount'),
+                            merchant=biz.get('merch_code', ''), appid=biz.get('appid', ''))
+        return self.kbz_response(result='SUCCESS', code='0', msg='success', merch_order_id=order.order_id,
+                                 merch_code=order.merchant, prepay_id=order.reference)
+
+    def kbz_queryorder(self, request):
+        body = self.kbz_verified(request)
+        if body is None:
+            return self.kbz_response(result='FAIL', code='AUTHENTICATION_FAIL', msg='Sign verification failed')
+        biz = body.get('biz_content') or {}
+        order_id = biz.get('merch_order_id')
+        state = self.state('kbz', order_id)
+        if state == 'missing':
+            return self.kbz_response(result='FAIL', code='ORDER_NOT_EXIST', msg='order does not exist')
+        order = self.orders.get(('kbz', str(order_id)))
+        status = {'paid': PAID, 'failed': FAILED, 'pending': PENDING}[state]['kbz']
+        return self.kbz_response(result='SUCCESS', code='0', msg='success', merch_order_id=order_id,
+                                 trade_status=status, total_amount=order.amount if order else '',
+                                 mm_order_id=order.reference if order else secrets.token_hex(12),
+                                 trans_currency='MMK')
+
+    # -- CB Pay --------------------------------------------------------------
+
+    def cb_request(self, request):
+        values = request.json()
+        expected = cb_signature(CB_AUTH_TOKEN, values.get('ecommerceId'), values.get('subMerId'),
+                                values.get('orderId'), values.get('amount'), values.get('currency'))
+        if values.get('authenToken') != CB_AUTH_TOKEN or values.get('signature') != expected:
+            return 200, {'code': '0002', 'msg': 'Invalid signature'}
+        order = self.create('cb', values.get('orderId'), values.get('amount'), merchant=values.get('ecommerceId', ''))
+        return 200, {'code': '0000', 'msg': 'Operation Success', 'generateRefOrder': order.reference,
+                     'orderId': order.order_id, 'transactionStatus': 'P'}
+
+    def cb_status(self, request):
+        values = request.json()
+        state = self.state('cb', values.get('orderId'))
+        if state == 'missing':
+            return 200, {'code': '0003', 'msg': 'Order not found'}
+        status = {'paid': PAID, 'failed': FAILED, 'pending': PENDING}[state]['cb']
+        return 200, {'code': '0000', 'msg': 'Operation Success', 'orderId': values.get('orderId'),
+                     'generateRefOrder': values.get('generateRefOrder'), 'transactionStatus': status}
+
+    # -- AYA Pay -------------------------------------------------------------
+
+    def aya_token(self, request):
+        token = secrets.token_hex(16)
+        self.tokens.add(token)
+        return 200, {'access_token': token, 'token_type': 'Bearer', 'expires_in': 3600}
+
+    def aya_login(self, request):
+        if request.headers.get('token', '').removeprefix('Bearer ') not in self.tokens:
+            return 401, {'err': 401, 'message': 'Invalid access token'}
+        token = secrets.token_hex(24)
+        self.tokens.add(token)
+        return 200, {'err': 200, 'message': 'Success', 'token': {'token': token}}
+
+    def aya_request(self, request):
+        if request.headers.get('authorization', '').removeprefix('Bearer ') not in self.tokens:
+            return 401, {'err': 401, 'message': 'Unauthorized'}
+        values = request.input()
+        order = self.create('aya', values.get('externalTransactionId'), values.get('amount'),
+                            phone=values.get('customerPhone', ''))
+        return 200, {'err': 200, 'message': 'Success',
+                     'data': {'externalTransactionId': order.order_id, 'referenceNumber': order.reference,
+                              'amount': order.amount, 'currency': values.get('currency', 'MMK'), 'status': 'pending'}}
+
+    # -- WavePay -------------------------------------------------------------
+
+    def wave_payment(self, request):
+        values = request.json()
+        expected = wave_hash([values.get('time_to_live_in_seconds'), values.get('merchant_id'), values.get('order_id'),
+                              values.get('amount'), values.get('backend_result_url'), values.get('merchant_reference_id')])
+        if values.get('hash') != expected:
+            return 400, {'message': 'Hash value mismatch'}
+        order = self.create('wave', values.get('order_id'), values.get('amount'), merchant=values.get('merchant_id', ''))
+        return 200, {'message': 'success', 'transaction_id': order.reference}
+
+    def wave_authenticate(self, request):
+        return 200, f"WavePay simulator: transaction {request.query.get('transaction_id', '')} awaiting confirmation"
+
+
+# -- callbacks --------------------------------------------------------------
+
+@dataclass
+class Delivery:
+    gateway: str
+    order: dict
+    kind: str       # 'first', 'duplicate' or 'stale'
+    status: str
+
+
+def build_callback(delivery, target):
+    """(url, json body) of one gateway notification"""
+    order, status = delivery.order, delivery.status
+    order_id, amount = str(order['order_id']), str(order.get('amount') or 0)
+    reference = order.get('reference') or secrets.token_hex(12)
+    now = time.strftime('%Y-%m-%d %H:%M:%S')
+
+    if delivery.gateway == 'kbz':
+        request = {
+            'notify_time': str(int(time.time())), 'merch_code': order.get('merchant', ''),
+            'merch_order_id': order_id, 'mm_order_id': reference, 'trans_currency': 'MMK',
+            'total_amount': amount, 'trade_status': status, 'trans_end_time': str(int(time.time())),
+            'callback_info': '', 'nonce_str': secrets.token_hex(16), 'appid': order.get('appid', ''),
+            'method': 'kbz.payment.notify', 'version': '1.0', 'sign_type': 'SHA256',
+        }
+        request['sign'] = kbz_sign(request)
+        return f"{target}/api/notify?order_id={order_id}", {'Request': request}
+
+    if delivery.gateway == 'cb':
+        merchant = order.get('merchant', '')
+        return f"{target}/api/notify?order_id={order_id}", {
+            'orderId': order_id, 'generateRefOrder': reference, 'ecommerceId': merchant,
+            'transactionStatus': status, 'amount': amount, 'currency': 'MMK', 'transactionDate': now,
+            'signature': cb_signature(CB_AUTH_TOKEN, merchant, order_id, amount, 'MMK', status),
+        }
+
+    if delivery.gateway == 'aya':
+        result = json.dumps({
+            'name': 'Subscriber Pay Online Merchant', 'desc': 'Subscriber Pay Online Merchant',
+            'currency': 'MMK', 'fees': {'debitFee': 0, 'creditFee': 0}, 'status': status,
+            'createdAt': time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime()),
+            'transRefId': reference, 'externalTransactionId': order_id, 'referenceNumber': reference,
+            'totalAmount': int(float(amount)), 'amount': int(float(amount)),
+            'customer': {'phone': order.get('phone', '')},
+        })
+        return f"{target}/api/aya-callback", {
+            'paymentResult': aya_encrypt(result), 'checksum': hashlib.sha256(result.encode()).hexdigest(),
+            'refundResult': None,
+        }
+
+    body = {
+        'status': status, 'timeToLiveSeconds': '600', 'merchantId': order.get('merchant', ''),
+        'orderId': order_id, 'amount': amount, 'backendResultUrl': f"{target}/api/wave-callback-payment",
+        'merchantReferenceId': order_id, 'initiatorMsisdn': order.get('phone', ''),
+        'transactionId': reference, 'paymentRequestId': reference, 'requestTime': now,
+        'currency': 'MMK', 'paymentDescription': order_id, 'frontendResultUrl': f"{target}/api/wave-mbt-return",
+    }
+    body['hashValue'] = wave_hash([body[k] for k in ('status', 'timeToLiveSeconds', 'merchantId', 'orderId', 'amount',
+                                                     'backendResultUrl', 'merchantReferenceId', 'initiatorMsisdn',
+                                                     'transactionId', 'paymentRequestId', 'requestTime')])
+    return f"{target}/api/wave-callback-payment", body
+
+
+def schedule(orders, duplicates=0.0, stale=0.0, failed=0.0, reorder=0):
+    """
+    Delivery list for the orders: one final notification each, plus a
+    duplicate of it for a `duplicates` share and an interim "pending"
+    notification for a `stale` share. Every delivery may move up to
+    `reorder` places from its natural position, so duplicates and stale
+    notifications can overtake the final one.
+    """
+    keyed = []
+    for i, order in enumerate(orders):
+        gateway = order['gateway']
+        final = (FAILED if random.random() < failed else PAID)[gateway]
+        if random.random() < stale:
+            keyed.append((i - 0.5, Delivery(gateway, order, 'stale', PENDING[gateway])))
+        keyed.append((i, Delivery(gateway, order, 'first', final)))
+        if random.random() < duplicates:
+            keyed.append((i + 0.5 + random.uniform(0, reorder), Delivery(gateway, order, 'duplicate', final)))
+
+    keyed = [(key + random.uniform(-reorder, reorder) / 2, delivery) for key, delivery in keyed]
+    return [delivery for _, delivery in sorted(keyed, key=lambda item: item[0])]
+
+
+class CallbackRun:
+    """Send deliveries at a fixed rate from a thread pool"""
+
+    def __init__(self, target, rate=20.0, concurrency=8, timeout=30):
+        self.target = target.rstrip('/')
+        self.rate = rate
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.histograms = defaultdict(Histogram)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+        self.lock = threading.Lock()
+        self._local = threading.local()
+
+    def run(self, deliveries):
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for i, delivery in enumerate(deliveries):
+                if self.rate:
+                    delay = started + i / self.rate - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                pool.submit(self.send, delivery)
+        return self.report(time.perf_counter() - started)
+
+    def send(self, delivery):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = new_session()
+            session.headers['Accept'] = 'application/json'
+
+        url, body = build_callback(delivery, self.target)
+        started = time.perf_counter()
+        try:
+            status = session.post(url, json=body, timeout=self.timeout).status_code
+        except Exception:
+            status = 'exception'
+        latency = time.perf_counter() - started
+
+        key = (delivery.gateway, delivery.kind)
+        with self.lock:
+            self.histograms[key].record(latency * 1_000_000)
+            self.statuses[key][str(status)] += 1
+
+    def report(self, elapsed):
+        rows = []
+        for (gateway, kind), histogram in sorted(self.histograms.items()):
+            statuses = dict(self.statuses[(gateway, kind)])
+            errors = sum(count for status, count in statuses.items() if not status.startswith(('2', '3')))
+            rows.append({
+                'gateway': gateway, 'kind': kind, 'requests': histogram.count, 'errors': errors,
+                'rps': round(histogram.count / elapsed, 2) if elapsed else 0,
+                'p50_ms': round(histogram.percentile(50) / 1000, 2),
+                'p95_ms': round(histogram.percentile(95) / 1000, 2),
+                'p99_ms': round(histogram.percentile(99) / 1000, 2),
+                'max_ms': round((histogram.max or 0) / 1000, 2),
+                'statuses': statuses,
+            })
+        total = sum(row['requests'] for row in rows)
+        return {'target': self.target, 'duration_s': round(elapsed, 2), 'requests': total,
+                'rps': round(total / elapsed, 2) if elapsed else 0, 'rows': rows}
+
+
+def load_orders(args):
+    """Orders from the simulator, a JSON file or generated ids"""
+    gateways = args.gateway or GATEWAYS
+    if args.orders_from:
+        session = new_session()
+        orders = session.get(f"{args.orders_from.rstrip('/')}/__orders", timeout=30).json()
+    elif args.orders:
+        with open(args.orders) as handle:
+            orders = json.load(handle)
+    else:
+        orders = [{'gateway': gateways[i % len(gateways)], 'order_id': f"SIM{int(time.time())}{i:06d}",
+                   'amount': random.choice([15000, 25000, 35000, 45000])} for i in range(args.generate)]
+    return [o for o in orders if o.get('gateway') in gateways]
+
+
+def print_report(report):
+    print()
+    print("=" * 86)
+    print(f"Callbacks: {report['requests']} to {report['target']} in {report['duration_s']}s ({report['rps']} req/s)")
+    print("=" * 86)
+    print(f"{'Gateway':<8}{'Kind':<11}{'Reqs':>7}{'Errors':>8}{'RPS':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}   statuses")
+    print("-" * 86)
+    for row in report['rows']:
+        color = RED if row['errors'] else GREEN
+        statuses = ' '.join(f"{status}:{count}" for status, count in sorted(row['statuses'].items()))
+        print(f"{row['gateway']:<8}{row['kind']:<11}{row['requests']:>7}{color}{row['errors']:>8}{NC}{row['rps']:>8.1f}"
+              f"{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}{row['max_ms']:>9.1f}   {statuses}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Payment gateway simulators and callback generator")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help="run the gateway endpoints")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8900)
+    serve.add_argument('--pay-rate', type=float, default=1.0, help="share of orders that end up paid (default 1.0)")
+    serve.add_argument('--pay-after', type=float, default=0.0, help="seconds an order stays pending before it settles")
+    serve.add_argument('--unknown', choices=['paid', 'missing'], default='missing',
+                       help="how status queries for orders the simulator never saw are answered (default missing)")
+    add_fault_arguments(serve)
+
+    callbacks = commands.add_parser('callbacks', help="send signed gateway callbacks to the app")
+    callbacks.add_argument('--target', required=True, help="app base URL, e.g. http://127.0.0.1:8000")
+    callbacks.add_argument('--allow-remote', action='store_true',
+                           help="allow a non-local target; callbacks can credit real accounts there")
+    callbacks.add_argument('--gateway', action='append', choices=GATEWAYS, help="limit to a gateway (repeatable)")
+    callbacks.add_argument('--orders-from', help="simulator URL whose /__orders supplies the orders")
+    callbacks.add_argument('--orders', help="JSON file of orders [{gateway, order_id, amount, ...}]")
+    callbacks.add_argument('--generate', type=int, default=100, help="generated orders when no source is given (default 100)")
+    callbacks.add_argument('--rate', type=float, default=20, help="callbacks per second, 0 for unthrottled (default 20)")
+    callbacks.add_argument('-c', '--concurrency', type=int, default=8, help="parallel requests (default 8)")
+    callbacks.add_argument('--duplicates', type=float, default=0.0, help="share of orders notified twice")
+    callbacks.add_argument('--stale', type=float, default=0.0, help="share of orders that also get a pending notification")
+    callbacks.add_argument('--failed', type=float, default=0.0, help="share of orders whose final status is a failure")
+    callbacks.add_argument('--reorder', type=int, default=0, help="how many places a delivery may move (default 0)")
+    callbacks.add_argument('--seed', type=int, help="random seed, for repeatable schedules")
+    callbacks.add_argument('--timeout', type=float, default=30, help="seconds per request (default 30)")
+    callbacks.add_argument('--json', help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        simulator = GatewaySimulator(args.pay_rate, args.pay_after, args.unknown, faults_from(args))
+        print(f"Gateway simulator listening on http://{args.host}:{args.port}/ (kbz, cb, aya, wave)")
+        simulator.server.run(args.host, args.port)
+        return 0
+
+    if not is_local(args.target) and not args.allow_remote:
+        print(f"{RED}Refusing to send payment callbacks to {args.target}: not a local host. "
+              f"Pass --allow-remote if this really is a test instance.{NC}")
+        return 2
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    orders = load_orders(args)
+    if any(o['gateway'] == 'aya' for o in orders) and Cipher is None:
+        print(f"{RED}AYA callbacks need the 'cryptography' package; skipping AYA orders{NC}")
+        orders = [o for o in orders if o['gateway'] != 'aya']
+    if not orders:
+        print(f"{RED}No orders to notify{NC}")
+        return 1
+
+    deliveries = schedule(orders, args.duplicates, args.stale, args.failed, args.reorder)
+    print(f"Sending {len(deliveries)} callbacks for {len(orders)} orders to {args.target}")
+    report = CallbackRun(args.target, args.rate, args.concurrency, args.timeout).run(deliveries)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, 'w') as handle:
+            json.dump(report, handle, indent=2)
+
+    return 0 if not any(row['errors'] for row in report['rows']) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
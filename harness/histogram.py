@@ -0,0 +1,73 @@
+"""
+HDR-style latency histogram.
+
+Values (microseconds) are counted in log-linear buckets: every power of two
+is split into 2**precision equal sub-buckets, so any recorded value is
+reported within 1 / 2**precision of its true value (0.8% at the default
+precision of 7) while memory stays constant however many samples arrive.
+Histograms from several threads can be merged.
+"""
+
+import math
+
+
+class Histogram:
+
+    def __init__(self, precision=7):
+        self.precision = precision
+        self.sub_buckets = 1 << precision
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def record(self, value):
+        """Count one value (an int, e.g. microseconds)"""
+        value = max(0, int(value))
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        """Add another histogram's counts into this one"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def percentile(self, percent):
+        """Value at the given percentile (0-100), or 0 when empty"""
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._value(index), self.max)
+        return self.max
+
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def _index(self, value):
+        if value < self.sub_buckets:
+            return value
+        shift = value.bit_length() - self.precision - 1
+        return ((shift + 1) << self.precision) + (value >> shift) - self.sub_buckets
+
+    def _value(self, index):
+        """Highest value that falls in a bucket"""
+        if index < self.sub_buckets:
+            return index
+        shift = (index >> self.precision) - 1
+        mantissa = (index & (self.sub_buckets - 1)) + self.sub_buckets
+        return ((mantissa + 1) << shift) - 1
@@ -0,0 +1,327 @@
+"""
+Load generator for the mobile API.
+
+Drives virtual users (one thread and one requests.Session each) through a
+weighted request mix described in a JSON scenario file, following a ramp
+profile, and reports throughput, error rate and latency percentiles per
+endpoint from HDR-style histograms.
+
+    python3 -m harness.load harness/scenarios/mobile_api.json \\
+        --json load.json --csv load.csv
+
+Scenario keys:
+
+    name            label used in reports
+    base_url        defaults to harness.settings.BASE_URL
+    stages          [{"duration": s, "users": n}, ...]; the active user
+                    count moves linearly to "users" over each stage
+    think_time      [min, max] seconds a user pauses between requests
+    timeout         seconds per request
+    users           identities; virtual user i uses users[i % len(users)]
+                    and its values fill {placeholders} in paths and bodies
+    login           optional {"method", "path", "json", "token"}; run once
+                    per identity and the token shared by every virtual
+                    user with that identity (a failed login is retried
+                    after LOGIN_RETRY seconds), "token" is the dotted path
+                    of the bearer token in the JSON response
+    requests        [{"name", "method", "path", "data" | "json" | "params",
+                      "weight", "auth", "expect"}, ...]
+
+A response counts as an error when its status is >= 400, differs from
+"expect" (when given), or the request fails outright.
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+
+from harness.auth import new_session
+from harness.histogram import Histogram
+from harness.settings import BASE_URL, GREEN, NC, RED
+from harness.timing import print_regressions
+
+PERCENTILES = [50, 90, 95, 99]
+
+# Seconds before a failed login of an identity is tried again
+LOGIN_RETRY = 60
+
+
+class Stats:
+    """Per-endpoint counters and latency histogram"""
+
+    def __init__(self):
+        self.histogram = Histogram()
+        self.errors = 0
+        self.statuses = defaultdict(int)
+
+    def row(self, name, elapsed):
+        h = self.histogram
+        row = {
+            'endpoint': name,
+            'requests': h.count,
+            'errors': self.errors,
+            'error_rate': round(self.errors / h.count, 4) if h.count else 0,
+            'rps': round(h.count / elapsed, 2) if elapsed else 0,
+            'min_ms': round((h.min or 0) / 1000, 2),
+            'mean_ms': round(h.mean() / 1000, 2),
+        }
+        for p in PERCENTILES:
+            row[f'p{p}_ms'] = round(h.percentile(p) / 1000, 2)
+        row['max_ms'] = round((h.max or 0) / 1000, 2)
+        row['statuses'] = dict(self.statuses)
+        return row
+
+
+class LoadTest:
+
+    def __init__(self, scenario):
+        self.scenario = scenario
+        self.base_url = (scenario.get('base_url') or BASE_URL).rstrip('/')
+        self.stages = scenario.get('stages') or [{'duration': 30, 'users': 10}]
+        self.duration = sum(stage['duration'] for stage in self.stages)
+        self.max_users = max(stage['users'] for stage in self.stages)
+        self.requests = scenario['requests']
+        self.weights = [r.get('weight', 1) for r in self.requests]
+        self.stats = defaultdict(Stats)
+        self.timeline = defaultdict(lambda: [0, 0])
+        self.lock = threading.Lock()
+        self.started = None
+        self.stop = threading.Event()
+        self.tokens = {}              # identity index -> (token or None, time of the attempt)
+        self.login_locks = defaultdict(threading.Lock)
+
+    def active_users(self, t):
+        """Number of virtual users that should be running t seconds in"""
+        previous = 0
+        for stage in self.stages:
+            if t < stage['duration']:
+                return round(previous + (stage['users'] - previous) * t / stage['duration'])
+            t -= stage['duration']
+            previous = stage['users']
+        return previous
+
+    def run(self, progress=True):
+        self.started = time.perf_counter()
+        threads = [threading.Thread(target=self._user, args=(i,), daemon=True) for i in range(self.max_users)]
+        for thread in threads:
+            thread.start()
+
+        try:
+            while (elapsed := time.perf_counter() - self.started) < self.duration:
+                time.sleep(min(5, self.duration - elapsed))
+                if progress:
+                    self._print_progress()
+        except KeyboardInterrupt:
+            print("Interrupted, finishing up...")
+        self.stop.set()
+
+        for thread in threads:
+            thread.join(timeout=self.scenario.get('timeout', 15) + 1)
+
+        return self.report()
+
+    def report(self):
+        elapsed = time.perf_counter() - self.started
+        total = Stats()
+        rows = []
+        for name in sorted(self.stats):
+            stats = self.stats[name]
+            rows.append(stats.row(name, elapsed))
+            total.histogram.merge(stats.histogram)
+            total.errors += stats.errors
+            for status, count in stats.statuses.items():
+                total.statuses[status] += count
+
+        return {
+            'scenario': self.scenario.get('name', 'load'),
+            'base_url': self.base_url,
+            'duration_s': round(elapsed, 2),
+            'max_users': self.max_users,
+            'total': total.row('TOTAL', elapsed),
+            'endpoints': rows,
+            'timeline': [
+                {'second': second, 'requests': counts[0], 'errors': counts[1]}
+                for second, counts in sorted(self.timeline.items())
+            ],
+        }
+
+    def _user(self, index):
+        identities = self.scenario.get('users') or [{}]
+        slot = index % len(identities)
+        identity = identities[slot]
+        session = new_session()
+        session.headers['Accept'] = 'application/json'
+        think = self.scenario.get('think_time', [0, 0])
+        timeout = self.scenario.get('timeout', 15)
+        logged_in = False
+
+        while not self.stop.is_set():
+            if index >= self.active_users(time.perf_counter() - self.started):
+                time.sleep(0.1)
+                continue
+
+            if self.scenario.get('login') and not logged_in:
+                token = self._token(slot, session, identity, timeout)
+                if token is not None:
+                    session.headers['Authorization'] = f"Bearer {token}"
+                    logged_in = True
+
+            spec = random.choices(self.requests, weights=self.weights)[0]
+            self._request(session, spec, identity, timeout)
+
+            if think[1] > 0:
+                self.stop.wait(random.uniform(*think))
+
+    def _token(self, slot, session, identity, timeout):
+        """
+        Bearer token of an identity. The login routes are rate limited
+        per client, so each identity logs in once and the token is shared;
+        a failed login is not retried for LOGIN_RETRY seconds.
+        """
+        with self.login_locks[slot]:
+            token, attempted = self.tokens.get(slot, (None, None))
+            if token is None and (attempted is None or time.perf_counter() - attempted >= LOGIN_RETRY):
+                token = self._login(session, identity, timeout)
+                self.tokens[slot] = (token, time.perf_counter())
+            return token
+
+    def _login(self, session, identity, timeout):
+        """Log in as identity; returns the bearer token or None"""
+        login = self.scenario['login']
+        ok, response = self._request(session, dict(login, name='login'), identity, timeout)
+        if not ok:
+            return None
+        try:
+            token = response.json()
+            for key in login.get('token', 'data.token').split('.'):
+                token = token[key]
+        except (ValueError, KeyError, TypeError):
+            return None
+        return token
+
+    def _request(self, session, spec, identity, timeout):
+        method = spec.get('method', 'GET').upper()
+        url = self.base_url + fill(spec['path'], identity)
+        kwargs = {'timeout': timeout}
+        for key in ('data', 'json', 'params'):
+            if key in spec:
+                kwargs[key] = fill(spec[key], identity)
+
+        started = time.perf_counter()
+        response = None
+        try:
+            response = session.request(method, url, **kwargs)
+            status = response.status_code
+            ok = status < 400 and ('expect' not in spec or status == spec['expect'])
+        except Exception:
+            status = 'exception'
+            ok = False
+        latency = time.perf_counter() - started
+
+        with self.lock:
+            stats = self.stats[spec['name']]
+            stats.histogram.record(latency * 1_000_000)
+            stats.statuses[str(status)] += 1
+            second = self.timeline[int(started - self.started)]
+            second[0] += 1
+            if not ok:
+                stats.errors += 1
+                second[1] += 1
+
+        return ok, response
+
+    def _print_progress(self):
+        elapsed = time.perf_counter() - self.started
+        with self.lock:
+            done = sum(s.histogram.count for s in self.stats.values())
+            errors = sum(s.errors for s in self.stats.values())
+        users = self.active_users(elapsed)
+        print(f"[{elapsed:6.1f}s] users={users:<4} requests={done:<7} errors={errors:<5} rps={done / elapsed:7.1f}")
+
+
+def fill(value, identity):
+    """Replace {placeholders} with the virtual user's identity values"""
+    if isinstance(value, str):
+        try:
+            return value.format(**identity)
+        except (KeyError, IndexError):
+            return value
+    if isinstance(value, dict):
+        return {k: fill(v, identity) for k, v in value.items()}
+    if isinstance(value, list):
+        return [fill(v, identity) for v in value]
+    return value
+
+
+def print_report(report):
+    total = report['total']
+    print()
+    print("=" * 96)
+    print(f"Scenario: {report['scenario']}  ({report['base_url']}, {report['duration_s']}s, up to {report['max_users']} users)")
+    print("=" * 96)
+    header = f"{'Endpoint':<28}{'Reqs':>8}{'Err%':>7}{'RPS':>8}" + ''.join(f"{'p' + str(p):>9}" for p in PERCENTILES) + f"{'max':>9}"
+    print(header + "   (ms)")
+    print("-" * 96)
+    for row in report['endpoints'] + [total]:
+        color = RED if row['error_rate'] > 0.01 else GREEN
+        print(f"{row['endpoint'][:27]:<28}{row['requests']:>8}{color}{row['error_rate'] * 100:>6.1f}%{NC}{row['rps']:>8.1f}"
+              + ''.join(f"{row[f'p{p}_ms']:>9.1f}" for p in PERCENTILES) + f"{row['max_ms']:>9.1f}")
+
+
+def write_csv(report, path):
+    fields = ['endpoint', 'requests', 'errors', 'error_rate', 'rps', 'min_ms', 'mean_ms'] \
+        + [f'p{p}_ms' for p in PERCENTILES] + ['max_ms']
+    with open(path, 'w', newline='') as handle:
+        writer = csv.DictWriter(handle, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        for row in report['endpoints'] + [report['total']]:
+            writer.writerow(row)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the mobile API from a scenario file")
+    parser.add_argument('scenario', help="scenario JSON file")
+    parser.add_argument('--base-url', help="override the scenario / HARNESS_BASE_URL target")
+    parser.add_argument('--users', type=int, help="scale every stage to this peak user count")
+    parser.add_argument('--duration', type=float, help="scale the stages to this total duration (seconds)")
+    parser.add_argument('--json', help="write the full report as JSON")
+    parser.add_argument('--csv', help="write the per-endpoint table as CSV")
+    parser.add_argument('--quiet', action='store_true', help="no progress lines")
+    args = parser.parse_args(argv)
+
+    with open(args.scenario) as handle:
+        scenario = json.load(handle)
+
+    if args.base_url:
+        scenario['base_url'] = args.base_url
+    stages = scenario.setdefault('stages', [{'duration': 30, 'users': 10}])
+    if args.users:
+        peak = max(stage['users'] for stage in stages) or 1
+        for stage in stages:
+            stage['users'] = round(stage['users'] * args.users / peak)
+    if args.duration:
+        total = sum(stage['duration'] for stage in stages)
+        for stage in stages:
+            stage['duration'] = stage['duration'] * args.duration / total
+
+    report = LoadTest(scenario).run(progress=not args.quiet)
+    print_report(report)
+    print()
+    print_regressions()
+
+    if args.json:
+        with open(args.json, 'w') as handle:
+            json.dump(report, handle, indent=2)
+    if args.csv:
+        write_csv(report, args.csv)
+
+    return 0 if report['total']['error_rate'] <= scenario.get('max_error_rate', 0.01) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+"""
+Local stand-in for the MBT billing server.
+
+Implements the api/v1/* paths the Laravel controllers call (through
+Setting::ip_address) with generated, deterministic fixture data, so the
+MbtController / PendingController / invoice code paths can be exercised and
+benchmarked without the real billing server or any network:
+
+    python3 -m harness.mbt_sim --users 5000 --port 8800 --latency 0.08
+    # then point Setting id 1 ip_address at http://127.0.0.1:8800/
+
+Responses follow the billing server's envelope, {"code": 0, "message",
+"data"}, with "_meta" pagination on list endpoints. Access tokens expire
+after --token-ttl seconds; calls with a missing, unknown or expired token
+get code 10401 ("access token invalid"). A recharge repeating an order_no
+gets code 10702, which the app treats as "already applied". A successful
+recharge returns the account's package row (with billing_name) as data[0].
+
+GET /__stats exposes per-path request and connection counters, which is
+how token caching and connection reuse on our side are measured.
+"""
+
+import argparse
+import random
+import secrets
+import time
+
+from harness.simhttp import Server, add_fault_arguments, faults_from
+
+TOKEN_INVALID = 10401
+USER_NOT_FOUND = 10101
+DUPLICATE_ORDER = 10702
+
+PLANS = [
+    (15000, '10Mbps'), (25000, '20Mbps'), (35000, '30Mbps'),
+    (45000, '50Mbps'), (65000, '100Mbps'), (99000, '200Mbps'),
+]
+TOWNSHIPS = ['Bahan', 'Kamaryut', 'Hlaing', 'Sanchaung', 'Mayangone', 'Tamwe', 'Yankin', 'Thingangyun']
+PAY_TYPES = [1, 2, 3, 8, 9, 10]
+
+
+def ok(data=None, **extra):
+    return 200, dict({'code': 0, 'message': 'success', 'data': data if data is not None else []}, **extra)
+
+
+def fail(code, message):
+    return 200, {'code': code, 'message': message, 'data': [], 'version': '1.0'}
+
+
+def guarded(handler):
+    """Reject calls without a live access token; passes the merged input on"""
+    def wrapper(self, request):
+        values = request.input()
+        if not self.authorized(values):
+            return fail(TOKEN_INVALID, 'access token invalid or expired')
+        return handler(self, request, values)
+    return wrapper
+
+
+class BillingData:
+    """Deterministic users, packages and payment records"""
+
+    def __init__(self, users=5000, seed=1):
+        rng = random.Random(seed)
+        now = int(time.time())
+        self.users = {}
+        self.packages = {}
+        self.payments = {}
+        self.orders = set()
+
+        for i in range(users):
+            user_id = 100000 + i
+            name = f"mbt{i:06d}"
+            price, speed = rng.choice(PLANS)
+            created = now - rng.randint(30, 1500) * 86400
+            expire = now + rng.randint(-20, 90) * 86400
+            phone = f"09{rng.randint(200000000, 999999999)}"
+
+            self.users[name] = {
+                'user_id': user_id, 'user_name': name, 'user_real_name': f"Customer {i}",
+                'group_id': rng.randint(1, 12), 'region_id': rng.randint(1, 30),
+                'user_create_time': created, 'user_update_time': now - rng.randint(0, 30) * 86400,
+                'user_expire_time': expire, 'user_status': 1 if expire > now else 2,
+                'balance': '0.00', 'mgr_name_create': 'admin', 'mgr_name_update': 'admin',
+                'user_start_time': created, 'user_stop_time': 0,
+                'phone': phone, 'email': f"{name}@example.com", 'create_visitor_num': 0,
+                'user_available': 0 if expire > now else 1,
+                'question1': '', 'answer1': '', 'question2': '', 'answer2': '', 'question3': '', 'answer3': '',
+                'school_type': 0, 'last_online': now - rng.randint(0, 86400), 'last_offline': now - rng.randint(0, 172800),
+                'user_address': f"No. {rng.randint(1, 300)}, {rng.choice(TOWNSHIPS)} Township, Yangon",
+                'salesman': f"sales{rng.randint(1, 40)}", 'Area': rng.choice(TOWNSHIPS),
+                'Router_type': rng.choice(['Huawei HG8145', 'ZTE F660', 'TP-Link XC220']),
+                'other': '', 'IPTV': rng.choice(['Yes', 'No']),
+                'Installation_cost': rng.choice(['FREE', '0', '50000', '100000']),
+                'Phone_number': phone, 'city': 'Yangon',
+                'GPS': f"16.{rng.randint(700000, 899999)},96.{rng.randint(100000, 199999)}",
+                'Service_type': 'FTTH', 'Bandwidth': speed,
+                'Order_Received_Date': time.strftime('%Y-%m-%d', time.gmtime(created - 7 * 86400)),
+                'Promotion_type': rng.choice(['', '6+1', '12+2']), 'Remark_Marketing': '',
+                'Monthly_Cost': str(price), 'Installation_person': f"tech{rng.randint(1, 25)}",
+                'ODB_Box': f"ODB-{rng.randint(1, 999):03d}", 'Pon': f"PON-{rng.randint(1, 64)}",
+                'LOID': f"LOID{user_id}", 'Fiber_length': f"{rng.randint(20, 600)}m",
+                'Initial_Contract_Validity': '12 months',
+                'Expected_installation_date': time.strftime('%Y-%m-%d', time.gmtime(created - 3 * 86400)),
+                'Installation_date': time.strftime('%Y-%m-%d', time.gmtime(created)),
+                'Optical_power': f"-{rng.randint(15, 27)}.{rng.randint(0, 9)}",
+                'Arrears_days': 0, 'Sub_company': rng.randint(1, 4), 'Nationality': 'Myanmar',
+                'LAN': '', 'DC_OCC': '', 'ODB_GPS': '', 'ODB_RX_Power': '', 'Speed_Test': '',
+                'Remark': '', 'Fault_details': '', 'Abnormal_change': '', 'Add_device_type': '',
+                'ALTERNATION_RECEIVE_DATE': '', 'Marketing_maintenance': '', 'Replacement_days': '',
+                'Reporting_time': '', 'Reason_for_temporarily_unable_to_maintain': '',
+                'Supplementary_explanation': '', 'User_maintenance_status': '', 'delay_finance': 0,
+                'explanation': '', 'password': '',
+            }
+
+            package_id = PLANS.index((price, speed)) + 1
+            self.packages[name] = [{
+                'package_id': package_id, 'products_id': package_id,
+                'billing_name': f"{price} {speed} Home Plan",
+                'products_name': f"FTTH {speed}", 'package': f"{speed} Monthly",
+                'checkout_amount': price, 'user_name': name,
+                'package_start_time': created, 'package_expire_time': expire,
+            }]
+
+            self.payments[name] = [
+                self._payment(name, rng.choice(PAY_TYPES), price, package_id, expire - k * 30 * 86400, rng)
+                for k in range(rng.randint(1, 12))
+            ]
+
+    def _payment(self, name, pay_type, amount, package_id, created, rng=random):
+        order_no = f"SIM{created}{rng.randint(1000, 9999)}"
+        self.orders.add(order_no)
+        return {
+            'user_name': name, 'create_at': created, 'pay_num': amount,
+            'order_no': order_no, 'bill_number': f"B{created}{rng.randint(100, 999)}",
+            'pay_type_id': pay_type, 'package_id': package_id, 'product_id': package_id,
+        }
+
+
+class MbtSimulator:
+
+    def __init__(self, data, token_ttl=7200, faults=None):
+        self.data = data
+        self.token_ttl = token_ttl
+        self.tokens = {}
+        self.server = Server(faults)
+
+        routes = {
+            'api/v1/auth/get-access-token': self.access_token,
+            'api/v1/user/view': self.user_view,
+            'api/v1/user/super-search': self.super_search,
+            'api/v1/user/update': self.user_update,
+            'api/v1/user/send-code': self.send_code,
+            'api/v1/users': self.create_user,
+            'api/v1/package/users-packages': self.users_packages,
+            'api/v1/financial/payment-records': self.payment_records,
+            'api/v1/product/recharge': self.recharge,
+            'api/v1/product/operators': self.operators,
+            'api/v1/groups': self.groups,
+            'api/v1/strategy/billing-create': self.acknowledge,
+            'api/v1/strategy/control-create': self.acknowledge,
+            'api/v1/message/notice': self.acknowledge,
+            'api/v1/base/macs': self.macs,
+        }
+        for path, handler in routes.items():
+            self.server.route(path, handler)
+
+    # -- auth --------------------------------------------------------------
+
+    def access_token(self, request):
+        token = secrets.token_hex(16)
+        expires = time.time() + self.token_ttl
+        self.tokens[token] = expires
+        return ok({'access_token': token, 'expire_time': int(expires)})
+
+    def authorized(self, values):
+        expires = self.tokens.get(values.get('access_token', ''))
+        if expires is None:
+            return False
+        if expires < time.time():
+            del self.tokens[values['access_token']]
+            return False
+        return True
+
+    # -- users -------------------------------------------------------------
+
+    @guarded
+    def user_view(self, request, values):
+        user = self.data.users.get(values.get('user_name', ''))
+        if user is None:
+            return fail(USER_NOT_FOUND, 'User does not exist')
+        return ok(user)
+
+    @guarded
+    def super_search(self, request, values):
+        needle = values.get('user_name', '')
+        per_page = int(values.get('per-page', 10) or 10)
+        matches = [u for name, u in self.data.users.items() if name.startswith(needle)][:per_page]
+        return ok(matches, _meta={'totalCount': len(matches), 'pageCount': 1, 'currentPage': 1, 'perPage': per_page})
+
+    @guarded
+    def user_update(self, request, values):
+        user = self.data.users.get(values.get('user_name', ''))
+        if user is None:
+            return fail(USER_NOT_FOUND, 'User does not exist')
+        for key, value in values.items():
+            if key in user and key not in ('user_id', 'user_name'):
+                user[key] = value
+        user['user_update_time'] = int(time.time())
+        return ok(user)
+
+    @guarded
+    def create_user(self, request, values):
+        name = values.get('username') or values.get('user_name')
+        if not name:
+            return fail(400, 'username is required')
+        if name not in self.data.users:
+            template = dict(next(iter(self.data.users.values())))
+            template.update(user_id=100000 + len(self.data.users), user_name=name,
+                            user_real_name=values.get('user_real_name', name), group_id=values.get('group_id', 1))
+            self.data.users[name] = template
+            self.data.packages[name] = []
+            self.data.payments[name] = []
+        return ok(self.data.users[name])
+
+    @guarded
+    def send_code(self, request, values):
+        return ok({'sent': True})
+
+    # -- packages and payments -----------------------------------------------
+
+    @guarded
+    def users_packages(self, request, values):
+        name = values.get('user_name', '')
+        if name not in self.data.packages:
+            return fail(USER_NOT_FOUND, 'User does not exist')
+        return ok(self.data.packages[name])
+
+    @guarded
+    def payment_records(self, request, values):
+        records = sorted(self.data.payments.get(values.get('user_name', ''), []), key=lambda r: -r['create_at'])
+        per_page = 20
+        page = max(1, int(values.get('page') or 1))
+        chunk = records[(page - 1) * per_page:page * per_page]
+        return ok(chunk, _meta={
+            'totalCount': len(records), 'pageCount': max(1, -(-len(records) // per_page)),
+            'currentPage': page, 'perPage': per_page,
+        })
+
+    @guarded
+    def recharge(self, request, values):
+        name = values.get('user_name', '')
+        user = self.data.users.get(name)
+        if user is None:
+            return fail(USER_NOT_FOUND, 'User does not exist')
+
+        order_no = str(values.get('order_no', ''))
+        if order_no in self.data.orders:
+            return fail(DUPLICATE_ORDER, 'Order already recharged')
+
+        now = int(time.time())
+        package = self.data.packages.get(name, [])[:1]
+        self.data.orders.add(order_no)
+        self.data.payments.setdefault(name, []).append({
+            'user_name': name, 'create_at': now, 'pay_num': values.get('pay_num', 0),
+            'order_no': order_no, 'bill_number': values.get('number') or f"B{now}",
+            'pay_type_id': values.get('pay_type_id', 0),
+            'package_id': package[0]['package_id'] if package else 0,
+            'product_id': package[0]['products_id'] if package else 0,
+        })
+        user['user_available'] = 0
+        user['Arrears_days'] = 0
+        # Like the billing server: the recharged package row, which the app
+        # checks for data[0].billing_name before treating the recharge as done
+        return ok([dict(row, order_no=order_no) for row in package])
+
+    @guarded
+    def operators(self, request, values):
+        return ok([{'id': i, 'name': f"operator{i}"} for i in range(1, 6)])
+
+    @guarded
+    def groups(self, request, values):
+        return ok([{'group_id': i, 'group_name': f"Group {i}", 'parent_id': 0} for i in range(1, 13)])
+
+    @guarded
+    def macs(self, request, values):
+        return ok([{'user_name': values.get('user_name', ''), 'mac': '00:1A:2B:3C:4D:5E'}])
+
+    @guarded
+    def acknowledge(self, request, values):
+        return ok({'id': random.randint(1000, 9999)})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local MBT billing-server simulator")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--users', type=int, default=5000, help="number of fixture accounts (default 5000)")
+    parser.add_argument('--seed', type=int, default=1, help="fixture random seed")
+    parser.add_argument('--token-ttl', type=float, default=7200, help="access token lifetime in seconds")
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    data = BillingData(args.users, args.seed)
+    simulator = MbtSimulator(data, args.token_ttl, faults_from(args))
+    print(f"MBT simulator: {len(data.users)} users generated in {time.perf_counter() - started:.1f}s, "
+          f"listening on http://{args.host}:{args.port}/ (e.g. user_name=mbt000001)")
+    simulator.server.run(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Single-pass scanner for PHP / Laravel error text in response bodies.
+
+Every pattern carries a literal that any match must contain. A body is
+scanned in chunks: the literals are checked first with plain substring
+search, and only when some are present does one precompiled alternation
+of the matching patterns run over the chunk. Clean pages - nearly all of
+them - never touch the regex engine.
+
+Bodies can be a str or an iterable of str / bytes chunks (for example
+response.iter_content()), so a response does not have to be decoded into
+one string first. Chunks overlap by `overlap` characters so a match
+straddling a chunk boundary is still found, and reported once.
+
+Usage:
+
+    from harness.phperrors import PHP_ERRORS
+
+    for hit in PHP_ERRORS.scan(response.iter_content(CHUNK_SIZE)):
+        print(hit.pattern, hit.text)
+"""
+
+import codecs
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+
+CHUNK_SIZE = 64 * 1024
+
+# (literal every match contains, regex); a plain string is both
+PHP_ERROR_PATTERNS = [
+    'Fatal error',
+    'Parse error',
+    ('Warning:', r'Warning:.*on line'),
+    ('Notice:', r'Notice:.*on line'),
+    'Undefined variable',
+    'Undefined index',
+    'Undefined array key',
+    'Call to undefined',
+    ('not found', r'Class .* not found'),
+    ('does not exist', r'Method .* does not exist'),
+    'SQLSTATE[',
+    'ErrorException',
+    'Exception in',
+    'Stack trace:',
+    'Whoops!',
+    ('Symfony\\Component\\', r'Symfony\\Component\\.*Exception'),
+    ('Illuminate\\', r'Illuminate\\.*Exception'),
+    'TypeError:',
+    'ArgumentCountError',
+    'ReflectionException',
+    'BadMethodCallException',
+    'InvalidArgumentException',
+    'RuntimeException',
+    'LogicException',
+    ('error</b>', r'<br\s*/>\s*<b>.*error</b>'),
+    'error_log',
+]
+
+
+@dataclass
+class Hit:
+    pattern: str
+    text: str
+
+
+class Scanner:
+    """Literal prefilter plus one compiled alternation per set of candidate patterns"""
+
+    def __init__(self, patterns, ignore_case=True, overlap=2048):
+        self.ignore_case = ignore_case
+        self.overlap = overlap
+        self.names, self.literals, self.regexes = [], [], []
+        for pattern in patterns:
+            literal, regex = (pattern, re.escape(pattern)) if isinstance(pattern, str) else pattern
+            self.names.append(regex if isinstance(pattern, tuple) else literal)
+            self.literals.append(literal.lower() if ignore_case else literal)
+            self.regexes.append(regex)
+        self._compiled = lru_cache(maxsize=256)(self._compile)
+
+    def _compile(self, candidates):
+        alternation = '|'.join(f"(?P<p{i}>{self.regexes[i]})" for i in sorted(candidates))
+        return re.compile(alternation, re.IGNORECASE if self.ignore_case else 0)
+
+    def scan(self, body, limit=2):
+        """
+        Hits in body order, at most `limit` per pattern (None for all).
+        body is a str or an iterable of str / bytes chunks.
+        """
+        hits = []
+        counts = Counter()
+        carry = ''
+        offset = 0        # absolute position of the current window
+        reported = 0      # absolute end of the last reported match
+
+        for chunk in _text_chunks(body):
+            window = carry + chunk
+            haystack = window.lower() if self.ignore_case else window
+            candidates = frozenset(i for i, literal in enumerate(self.literals) if literal in haystack)
+            if candidates:
+                for match in self._compiled(candidates).finditer(window):
+                    if offset + match.start() < reported:
+                        continue
+                    i = int(match.lastgroup[1:])
+                    if limit is None or counts[i] < limit:
+                        counts[i] += 1
+                        hits.append(Hit(self.names[i], match.group()))
+                    reported = offset + match.end()
+
+            carry = window[-self.overlap:]
+            offset += len(window) - len(carry)
+
+        return hits
+
+    def search(self, body):
+        """First hit or None"""
+        hits = self.scan(body, limit=1)
+        return hits[0] if hits else None
+
+
+def _text_chunks(body):
+    if isinstance(body, str):
+        yield body
+        return
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    for chunk in body:
+        text = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        if text:
+            yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+PHP_ERRORS = Scanner(PHP_ERROR_PATTERNS)
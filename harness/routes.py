@@ -0,0 +1,587 @@
+"""
+Route catalogue and admin crawler.
+
+Builds the list of application routes from core/routes/*.php (or from a
+saved `php artisan route:list --json`), so the sweeps no longer depend on
+hand-maintained route lists. The PHP parser understands what the route
+files use: Route::get/post/put/patch/delete/options/any/match, groups
+given as attribute arrays or as prefix()/middleware()/namespace()/name()
+chains, and ->name()/->middleware()/->where() on single routes. Files
+get the prefix and middleware group RouteServiceProvider wraps them in.
+
+    python3 -m harness.routes list --method GET --prefix '{locale}/admin'
+    python3 -m harness.routes sweep --param id=1 -c 16
+    python3 -m harness.routes crawl -c 16 --max-pages 800
+    python3 -m harness.routes scenario --prefix api/v1 --out api.json
+
+`sweep` runs the catalogue's admin GET routes through harness.sweep;
+routes with parameters need --param values. `crawl` starts from the same
+routes, follows every admin link it finds concurrently and reports which
+catalogue routes were reached and which links match no route; it only
+runs against a local host unless --allow-remote is given. Routes and
+links matching UNSAFE_WORDS are never requested. `scenario`
+writes a load scenario (harness.load) over parameterless API routes.
+"""
+
+import argparse
+import codecs
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
+from html.parser import HTMLParser
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+from harness.phperrors import CHUNK_SIZE
+from harness.settings import ADMIN_URL, BASE_URL, GREEN, LOCALE, NC, RED, YELLOW, is_local
+from harness.sweep import Sweep, argument_parser, classify, main as sweep_main, print_result, print_summary
+from harness.timing import print_regressions
+
+ROUTES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'core', 'routes')
+
+# Route files in the order RouteServiceProvider registers them, with the
+# prefix and middleware group it wraps each one in
+ROUTE_FILES = [('api.php', 'api', 'api'), ('api_v1.php', 'api', 'api'), ('web.php', '', 'web')]
+ROOT_NAMESPACE = 'App\\Http\\Controllers'
+
+ADMIN_PREFIX = '{locale}/admin'
+
+ALL_METHODS = ('GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS')
+VERBS = {'get': ('GET',), 'post': ('POST',), 'put': ('PUT',), 'patch': ('PATCH',),
+         'delete': ('DELETE',), 'options': ('OPTIONS',), 'any': ALL_METHODS}
+
+# GET routes and links that change state (or dump data); never swept or followed.
+# The admin area does a lot over GET: update/cbpay, currency/status/set/{id},
+# user-disable, insert-user-chat, export-*-excel, backup/{id}/download
+UNSAFE_WORDS = ('logout', 'delete', 'remove', 'destroy', 'clear', 'backup/store',
+                'update/', 'status/set', 'disable', 'export', 'insert-', 'download')
+
+ASSET_EXTENSIONS = ('.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico', '.webp',
+                    '.woff', '.woff2', '.ttf', '.pdf', '.zip', '.xlsx', '.csv', '.mp4')
+
+PARAM_RE = re.compile(r'\{(\w+)(\?)?\}')
+
+# Strings are kept whole, comments are blanked (keeping their newlines)
+SOURCE_RE = re.compile(r"""'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*"|//[^\n]*|\#[^\n]*|/\*.*?\*/""", re.S)
+TOKEN_RE = re.compile(r"""'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*"|=>|[()\[\]{},]""")
+ROUTE_RE = re.compile(r'\bRoute::')
+CALL_RE = re.compile(r'\s*(\w+)\s*\(')
+ARROW_RE = re.compile(r'\s*->')
+
+
+@dataclass
+class Route:
+    methods: tuple
+    uri: str
+    name: str = None
+    action: str = None
+    middleware: tuple = ()
+    where: dict = field(default_factory=dict)
+    source: str = None
+
+    @property
+    def params(self):
+        """Parameter names in URI order"""
+        return [name for name, _ in PARAM_RE.findall(self.uri)]
+
+    @property
+    def required(self):
+        return [name for name, optional in PARAM_RE.findall(self.uri) if not optional]
+
+    @property
+    def label(self):
+        """Admin routes relative to the admin URL (as in the hand-written lists), others as-is"""
+        if self.uri.startswith(ADMIN_PREFIX + '/'):
+            return self.uri[len(ADMIN_PREFIX) + 1:]
+        return self.uri
+
+    @property
+    def unsafe(self):
+        return any(word in self.uri for word in UNSAFE_WORDS)
+
+    @cached_property
+    def pattern(self):
+        """Regex matching concrete paths of this route"""
+        regex = ''
+        for segment in filter(None, self.uri.split('/')):
+            whole = PARAM_RE.fullmatch(segment)
+            if whole and whole.group(2):
+                regex += f"(?:/(?:{self.where.get(whole.group(1), '[^/]+')}))?"
+                continue
+            regex += '/'
+            last = 0
+            for match in PARAM_RE.finditer(segment):
+                regex += re.escape(segment[last:match.start()]) + f"(?:{self.where.get(match.group(1), '[^/]+')})"
+                last = match.end()
+            regex += re.escape(segment[last:])
+        return re.compile(f"^{regex or '/'}/?$")
+
+    def path(self, values=None):
+        """Concrete path with the parameters filled in, or None when a required one has no value"""
+        values = {'locale': LOCALE, **(values or {})}
+        if any(name not in values for name in self.required):
+            return None
+
+        def fill(match):
+            name = match.group(1)
+            return str(values[name]) if name in values else ''
+        path = PARAM_RE.sub(fill, self.uri.strip('/'))
+        return '/' + re.sub(r'/+', '/', path).rstrip('/') if path else '/'
+
+    def as_dict(self):
+        return asdict(self)
+
+
+class Catalogue:
+    """Routes in registration order; a later definition of the same method and URI replaces the earlier one"""
+
+    def __init__(self, routes):
+        unique = {}
+        for route in routes:
+            unique[(route.methods, route.uri.strip('/'))] = route
+        self.routes = list(unique.values())
+
+    def __iter__(self):
+        return iter(self.routes)
+
+    def __len__(self):
+        return len(self.routes)
+
+    @classmethod
+    def load(cls, source=None):
+        """From a routes directory (default core/routes) or a route:list --json file"""
+        source = source or ROUTES_DIR
+        if os.path.isdir(source):
+            return cls.from_route_files(source)
+        return cls.from_route_list(source)
+
+    @classmethod
+    def from_route_files(cls, directory=ROUTES_DIR):
+        routes = []
+        for filename, prefix, group in ROUTE_FILES:
+            path = os.path.join(directory, filename)
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as f:
+                    routes += parse_routes(f.read(), filename, prefix=prefix, middleware=(group,))
+        return cls(routes)
+
+    @classmethod
+    def from_route_list(cls, path):
+        with open(path, encoding='utf-8') as f:
+            entries = json.load(f)
+        routes = []
+        for entry in entries:
+            methods = tuple(m for m in entry['method'].split('|') if m != 'HEAD')
+            middleware = entry.get('middleware') or ()
+            routes.append(Route(methods, entry['uri'], entry.get('name'), entry.get('action'),
+                                tuple(middleware if isinstance(middleware, list) else middleware.split(','))))
+        return cls(routes)
+
+    def select(self, method=None, prefix=None):
+        """Routes accepting `method` whose URI starts with `prefix`"""
+        prefix = prefix.strip('/') if prefix else None
+        return [r for r in self.routes
+                if (method is None or method in r.methods)
+                and (prefix is None or r.uri.strip('/') == prefix or r.uri.strip('/').startswith(prefix + '/'))]
+
+    def match(self, method, path):
+        """First route (in registration order, like the router) matching a concrete path"""
+        path = '/' + path.strip('/')
+        for route in self.routes:
+            if method in route.methods and route.pattern.match(path):
+                return route
+        return None
+
+
+# --- PHP route file parser ---
+
+def parse_routes(source, filename='routes.php', prefix='', middleware=()):
+    """Route definitions of one route file"""
+    source = SOURCE_RE.sub(lambda m: m.group() if m.group()[0] in '\'"' else '\n' * m.group().count('\n'), source)
+    context = {'prefix': prefix, 'middleware': tuple(middleware), 'name': '', 'namespace': ROOT_NAMESPACE, 'where': {}}
+    routes = []
+    _parse_block(source, 0, len(source), context, filename, routes)
+    return routes
+
+
+def _parse_block(source, start, end, context, filename, routes):
+    position = start
+    while True:
+        match = ROUTE_RE.search(source, position, end)
+        if match is None:
+            return
+        calls, position = _chain(source, match.end())
+        line = source.count('\n', 0, match.start()) + 1
+        _apply(source, calls, dict(context), f"{filename}:{line}", routes)
+
+
+def _chain(source, position):
+    """Method calls of a Route:: chain as (name, start, end) of their argument text"""
+    calls = []
+    while True:
+        match = CALL_RE.match(source, position)
+        if match is None:
+            return calls, position
+        close = _closing(source, match.end() - 1)
+        calls.append((match.group(1), match.end(), close))
+        position = close + 1
+        arrow = ARROW_RE.match(source, position)
+        if arrow is None:
+            return calls, position
+        position = arrow.end()
+
+
+def _closing(source, opening):
+    """Index of the bracket closing the one at `opening`"""
+    depth = 0
+    for token in TOKEN_RE.finditer(source, opening):
+        text = token.group()
+        if text in '([{':
+            depth += 1
+        elif text in ')]}':
+            depth -= 1
+            if depth == 0:
+                return token.start()
+    return len(source)
+
+
+def _split(source, start, end, separator=','):
+    """Top-level pieces of source[start:end] split on `separator`, as (start, end) spans"""
+    spans, depth, piece = [], 0, start
+    for token in TOKEN_RE.finditer(source, start, end):
+        text = token.group()
+        if text in '([{':
+            depth += 1
+        elif text in ')]}':
+            depth -= 1
+        elif text == separator and depth == 0:
+            spans.append((piece, token.start()))
+            piece = token.end()
+    if source[piece:end].strip():
+        spans.append((piece, end))
+    return spans
+
+
+def _value(source, start, end):
+    """A PHP literal: strings, arrays (list or dict); anything else as its source text"""
+    text = source[start:end].strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in '\'"':
+        # single quotes only escape \\ and \'
+        return re.sub(r"\\([\\'])" if text[0] == "'" else r'\\([\\"$])', r'\1', text[1:-1])
+    offset = start + len(source[start:end]) - len(source[start:end].lstrip())
+    if text.startswith('[') or text.lower().startswith('array('):
+        inner = offset + text.index('[' if text.startswith('[') else '(') + 1
+        items = _split(source, inner, offset + len(text) - 1)
+        pairs = [_split(source, a, b, '=>') for a, b in items]
+        if all(len(pair) == 2 for pair in pairs) and pairs:
+            return {_value(source, *pair[0]): _value(source, *pair[1]) for pair in pairs}
+        return [_value(source, a, b) for a, b in items]
+    return text
+
+
+def _listify(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return (value,) if value else ()
+
+
+def _merge(context, attributes):
+    """Nest group attributes the way Laravel does"""
+    for key, value in attributes.items():
+        if key == 'prefix':
+            context['prefix'] = '/'.join(p.strip('/') for p in (context['prefix'], value) if p.strip('/'))
+        elif key == 'middleware':
+            context['middleware'] += _listify(value)
+        elif key in ('as', 'name'):
+            context['name'] += value
+        elif key == 'namespace':
+            context['namespace'] = value.lstrip('\\') if value.startswith('\\') else '\\'.join(
+                part for part in (context['namespace'], value) if part)
+        elif key == 'where':
+            context['where'] = {**context['where'], **value}
+    return context
+
+
+def _action(value, namespace):
+    if isinstance(value, list) and len(value) == 2:
+        return f"{value[0].removesuffix('::class')}@{value[1]}"
+    if isinstance(value, str) and '@' in value:
+        return value if value.startswith('\\') or not namespace else f"{namespace}\\{value}"
+    return 'Closure' if isinstance(value, str) and value.startswith(('function', 'fn')) else value
+
+
+def _apply(source, calls, context, where, routes):
+    route = None
+    for name, start, end in calls:
+        args = _split(source, start, end)
+        if name == 'group':
+            if len(args) > 1:
+                _merge(context, _value(source, *args[0]))
+            body_start, body_end = args[-1]
+            opening = source.index('{', body_start, body_end)
+            _parse_block(source, opening + 1, _closing(source, opening), context, where.split(':')[0], routes)
+            return
+        if name in VERBS or name == 'match':
+            if name == 'match':
+                methods = tuple(m.upper() for m in _listify(_value(source, *args[0])) if m.upper() != 'HEAD')
+                args = args[1:]
+            else:
+                methods = VERBS[name]
+            uri = '/'.join(p.strip('/') for p in (context['prefix'], _value(source, *args[0])) if p.strip('/')) or '/'
+            action = _action(_value(source, *args[1]), context['namespace']) if len(args) > 1 else None
+            route = Route(methods, uri, context['name'] or None, action, context['middleware'], dict(context['where']), where)
+            routes.append(route)
+        elif route is None:
+            values = [_value(source, a, b) for a, b in args]
+            value = values[0] if len(values) == 1 else values
+            _merge(context, {name: value})
+        elif name in ('name', 'as'):
+            route.name = (context['name'] or '') + _value(source, *args[0])
+        elif name == 'middleware':
+            for a, b in args:
+                route.middleware += _listify(_value(source, a, b))
+        elif name == 'where':
+            value = _value(source, *args[0])
+            route.where.update(value if isinstance(value, dict) else {value: _value(source, *args[1])})
+
+
+# --- Crawler ---
+
+class LinkParser(HTMLParser):
+    """Collects <a href> targets, resolved against the page URL"""
+
+    def __init__(self, base):
+        super().__init__(convert_charrefs=True)
+        self.base = base
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            href = dict(attrs).get('href')
+            if href and not href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
+                self.links.append(urldefrag(urljoin(self.base, href.strip()))[0])
+
+
+class Crawler(Sweep):
+    """
+    Sweep that follows links: every page fetched is classified as usual
+    and its admin links are queued, up to max_pages pages.
+    """
+
+    def __init__(self, scope=ADMIN_URL, max_pages=500, **kwargs):
+        super().__init__(**kwargs)
+        self.scope = scope.rstrip('/')
+        self.max_pages = max_pages
+        self.links = {}
+        self._links_lock = threading.Lock()
+
+    def read(self, url, response):
+        if 'html' not in response.headers.get('content-type', ''):
+            return super().read(url, response)
+
+        parser = LinkParser(response.url)
+        decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+
+        def chunks():
+            for chunk in response.iter_content(CHUNK_SIZE):
+                parser.feed(decoder.decode(chunk))
+                yield chunk
+
+        result = classify(response.status_code, chunks(), self.min_size)
+        parser.close()
+        with self._links_lock:
+            self.links[url] = parser.links
+        return result
+
+    def follow(self, link):
+        """The link if it should be crawled, else None"""
+        path = urlsplit(link).path.lower()
+        if not (link == self.scope or link.startswith(self.scope + '/')):
+            return None
+        if path.endswith(ASSET_EXTENSIONS) or any(word in path for word in UNSAFE_WORDS):
+            return None
+        return link
+
+    def crawl(self, start, on_result=None):
+        """Crawl from the start URLs; returns the Results in completion order"""
+        self.login()
+
+        seen = set(start)
+        results = []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            pending = {pool.submit(self.fetch, url): url for url in start}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = pending.pop(future)
+                    result = future.result()
+                    results.append(result)
+                    if on_result:
+                        on_result(result)
+                    with self._links_lock:
+                        links = self.links.pop(url, ())
+                    for link in links:
+                        link = self.follow(link)
+                        if link and link not in seen and len(seen) < self.max_pages:
+                            seen.add(link)
+                            pending[pool.submit(self.fetch, link)] = link
+        return results
+
+
+# --- Front ends ---
+
+def sweep_targets(catalogue, values=None, prefix=ADMIN_PREFIX):
+    """(label, url) pairs for the safe GET routes under prefix, plus the routes skipped for missing values"""
+    targets, skipped = [], []
+    for route in catalogue.select('GET', prefix):
+        path = route.path(values)
+        if route.unsafe and not route.uri.endswith('logout'):
+            continue
+        if path is None:
+            skipped.append(route)
+        else:
+            targets.append((route.label, BASE_URL + path))
+    return targets, skipped
+
+
+def print_coverage(catalogue, results, prefix=ADMIN_PREFIX):
+    """Which catalogue routes a crawl reached, and which crawled pages match no route"""
+    routes = [r for r in catalogue.select('GET', prefix) if not r.unsafe]
+    reached, unknown = set(), []
+    for result in results:
+        route = catalogue.match('GET', urlsplit(result.url).path)
+        if route is None:
+            unknown.append(result.url)
+        else:
+            reached.add(id(route))
+    missed = [r for r in routes if id(r) not in reached]
+
+    print()
+    print(f"Catalogue coverage: {len(routes) - len(missed)}/{len(routes)} GET routes under {prefix}")
+    for route in missed:
+        print(f"  {YELLOW}-{NC} {route.uri}  ({route.source})")
+    if unknown:
+        print(f"{RED}Crawled pages matching no route: {len(unknown)}{NC}")
+        for url in unknown:
+            print(f"  {RED}?{NC} {url}")
+
+
+def parse_values(pairs):
+    values = {}
+    for pair in pairs or ():
+        name, _, value = pair.partition('=')
+        values[name] = value
+    return values
+
+
+def build_scenario(catalogue, values=None, prefix='api'):
+    """harness.load scenario over the parameterless (after `values`) GET routes under prefix"""
+    requests_ = []
+    for route in catalogue.select('GET', prefix):
+        path = route.path(values)
+        if path is not None and not route.unsafe:
+            requests_.append({'name': route.name or route.uri, 'method': 'GET', 'path': path, 'weight': 1})
+    return {
+        'name': f"catalogue-{prefix.strip('/').replace('/', '-')}",
+        'description': "Generated by harness.routes from the route files; adjust weights and add POST bodies by hand.",
+        'stages': [{'duration': 30, 'users': 10}, {'duration': 60, 'users': 10}, {'duration': 10, 'users': 0}],
+        'think_time': [0.5, 2.0],
+        'timeout': 15,
+        'requests': requests_,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Route catalogue built from core/routes, with sweep and crawl front ends")
+    parser.add_argument('--source', help="routes directory or `artisan route:list --json` file (default core/routes)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    listing = commands.add_parser('list', help="print the catalogue")
+    listing.add_argument('--method', help="only routes accepting this method")
+    listing.add_argument('--prefix', help="only URIs under this prefix")
+    listing.add_argument('--json', action='store_true', help="print JSON")
+
+    sweep = commands.add_parser('sweep', help="sweep the catalogue's GET routes (harness.sweep options apply)")
+    sweep.add_argument('--prefix', default=ADMIN_PREFIX, help=f"URI prefix to sweep (default {ADMIN_PREFIX})")
+    sweep.add_argument('--param', action='append', metavar='NAME=VALUE', help="value for a route parameter, e.g. id=1")
+
+    crawl = commands.add_parser('crawl', parents=[argument_parser(None)], add_help=False,
+                                help="follow admin links from the catalogue routes and report coverage")
+    crawl.add_argument('--max-pages', type=int, default=500, help="stop queueing links after this many pages (default 500)")
+    crawl.add_argument('--param', action='append', metavar='NAME=VALUE', help="value for a route parameter, e.g. id=1")
+    crawl.add_argument('--allow-remote', action='store_true',
+                       help="allow a non-local BASE_URL; the crawl follows every admin link it finds")
+
+    scenario = commands.add_parser('scenario', help="write a harness.load scenario over the API GET routes")
+    scenario.add_argument('--prefix', default='api', help="URI prefix (default api)")
+    scenario.add_argument('--param', action='append', metavar='NAME=VALUE', help="value for a route parameter")
+    scenario.add_argument('--out', help="output file (default stdout)")
+
+    args, rest = parser.parse_known_args(argv)
+    if rest and args.command != 'sweep':
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+
+    catalogue = Catalogue.load(args.source)
+
+    if args.command == 'list':
+        routes = catalogue.select(args.method and args.method.upper(), args.prefix)
+        if args.json:
+            print(json.dumps([r.as_dict() for r in routes], indent=2))
+        else:
+            for route in routes:
+                print(f"{'|'.join(route.methods):<12} {route.uri:<60} {route.name or '':<40} {route.action or ''}")
+            print(f"{len(routes)} routes")
+        return 0
+
+    if args.command == 'scenario':
+        text = json.dumps(build_scenario(catalogue, parse_values(args.param), args.prefix), indent=2)
+        if args.out:
+            with open(args.out, 'w') as f:
+                f.write(text + '\n')
+            print(f"Scenario written to {args.out}")
+        else:
+            print(text)
+        return 0
+
+    values = parse_values(args.param)
+    targets, skipped = sweep_targets(catalogue, values, getattr(args, 'prefix', ADMIN_PREFIX))
+
+    if args.command == 'sweep':
+        if skipped:
+            print(f"{YELLOW}Skipping {len(skipped)} routes without --param values: "
+                  f"{', '.join(sorted({p for r in skipped for p in r.required if p not in {'locale', *values}}))}{NC}")
+        return sweep_main(targets, f"Catalogue sweep ({len(targets)} routes from {args.source or 'core/routes'})", rest)
+
+    if not is_local(BASE_URL) and not args.allow_remote:
+        print(f"{RED}Refusing to crawl {BASE_URL}: not a local host. "
+              f"Pass --allow-remote if this really is a test instance.{NC}")
+        return 2
+
+    crawler = Crawler(max_pages=max(args.max_pages, len(targets)), concurrency=args.concurrency,
+                      per_host=args.per_host, timeout=args.timeout)
+    print("=" * 50)
+    print("Admin crawl")
+    print("=" * 50)
+    if crawler.login():
+        print(f"{GREEN}✓ Login successful!{NC}")
+    else:
+        print(f"{RED}✗ Login failed{NC} - continuing (pages may redirect to login)...")
+    print()
+
+    started = time.perf_counter()
+    results = crawler.crawl([url for _, url in targets if not url.endswith('logout')] or [f"{ADMIN_URL}/dashboard"],
+                            on_result=print_result)
+    print_summary(results, time.perf_counter() - started)
+    print_coverage(catalogue, results)
+    print()
+    print_regressions()
+    return 0 if all(r.status == 'PASS' for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
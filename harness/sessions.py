@@ -0,0 +1,223 @@
+"""
+Pool of logged-in admin sessions.
+
+One admin login is shared by every session the pool hands out: each
+worker gets its own requests.Session (they are not thread-safe) carrying
+the same cookies. The cookies are cached on disk (HARNESS_SESSION_CACHE)
+together with their expiry, so the next run - or the next pytest-xdist
+worker - skips the login while they are still valid.
+
+Pooled sessions notice when the login is gone: a 419 (CSRF / session
+expired) or a redirect to the login page makes the pool log in again,
+once for all sessions, and the request is replayed with the new cookies
+and, for forms, the new CSRF token.
+
+Usage:
+
+    pool = SessionPool()
+    if pool.open():
+        with pool.session() as session:
+            session.get(f"{ADMIN_URL}/dashboard")
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from requests.cookies import create_cookie
+
+from harness.auth import get_csrf_token, login, new_session
+from harness.settings import ADMIN_PASSWORD, ADMIN_URL, ADMIN_USERNAME, BASE_URL, SESSION_CACHE
+
+# Cached cookies this close to expiry are not reused
+EXPIRY_MARGIN = 60
+
+# Where Laravel sends a guest: route('login') for the admin area, /admin for the form itself
+LOGIN_URLS = (f"{BASE_URL}/login", f"{BASE_URL}/admin")
+
+
+class PooledSession(requests.Session):
+    """Session that re-authenticates through its pool when the login has expired"""
+
+    pool = None
+
+    def request(self, method, url, *args, **kwargs):
+        generation = self.pool.generation
+        response = super().request(method, url, *args, **kwargs)
+        if not self.pool.expired(url, response) or not self.pool.reauthenticate(generation):
+            return response
+
+        response.close()
+        data = kwargs.get('data')
+        if isinstance(data, dict) and '_token' in data:
+            kwargs['data'] = dict(data, _token=self.pool.csrf_token())
+        return super().request(method, url, *args, **kwargs)
+
+
+class SessionPool:
+    """Admin sessions sharing one login, cached on disk between runs"""
+
+    def __init__(self, username=ADMIN_USERNAME, password=ADMIN_PASSWORD, cache=SESSION_CACHE):
+        self.username = username
+        self.password = password
+        self.cache = cache
+        self.key = f"{BASE_URL} {username}"
+        self.generation = 0       # bumped on every login
+        self.logins = 0
+        self.ready = False
+        self._cookies = None
+        self._token = None
+        self._members = []
+        self._idle = queue.Queue()
+        self._lock = threading.RLock()
+
+    def open(self):
+        """Authenticate the pool, from the cache when possible; returns True on success"""
+        with self._lock:
+            if not self.ready:
+                cookies = self._load()
+                if cookies is not None:
+                    self._share(cookies)
+                    self.ready = True
+                else:
+                    self.ready = self._login()
+            return self.ready
+
+    def acquire(self):
+        """A session for one worker; new ones are created on demand"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        session = new_session(PooledSession)
+        session.pool = self
+        with self._lock:
+            if self._cookies is not None:
+                session.cookies.update(self._cookies)
+            self._members.append(session)
+        return session
+
+    def release(self, session):
+        self._idle.put(session)
+
+    @contextmanager
+    def session(self):
+        """Check a session out for the duration of the block"""
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def expired(self, url, response):
+        """True when the response shows the login is gone"""
+        if response.status_code == 419:
+            return True
+        return (bool(response.history) and response.url.rstrip('/') in LOGIN_URLS
+                and url.rstrip('/') not in LOGIN_URLS + (f"{BASE_URL}/admin/login",))
+
+    def reauthenticate(self, generation):
+        """
+        Log in again unless another worker already did since `generation`
+        was read; returns True when the sessions hold a fresh login
+        """
+        with self._lock:
+            if self.generation != generation:
+                return True
+            return self._login()
+
+    def csrf_token(self):
+        """CSRF token of the current login, fetched once per login"""
+        with self._lock:
+            if self._token is None:
+                session = self.acquire()
+                try:
+                    self._token = get_csrf_token(session.get(f"{ADMIN_URL}/dashboard", timeout=30).text)
+                finally:
+                    self.release(session)
+            return self._token
+
+    def forget(self):
+        """Drop the cached login, e.g. after a route that logs out"""
+        with self._lock:
+            self.ready = False
+            entries = self._read_cache()
+            if entries.pop(self.key, None) is not None:
+                self._write_cache(entries)
+
+    def _login(self):
+        session = new_session()
+        ok = login(session, self.username, self.password)
+        self.logins += 1
+        self.generation += 1
+        self._token = None
+        if ok:
+            self._share(session.cookies)
+            self._save(session.cookies)
+        return ok
+
+    def _share(self, cookies):
+        self._cookies = cookies
+        for member in self._members:
+            member.cookies.clear()
+            member.cookies.update(cookies)
+
+    def _load(self):
+        """Cached cookie jar for this site and user, or None when missing or about to expire"""
+        entry = self._read_cache().get(self.key)
+        if not entry or not entry.get('cookies'):
+            return None
+        deadline = time.time() + EXPIRY_MARGIN
+        if any(c['expires'] is not None and c['expires'] < deadline for c in entry['cookies']):
+            return None
+
+        jar = requests.cookies.RequestsCookieJar()
+        for c in entry['cookies']:
+            jar.set_cookie(create_cookie(c['name'], c['value'], domain=c['domain'], path=c['path'],
+                                         expires=c['expires'], secure=c['secure']))
+        return jar
+
+    def _save(self, cookies):
+        if not self.cache:
+            return
+        entries = self._read_cache()
+        entries[self.key] = {
+            'saved': int(time.time()),
+            'cookies': [{'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path,
+                         'expires': c.expires, 'secure': c.secure} for c in cookies],
+        }
+        self._write_cache(entries)
+
+    def _read_cache(self):
+        if not self.cache:
+            return {}
+        try:
+            with open(self.cache) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, entries):
+        """Atomic write, readable by the owner only (the cookies are a login)"""
+        partial = f"{self.cache}.{os.getpid()}"
+        fd = os.open(partial, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(entries, f, indent=2)
+        os.replace(partial, self.cache)
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_pool():
+    """The process-wide pool for the configured admin user"""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = SessionPool()
+        return _default
@@ -0,0 +1,64 @@
+"""
+Target site and credentials used by the harness.
+
+Every value can be overridden from the environment, so the same scripts
+run against production, staging or a local checkout.
+"""
+
+import os
+from urllib.parse import urlsplit
+
+BASE_URL = os.environ.get("HARNESS_BASE_URL", "https://isp.mlbbshop.app").rstrip("/")
+LOCALE = os.environ.get("HARNESS_LOCALE", "en")
+ADMIN_URL = f"{BASE_URL}/{LOCALE}/admin"
+
+# Admin credentials
+ADMIN_USERNAME = os.environ.get("HARNESS_ADMIN_USERNAME", "admin")
+ADMIN_PASSWORD = os.environ.get("HARNESS_ADMIN_PASSWORD", "TestAdmin123!")
+
+# Payment gateway secrets; must match the payment settings row the app
+# signs with when it is pointed at harness.gateway_sim
+KBZ_KEY = os.environ.get("HARNESS_KBZ_KEY", "sim-kbz-key")
+CB_AUTH_TOKEN = os.environ.get("HARNESS_CB_AUTH_TOKEN", "sim-cb-token")
+AYA_ENC_KEY = os.environ.get("HARNESS_AYA_ENC_KEY", "sim-aya-key-0123456789abcdefghij")
+WAVE_SECRET_KEY = os.environ.get("HARNESS_WAVE_SECRET_KEY", "sim-wave-secret")
+
+# Latency history of every harness request (harness/timing.py)
+TIMINGS = os.environ.get("HARNESS_TIMINGS", "1") == "1"
+TIMING_DB = os.environ.get(
+    "HARNESS_TIMING_DB",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "harness_timings.sqlite"),
+)
+
+# Admin login cookies reused between runs (harness/sessions.py); empty disables
+SESSION_CACHE = os.environ.get(
+    "HARNESS_SESSION_CACHE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".harness_sessions.json"),
+)
+
+# Hosts that count as local for the commands that change state on the
+# target (gateway callbacks, admin crawl); anything else needs an opt-in
+LOCAL_HOSTS = ('localhost', '127.0.0.1', '::1', '0.0.0.0')
+LOCAL_SUFFIXES = ('.localhost', '.test', '.local')
+
+
+def is_local(url):
+    """True when the URL points at this machine or a local development host"""
+    host = (urlsplit(url).hostname or '').lower()
+    return host in LOCAL_HOSTS or host.startswith('127.') or host.endswith(LOCAL_SUFFIXES)
+
+
+# The test hosts use self-signed certificates
+VERIFY_TLS = os.environ.get("HARNESS_VERIFY_TLS", "0") == "1"
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+# Text only present on the admin login form
+LOGIN_MARKER = "Login To Go Your Dashboard"
+
+# Color codes
+GREEN = '\033[92m'
+RED = '\033[91m'
+YELLOW = '\033[93m'
+BLUE = '\033[94m'
+NC = '\033[0m'
@@ -0,0 +1,214 @@
+"""
+Minimal asyncio HTTP/1.1 server for the local service simulators.
+
+Only what the simulators need: request line, headers, Content-Length
+bodies, keep-alive, JSON/form parsing and injected latency / failures.
+No third-party dependencies, so the simulators run anywhere Python does.
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from urllib.parse import parse_qsl, urlsplit
+
+REASONS = {200: 'OK', 400: 'Bad Request', 401: 'Unauthorized', 404: 'Not Found', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    query: dict
+    headers: dict
+    body: bytes
+
+    def json(self):
+        try:
+            return json.loads(self.body or b'{}')
+        except ValueError:
+            return {}
+
+    def form(self):
+        return dict(parse_qsl(self.body.decode('utf-8', 'replace')))
+
+    def input(self):
+        """Query string merged with a JSON or form body, like Laravel's request->all()"""
+        values = dict(self.query)
+        if 'json' in self.headers.get('content-type', '') or self.body[:1] in (b'{', b'['):
+            body = self.json()
+            if isinstance(body, dict):
+                values.update(body)
+        elif self.body:
+            values.update(self.form())
+        return values
+
+
+@dataclass
+class Faults:
+    """Latency and failure injection applied to every request"""
+    latency: float = 0.0       # mean seconds added to each response
+    jitter: float = 0.0        # +/- seconds of uniform jitter
+    error_rate: float = 0.0    # share of requests answered with HTTP 500
+    drop_rate: float = 0.0     # share of connections closed without a response
+
+    async def apply(self):
+        """Sleep for the configured latency; returns 'drop', 'error' or None"""
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        roll = random.random()
+        if roll < self.drop_rate:
+            return 'drop'
+        if roll < self.drop_rate + self.error_rate:
+            return 'error'
+        return None
+
+
+@dataclass
+class Stats:
+    started: float = field(default_factory=time.time)
+    connections: int = 0
+    requests: Counter = field(default_factory=Counter)
+    statuses: Counter = field(default_factory=Counter)
+
+    def snapshot(self):
+        return {
+            'uptime_s': round(time.time() - self.started, 1),
+            'connections': self.connections,
+            'requests': dict(self.requests),
+            'statuses': {str(k): v for k, v in self.statuses.items()},
+            'total_requests': sum(self.requests.values()),
+        }
+
+
+class Server:
+    """
+    Route table plus connection loop. Handlers are (async or plain)
+    callables taking a Request and returning (status, body[, headers]),
+    where body is a dict/list (sent as JSON), str or bytes.
+
+    GET /__stats returns request counters; POST /__reset clears them.
+    """
+
+    def __init__(self, faults=None):
+        self.routes = {}
+        self.faults = faults or Faults()
+        self.stats = Stats()
+
+    def route(self, path, handler, methods=('GET', 'POST')):
+        for method in methods:
+            self.routes[(method, path.strip('/'))] = handler
+
+    async def serve(self, host='127.0.0.1', port=8800):
+        server = await asyncio.start_server(self._connection, host, port, limit=1 << 20)
+        async with server:
+            await server.serve_forever()
+
+    def run(self, host='127.0.0.1', port=8800):
+        try:
+            asyncio.run(self.serve(host, port))
+        except KeyboardInterrupt:
+            pass
+
+    async def _connection(self, reader, writer):
+        self.stats.connections += 1
+        try:
+            while True:
+                request = await self._read(reader)
+                if request is None:
+                    break
+                keep_alive = request.headers.get('connection', '').lower() != 'close'
+
+                status, body, headers = await self._dispatch(request)
+                if status is None:
+                    break
+                self.stats.statuses[status] += 1
+                writer.write(self._response(status, body, headers, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, request):
+        key = request.path.strip('/')
+        if key == '__stats':
+            return 200, self.stats.snapshot(), {}
+        if key == '__reset':
+            self.stats = Stats()
+            return 200, {'reset': True}, {}
+
+        self.stats.requests[f"{request.method} /{key}"] += 1
+
+        fault = await self.faults.apply()
+        if fault == 'drop':
+            return None, None, None
+        if fault == 'error':
+            return 500, {'code': 500, 'message': 'Injected server error'}, {}
+
+        handler = self.routes.get((request.method, key))
+        if handler is None:
+            return 404, {'code': 404, 'message': f"No route {request.method} /{key}"}, {}
+
+        result = handler(request)
+        if asyncio.iscoroutine(result):
+            result = await result
+        status, body, *rest = result
+        return status, body, rest[0] if rest else {}
+
+    @staticmethod
+    async def _read(reader):
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        method, target, _ = line.decode('latin-1').split(' ', 2)
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get('content-length', 0) or 0)
+        body = await reader.readexactly(length) if length else b''
+
+        parts = urlsplit(target)
+        return Request(method.upper(), parts.path, dict(parse_qsl(parts.query, keep_blank_values=True)), headers, body)
+
+    @staticmethod
+    def _response(status, body, headers, keep_alive):
+        if isinstance(body, (dict, list)):
+            payload = json.dumps(body).encode()
+            content_type = 'application/json'
+        elif isinstance(body, str):
+            payload = body.encode()
+            content_type = 'text/plain; charset=utf-8'
+        else:
+            payload = body or b''
+            content_type = 'application/octet-stream'
+
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, 'Status')}",
+                 f"Content-Type: {headers.pop('Content-Type', content_type)}",
+                 f"Content-Length: {len(payload)}",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + payload
+
+
+def add_fault_arguments(parser):
+    """Command-line options for Faults"""
+    parser.add_argument('--latency', type=float, default=0.05, help="mean added latency in seconds (default 0.05)")
+    parser.add_argument('--jitter', type=float, default=0.02, help="+/- latency jitter in seconds (default 0.02)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="share of requests answered with HTTP 500")
+    parser.add_argument('--drop-rate', type=float, default=0.0, help="share of requests whose connection is dropped")
+
+
+def faults_from(args):
+    return Faults(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, drop_rate=args.drop_rate)
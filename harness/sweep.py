@@ -0,0 +1,292 @@
+"""
+Concurrent GET sweep over admin routes.
+
+Fetches routes from a thread pool. Every worker thread takes its own
+requests.Session from the admin session pool (harness/sessions.py), so
+they all share one login that is cached between runs and renewed when it
+expires. Concurrency is capped globally and per host.
+
+Each response is classified the way test_admin_routes.py always did:
+
+    PASS        200, not the login page, no error text, > min_size bytes
+    LOGIN       the login page came back (session missing or expired)
+    ERROR       an exception / PHP error shows up in the body
+    HTTP_ERROR  any other non-200 status
+    SMALL       200 but suspiciously small
+    EXCEPTION   the request itself failed (timeout, connection error)
+
+Usage from a front end:
+
+    sweep = Sweep(concurrency=16)
+    results = sweep.run(ROUTES, on_result=print_result)
+    print_summary(results)
+"""
+
+import argparse
+import codecs
+import re
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from harness.phperrors import CHUNK_SIZE, Scanner
+from harness.sessions import default_pool
+from harness.settings import ADMIN_URL, GREEN, LOGIN_MARKER, NC, RED, YELLOW
+from harness.timing import print_regressions
+
+STATUSES = ['PASS', 'LOGIN', 'ERROR', 'HTTP_ERROR', 'SMALL', 'EXCEPTION']
+
+ERROR_MARKERS = [
+    "Exception", "ErrorException", "undefined variable",
+    "Missing required", "Call to undefined", "Class not found",
+]
+
+# Ignition's JSON payload names the exception; it is preferred as the message
+EXCEPTION_MESSAGE = ('"exception_message":"', r'"exception_message":"[^"]+"')
+
+BODY_MARKERS = Scanner([LOGIN_MARKER, EXCEPTION_MESSAGE] + [(m, re.escape(m) + r'[^<]{0,100}') for m in ERROR_MARKERS],
+                       ignore_case=False)
+
+# Routes that end the session; they are fetched after everything else
+SESSION_ENDING = ('logout',)
+
+
+@dataclass
+class Result:
+    route: str
+    url: str
+    status: str
+    http_code: int
+    size: int
+    message: str
+    elapsed: float
+
+
+def admin_url(route):
+    """Turn an admin route ("blog/add" or "/blog/add") or full URL into a URL"""
+    if route.startswith(('http://', 'https://')):
+        return route
+    return f"{ADMIN_URL}/{route.lstrip('/')}"
+
+
+def classify(status_code, body, min_size=3000):
+    """
+    Classify a response body, a str or an iterable of str / bytes chunks;
+    returns (status, http_code, size, message). size is in characters,
+    like len(response.text).
+    """
+    counted = _Counted(body)
+    hits = BODY_MARKERS.scan(counted, limit=1)
+    is_login_page = any(hit.pattern == LOGIN_MARKER for hit in hits)
+    errors = [hit for hit in hits if hit.pattern != LOGIN_MARKER]
+    has_error = bool(errors)
+    size = counted.size
+
+    if status_code == 200 and not is_login_page and not has_error and size > min_size:
+        return ("PASS", status_code, size, None)
+    elif is_login_page:
+        return ("LOGIN", status_code, size, "Redirected to login")
+    elif has_error:
+        named = [hit for hit in errors if hit.pattern == EXCEPTION_MESSAGE[1]]
+        message = named[0].text[len(EXCEPTION_MESSAGE[0]):-1] if named else errors[0].text
+        return ("ERROR", status_code, size, message)
+    elif status_code != 200:
+        return ("HTTP_ERROR", status_code, size, f"HTTP {status_code}")
+    else:
+        return ("SMALL", status_code, size, "Small response")
+
+
+class _Counted:
+    """Iterate a body as text while counting its length in characters"""
+
+    def __init__(self, body):
+        self.body = body
+        self.size = 0
+
+    def __iter__(self):
+        if isinstance(self.body, str):
+            self.body = (self.body,)
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        for chunk in self.body:
+            text = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            self.size += len(text)
+            yield text
+        tail = decoder.decode(b'', final=True)
+        self.size += len(tail)
+        if tail:
+            yield tail
+
+
+class Sweep:
+    """Fetch many admin routes concurrently with one shared login"""
+
+    def __init__(self, concurrency=8, per_host=None, timeout=30, min_size=3000, pool=None):
+        self.concurrency = max(1, concurrency)
+        self.per_host = per_host or self.concurrency
+        self.timeout = timeout
+        self.min_size = min_size
+        self.pool = pool or default_pool()
+        self._local = threading.local()
+        self._host_limits = defaultdict(lambda: threading.BoundedSemaphore(self.per_host))
+        self._host_lock = threading.Lock()
+
+    def login(self):
+        """Authenticate the session pool; returns True on success"""
+        return self.pool.open()
+
+    def fetch(self, route, label=None):
+        """Fetch and classify one route"""
+        url = admin_url(route)
+        session = self._worker_session()
+        started = time.perf_counter()
+
+        try:
+            with self._host_limit(url):
+                with session.get(url, timeout=self.timeout, stream=True) as response:
+                    status, http_code, size, message = self.read(url, response)
+        except Exception as e:
+            status, http_code, size, message = ("EXCEPTION", 0, 0, str(e))
+
+        return Result(label or route, url, status, http_code, size, message, time.perf_counter() - started)
+
+    def read(self, url, response):
+        """Classify a streamed response; subclasses can look at the body on the way"""
+        return classify(response.status_code, response.iter_content(CHUNK_SIZE), self.min_size)
+
+    def run(self, routes, on_result=None):
+        """
+        Sweep the routes; each entry is a route string or a (label, route)
+        pair. on_result is called with every Result as it completes.
+        Results come back in input order, session-ending routes last.
+        """
+        self.login()
+
+        entries = [(r, r) if isinstance(r, str) else (r[0], r[1]) for r in routes]
+        last = [e for e in entries if e[1].rstrip('/').endswith(SESSION_ENDING)]
+        first = [e for e in entries if e not in last]
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = {pool.submit(self.fetch, route, label): i for i, (label, route) in enumerate(first)}
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                if on_result:
+                    on_result(result)
+
+        for label, route in last:
+            result = self.fetch(route, label)
+            results[len(results)] = result
+            if on_result:
+                on_result(result)
+        if last:
+            self.pool.forget()
+
+        return [results[i] for i in sorted(results)]
+
+    def _worker_session(self):
+        """The pooled session this thread uses for the whole sweep"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self.pool.acquire()
+        return session
+
+    def _host_limit(self, url):
+        host = urlsplit(url).netloc
+        with self._host_lock:
+            return self._host_limits[host]
+
+
+def print_result(result):
+    """Print one result line"""
+    route, http_code, size, message = result.route, result.http_code, result.size, result.message or ''
+    if result.status == "PASS":
+        print(f"{GREEN}✓{NC} {route} - {http_code} ({size}B, {result.elapsed * 1000:.0f}ms)")
+    elif result.status == "LOGIN":
+        print(f"{YELLOW}→{NC} {route} - {http_code} (login redirect)")
+    elif result.status == "ERROR":
+        print(f"{RED}✗{NC} {route} - {http_code} ({message[:50]}...)")
+    elif result.status == "HTTP_ERROR":
+        print(f"{RED}✗{NC} {route} - {message}")
+    elif result.status == "SMALL":
+        print(f"{YELLOW}?{NC} {route} - {http_code} ({size}B - small)")
+    else:
+        print(f"{RED}✗{NC} {route} - Exception: {message[:50]}")
+
+
+def print_summary(results, elapsed=None):
+    """Print the totals and the failing routes"""
+    grouped = {status: [r for r in results if r.status == status] for status in STATUSES}
+
+    print()
+    print("=" * 50)
+    print("Test Summary")
+    print("=" * 50)
+    print(f"Total Routes Tested: {len(results)}")
+    if elapsed is not None:
+        print(f"Wall time: {elapsed:.1f}s")
+    print(f"{GREEN}Successful (200 with content): {len(grouped['PASS'])}{NC}")
+    print(f"{YELLOW}Login Required: {len(grouped['LOGIN'])}{NC}")
+    print(f"{RED}Errors: {len(grouped['ERROR'])}{NC}")
+    print(f"{RED}HTTP Errors: {len(grouped['HTTP_ERROR'])}{NC}")
+    print(f"{YELLOW}Small Responses: {len(grouped['SMALL'])}{NC}")
+    print(f"{RED}Exceptions: {len(grouped['EXCEPTION'])}{NC}")
+
+    if grouped['ERROR']:
+        print()
+        print("=" * 50)
+        print(f"{RED}Error Routes:{NC}")
+        print("=" * 50)
+        for r in grouped['ERROR']:
+            print(f"  {RED}✗{NC} {r.route}: {r.message[:80]}")
+
+    if grouped['HTTP_ERROR']:
+        print()
+        print("=" * 50)
+        print(f"{RED}HTTP Error Routes:{NC}")
+        print("=" * 50)
+        for r in grouped['HTTP_ERROR']:
+            print(f"  {RED}✗{NC} {r.route}: {r.message}")
+
+    slowest = sorted(results, key=lambda r: r.elapsed, reverse=True)[:5]
+    if slowest:
+        print()
+        print("Slowest routes:")
+        for r in slowest:
+            print(f"  {r.elapsed * 1000:7.0f}ms  {r.route}")
+
+
+def argument_parser(description):
+    """Command-line options shared by the sweep front ends"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('-c', '--concurrency', type=int, default=8, help="parallel requests (default 8)")
+    parser.add_argument('--per-host', type=int, default=None, help="parallel requests per host (default: --concurrency)")
+    parser.add_argument('--timeout', type=float, default=30, help="seconds per request (default 30)")
+    return parser
+
+
+def main(routes, description="Admin route sweep", argv=None):
+    """Run a sweep from the command line; returns a process exit code"""
+    args = argument_parser(description).parse_args(argv)
+
+    sweep = Sweep(concurrency=args.concurrency, per_host=args.per_host, timeout=args.timeout)
+
+    print("=" * 50)
+    print(description)
+    print("=" * 50)
+    if sweep.login():
+        print(f"{GREEN}✓ Login successful!{NC}")
+    else:
+        print(f"{RED}✗ Login failed{NC} - continuing (routes may redirect to login)...")
+    print()
+
+    started = time.perf_counter()
+    results = sweep.run(routes, on_result=print_result)
+    print_summary(results, time.perf_counter() - started)
+    print()
+    print_regressions()
+
+    return 0 if all(r.status == 'PASS' for r in results) else 1
@@ -0,0 +1,353 @@
+"""
+Latency history for every request the harness makes.
+
+Sessions from harness.auth.new_session() carry a response hook that
+records method, endpoint, status, elapsed time and any Server-Timing
+metrics of each response (redirect hops included). Samples are written
+to a local SQLite database (HARNESS_TIMING_DB, default
+harness_timings.sqlite at the repository root), grouped into runs tagged
+with the git commit, so any two commits can be compared:
+
+    python3 -m harness.timing runs
+    python3 -m harness.timing report [--commit abc1234]
+    python3 -m harness.timing compare [--baseline abc1234] [--current def5678] \\
+        [--threshold 0.2] [--min-ms 20] [--min-samples 5] [--script test_admin_routes.py] \\
+        [--base-url http://127.0.0.1:8000]
+
+Endpoints are paths with numeric and hash-like segments replaced by {id},
+so /faq/edit/12 and /faq/edit/13 share one history. compare flags every
+endpoint whose p95 grew by more than --threshold (and --min-ms) against
+the baseline, which defaults to the newest other commit with samples,
+and exits 1 when anything regressed. Runs are kept apart by target site:
+report and compare only look at runs against --base-url (default
+HARNESS_BASE_URL), so a local run never mixes with a production one. The
+sweep front ends, the CRUD suite and the load generator print the same
+check, limited to runs of the same script and site, at the end of every
+run.
+
+Set HARNESS_TIMINGS=0 to switch recording off.
+"""
+
+import argparse
+import atexit
+import json
+import math
+import re
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from harness.settings import BASE_URL, GREEN, NC, RED, TIMING_DB, TIMINGS
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Samples kept in memory before they are written out
+FLUSH_EVERY = 5000
+
+ID_SEGMENT_RE = re.compile(r'/(\d+|[0-9a-f]{16,}|[0-9a-f-]{36})(?=/|$)', re.I)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started REAL NOT NULL,
+    git_commit TEXT NOT NULL,
+    dirty INTEGER NOT NULL DEFAULT 0,
+    script TEXT,
+    base_url TEXT
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    method TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    status INTEGER,
+    ms REAL NOT NULL,
+    server_timing TEXT
+);
+CREATE INDEX IF NOT EXISTS samples_endpoint ON samples (endpoint, run_id);
+"""
+
+
+def git_commit():
+    """(short commit hash, dirty flag) of the checkout, or ('unknown', False)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, timeout=10).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                               capture_output=True, text=True, timeout=30).stdout.strip() != ''
+        return commit or 'unknown', dirty
+    except (OSError, subprocess.SubprocessError):
+        return 'unknown', False
+
+
+def script_name():
+    """Label for this process's runs: the script, or the package run with -m"""
+    path = Path(sys.argv[0] if sys.argv and sys.argv[0] else 'python')
+    return path.parent.name if path.name == '__main__.py' else path.name
+
+
+def endpoint(url):
+    """host-less path with ids folded, e.g. /en/admin/faq/edit/{id}"""
+    path = urlsplit(url).path or '/'
+    return ID_SEGMENT_RE.sub('/{id}', path.rstrip('/') or '/')
+
+
+def parse_server_timing(header):
+    """'db;dur=53.2, app;dur=47' -> {'db': 53.2, 'app': 47.0}"""
+    metrics = {}
+    for entry in (header or '').split(','):
+        name, _, params = entry.strip().partition(';')
+        if not name:
+            continue
+        duration = re.search(r'dur=([\d.]+)', params)
+        metrics[name.strip()] = float(duration.group(1)) if duration else None
+    return metrics
+
+
+def connect(path=TIMING_DB):
+    db = sqlite3.connect(path, timeout=30)
+    db.executescript(SCHEMA)
+    return db
+
+
+class Recorder:
+    """
+    Collects samples from session hooks; one run per process.
+
+    The hook only appends to a list. A background thread writes the
+    samples out every FLUSH_EVERY, and save() writes the rest at exit, so
+    neither SQLite nor git ever runs inside a timed request.
+    """
+
+    def __init__(self, path=TIMING_DB):
+        self.path = path
+        self.samples = []
+        self.lock = threading.Lock()          # samples and base_url
+        self.write_lock = threading.Lock()    # one writer at a time
+        self.full = threading.Event()
+        self.writer = None
+        self.run_id = None
+        self.base_url = None
+        self.script = script_name()
+        self.commit, self.dirty = git_commit() if TIMINGS else ('unknown', False)
+
+    def hook(self, response, *args, **kwargs):
+        """requests response hook"""
+        server_timing = parse_server_timing(response.headers.get('Server-Timing'))
+        sample = (response.request.method, endpoint(response.url), response.status_code,
+                  response.elapsed.total_seconds() * 1000, json.dumps(server_timing) if server_timing else None)
+        with self.lock:
+            if self.base_url is None:
+                self.base_url = origin(response.url)
+            self.samples.append(sample)
+            if len(self.samples) < FLUSH_EVERY:
+                return
+            if self.writer is None:
+                self.writer = threading.Thread(target=self._write_loop, name='timing-writer', daemon=True)
+                self.writer.start()
+        self.full.set()
+
+    def save(self):
+        """Write pending samples; returns the run id (None when nothing was recorded)"""
+        self._flush()
+        return self.run_id
+
+    def _write_loop(self):
+        while True:
+            self.full.wait()
+            self.full.clear()
+            self._flush()
+
+    def _flush(self):
+        with self.lock:
+            samples, self.samples = self.samples, []
+        if not samples:
+            return
+        with self.write_lock:
+            db = connect(self.path)
+            with db:
+                if self.run_id is None:
+                    self.run_id = db.execute(
+                        "INSERT INTO runs (started, git_commit, dirty, script, base_url) VALUES (?, ?, ?, ?, ?)",
+                        (time.time(), self.commit, int(self.dirty), self.script, self.base_url),
+                    ).lastrowid
+                db.executemany("INSERT INTO samples (run_id, method, endpoint, status, ms, server_timing) "
+                               "VALUES (?, ?, ?, ?, ?, ?)", [(self.run_id, *sample) for sample in samples])
+            db.close()
+
+
+recorder = Recorder()
+atexit.register(recorder.save)
+
+
+def origin(url):
+    """scheme://host[:port] of a URL, the form runs.base_url is stored in"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def attach(session):
+    """Time every response of a requests session"""
+    if TIMINGS:
+        session.hooks['response'].append(recorder.hook)
+    return session
+
+
+# -- analysis ---------------------------------------------------------------
+
+def percentile(values, percent):
+    if not values:
+        return 0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(len(ordered) * percent / 100) - 1)]
+
+
+def latest_commits(db, script=None, base_url=None):
+    """Commits with samples (from one script / site, when given), newest first"""
+    rows = db.execute("SELECT git_commit, MAX(started) FROM runs WHERE id IN (SELECT DISTINCT run_id FROM samples) "
+                      "AND (? IS NULL OR script = ?) AND (? IS NULL OR base_url = ?) "
+                      "GROUP BY git_commit ORDER BY MAX(started) DESC", (script, script, base_url, base_url))
+    return [commit for commit, _ in rows]
+
+
+def endpoint_stats(db, commit, script=None, base_url=None):
+    """{(method, endpoint): {'n', 'p50', 'p95', 'server'}} over every run of a commit (against one site, when given)"""
+    times = defaultdict(list)
+    server = defaultdict(lambda: defaultdict(list))
+    rows = db.execute("SELECT s.method, s.endpoint, s.ms, s.server_timing FROM samples s JOIN runs r ON r.id = s.run_id "
+                      "WHERE r.git_commit = ? AND (? IS NULL OR r.script = ?) AND (? IS NULL OR r.base_url = ?)",
+                      (commit, script, script, base_url, base_url))
+    for method, path, ms, server_timing in rows:
+        times[(method, path)].append(ms)
+        for name, value in json.loads(server_timing or '{}').items():
+            if value is not None:
+                server[(method, path)][name].append(value)
+    return {
+        key: {
+            'n': len(values),
+            'p50': percentile(values, 50),
+            'p95': percentile(values, 95),
+            'server': {name: sum(v) / len(v) for name, v in server[key].items()},
+        }
+        for key, values in times.items()
+    }
+
+
+def compare(db, baseline=None, current=None, threshold=0.2, min_ms=20, min_samples=5, script=None, base_url=None):
+    """
+    Endpoints whose p95 regressed from baseline to current, optionally
+    only over runs of one script (load tests and functional runs see very
+    different latencies) and against one site (base_url, as stored in
+    runs). Returns (baseline, current, rows); rows are dicts sorted by
+    slowdown.
+    """
+    commits = latest_commits(db, script, base_url)
+    current = current or (commits[0] if commits else None)
+    baseline = baseline or next((c for c in commits if c != current), None)
+    if not current or not baseline:
+        return baseline, current, []
+
+    before = endpoint_stats(db, baseline, script, base_url)
+    after = endpoint_stats(db, current, script, base_url)
+    rows = []
+    for key, stats in after.items():
+        old = before.get(key)
+        if not old or min(old['n'], stats['n']) < min_samples:
+            continue
+        delta = stats['p95'] - old['p95']
+        if delta > min_ms and stats['p95'] > old['p95'] * (1 + threshold):
+            rows.append({'method': key[0], 'endpoint': key[1], 'baseline_p95': old['p95'], 'current_p95': stats['p95'],
+                         'change': delta / old['p95'] if old['p95'] else math.inf, 'samples': stats['n']})
+    return baseline, current, sorted(rows, key=lambda r: -r['change'])
+
+
+def print_regressions(threshold=0.2, min_ms=20, min_samples=5):
+    """Save this process's samples and print the p95 check of its script and site against the previous commit"""
+    if not TIMINGS:
+        return []
+    recorder.save()
+    db = connect(recorder.path)
+    baseline, current, rows = compare(db, threshold=threshold, min_ms=min_ms, min_samples=min_samples,
+                                      script=recorder.script, base_url=recorder.base_url or origin(BASE_URL))
+    db.close()
+    if current is None:
+        return []
+    if baseline is None:
+        print(f"Latency history: first commit with samples ({current}), nothing to compare yet")
+    elif rows:
+        print(f"{RED}p95 regressions vs {baseline} (>{threshold:.0%}):{NC}")
+        for row in rows[:15]:
+            print(f"  {RED}✗{NC} {row['method']} {row['endpoint']}: {row['baseline_p95']:.0f}ms -> {row['current_p95']:.0f}ms")
+    else:
+        print(f"{GREEN}No p95 regressions vs {baseline}{NC}")
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Harness latency history")
+    parser.add_argument('--db', default=TIMING_DB, help="SQLite file (default HARNESS_TIMING_DB)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('runs', help="list recorded runs")
+    report = commands.add_parser('report', help="p50/p95 per endpoint for one commit")
+    report.add_argument('--commit', help="default: newest commit with samples")
+    report.add_argument('--script', help="only runs of this script (see 'runs')")
+    report.add_argument('--base-url', default=origin(BASE_URL), help="only runs against this site (default HARNESS_BASE_URL)")
+    check = commands.add_parser('compare', help="flag endpoints whose p95 regressed")
+    check.add_argument('--baseline', help="baseline commit (default: the newest other commit)")
+    check.add_argument('--current', help="commit to check (default: the newest commit)")
+    check.add_argument('--threshold', type=float, default=0.2, help="allowed p95 growth, 0.2 = 20%% (default)")
+    check.add_argument('--min-ms', type=float, default=20, help="ignore p95 growth below this many ms (default 20)")
+    check.add_argument('--min-samples', type=int, default=5, help="samples needed on both sides (default 5)")
+    check.add_argument('--script', help="only runs of this script (see 'runs')")
+    check.add_argument('--base-url', default=origin(BASE_URL), help="only runs against this site (default HARNESS_BASE_URL)")
+    check.add_argument('--json', help="write the regressions as JSON")
+    args = parser.parse_args(argv)
+
+    db = connect(args.db)
+
+    if args.command == 'runs':
+        rows = db.execute("SELECT r.id, r.started, r.git_commit, r.dirty, r.script, r.base_url, COUNT(s.rowid) "
+                          "FROM runs r LEFT JOIN samples s ON s.run_id = r.id GROUP BY r.id ORDER BY r.id DESC")
+        for run_id, started, commit, dirty, script, base_url, count in rows:
+            print(f"{run_id:>5}  {time.strftime('%Y-%m-%d %H:%M', time.localtime(started))}  "
+                  f"{commit}{'+' if dirty else ' '}  {count:>7} samples  {script}  {base_url}")
+        return 0
+
+    if args.command == 'report':
+        base_url = origin(args.base_url)
+        commit = args.commit or next(iter(latest_commits(db, args.script, base_url)), None)
+        if commit is None:
+            print(f"No samples recorded against {base_url} yet")
+            return 1
+        stats = endpoint_stats(db, commit, args.script, base_url)
+        print(f"Commit {commit} on {base_url}: {len(stats)} endpoints")
+        print(f"{'Method':<7}{'Endpoint':<56}{'n':>7}{'p50':>9}{'p95':>9}   server timing (mean ms)")
+        for (method, path), row in sorted(stats.items(), key=lambda item: -item[1]['p95']):
+            server = ' '.join(f"{name}={value:.1f}" for name, value in row['server'].items())
+            print(f"{method:<7}{path[:55]:<56}{row['n']:>7}{row['p50']:>9.0f}{row['p95']:>9.0f}   {server}")
+        return 0
+
+    base_url = origin(args.base_url)
+    baseline, current, rows = compare(db, args.baseline, args.current, args.threshold, args.min_ms,
+                                      args.min_samples, args.script, base_url)
+    if baseline is None or current is None:
+        print(f"Need samples against {base_url} from two commits to compare")
+        return 1
+    print(f"p95 {baseline} -> {current} on {base_url}, threshold {args.threshold:.0%} / {args.min_ms:.0f}ms")
+    for row in rows:
+        print(f"  {RED}✗{NC} {row['method']:<6} {row['endpoint']:<56} {row['baseline_p95']:>7.0f}ms -> "
+              f"{row['current_p95']:>7.0f}ms  (+{row['change']:.0%}, n={row['samples']})")
+    if not rows:
+        print(f"{GREEN}No regressions{NC}")
+    if args.json:
+        with open(args.json, 'w') as handle:
+            json.dump({'baseline': baseline, 'current': current, 'regressions': rows}, handle, indent=2)
+    return 1 if rows else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,27 +2,18 @@
 """
 Admin Route Testing Script
 Tests all GET admin routes with proper authentication
-"""
 
-import requests
-from bs4 import BeautifulSoup
-import re
-import sys
-import time
+Runs on the shared concurrent sweep engine (harness/sweep.py):
+    python3 test_admin_routes.py --concurrency 16
 
-BASE_URL = "https://isp.mlbbshop.app"
-LOCALE = "en"
+Every admin GET route in core/routes, without this hand-kept list:
+    python3 -m harness.routes sweep --param id=1
+"""
 
-# Admin credentials
-ADMIN_USERNAME = "admin"
-ADMIN_PASSWORD = "TestAdmin123!"
+import sys
 
-# Color codes
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-BLUE = '\033[94m'
-NC = '\033[0m'
+from harness.phperrors import CHUNK_SIZE
+from harness.sweep import admin_url, classify, main as sweep_main
 
 # All GET admin routes to test
 ADMIN_ROUTES = [
@@ -244,176 +235,16 @@ ADMIN_ROUTES = [
     "app-banner",
 ]
 
-def login(session):
-    """Perform admin login and return True if successful"""
-    print("=" * 50)
-    print("Admin Route Testing Script")
-    print("=" * 50)
-    print()
-    
-    # Get login page
-    print("Step 1: Getting login page...")
-    login_url = f"{BASE_URL}/admin"
-    response = session.get(login_url)
-    
-    # Extract CSRF token
-    soup = BeautifulSoup(response.text, 'html.parser')
-    token_input = soup.find('input', {'name': '_token'})
-    
-    if not token_input:
-        print(f"{RED}✗ Could not find CSRF token{NC}")
-        return False
-    
-    csrf_token = token_input.get('value')
-    print(f"CSRF Token: {csrf_token[:20]}...")
-    
-    # Perform login
-    print()
-    print("Step 2: Logging in as admin...")
-    login_data = {
-        '_token': csrf_token,
-        'username': ADMIN_USERNAME,
-        'password': ADMIN_PASSWORD
-    }
-    
-    headers = {
-        'Content-Type': 'application/x-www-form-urlencoded',
-        'Accept': 'text/html,application/xhtml+xml',
-        'Origin': BASE_URL,
-        'Referer': login_url
-    }
-    
-    response = session.post(f"{BASE_URL}/admin/login", data=login_data, headers=headers, allow_redirects=True)
-    
-    # Check if login was successful
-    dashboard_url = f"{BASE_URL}/{LOCALE}/admin/dashboard"
-    dashboard_response = session.get(dashboard_url)
-    
-    if "Login To Go Your Dashboard" in dashboard_response.text:
-        print(f"{RED}✗ Login failed - still showing login page{NC}")
-        return False
-    
-    if dashboard_response.status_code == 200 and len(dashboard_response.text) > 5000:
-        print(f"{GREEN}✓ Login successful!{NC}")
-        return True
-    
-    print(f"{YELLOW}⚠ Login status uncertain (HTTP {dashboard_response.status_code}, {len(dashboard_response.text)} bytes){NC}")
-    return True  # Continue anyway
-
 def test_route(session, route):
     """Test a single route and return result"""
-    url = f"{BASE_URL}/{LOCALE}/admin/{route}"
-    
     try:
-        response = session.get(url, timeout=30)
-        
-        # Check for various conditions
-        is_login_page = "Login To Go Your Dashboard" in response.text
-        has_error = any(err in response.text for err in [
-            "Exception", "ErrorException", "undefined variable",
-            "Missing required", "Call to undefined", "Class not found"
-        ])
-        
-        size = len(response.text)
-        status = response.status_code
-        
-        if status == 200 and not is_login_page and not has_error and size > 3000:
-            return ("PASS", status, size, None)
-        elif is_login_page:
-            return ("LOGIN", status, size, "Redirected to login")
-        elif has_error:
-            # Extract error message
-            error_match = re.search(r'(Exception|Error|undefined variable)[^<]{0,100}', response.text)
-            error_msg = error_match.group(0) if error_match else "Unknown error"
-            return ("ERROR", status, size, error_msg)
-        elif status != 200:
-            return ("HTTP_ERROR", status, size, f"HTTP {status}")
-        else:
-            return ("SMALL", status, size, "Small response")
-            
+        with session.get(admin_url(route), timeout=30, stream=True) as response:
+            return classify(response.status_code, response.iter_content(CHUNK_SIZE))
     except Exception as e:
         return ("EXCEPTION", 0, 0, str(e))
 
-def main():
-    # Create session with persistent cookies
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-    })
-    
-    # Login
-    if not login(session):
-        print()
-        print("Continuing with tests anyway (routes may redirect to login)...")
-    
-    print()
-    print("=" * 50)
-    print("Testing Admin Routes...")
-    print("=" * 50)
-    print()
-    
-    # Results tracking
-    results = {
-        'PASS': [],
-        'LOGIN': [],
-        'ERROR': [],
-        'HTTP_ERROR': [],
-        'SMALL': [],
-        'EXCEPTION': []
-    }
-    
-    total = len(ADMIN_ROUTES)
-    
-    for i, route in enumerate(ADMIN_ROUTES, 1):
-        status, http_code, size, message = test_route(session, route)
-        results[status].append((route, http_code, size, message))
-        
-        if status == "PASS":
-            print(f"{GREEN}✓{NC} {route} - {http_code} ({size}B)")
-        elif status == "LOGIN":
-            print(f"{YELLOW}→{NC} {route} - {http_code} (login redirect)")
-        elif status == "ERROR":
-            print(f"{RED}✗{NC} {route} - {http_code} ({message[:50]}...)")
-        elif status == "HTTP_ERROR":
-            print(f"{RED}✗{NC} {route} - {message}")
-        elif status == "SMALL":
-            print(f"{YELLOW}?{NC} {route} - {http_code} ({size}B - small)")
-        else:
-            print(f"{RED}✗{NC} {route} - Exception: {message[:50]}")
-        
-        # Small delay to avoid overwhelming the server
-        if i % 20 == 0:
-            time.sleep(0.5)
-    
-    # Print summary
-    print()
-    print("=" * 50)
-    print("Test Summary")
-    print("=" * 50)
-    print(f"Total Routes Tested: {total}")
-    print(f"{GREEN}Successful (200 with content): {len(results['PASS'])}{NC}")
-    print(f"{YELLOW}Login Required: {len(results['LOGIN'])}{NC}")
-    print(f"{RED}Errors: {len(results['ERROR'])}{NC}")
-    print(f"{RED}HTTP Errors: {len(results['HTTP_ERROR'])}{NC}")
-    print(f"{YELLOW}Small Responses: {len(results['SMALL'])}{NC}")
-    print(f"{RED}Exceptions: {len(results['EXCEPTION'])}{NC}")
-    
-    # Print failed routes
-    if results['ERROR']:
-        print()
-        print("=" * 50)
-        print(f"{RED}Error Routes:{NC}")
-        print("=" * 50)
-        for route, code, size, msg in results['ERROR']:
-            print(f"  {RED}✗{NC} {route}: {msg[:80]}")
-    
-    if results['HTTP_ERROR']:
-        print()
-        print("=" * 50)
-        print(f"{RED}HTTP Error Routes:{NC}")
-        print("=" * 50)
-        for route, code, size, msg in results['HTTP_ERROR']:
-            print(f"  {RED}✗{NC} {route}: {msg}")
+def main(argv=None):
+    return sweep_main(ADMIN_ROUTES, "Admin Route Testing Script", argv)
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
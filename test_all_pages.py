@@ -1,32 +1,14 @@
 #!/usr/bin/env python3
 """
 Final Verification Test - Check ALL admin pages load without PHP errors
-"""
-
-import requests
-import re
-import urllib3
-urllib3.disable_warnings()
 
-BASE_URL = "https://isp.mlbbshop.app"
-ADMIN_URL = f"{BASE_URL}/en/admin"
-
-session = requests.Session()
-session.verify = False
+Runs on the shared concurrent sweep engine (harness/sweep.py):
+    python3 test_all_pages.py --concurrency 16
+"""
 
-def get_csrf_token(html):
-    match = re.search(r'name="_token"\s+value="([^"]+)"', html)
-    return match.group(1) if match else None
+import sys
 
-def login():
-    r = session.get(f"{BASE_URL}/admin")
-    csrf_token = get_csrf_token(r.text)
-    r = session.post(f"{BASE_URL}/admin/login", data={
-        '_token': csrf_token,
-        'username': 'admin',
-        'password': 'TestAdmin123!'
-    }, allow_redirects=True)
-    return 'dashboard' in r.url
+from harness.sweep import main as sweep_main
 
 # All admin pages to test (list pages, settings pages, etc.)
 PAGES = [
@@ -94,70 +76,5 @@ PAGES = [
     ('Backup', '/backup'),
 ]
 
-def test_page(name, path):
-    """Test that a page loads without errors"""
-    url = f"{ADMIN_URL}{path}"
-    try:
-        r = session.get(url, allow_redirects=True, timeout=30)
-        
-        if r.status_code == 500:
-            err_match = re.search(r'"exception_message":"([^"]+)"', r.text)
-            error = err_match.group(1) if err_match else "500 Error"
-            return False, f"500: {error[:60]}"
-        
-        if r.status_code == 404:
-            return False, "404 Not Found"
-        
-        if r.status_code == 200:
-            # Check for PHP errors in page content
-            if 'Parse error' in r.text or 'Fatal error' in r.text or 'Syntax error' in r.text:
-                return False, "PHP Error in page"
-            return True, "OK"
-        
-        return False, f"Status {r.status_code}"
-    except Exception as e:
-        return False, str(e)[:50]
-
-def main():
-    print("="*70)
-    print("ADMIN PANEL PAGES VERIFICATION TEST")
-    print("="*70)
-    
-    if not login():
-        print("❌ Login failed!")
-        return
-    
-    print("✅ Logged in successfully\n")
-    
-    passed = 0
-    failed = 0
-    failures = []
-    
-    for name, path in PAGES:
-        success, msg = test_page(name, path)
-        if success:
-            passed += 1
-            print(f"  ✅ {name}")
-        else:
-            failed += 1
-            print(f"  ❌ {name}: {msg}")
-            failures.append(f"{name}: {msg}")
-    
-    total = passed + failed
-    print("\n" + "="*70)
-    print("SUMMARY")
-    print("="*70)
-    print(f"Total pages tested: {total}")
-    print(f"Passed: {passed} ✅")
-    print(f"Failed: {failed} ❌")
-    print(f"Pass rate: {passed/total*100:.1f}%")
-    
-    if failures:
-        print(f"\n--- FAILURES ({len(failures)}) ---")
-        for f in failures:
-            print(f"  ❌ {f}")
-    
-    print("\n" + "="*70)
-
 if __name__ == "__main__":
-    main()
+    sys.exit(sweep_main(PAGES, "ADMIN PANEL PAGES VERIFICATION TEST"))
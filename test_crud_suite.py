@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+CRUD suite for the admin entities
+
+One create/read/update/delete cycle per entity of harness/crud.py's
+ENTITIES, sharing one login per process; spread the entities over
+workers with pytest-xdist:
+
+    python3 -m pytest test_crud_suite.py -n 9
+    python3 -m pytest test_crud_suite.py --entities all --crud-slow 500
+"""
+
+from harness.crud import Cycle
+
+
+def test_crud_cycle(entity, admin_session, csrf, record_property):
+    cycle = Cycle(admin_session, entity, csrf)
+    try:
+        cycle.run()
+    finally:
+        record_property('crud_steps', [step.as_dict() for step in cycle.steps])
@@ -4,18 +4,18 @@ Comprehensive Web Functionality Test
 Tests ALL aspects: Frontend, Admin Panel, API, and Business Logic
 """
 
-import requests
 import re
 import json
-import urllib3
-urllib3.disable_warnings()
 
-BASE_URL = "https://isp.mlbbshop.app"
-ADMIN_URL = f"{BASE_URL}/en/admin"
+from harness.phperrors import CHUNK_SIZE, PHP_ERRORS
+from harness.sessions import default_pool
+from harness.settings import ADMIN_URL, BASE_URL
+from harness.timing import print_regressions
+
 API_URL = f"{BASE_URL}/api"
 
-session = requests.Session()
-session.verify = False
+pool = default_pool()
+session = pool.acquire()
 
 results = {
     'frontend': {'passed': 0, 'failed': 0, 'tests': []},
@@ -78,7 +78,7 @@ def test_frontend():
             r = session.get(f"{BASE_URL}{path}", timeout=15, allow_redirects=True)
             if r.status_code == 200:
                 # Check for PHP errors
-                if 'Parse error' in r.text or 'Fatal error' in r.text:
+                if PHP_ERRORS.search(r.iter_content(CHUNK_SIZE)):
                     record_result('frontend', name, False, 'PHP Error')
                 else:
                     record_result('frontend', name, True)
@@ -97,14 +97,7 @@ def test_frontend():
 # 2. ADMIN PANEL TESTS
 # ============================================================
 def admin_login():
-    r = session.get(f"{BASE_URL}/admin")
-    csrf_token = get_csrf_token(r.text)
-    r = session.post(f"{BASE_URL}/admin/login", data={
-        '_token': csrf_token,
-        'username': 'admin',
-        'password': 'TestAdmin123!'
-    }, allow_redirects=True)
-    return 'dashboard' in r.url
+    return pool.open()
 
 def test_admin_panel():
     print("\n" + "="*60)
@@ -444,6 +437,7 @@ def main():
     test_crud_operations()
     test_business_logic()
     print_summary()
+    print_regressions()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,54 @@
+"""
+Response shapes of the MBT billing-server simulator (harness/mbt_sim.py).
+
+MbtController only takes the success paths when the simulator answers the
+way the real billing server does; these checks run the handlers in-process,
+no server or network needed:
+
+    python3 -m pytest -q test_mbt_sim.py
+"""
+
+import json
+from urllib.parse import urlencode
+
+import pytest
+
+from harness.mbt_sim import DUPLICATE_ORDER, BillingData, MbtSimulator
+from harness.simhttp import Request
+
+
+def call(handler, **values):
+    body = urlencode(values).encode()
+    status, payload = handler(Request('POST', '/', {}, {'content-type': 'application/x-www-form-urlencoded'}, body))
+    assert status == 200
+    return json.loads(json.dumps(payload))
+
+
+@pytest.fixture
+def simulator():
+    return MbtSimulator(BillingData(users=5))
+
+
+@pytest.fixture
+def token(simulator):
+    return call(simulator.access_token)['data']['access_token']
+
+
+def test_recharge_returns_package_row(simulator, token):
+    name = 'mbt000001'
+    decoded = call(simulator.recharge, access_token=token, user_name=name, order_no='T1', pay_num=15000, number='INV1')
+
+    # MbtController: $decode['code'] == 0 && isset($decode['data'][0]['billing_name'])
+    assert decoded['code'] == 0
+    assert isinstance(decoded['data'], list)
+    row = decoded['data'][0]
+    assert row['billing_name'] == simulator.data.packages[name][0]['billing_name']
+    assert row['products_name']
+    assert row['order_no'] == 'T1'
+
+
+def test_recharge_repeated_order(simulator, token):
+    call(simulator.recharge, access_token=token, user_name='mbt000002', order_no='T2')
+    decoded = call(simulator.recharge, access_token=token, user_name='mbt000002', order_no='T2')
+
+    assert decoded['code'] == DUPLICATE_ORDER
@@ -4,16 +4,16 @@ Comprehensive PHP Code Execution Test
 Tests all CRUD endpoints and checks for PHP errors in responses
 """
 
-import requests
 import re
 import json
-from urllib3.exceptions import InsecureRequestWarning
-requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
-BASE_URL = "https://isp.mlbbshop.app"
-ADMIN_URL = f"{BASE_URL}/en/admin"
-session = requests.Session()
-session.verify = False
+from harness.phperrors import CHUNK_SIZE, PHP_ERRORS
+from harness.sessions import default_pool
+from harness.settings import ADMIN_URL, BASE_URL
+from harness.timing import print_regressions
+
+pool = default_pool()
+session = pool.acquire()
 
 # Track results
 results = {
@@ -24,47 +24,10 @@ results = {
     'tested_endpoints': []
 }
 
-# PHP error patterns to detect
-PHP_ERROR_PATTERNS = [
-    r'Fatal error',
-    r'Parse error',
-    r'Warning:.*on line',
-    r'Notice:.*on line',
-    r'Undefined variable',
-    r'Undefined index',
-    r'Undefined array key',
-    r'Call to undefined',
-    r'Class .* not found',
-    r'Method .* does not exist',
-    r'SQLSTATE\[',
-    r'ErrorException',
-    r'Exception in',
-    r'Stack trace:',
-    r'Whoops!',
-    r'Symfony\\Component\\.*Exception',
-    r'Illuminate\\.*Exception',
-    r'TypeError:',
-    r'ArgumentCountError',
-    r'ReflectionException',
-    r'BadMethodCallException',
-    r'InvalidArgumentException',
-    r'RuntimeException',
-    r'LogicException',
-    r'<br\s*/>\s*<b>.*error</b>',
-    r'error_log',
-]
-
 def check_for_php_errors(response, endpoint_name):
     """Check response for PHP errors"""
-    errors_found = []
-    text = response.text
-    
-    for pattern in PHP_ERROR_PATTERNS:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            errors_found.extend(matches[:2])  # Limit to first 2 matches per pattern
-    
-    return errors_found
+    hits = PHP_ERRORS.scan(response.iter_content(CHUNK_SIZE))  # first 2 matches per pattern
+    return [hit.text for hit in hits]
 
 def get_csrf_token(html):
     """Extract CSRF token from HTML"""
@@ -139,26 +102,12 @@ def admin_login():
     print("ADMIN LOGIN")
     print("="*70)
     
-    r = session.get(f"{BASE_URL}/admin", timeout=30)
-    csrf = get_csrf_token(r.text)
-    
-    if not csrf:
-        print("  ❌ Could not get CSRF token")
-        return False
-    
-    r = session.post(f"{BASE_URL}/admin/login", data={
-        '_token': csrf,
-        'email': 'admin',
-        'password': 'TestAdmin123!'
-    }, allow_redirects=True, timeout=30)
-    
-    # Check if we're logged in by accessing dashboard
-    r2 = session.get(f"{ADMIN_URL}/dashboard", timeout=30)
-    if r2.status_code == 200 and ('dashboard' in r2.text.lower() or 'admin' in r2.url.lower()):
-        print("  ✅ Admin login successful")
+    # Shared pool login; reuses the cached cookies while they are valid
+    if pool.open():
+        print("  ✅ Admin login successful" + (" (cached session)" if not pool.logins else ""))
         return True
     else:
-        print(f"  ❌ Admin login failed (status: {r2.status_code})")
+        print("  ❌ Admin login failed")
         return False
 
 # ============================================================
@@ -397,3 +346,4 @@ if __name__ == "__main__":
         test_api()
     
     print_summary()
+    print_regressions()